@@ -0,0 +1,70 @@
+"""전종목 여러 해 패널의 메모리 사용량 비교
+
+일자별 전종목 OHLCV(get_market_ohlcv_by_ticker)를 영업일마다 조회해 날짜, 티커
+열이 있는 long 형식 패널 하나로 합친 뒤 memory_usage(deep=True)를 비교한다.
+
+- default : 문자열 티커 index, 스키마에 선언된 정수 타입
+- compact : enable_compact() - 공유 티커 사전 category, 값 범위에 맞춘 정수 타입
+
+기본값은 SyntheticTransport의 가상 시세를 사용한다. --fixtures로 RecordTransport
+응답 디렉터리를 지정하면 기록된 응답을 사용한다.
+
+    $ python benchmarks/bench_compact_memory.py
+    $ python benchmarks/bench_compact_memory.py --tickers 2700 --years 5
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from pykrx.website.comm import disable_compact, enable_compact
+from pykrx.website.comm.transport import ReplayTransport, SyntheticTransport
+from pykrx.website.comm.webio import set_transport
+from pykrx.website.krx.market.wrap import get_market_ohlcv_by_ticker
+
+
+def build_panel(dates) -> pd.DataFrame:
+    frames = [get_market_ohlcv_by_ticker(d.strftime("%Y%m%d"), "ALL") for d in dates]
+    panel = pd.concat(frames, keys=dates, names=["날짜", "티커"])
+    return panel.reset_index()
+
+
+def measure(dates, compact: bool):
+    if compact:
+        enable_compact()
+    begin = time.perf_counter()
+    try:
+        panel = build_panel(dates)
+    finally:
+        disable_compact()
+    elapsed = time.perf_counter() - begin
+    return panel, int(panel.memory_usage(deep=True, index=True).sum()), elapsed
+
+
+def run(fixtures: str | None, tickers: int, years: int):
+    if fixtures:
+        set_transport(ReplayTransport(fixtures))
+    else:
+        set_transport(SyntheticTransport(tickers=tickers))
+    dates = pd.bdate_range(end="2024-12-30", periods=years * 250)
+
+    print(f"{'mode':<10}{'rows':>12}{'memory MB':>12}{'build s':>10}")
+    results = {}
+    for mode in ("default", "compact"):
+        panel, nbytes, elapsed = measure(dates, mode == "compact")
+        results[mode] = nbytes
+        print(f"{mode:<10}{len(panel):>12,}{nbytes / 2**20:>12.1f}{elapsed:>10.1f}")
+        for column, dtype in panel.dtypes.items():
+            print(f"{'':<10}{column:<10}{str(dtype):>12}")
+    print(f"compact / default = {results['compact'] / results['default']:.2f}")
+    set_transport(None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="RecordTransport로 기록한 응답 디렉터리")
+    parser.add_argument("--tickers", type=int, default=2700)
+    parser.add_argument("--years", type=int, default=3)
+    args = parser.parse_args()
+    run(args.fixtures, args.tickers, args.years)
@@ -0,0 +1,67 @@
+"""import 시간 측정
+
+새 인터프리터에서 각 문장을 실행한 시간(ms)과 불러온 모듈 수를 출력한다.
+`import pykrx`가 기준 시간(--budget-ms)을 넘거나 무거운 모듈(pandas, matplotlib,
+wrap 모듈)을 불러오면 실패 코드로 종료하므로 CI에서 회귀 검사로 사용할 수 있다.
+
+    $ python benchmarks/bench_import_time.py --repeat 5 --budget-ms 50
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import pykrx",
+    "from pykrx import bond",
+    "from pykrx import stock",
+)
+HEAVY = ("pandas", "matplotlib", "pykrx.stock", "pykrx.bond", "pykrx.website")
+
+_PROBE = """
+import json, sys, time
+begin = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - begin
+print(json.dumps({{"ms": elapsed * 1e3, "modules": len(sys.modules), "loaded": sorted(sys.modules)}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run(repeat: int, budget_ms: float) -> int:
+    print(f"{'statement':<26}{'median ms':>10}{'modules':>9}")
+    failures = []
+    for statement in STATEMENTS:
+        samples = [measure(statement) for _ in range(repeat)]
+        median = statistics.median(s["ms"] for s in samples)
+        print(f"{statement:<26}{median:>10.1f}{samples[0]['modules']:>9}")
+
+        if statement == "import pykrx":
+            heavy = [m for m in HEAVY if m in samples[0]["loaded"]]
+            if heavy:
+                failures.append(f"import pykrx loaded {', '.join(heavy)}")
+            if median > budget_ms:
+                failures.append(f"import pykrx took {median:.1f} ms > {budget_ms} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    sys.exit(run(args.repeat, args.budget_ms))
@@ -0,0 +1,117 @@
+"""KRX 응답 디코딩 + DataFrame 변환 시간/메모리 비교
+
+재생(replay)한 응답 본문에 대해 다음 두 경로를 비교한다.
+
+- baseline: json.loads -> DataFrame(list_of_dicts)
+- fast    : jsonio.loads (orjson/simdjson) -> records_to_frame (열 단위 변환)
+
+기본값은 SyntheticTransport로 만든 전종목 시세(3,000종목)와 20년 일별 시세를
+RecordTransport로 기록한 뒤 ReplayTransport로 읽는다. --fixtures로 실제 사이트에서
+기록한 응답 디렉터리를 지정하면 그 안의 모든 응답을 사용한다.
+
+    $ python benchmarks/bench_json_decode.py
+    $ python benchmarks/bench_json_decode.py --fixtures tests/fixtures/transport
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from pandas import DataFrame
+
+from pykrx.website.comm import jsonio
+from pykrx.website.comm.transport import RecordTransport, SyntheticTransport
+
+URL = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+
+
+def record_synthetic(directory: Path, tickers: int):
+    recorder = RecordTransport(directory, inner=SyntheticTransport(tickers=tickers))
+    recorder.request(
+        "POST",
+        URL,
+        {},
+        {"bld": "dbms/MDC/STAT/standard/MDCSTAT01501", "trdDd": "20240115", "mktId": "ALL"},
+    )
+    recorder.request(
+        "POST",
+        URL,
+        {},
+        {
+            "bld": "dbms/MDC/STAT/standard/MDCSTAT01701",
+            "isuCd": "KR7000010000",
+            "strtDd": "20040101",
+            "endDd": "20231231",
+        },
+    )
+
+
+def load_payloads(directory: Path) -> list[tuple[str, bytes]]:
+    payloads = []
+    for path in sorted(directory.rglob("*.json")):
+        record = json.loads(path.read_text(encoding="utf-8"))
+        if record.get("content_type", "").startswith("application/json"):
+            payloads.append((path.parent.name, record["text"].encode("utf-8")))
+    return payloads
+
+
+def records_of(data: dict) -> list:
+    for key in ("output", "OutBlock_1", "block1"):
+        if isinstance(data.get(key), list):
+            return data[key]
+    return []
+
+
+def baseline(body: bytes) -> DataFrame:
+    return DataFrame(records_of(json.loads(body)))
+
+
+def fast(body: bytes) -> DataFrame:
+    return jsonio.records_to_frame(records_of(jsonio.loads(body)))
+
+
+def measure(func, body: bytes, repeat: int) -> tuple[float, int]:
+    func(body)
+    begin = time.perf_counter()
+    for _ in range(repeat):
+        func(body)
+    elapsed = (time.perf_counter() - begin) / repeat
+
+    tracemalloc.start()
+    func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(fixtures: str | None, tickers: int, repeat: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(fixtures) if fixtures else Path(tmp)
+        if not fixtures:
+            record_synthetic(directory, tickers)
+        payloads = load_payloads(directory)
+
+        print(f"decoder: {jsonio.BACKEND}")
+        print(
+            f"{'payload':<28}{'bytes':>10}{'rows':>8}{'base ms':>10}{'fast ms':>10}{'base MB':>10}{'fast MB':>10}"
+        )
+        for name, body in payloads:
+            rows = len(records_of(json.loads(body)))
+            t0, m0 = measure(baseline, body, repeat)
+            t1, m1 = measure(fast, body, repeat)
+            print(
+                f"{name[-28:]:<28}{len(body):>10,}{rows:>8,}"
+                f"{t0 * 1e3:>10.1f}{t1 * 1e3:>10.1f}{m0 / 2**20:>10.1f}{m1 / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="RecordTransport로 기록한 응답 디렉터리")
+    parser.add_argument("--tickers", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    run(args.fixtures, args.tickers, args.repeat)
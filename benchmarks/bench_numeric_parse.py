@@ -0,0 +1,111 @@
+"""wrap 함수별 응답 변환 시간 비교
+
+같은 응답을 재생(replay)하면서 core 클래스 응답을 최종 DataFrame으로 바꾸는 시간을 잰다.
+
+- legacy : 원본 DataFrame -> 열 선택/이름 변경 -> 정규식 replace 여러 번 -> astype (이전 구현)
+- schema : 스키마가 응답 레코드에서 바로 타입이 지정된 DataFrame 생성
+
+기본값은 SyntheticTransport 응답을 RecordTransport로 기록한 뒤 ReplayTransport로
+읽는다. --fixtures로 실제 사이트에서 기록한 응답 디렉터리를 지정하면 그 응답을
+사용하고, 기록되지 않은 조회는 건너뛴다.
+
+    $ python benchmarks/bench_numeric_parse.py
+    $ python benchmarks/bench_numeric_parse.py --fixtures tests/fixtures/transport --isin KR7005930003
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from pykrx.website.comm.transport import (
+    RecordTransport,
+    ReplayMissError,
+    ReplayTransport,
+    SyntheticTransport,
+)
+from pykrx.website.comm.webio import set_transport
+from pykrx.website.krx.market import schema
+from pykrx.website.krx.schema import DATE
+
+TRADE_DATE, FROMDATE = "20240115", "20040101"
+
+
+def cases(isin: str):
+    return [
+        ("get_market_ohlcv_by_ticker", schema.STOCK_OHLCV_BY_TICKER, (TRADE_DATE, "ALL")),
+        ("get_market_cap_by_ticker", schema.STOCK_CAP_BY_TICKER, (TRADE_DATE, "ALL")),
+        (
+            "get_market_fundamental_by_ticker",
+            schema.STOCK_FUNDAMENTAL_BY_TICKER,
+            (TRADE_DATE, "ALL"),
+        ),
+        ("get_market_ohlcv_by_date", schema.STOCK_OHLCV_BY_DATE, (FROMDATE, TRADE_DATE, isin, 2)),
+        ("get_market_cap_by_date", schema.STOCK_CAP_BY_DATE, (FROMDATE, TRADE_DATE, isin, 2)),
+    ]
+
+
+def legacy(sc, args):
+    df = sc.core().fetch(*args)
+    df = df[sc.sources]
+    df.columns = sc.names
+    if sc.index is not None:
+        df = df.set_index(sc.index)
+    df = df.replace(r"[^-\w\.]", "", regex=True)
+    df = df.replace(r"\-$", "0", regex=True)
+    df = df.replace("", "0")
+    dtypes = {n: t for n, t in zip(sc.names, sc.dtypes) if t is not None and t != DATE}
+    df = df.astype(dtypes)
+    if sc.index is not None and DATE in sc.dtypes:
+        df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
+    return df
+
+
+def current(sc, args):
+    return sc.fetch(*args)
+
+
+def record_synthetic(directory: Path, tickers: int, isin: str):
+    set_transport(RecordTransport(directory, inner=SyntheticTransport(tickers=tickers)))
+    for _, sc, args in cases(isin):
+        sc.fetch(*args)
+
+
+def measure(func, sc, args, repeat: int) -> float:
+    func(sc, args)
+    begin = time.perf_counter()
+    for _ in range(repeat):
+        func(sc, args)
+    return (time.perf_counter() - begin) / repeat
+
+
+def run(fixtures: str | None, tickers: int, isin: str, repeat: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(fixtures) if fixtures else Path(tmp)
+        if not fixtures:
+            record_synthetic(directory, tickers, isin)
+        set_transport(ReplayTransport(directory))
+
+        print(f"{'function':<36}{'rows':>8}{'legacy ms':>12}{'schema ms':>12}{'speedup':>9}")
+        for name, sc, args in cases(isin):
+            try:
+                rows = len(current(sc, args))
+            except ReplayMissError:
+                print(f"{name:<36}{'(not recorded)':>20}")
+                continue
+            t0 = measure(legacy, sc, args, repeat)
+            t1 = measure(current, sc, args, repeat)
+            print(f"{name:<36}{rows:>8,}{t0 * 1e3:>12.1f}{t1 * 1e3:>12.1f}{t0 / t1:>8.1f}x")
+    set_transport(None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="RecordTransport로 기록한 응답 디렉터리")
+    parser.add_argument("--tickers", type=int, default=3000)
+    parser.add_argument("--isin", default="KR7000010000", help="일별 조회에 사용할 종목 ISIN")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.fixtures, args.tickers, args.isin, args.repeat)
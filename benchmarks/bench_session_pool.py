@@ -0,0 +1,79 @@
+"""커넥션 풀 사용 전/후 요청 지연 시간 비교
+
+로컬 stub 서버에 같은 요청을 반복해서 보내고, 매번 새 TCP 연결을 맺는
+`requests.post`와 공유 keep-alive 세션을 사용하는 `Post.read`의 호출당
+평균 지연 시간을 비교한다. 루프백에서는 TCP 핸드셰이크 비용이 매우 작으므로
+실제 KRX 서버(왕복 수십 ms)에서의 절감 폭은 이보다 훨씬 크다.
+
+    $ python benchmarks/bench_session_pool.py --calls 500
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from pykrx.website.comm.webio import Post
+
+PAYLOAD = json.dumps({"output": [{"ISU_SRT_CD": "005930", "TDD_CLSPRC": "71,000"}]}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+def start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(calls: int):
+    server = start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    class StubPost(Post):
+        @property
+        def url(self):
+            return url
+
+    headers = {"User-Agent": "Mozilla/5.0"}
+    begin = time.perf_counter()
+    for _ in range(calls):
+        requests.post(url, headers=headers, data={"bld": "bench"}).json()
+    no_pool = (time.perf_counter() - begin) / calls
+
+    io = StubPost()
+    io.read(bld="warmup")
+    begin = time.perf_counter()
+    for _ in range(calls):
+        io.read(bld="bench").json()
+    pooled = (time.perf_counter() - begin) / calls
+
+    server.shutdown()
+    print(f"calls           : {calls}")
+    print(f"new connection  : {no_pool * 1e6:8.1f} us/call")
+    print(f"pooled session  : {pooled * 1e6:8.1f} us/call")
+    print(f"saved per call  : {(no_pool - pooled) * 1e6:8.1f} us ({no_pool / pooled:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=300)
+    run(parser.parse_args().calls)
@@ -0,0 +1,99 @@
+"""티커 -> ISIN 조회 시간 비교
+
+- legacy      : 상장/상장폐지 DataFrame의 index를 차례로 확인하고, 상장폐지 목록의
+                중복 티커는 호출마다 sort_values로 골라내던 이전 StockTicker.get
+- lookup      : 미리 만든 dict 색인 (StockTicker.lookup)
+- lookup_many : 여러 티커를 reindex 한 번으로 조회 (StockTicker.lookup_many)
+
+네트워크 없이 가상 종목 목록을 사용한다.
+
+    $ python benchmarks/bench_ticker_lookup.py --listed 2700 --delisted 3500
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.krx.market import ticker as ticker_module
+from pykrx.website.krx.market.ticker import StockTicker
+
+
+def make_tables(listed: int, delisted: int, duplicated: int):
+    def frame(codes, prefix):
+        return DataFrame(
+            {
+                "종목": [f"종목{c}" for c in codes],
+                "ISIN": [f"{prefix}{c}{i % 10}" for i, c in enumerate(codes)],
+                "시장": ["STK"] * len(codes),
+            },
+            index=pd.Index(codes, name="티커"),
+        )
+
+    listed_codes = [f"{i:06d}" for i in range(listed)]
+    delisted_codes = [f"{i:06d}" for i in range(listed, listed + delisted)]
+    delisted_codes += random.sample(delisted_codes, duplicated)
+    return frame(listed_codes, "KR7"), frame(delisted_codes, "KRA")
+
+
+def legacy_get(listed, delisted, ticker):
+    df = listed
+    if ticker not in df.index:
+        df = delisted
+        if ticker not in df.index:
+            return None
+        elif isinstance(df.loc[ticker], DataFrame):
+            df = df.loc[ticker].sort_values("ISIN").iloc[:1]
+    return df.loc[ticker]
+
+
+class FakeMaster:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def load(self, fetch, on_refresh=None):
+        return (*self.tables, False)
+
+
+def run(listed: int, delisted: int, duplicated: int, queries: int):
+    random.seed(0)
+    tables = make_tables(listed, delisted, duplicated)
+    ticker_module.get_ticker_master = lambda: FakeMaster(tables)
+    StockTicker._instance = None
+    stock_ticker = StockTicker()
+
+    universe = list(tables[0].index) + list(tables[1].index)
+    tickers = random.choices(universe, k=queries)
+
+    begin = time.perf_counter()
+    expected = [legacy_get(*tables, t)["ISIN"] for t in tickers]
+    legacy = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    result = [stock_ticker.lookup(t)[1] for t in tickers]
+    lookup = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    many = stock_ticker.lookup_many(tickers)["ISIN"].tolist()
+    lookup_many = time.perf_counter() - begin
+
+    assert expected == result == many
+    print(f"{queries:,} lookups ({listed:,} listed, {delisted + duplicated:,} delisted rows)")
+    print(f"{'path':<14}{'total ms':>10}{'us/ticker':>12}{'speedup':>9}")
+    for name, elapsed in (("legacy", legacy), ("lookup", lookup), ("lookup_many", lookup_many)):
+        print(
+            f"{name:<14}{elapsed * 1e3:>10.1f}{elapsed / queries * 1e6:>12.2f}"
+            f"{legacy / elapsed:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--listed", type=int, default=2700)
+    parser.add_argument("--delisted", type=int, default=3500)
+    parser.add_argument("--duplicated", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.listed, args.delisted, args.duplicated, args.queries)
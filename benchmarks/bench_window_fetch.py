@@ -0,0 +1,69 @@
+"""30년 일별 시세 조회 시간 비교 (기간 분할 조회)
+
+SyntheticTransport에 서버 왕복 지연(--latency)을 주고, data.krx.co.kr의 기본
+rate limit(초당 2회) 아래에서 다음을 비교한다.
+
+- legacy    : 730일 구간을 순서대로 조회하고 구간마다 1초 sleep (이전 동작)
+- sequential: 새 구현, max_workers=1
+- concurrent: 새 구현, max_workers=4
+
+    $ python benchmarks/bench_window_fetch.py --latency 1.0
+"""
+
+import argparse
+import time
+
+from pykrx.website.comm.ratelimit import throttle
+from pykrx.website.comm.transport import SyntheticTransport
+from pykrx.website.comm.webio import set_transport
+from pykrx.website.krx import krxio
+from pykrx.website.krx.market.core import IndividualStockPrice
+
+FROMDATE, TODATE = "19950101", "20241231"
+
+
+class ThrottledSynthetic(SyntheticTransport):
+    """실제 HttpTransport처럼 호스트별 rate limit을 적용"""
+
+    def request(self, method, url, headers, params):
+        throttle(url)
+        return super().request(method, url, headers, params)
+
+
+def legacy(io: IndividualStockPrice, isin: str) -> int:
+    params = {"bld": io.bld, "isuCd": isin, "adjStkPrc": 2}
+    rows = 0
+    for start, end in krxio.split_date_range(FROMDATE, TODATE, 730):
+        rows += len(io._read_json(**params, strtDd=start, endDd=end)["output"])
+        time.sleep(1)
+    return rows
+
+
+def current(io: IndividualStockPrice, isin: str) -> int:
+    return len(io.fetch(FROMDATE, TODATE, isin, 2))
+
+
+def run(latency: float):
+    synthetic = ThrottledSynthetic(tickers=10, latency=latency)
+    set_transport(synthetic)
+    isin = synthetic.market.isins[0]
+    windows = len(krxio.split_date_range(FROMDATE, TODATE, 730))
+    print(f"range {FROMDATE}~{TODATE}, {windows} windows, latency {latency * 1e3:.0f} ms/request")
+
+    for name, func, workers in [
+        ("legacy", legacy, 1),
+        ("sequential", current, 1),
+        ("concurrent", current, 4),
+    ]:
+        krxio.configure_window_fetch(max_workers=workers)
+        # 이전 실행이 남긴 token이 결과에 영향을 주지 않도록 bucket을 비운다.
+        time.sleep(1.0)
+        begin = time.perf_counter()
+        rows = func(IndividualStockPrice(), isin)
+        print(f"{name:<11}: {time.perf_counter() - begin:6.2f} s ({rows:,} rows)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.4)
+    run(parser.parse_args().latency)
@@ -1,24 +1,51 @@
-import importlib.resources as resources
-import platform
+import importlib
 
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
+# 하위 패키지는 처음 접근할 때 불러온다 (PEP 562). `import pykrx`만으로는
+# pandas, matplotlib, wrap 모듈을 불러오지 않는다.
+#
+#    >> import pykrx
+#    >> pykrx.stock.get_market_ohlcv("20240102")    # 이때 pykrx.stock을 불러옴
+_SUBMODULES = ("arrow", "bond", "crawler", "stock", "website")
 
-from . import bond, stock
 
-os = platform.system()
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name == "setup_font":
+        from .font import setup_font
 
-if os == "Darwin":
-    plt.rc("font", family="AppleGothic")
+        return setup_font
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-else:
-    with resources.path("pykrx", "NanumBarunGothic.ttf") as font_path:
-        fe = fm.FontEntry(fname=str(font_path), name="NanumBarunGothic")
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rc("font", family=fe.name)
 
-plt.rcParams["axes.unicode_minus"] = False
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-__all__ = ["bond", "stock"]
+
+def cache_info() -> dict:
+    """pykrx 캐시 사용 현황
+
+    Returns:
+        dict: {"memo": wrap 함수 결과 메모이제이션 통계 (MemoInfo),
+               "disk": KRX 응답 디스크 캐시 통계 (CacheInfo, 비활성화 시 None)}
+
+        >> import pykrx
+        >> from pykrx.website.comm import enable_memo
+        >> enable_memo()
+        >> pykrx.cache_info()["memo"]
+        MemoInfo(enabled=True, hits=12, misses=3, evictions=0, entries=3, size=1048576, max_bytes=268435456)
+    """
+    from .website.comm import disk_cache_info, memo_info
+
+    return {"memo": memo_info(), "disk": disk_cache_info()}
+
+
+# matplotlib.pyplot을 불러오는 시점(이미 불러왔으면 지금)에 한글 글꼴을 설정한다.
+from .font import install_pyplot_hook as _install_pyplot_hook  # noqa: E402
+
+_install_pyplot_hook()
+
+
+__all__ = ["bond", "cache_info", "setup_font", "stock"]
 
 __version__ = "1.0.51"
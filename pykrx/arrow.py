@@ -0,0 +1,355 @@
+"""
+pyarrow.Table을 반환하는 조회 API
+
+KRX 응답(JSON) 레코드에서 pandas를 거치지 않고 바로 pyarrow.Table을 만든다.
+숫자 문자열("1,234", "-")은 Arrow compute로 변환하며, 열 이름과 타입은 pykrx.stock의
+같은 이름 함수가 반환하는 DataFrame과 같다. DataFrame의 index(티커, 날짜)는 첫 번째
+열로 포함된다. polars, duckdb 등 Arrow 기반 도구에 그대로 넘길 때 사용한다.
+
+    >> from pykrx import arrow
+    >> table = arrow.get_market_ohlcv_by_ticker("20240102", "KOSPI")
+    >> table.to_pandas()
+
+스키마로 정의된 조회 API만 제공한다. 아래 pykrx.stock 함수는 Arrow 버전이 없으므로
+DataFrame을 pa.Table.from_pandas로 변환해서 사용한다.
+
+- 티커/이름/상장일: get_market_ticker_list, get_market_ticker_name,
+  get_index_ticker_list, get_index_ticker_name, get_index_listing_date,
+  get_etf_ticker_list, get_etn_ticker_list, get_elw_ticker_list
+- 여러 조회를 조합하는 API: get_market_ohlcv, get_market_cap,
+  get_market_ohlcv_panel, get_index_portfolio_history,
+  get_etf_portfolio_deposit_file_history
+- 투자자별 거래실적: get_market_trading_volume_by_investor,
+  get_market_trading_value_by_investor, get_market_trading_volume_by_date,
+  get_market_trading_value_by_date, get_market_net_purchases_of_equities_by_ticker
+- 공매도: get_shorting_status_by_date, get_shorting_volume_by_ticker,
+  get_shorting_value_by_ticker, get_shorting_volume_by_date,
+  get_shorting_value_by_date, get_shorting_investor_volume_by_date,
+  get_shorting_investor_value_by_date, get_shorting_volume_top50,
+  get_shorting_balance_top50
+- 지수/ETF: get_index_price_change_by_ticker, get_index_portfolio_deposit_file,
+  get_etf_price_change_by_ticker, get_etf_portfolio_deposit_file,
+  get_etf_trading_volume_and_value
+
+pyarrow가 필요하다 (pip install pykrx[arrow]).
+"""
+
+import datetime
+import functools
+import logging
+
+import pyarrow as pa
+
+from pykrx.website.krx.etx import schema as etx_schema
+from pykrx.website.krx.etx.ticker import get_etx_isin
+from pykrx.website.krx.market import schema as market_schema
+from pykrx.website.krx.market.schema import (
+    INDEX_GROUP_TO_IDX,
+    MARKET_TO_MKTID,
+    SHORTING_MARKET_TO_IDX,
+)
+from pykrx.website.krx.market.ticker import get_stock_ticker_isin
+
+__all__ = [
+    "get_etf_ohlcv_by_date",
+    "get_etf_ohlcv_by_ticker",
+    "get_exhaustion_rates_of_foreign_investment_by_date",
+    "get_exhaustion_rates_of_foreign_investment_by_ticker",
+    "get_index_fundamental_by_date",
+    "get_index_fundamental_by_ticker",
+    "get_index_ohlcv_by_date",
+    "get_index_ohlcv_by_ticker",
+    "get_market_cap_by_date",
+    "get_market_cap_by_ticker",
+    "get_market_fundamental_by_date",
+    "get_market_fundamental_by_ticker",
+    "get_market_ohlcv_by_date",
+    "get_market_ohlcv_by_ticker",
+    "get_market_price_change_by_ticker",
+    "get_shorting_balance_by_date",
+    "get_shorting_balance_by_ticker",
+]
+
+
+def _table_empty_handler(func):
+    """dataframe_empty_handler와 같은 규칙으로 오류 시 빈 Table 반환"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logging.info(args, kwargs)
+            logging.info(e)
+            return pa.table({})
+
+    return wrapper
+
+
+def _yyyymmdd(date) -> str:
+    if isinstance(date, datetime.date):
+        return date.strftime("%Y%m%d")
+    return date.replace("-", "")
+
+
+def _sorted(table: pa.Table) -> pa.Table:
+    """DataFrame.sort_index와 같이 첫 번째 열(날짜/티커) 기준으로 정렬"""
+    if table.num_columns == 0:
+        return table
+    return table.sort_by(table.column_names[0])
+
+
+# -----------------------------------------------------------------------------
+# stock
+@_table_empty_handler
+def get_market_ohlcv_by_date(fromdate, todate, ticker: str, adjusted: bool = True) -> pa.Table:
+    """일자별 특정 종목의 OHLCV
+
+    Args:
+        fromdate (str or date): 조회 시작 일자 (YYYYMMDD)
+        todate   (str or date): 조회 종료 일자 (YYYYMMDD)
+        ticker   (str        ): 조회할 종목의 티커
+        adjusted (bool       ): 수정 종가 여부
+
+    Returns:
+        pa.Table: 날짜(date32), 시가, 고가, 저가, 종가, 거래량, 거래대금, 등락률
+    """
+    isin = get_stock_ticker_isin(ticker)
+    adjusted_value = 2 if adjusted else 1
+    table = market_schema.STOCK_OHLCV_BY_DATE.fetch(
+        _yyyymmdd(fromdate), _yyyymmdd(todate), isin, adjusted_value, output="arrow"
+    )
+    return _sorted(table)
+
+
+@_table_empty_handler
+def get_market_ohlcv_by_ticker(date, market: str = "KOSPI") -> pa.Table:
+    """티커별 특정 일자의 OHLCV
+
+    Args:
+        date   (str or date): 조회 일자 (YYYYMMDD)
+        market (str        ): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+
+    Returns:
+        pa.Table: 티커, 시가, 고가, 저가, 종가, 거래량, 거래대금, 등락률, 시가총액
+    """
+    return market_schema.STOCK_OHLCV_BY_TICKER.fetch(
+        _yyyymmdd(date), MARKET_TO_MKTID[market], output="arrow"
+    )
+
+
+@_table_empty_handler
+def get_market_cap_by_date(fromdate, todate, ticker: str, adjusted: bool = True) -> pa.Table:
+    """일자별 특정 종목의 시가총액
+
+    Returns:
+        pa.Table: 날짜(date32), 시가총액, 거래량, 거래대금, 상장주식수
+    """
+    isin = get_stock_ticker_isin(ticker)
+    adjusted_value = 2 if adjusted else 1
+    table = market_schema.STOCK_CAP_BY_DATE.fetch(
+        _yyyymmdd(fromdate), _yyyymmdd(todate), isin, adjusted_value, output="arrow"
+    )
+    return _sorted(table)
+
+
+@_table_empty_handler
+def get_market_cap_by_ticker(date, market: str = "ALL", ascending: bool = False) -> pa.Table:
+    """시가총액 순으로 정렬된 티커별 특정 일자의 시가총액
+
+    Args:
+        date      (str or date   ): 조회 일자 (YYYYMMDD)
+        market    (str, optional ): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        ascending (bool, optional): 정렬 기준. 기본값은 시가총액 내림차순
+
+    Returns:
+        pa.Table: 티커, 종가, 시가총액, 거래량, 거래대금, 상장주식수
+    """
+    table = market_schema.STOCK_CAP_BY_TICKER.fetch(
+        _yyyymmdd(date), MARKET_TO_MKTID[market], output="arrow"
+    )
+    return table.sort_by([("시가총액", "ascending" if ascending else "descending")])
+
+
+@_table_empty_handler
+def get_market_fundamental_by_ticker(date, market: str = "KOSPI") -> pa.Table:
+    """티커별 특정 일자의 BPS/PER/PBR/EPS/DIV/DPS
+
+    Returns:
+        pa.Table: 티커, BPS, PER, PBR, EPS, DIV, DPS
+    """
+    return market_schema.STOCK_FUNDAMENTAL_BY_TICKER.fetch(
+        _yyyymmdd(date), MARKET_TO_MKTID[market], output="arrow"
+    )
+
+
+@_table_empty_handler
+def get_market_fundamental_by_date(fromdate, todate, ticker: str) -> pa.Table:
+    """일자별 특정 종목의 BPS/PER/PBR/EPS/DIV/DPS
+
+    Returns:
+        pa.Table: 날짜(date32), BPS, PER, PBR, EPS, DIV, DPS
+    """
+    isin = get_stock_ticker_isin(ticker)
+    table = market_schema.STOCK_FUNDAMENTAL_BY_DATE.fetch(
+        _yyyymmdd(fromdate), _yyyymmdd(todate), "ALL", isin, output="arrow"
+    )
+    return _sorted(table)
+
+
+@_table_empty_handler
+def get_market_price_change_by_ticker(
+    fromdate, todate, market: str = "KOSPI", adjusted: bool = True
+) -> pa.Table:
+    """티커별 기간 등락률
+
+    Returns:
+        pa.Table: 티커, 종목명, 시가, 종가, 변동폭, 등락률, 거래량, 거래대금
+    """
+    adjusted_value = 2 if adjusted else 1
+    return market_schema.STOCK_PRICE_CHANGE_BY_TICKER.fetch(
+        _yyyymmdd(fromdate),
+        _yyyymmdd(todate),
+        MARKET_TO_MKTID[market],
+        adjusted_value,
+        output="arrow",
+    )
+
+
+@_table_empty_handler
+def get_exhaustion_rates_of_foreign_investment_by_date(fromdate, todate, ticker: str) -> pa.Table:
+    """일자별 특정 종목의 외국인 보유량 및 한도소진률
+
+    Returns:
+        pa.Table: 날짜(date32), 상장주식수, 보유수량, 지분율, 한도수량, 한도소진률
+    """
+    isin = get_stock_ticker_isin(ticker)
+    table = market_schema.FOREIGN_OWNERSHIP_BY_DATE.fetch(
+        _yyyymmdd(fromdate), _yyyymmdd(todate), isin, output="arrow"
+    )
+    return _sorted(table)
+
+
+@_table_empty_handler
+def get_exhaustion_rates_of_foreign_investment_by_ticker(
+    date, market: str = "KOSPI", balance_limit: bool = False
+) -> pa.Table:
+    """티커별 특정 일자의 외국인 보유량 및 한도소진률
+
+    Returns:
+        pa.Table: 티커, 상장주식수, 보유수량, 지분율, 한도수량, 한도소진률
+    """
+    isin_limit_ratio = 1 if balance_limit else 0
+    table = market_schema.FOREIGN_OWNERSHIP_BY_TICKER.fetch(
+        _yyyymmdd(date), MARKET_TO_MKTID[market], isin_limit_ratio, output="arrow"
+    )
+    return _sorted(table)
+
+
+# -----------------------------------------------------------------------------
+# index
+@_table_empty_handler
+def get_index_ohlcv_by_date(fromdate, todate, ticker: str) -> pa.Table:
+    """일자별 특정 지수의 OHLCV
+
+    Args:
+        ticker (str): 지수 티커 (1001 등)
+
+    Returns:
+        pa.Table: 날짜(date32), 시가, 고가, 저가, 종가, 거래량, 거래대금, 상장시가총액
+    """
+    table = market_schema.INDEX_OHLCV_BY_DATE.fetch(
+        ticker[1:], ticker[0], _yyyymmdd(fromdate), _yyyymmdd(todate), output="arrow"
+    )
+    return _sorted(table)
+
+
+@_table_empty_handler
+def get_index_ohlcv_by_ticker(date, market: str = "KOSPI") -> pa.Table:
+    """지수별 특정 일자의 OHLCV
+
+    Returns:
+        pa.Table: 지수명, 시가, 고가, 저가, 종가, 거래량, 거래대금, 상장시가총액
+    """
+    return market_schema.INDEX_OHLCV_BY_TICKER.fetch(
+        _yyyymmdd(date), INDEX_GROUP_TO_IDX[market], output="arrow"
+    )
+
+
+@_table_empty_handler
+def get_index_fundamental_by_ticker(date, market: str = "KOSPI") -> pa.Table:
+    """지수별 특정 일자의 PER/PBR/배당수익률
+
+    Returns:
+        pa.Table: 지수명, 종가, 등락률, PER, PBR, 배당수익률
+    """
+    return market_schema.INDEX_FUNDAMENTAL_BY_TICKER.fetch(
+        _yyyymmdd(date), INDEX_GROUP_TO_IDX[market], output="arrow"
+    )
+
+
+@_table_empty_handler
+def get_index_fundamental_by_date(fromdate, todate, ticker: str) -> pa.Table:
+    """일자별 특정 지수의 PER/PBR/배당수익률
+
+    Returns:
+        pa.Table: 날짜(date32), 종가, 등락률, PER, PBR, 배당수익률
+    """
+    table = market_schema.INDEX_FUNDAMENTAL_BY_DATE.fetch(
+        _yyyymmdd(fromdate), _yyyymmdd(todate), ticker[0], ticker[1:], output="arrow"
+    )
+    return _sorted(table)
+
+
+# -----------------------------------------------------------------------------
+# shorting
+@_table_empty_handler
+def get_shorting_balance_by_ticker(date, market: str = "KOSPI") -> pa.Table:
+    """티커별 특정 일자의 공매도 잔고
+
+    Returns:
+        pa.Table: 티커, 공매도잔고, 상장주식수, 공매도금액, 시가총액, 비중
+    """
+    return market_schema.SHORTING_BALANCE_BY_TICKER.fetch(
+        _yyyymmdd(date), SHORTING_MARKET_TO_IDX[market], output="arrow"
+    )
+
+
+@_table_empty_handler
+def get_shorting_balance_by_date(fromdate, todate, ticker: str) -> pa.Table:
+    """일자별 특정 종목의 공매도 잔고
+
+    Returns:
+        pa.Table: 날짜(date32), 공매도잔고, 상장주식수, 공매도금액, 시가총액, 비중
+    """
+    isin = get_stock_ticker_isin(ticker)
+    table = market_schema.SHORTING_BALANCE_BY_DATE.fetch(
+        _yyyymmdd(fromdate), _yyyymmdd(todate), isin, output="arrow"
+    )
+    return _sorted(table)
+
+
+# -----------------------------------------------------------------------------
+# etf
+@_table_empty_handler
+def get_etf_ohlcv_by_date(fromdate, todate, ticker: str) -> pa.Table:
+    """일자별 특정 ETF의 OHLCV
+
+    Returns:
+        pa.Table: 날짜(date32), NAV, 시가, 고가, 저가, 종가, 거래량, 거래대금, 기초지수
+    """
+    isin = get_etx_isin(ticker)
+    table = etx_schema.ETF_OHLCV_BY_DATE.fetch(
+        _yyyymmdd(fromdate), _yyyymmdd(todate), isin, output="arrow"
+    )
+    return _sorted(table)
+
+
+@_table_empty_handler
+def get_etf_ohlcv_by_ticker(date) -> pa.Table:
+    """ETF별 특정 일자의 OHLCV
+
+    Returns:
+        pa.Table: 티커, NAV, 시가, 고가, 저가, 종가, 거래량, 거래대금, 기초지수
+    """
+    return etx_schema.ETF_OHLCV_BY_TICKER.fetch(_yyyymmdd(date), output="arrow")
@@ -21,6 +21,7 @@ class Config:
     PARQUET_DIR = BASE_DIR / "parquet" / "daily"
     DUCKDB_PATH = BASE_DIR / "duckdb" / "stock_data.duckdb"
     PROGRESS_DIR = BASE_DIR / "progress"
+    UNIVERSE_PATH = PROGRESS_DIR / "universe.npz"  # 날짜별 티커 유니버스 색인
 
     # Parquet 파일 구조
     PARQUET_COMPRESSION = "snappy"  # snappy, gzip, brotli 등
@@ -28,8 +29,9 @@ class Config:
     # API 호출 설정
     MAX_RETRIES = 3  # 최대 재시도 횟수
     RETRY_DELAY = 1  # 재시도 간격 (초)
-    REQUEST_DELAY = 5  # API 호출 간 딜레이 (초)
-    # REQUEST_DELAY = 0.1  # API 호출 간 딜레이 (초)
+    REQUEST_RATE = 1.0  # KRX 초당 최대 요청 수 (모든 워커 프로세스 합산)
+    REQUEST_BURST = 1.0  # 한 번에 연속으로 보낼 수 있는 요청 수
+    RATE_LIMIT_STATE = PROGRESS_DIR / "krx_rate_limit.state"
 
     # 멀티프로세싱 설정
     MAX_WORKERS = 4  # 병렬 처리 워커 수
@@ -50,3 +52,23 @@ class Config:
         for market in cls.MARKETS:
             market_dir = cls.PARQUET_DIR / market
             market_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def setup_rate_limit(cls):
+        """KRX 요청 속도 제한 설정
+
+        고정 sleep 대신 pykrx의 token bucket을 사용한다. 상태 파일을 공유하므로
+        멀티프로세싱 워커들이 모두 합쳐서 REQUEST_RATE를 넘지 않는다.
+        """
+        from pykrx.website.comm import configure_rate_limit
+
+        try:
+            configure_rate_limit(
+                "data.krx.co.kr",
+                cls.REQUEST_RATE,
+                cls.REQUEST_BURST,
+                shared_path=str(cls.RATE_LIMIT_STATE),
+            )
+        except RuntimeError:
+            # fcntl을 쓸 수 없는 환경에서는 프로세스별 한도로 대체
+            configure_rate_limit("data.krx.co.kr", cls.REQUEST_RATE, cls.REQUEST_BURST)
@@ -38,6 +38,7 @@ def collect_backtest_data(
 
     # 디렉토리 설정
     Config.setup_directories()
+    Config.setup_rate_limit()
 
     # 진행 상황 추적 초기화
     progress_tracker = ProgressTracker()
@@ -2,12 +2,11 @@
 메타데이터 수집 모듈 (Phase 1)
 """
 
-import time
-
 import pandas as pd
 
 from pykrx import stock
 from pykrx.website.krx.market.ticker import StockTicker
+from pykrx.website.krx.market.universe import UniverseIndex
 
 from .config import Config
 from .progress_tracker import ProgressTracker
@@ -18,6 +17,9 @@ from .utils import date_to_string, retry_with_backoff, string_to_date
 class MetadataCollector:
     """메타데이터 수집 클래스"""
 
+    # 이 영업일 수마다 유니버스 색인을 저장해 중단되어도 이어서 수집
+    UNIVERSE_SAVE_INTERVAL = 50
+
     def __init__(self, progress_tracker: ProgressTracker, storage: StorageManager):
         """메타데이터 수집 초기화"""
 
@@ -32,35 +34,16 @@ class MetadataCollector:
         print(f"  기간: {Config.START_DATE} ~ {Config.END_DATE}")
         print(f"  시장: {', '.join(Config.MARKETS)}")
 
-        all_tickers = set()
-        ticker_info = {}
-
-        # 1. 모든 영업일 순회하며 티커 리스트 수집
+        # 1. 유니버스 색인에 아직 반영하지 않은 영업일만 티커 리스트 수집
         print("\n  🔍 날짜별 티커 리스트 수집 중...")
-        business_days = self._get_all_business_days()
-
-        for i, date in enumerate(business_days):
-            date_str = date_to_string(date)
-            if (i + 1) % 50 == 0:
-                print(f"    진행: {i + 1}/{len(business_days)} ({date_str})")
-
-            for market in Config.MARKETS:
-                tickers = self._get_tickers_for_date(date_str, market)
-                all_tickers.update(tickers)
-
-                # 각 티커의 정보 저장
-                for ticker in tickers:
-                    if ticker not in ticker_info:
-                        ticker_info[ticker] = {
-                            "ticker": ticker,
-                            "market": market,
-                            "first_seen_date": date_str,
-                            "last_seen_date": date_str,
-                        }
-                    else:
-                        ticker_info[ticker]["last_seen_date"] = date_str
-
-            time.sleep(Config.REQUEST_DELAY)
+        business_days = [date_to_string(d) for d in self._get_all_business_days()]
+        universe = self._update_universe(business_days)
+
+        summary = universe.summary(Config.START_DATE, Config.END_DATE, Config.MARKETS)
+        ticker_info = {
+            ticker: {"ticker": ticker, **row} for ticker, row in summary.to_dict("index").items()
+        }
+        all_tickers = set(ticker_info)
 
         print(f"\n  ✅ 총 {len(all_tickers)}개 티커 발견")
 
@@ -83,8 +66,6 @@ class MetadataCollector:
                     delisting_date=info.get("상장폐지일"),
                 )
 
-            time.sleep(Config.REQUEST_DELAY * 0.5)  # 메타데이터 조회는 더 짧은 딜레이
-
         # 3. DataFrame 생성
         metadata_df = pd.DataFrame(metadata_list)
 
@@ -101,6 +82,24 @@ class MetadataCollector:
 
         return metadata_df
 
+    def _update_universe(self, business_days: list[str]) -> UniverseIndex:
+        """저장된 유니버스 색인을 읽어 새 영업일만 반영하고 저장"""
+
+        universe = UniverseIndex.load(Config.UNIVERSE_PATH)
+        if universe.dates and business_days and business_days[0] < universe.dates[0]:
+            # 수집 시작일이 색인보다 앞이면 처음부터 다시 만든다.
+            universe = UniverseIndex()
+
+        last = universe.last_date or ""
+        pending = [d for d in business_days if d > last]
+        print(f"    색인 반영: {len(business_days) - len(pending)}일, 새로 조회: {len(pending)}일")
+        for i in range(0, len(pending), self.UNIVERSE_SAVE_INTERVAL):
+            chunk = pending[i : i + self.UNIVERSE_SAVE_INTERVAL]
+            universe.sync(chunk, Config.MARKETS, self._get_tickers_for_date)
+            universe.save(Config.UNIVERSE_PATH)
+            print(f"    진행: {i + len(chunk)}/{len(pending)} ({chunk[-1]})")
+        return universe
+
     def _get_all_business_days(self) -> list[pd.Timestamp]:
         """전체 영업일 리스트 수집"""
 
@@ -127,7 +126,6 @@ class MetadataCollector:
                     for day in days:
                         if start_date <= day <= end_date:
                             business_days.append(day)
-                    time.sleep(Config.REQUEST_DELAY * 0.5)
                 except Exception as e:
                     print(f"  ⚠️  {current_year}-{month:02d} 영업일 수집 실패: {e}")
 
@@ -2,7 +2,6 @@
 OHLCV 데이터 수집 모듈 (Phase 2)
 """
 
-import time
 from multiprocessing import Pool
 
 import pandas as pd
@@ -63,7 +62,6 @@ class OHLCVCollector:
         for i, ticker in enumerate(tickers, 1):
             print(f"\n  [{i}/{total}] 티커: {ticker}")
             self._collect_ticker_ohlcv(ticker)
-            time.sleep(Config.REQUEST_DELAY)
 
     def _collect_with_multiprocessing(self, tickers: list[str]):
         """멀티프로세싱으로 OHLCV 데이터 수집"""
@@ -85,8 +83,6 @@ class OHLCVCollector:
             failed = sum(1 for r in results if r is False)
             print(f"    완료: {completed}, 실패: {failed}")
 
-            time.sleep(Config.REQUEST_DELAY * 2)  # 배치 간 딜레이
-
     @staticmethod
     def _collect_ticker_ohlcv_wrapper(ticker: str) -> bool:
         """멀티프로세싱용 래퍼 함수"""
@@ -95,6 +91,9 @@ class OHLCVCollector:
         from .progress_tracker import ProgressTracker
         from .storage import StorageManager
 
+        # spawn 방식의 워커는 부모의 한도 설정을 물려받지 않는다.
+        Config.setup_rate_limit()
+
         progress_tracker = ProgressTracker()
         storage = StorageManager()
 
@@ -155,9 +154,6 @@ class OHLCVCollector:
                         print(f"      [{year}] ⚠️  데이터 없음")
                         failed_years.append(year)
 
-                    # 연도 간 딜레이
-                    time.sleep(Config.REQUEST_DELAY)
-
                 except Exception as e:
                     print(f"      [{year}] ❌ 수집 실패: {e}")
                     failed_years.append(year)
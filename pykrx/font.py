@@ -0,0 +1,111 @@
+"""matplotlib 한글 글꼴 설정
+
+matplotlib은 그래프를 그릴 때만 필요하므로 `import pykrx`에서 불러오지 않는다.
+한글 제목/축 이름을 사용하려면 그래프를 그리기 전에 한 번 호출한다.
+
+    >> import pykrx
+    >> pykrx.setup_font()
+    >> df["종가"].plot(title="삼성전자")
+
+`import pykrx` 전후에 관계없이 matplotlib.pyplot을 불러오면 자동으로 설정된다.
+`import pykrx`는 matplotlib.pyplot을 처음 불러오는 시점을 감지하는 import hook만
+등록하므로, 그래프를 그리지 않는 프로세스는 matplotlib을 불러오지 않는다.
+"""
+
+import sys
+import threading
+
+_lock = threading.Lock()
+_configured = False
+
+
+def setup_font(force: bool = False) -> str:
+    """matplotlib 기본 글꼴을 한글 글꼴로 설정
+
+    macOS는 AppleGothic, 그 밖의 OS는 pykrx에 포함된 NanumBarunGothic을 등록해서 사용한다.
+
+    Args:
+        force (bool, optional): True면 이미 설정했더라도 다시 설정
+
+    Returns:
+        str: 설정된 글꼴 이름
+    """
+    global _configured
+    import importlib.resources as resources
+    import platform
+
+    import matplotlib.font_manager as fm
+    import matplotlib.pyplot as plt
+
+    with _lock:
+        if _configured and not force:
+            return plt.rcParams["font.family"][0]
+
+        if platform.system() == "Darwin":
+            family = "AppleGothic"
+        else:
+            font = resources.files("pykrx") / "NanumBarunGothic.ttf"
+            with resources.as_file(font) as font_path:
+                fe = fm.FontEntry(fname=str(font_path), name="NanumBarunGothic")
+            if all(f.name != fe.name for f in fm.fontManager.ttflist):
+                fm.fontManager.ttflist.insert(0, fe)
+            family = fe.name
+
+        plt.rc("font", family=family)
+        plt.rcParams["axes.unicode_minus"] = False
+        _configured = True
+        return family
+
+
+def install_pyplot_hook():
+    """matplotlib.pyplot을 불러올 때 setup_font를 실행하도록 설정
+
+    이미 불러왔으면 바로 설정한다. 여러 번 호출해도 hook은 하나만 등록된다.
+    """
+    if "matplotlib.pyplot" in sys.modules:
+        _setup_quietly()
+    elif not any(isinstance(finder, _PyplotFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _PyplotFinder())
+
+
+def _setup_quietly():
+    try:
+        setup_font()
+    except Exception:  # 글꼴 설정 실패가 그래프 그리기를 막지 않도록 한다.
+        import logging
+
+        logging.getLogger(__name__).warning("Korean font setup failed", exc_info=True)
+
+
+# import pykrx를 가볍게 유지하기 위해 importlib.abc를 상속하지 않고 프로토콜만 구현한다.
+class _PyplotFinder:
+    """matplotlib.pyplot의 spec에 글꼴 설정을 끼워 넣는 일회용 meta path finder"""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "matplotlib.pyplot":
+            return None
+        sys.meta_path[:] = [finder for finder in sys.meta_path if finder is not self]
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            spec = find_spec(fullname, path, target) if find_spec is not None else None
+            if spec is not None:
+                if spec.loader is not None:
+                    spec.loader = _SetupFontLoader(spec.loader)
+                return spec
+        return None
+
+
+class _SetupFontLoader:
+    """원래 loader로 모듈을 실행한 뒤 setup_font를 호출"""
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        # 모듈에는 원래 loader가 보이도록 되돌린다.
+        module.__loader__ = module.__spec__.loader = self.loader
+        self.loader.exec_module(module)
+        _setup_quietly()
@@ -8,7 +8,10 @@ from .stock_api import *  # noqa: F403, F405
 from .stock_business_days import (
     get_nearest_business_day_in_a_week,
     get_previous_business_days,
+    get_trading_calendar,
 )
+from .stock_etf_pdf import get_etf_portfolio_deposit_file_history
+from .stock_index_history import get_index_portfolio_history
 from .stock_market_cap import (
     get_market_cap,
     get_market_cap_by_date,
@@ -18,7 +21,10 @@ from .stock_ohlcv import (
     get_market_ohlcv,
     get_market_ohlcv_by_date,
     get_market_ohlcv_by_ticker,
+    get_market_ohlcv_panel,
+    plan_market_ohlcv_panel,
 )
+from .stock_snapshots import iter_snapshots, write_snapshots_parquet
 from .stock_ticker import get_market_ticker_list, get_market_ticker_name
 
 # 개별 모듈에서도 직접 import 가능
@@ -32,6 +38,7 @@ __all__ = [  # noqa: F405
     # 영업일
     "get_nearest_business_day_in_a_week",
     "get_previous_business_days",
+    "get_trading_calendar",
     # 티커
     "get_market_ticker_list",
     "get_market_ticker_name",
@@ -39,6 +46,11 @@ __all__ = [  # noqa: F405
     "get_market_ohlcv",
     "get_market_ohlcv_by_date",
     "get_market_ohlcv_by_ticker",
+    "get_market_ohlcv_panel",
+    "plan_market_ohlcv_panel",
+    # 기간 스냅샷
+    "iter_snapshots",
+    "write_snapshots_parquet",
     # 시가총액
     "get_market_cap",
     "get_market_cap_by_date",
@@ -75,6 +87,7 @@ __all__ = [  # noqa: F405
     "get_index_listing_date",
     "get_index_price_change_by_ticker",
     "get_index_portfolio_deposit_file",
+    "get_index_portfolio_history",
     # ETF/ETN/ELW
     "get_etf_ticker_list",
     "get_etn_ticker_list",
@@ -83,6 +96,7 @@ __all__ = [  # noqa: F405
     "get_etf_ohlcv_by_ticker",
     "get_etf_price_change_by_ticker",
     "get_etf_portfolio_deposit_file",
+    "get_etf_portfolio_deposit_file_history",
     "get_etf_trading_volume_and_value",
     # 투자자별 순매수 상위종목
     "get_market_net_purchases_of_equities_by_ticker",
@@ -0,0 +1,42 @@
+"""
+pykrx.stock의 asyncio API
+
+pykrx.stock에 공개된 모든 조회 함수를 같은 이름, 같은 인자의 코루틴 함수로
+제공한다. 각 호출은 워커 스레드에서 실행되며, 동시에 upstream으로 나가는
+요청 수는 `set_concurrency_limit`으로 설정한 공유 한도를 넘지 않는다.
+
+    >> import asyncio
+    >> from pykrx.stock import aio
+    >>
+    >> async def main():
+    >>     tickers = ["005930", "000660", "035420"]
+    >>     return await asyncio.gather(
+    >>         *[aio.get_market_ohlcv("20240102", "20240131", t) for t in tickers]
+    >>     )
+"""
+
+import pykrx.stock as _stock
+from pykrx.website.comm.aio import (
+    get_concurrency_limit,
+    run_blocking,
+    set_concurrency_limit,
+    to_async,
+)
+
+# 네트워크를 사용하지 않는 유틸리티는 비동기 버전을 만들지 않는다.
+_SYNC_ONLY = {
+    "iter_snapshots",
+    "market_valid_check",
+    "resample_ohlcv",
+    "write_snapshots_parquet",
+}
+
+__all__ = ["get_concurrency_limit", "run_blocking", "set_concurrency_limit"]
+
+for _name in _stock.__all__:
+    if _name in _SYNC_ONLY:
+        continue
+    globals()[_name] = to_async(getattr(_stock, _name))
+    __all__.append(_name)
+
+del _name
@@ -102,6 +102,7 @@ from pykrx.website.krx.market.wrap import (
     get_shorting_volume_top50 as _get_shorting_volume_top50,
 )
 
+from .stock_batch import fetch_by_tickers, is_ticker_list, strict
 from .stock_business_days import (
     get_nearest_business_day_in_a_week,
     get_previous_business_days,
@@ -264,20 +265,29 @@ def get_elw_ticker_list(date: str | None = None) -> list:
     return get_etx_ticker_list(date, "ELW")
 
 
-def get_etf_ohlcv_by_date(fromdate: str, todate: str, ticker: str, freq: str = "d") -> "DataFrame":
+def get_etf_ohlcv_by_date(
+    fromdate: str, todate: str, ticker: str | list, freq: str = "d"
+) -> "DataFrame":
     """ETF OHLCV 조회 (일자별)
 
     Args:
-        fromdate (str): 조회 시작 일자 (YYYYMMDD)
-        todate   (str): 조회 종료 일자 (YYYYMMDD)
-        ticker   (str): ETF 티커
+        fromdate (str        ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str        ): 조회 종료 일자 (YYYYMMDD)
+        ticker   (str or list): ETF 티커. 목록이면 종목별로 동시에 조회
         freq     (str, optional): 리샘플링 주기 (d/m/y). 기본값은 'd'
 
     Returns:
-        DataFrame: ETF OHLCV 데이터
+        DataFrame: ETF OHLCV 데이터. ticker가 목록이면 (티커, 날짜) MultiIndex
     """
-    df = _get_etf_ohlcv_by_date(fromdate, todate, ticker)
+    if is_ticker_list(ticker):
+        fetch = strict(_get_etf_ohlcv_by_date)
+        return fetch_by_tickers(
+            lambda t: _resample_etf_ohlcv(fetch(fromdate, todate, t), freq), ticker
+        )
+    return _resample_etf_ohlcv(_get_etf_ohlcv_by_date(fromdate, todate, ticker), freq)
+
 
+def _resample_etf_ohlcv(df: "DataFrame", freq: str) -> "DataFrame":
     if freq != "d" and len(df) > 0:
         how = {
             "NAV": "last",
@@ -383,20 +393,28 @@ def get_market_price_change_by_ticker(
 
 
 def get_market_fundamental_by_date(
-    fromdate: str, todate: str, ticker: str, freq: str = "d"
+    fromdate: str, todate: str, ticker: str | list, freq: str = "d"
 ) -> "DataFrame":
     """시장 펀더멘털 조회 (일자별)
 
     Args:
-        fromdate (str): 조회 시작 일자 (YYYYMMDD)
-        todate   (str): 조회 종료 일자 (YYYYMMDD)
-        ticker   (str): 종목 티커
+        fromdate (str        ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str        ): 조회 종료 일자 (YYYYMMDD)
+        ticker   (str or list): 종목 티커. 목록이면 종목별로 동시에 조회
         freq     (str, optional): 리샘플링 주기 (d/m/y). 기본값은 "d"
 
     Returns:
-        DataFrame: 시장 펀더멘털 데이터
+        DataFrame: 시장 펀더멘털 데이터. ticker가 목록이면 (티커, 날짜) MultiIndex
     """
-    df = _get_market_fundamental_by_date(fromdate, todate, ticker)
+    if is_ticker_list(ticker):
+        fetch = strict(_get_market_fundamental_by_date)
+        return fetch_by_tickers(
+            lambda t: _resample_fundamental(fetch(fromdate, todate, t), freq), ticker
+        )
+    return _resample_fundamental(_get_market_fundamental_by_date(fromdate, todate, ticker), freq)
+
+
+def _resample_fundamental(df: "DataFrame", freq: str) -> "DataFrame":
     if freq != "d" and len(df) > 0:
         how = {
             "BPS": "last",
@@ -602,18 +620,21 @@ def get_exhaustion_rates_of_foreign_investment_by_ticker(
 
 
 def get_exhaustion_rates_of_foreign_investment_by_date(
-    fromdate: str, todate: str, ticker: str
+    fromdate: str, todate: str, ticker: str | list
 ) -> "DataFrame":
     """외국인보유제한 한도소진률 조회 (일자별)
 
     Args:
-        fromdate (str): 조회 시작 일자 (YYYYMMDD)
-        todate   (str): 조회 종료 일자 (YYYYMMDD)
-        ticker   (str): 종목 티커
+        fromdate (str        ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str        ): 조회 종료 일자 (YYYYMMDD)
+        ticker   (str or list): 종목 티커. 목록이면 종목별로 동시에 조회
 
     Returns:
-        DataFrame: 외국인보유제한 한도소진률 데이터
+        DataFrame: 외국인보유제한 한도소진률 데이터. ticker가 목록이면 (티커, 날짜) MultiIndex
     """
+    if is_ticker_list(ticker):
+        fetch = strict(_get_exhaustion_rates_of_foreign_investment_by_date)
+        return fetch_by_tickers(lambda t: fetch(fromdate, todate, t), ticker)
     return _get_exhaustion_rates_of_foreign_investment_by_date(fromdate, todate, ticker)
 
 
@@ -635,17 +656,20 @@ def get_market_net_purchases_of_equities_by_ticker(
 
 
 # 공매도 관련 wrapper 함수들
-def get_shorting_status_by_date(fromdate: str, todate: str, ticker: str) -> "DataFrame":
+def get_shorting_status_by_date(fromdate: str, todate: str, ticker: str | list) -> "DataFrame":
     """공매도 종합 현황 조회 (일자별)
 
     Args:
-        fromdate (str): 조회 시작 일자 (YYYYMMDD)
-        todate   (str): 조회 종료 일자 (YYYYMMDD)
-        ticker   (str): 종목 티커
+        fromdate (str        ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str        ): 조회 종료 일자 (YYYYMMDD)
+        ticker   (str or list): 종목 티커. 목록이면 종목별로 동시에 조회
 
     Returns:
-        DataFrame: 공매도 종합 현황 데이터
+        DataFrame: 공매도 종합 현황 데이터. ticker가 목록이면 (티커, 날짜) MultiIndex
     """
+    if is_ticker_list(ticker):
+        fetch = strict(_get_shorting_status_by_date)
+        return fetch_by_tickers(lambda t: fetch(fromdate, todate, t), ticker)
     return _get_shorting_status_by_date(fromdate, todate, ticker)
 
 
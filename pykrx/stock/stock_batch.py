@@ -0,0 +1,90 @@
+"""
+여러 종목의 일자별 조회를 한 번에 실행하는 함수들
+
+종목 하나를 받는 일자별 조회 함수에 티커 목록을 넘기면 종목별 조회를 동시에
+실행하고 (티커, 날짜) MultiIndex DataFrame 하나로 합친다.
+
+- 동시 요청 수는 set_concurrency_limit, 요청 속도는 configure_rate_limit 한도를 따른다.
+- 조회에 실패한 종목은 결과에서 빠지고 `df.attrs["errors"]`에 {티커: 예외}로 남는다.
+  나머지 종목의 결과는 그대로 반환한다.
+
+    >> df = stock.get_market_cap_by_date("20240102", "20240131", ["005930", "000660"])
+    >> df.loc["005930"]
+    >> df.attrs["errors"]
+"""
+
+import contextvars
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.comm import memoize
+from pykrx.website.comm.aio import get_concurrency_limit
+
+
+def is_ticker_list(ticker) -> bool:
+    return not isinstance(ticker, str) and ticker is not None
+
+
+def strict(func):
+    """wrap 함수에서 dataframe_empty_handler를 걷어내 조회 실패를 예외로 받는 함수
+
+    메모이제이션 키는 함수 이름으로 만들므로 원래 wrap 함수와 캐시를 공유한다.
+    """
+    return memoize(inspect.unwrap(func))
+
+
+def run_concurrently(func, items) -> list:
+    """items마다 func를 공유 동시 실행 한도 안에서 스레드로 실행한 결과 목록"""
+    if not items:
+        return []
+    workers = min(get_concurrency_limit(), len(items))
+    with ThreadPoolExecutor(workers) as executor:
+        # 계측 중인 호출(contextvars)이 작업 스레드에서도 보이도록 context를 복사
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+        return [f.result() for f in futures]
+
+
+def run_each(func, items) -> tuple[list, dict]:
+    """run_concurrently와 같지만 item 하나의 실패가 나머지 결과를 버리지 않음
+
+    Returns:
+        tuple: (결과 목록, {item: 예외}). 실패한 item의 결과는 None
+    """
+
+    def run(item):
+        try:
+            return func(item), None
+        except Exception as e:
+            logging.warning(f"{item}: {e!r}")
+            return None, e
+
+    results = run_concurrently(run, items)
+    errors = {item: e for item, (_, e) in zip(items, results) if e is not None}
+    return [result for result, _ in results], errors
+
+
+def fetch_by_tickers(func, tickers) -> DataFrame:
+    """티커마다 func(ticker)를 동시에 실행해 (티커, 날짜) MultiIndex DataFrame으로 합침
+
+    Args:
+        func    (callable): func(ticker) -> 일자별 DataFrame
+        tickers (list    ): 티커 목록
+
+    Returns:
+        DataFrame: 성공한 종목의 결과. 실패한 종목은 attrs["errors"]에 {티커: 예외}로 기록
+    """
+    tickers = list(dict.fromkeys(tickers))
+    results, errors = run_each(func, tickers)
+    frames = {t: df for t, df in zip(tickers, results) if df is not None and not df.empty}
+
+    if frames:
+        first = next(iter(frames.values()))
+        df = pd.concat(frames, names=["티커", first.index.name])
+    else:
+        df = DataFrame()
+    df.attrs["errors"] = errors
+    return df
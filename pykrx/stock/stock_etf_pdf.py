@@ -0,0 +1,313 @@
+"""
+ETF PDF(Portfolio Deposit File) 이력
+
+get_etf_portfolio_deposit_file은 ETF 하나의 하루치 구성 종목을 반환한다. 여러 ETF의
+기간 PDF를 한 번에 수집하고, 매일의 구성 종목 전체 대신 변경분만 저장한다.
+
+- 수집: 영업일마다 ETF들의 PDF를 공유 동시 실행 한도 안에서 동시에 조회한다.
+  조회에 실패한 (ETF, 날짜)는 건너뛰고 `errors`에 남는다.
+- 저장: ETF마다 `checkpoint`번째 관측일마다 구성 종목 전체(스냅샷)를 저장하고, 그
+  사이의 날짜에는 값이 바뀐 구성 종목과 편출된 구성 종목만 저장한다. 비교하는 값은
+  `columns`이다. 금액(VALU_AMT)은 가격에 따라 매일 바뀌므로 기본값에서 제외한다.
+- 복원: (ETF, 날짜)의 구성 종목은 가장 가까운 스냅샷과 그 뒤 최대
+  `checkpoint - 1`일의 변경분만 읽어서 만든다.
+
+    >> history = stock.get_etf_portfolio_deposit_file_history(["069500", "102110"], "20240102", "20240628")
+    >> history.basket("069500", "20240315")
+    >> history.compression
+    >> history.save("etf_pdf.npz")
+"""
+
+import logging
+import math
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.comm.aio import get_concurrency_limit
+from pykrx.website.krx.etx.wrap import (
+    get_etf_portfolio_deposit_file as _get_etf_portfolio_deposit_file,
+)
+from pykrx.website.krx.market.calendar import get_trading_calendar
+
+from .stock_batch import run_concurrently, strict
+
+FORMAT_VERSION = 1
+PDF_COLUMNS = ("계약수", "금액", "비중")
+
+
+class EtfPdfHistory:
+    """스냅샷과 변경분으로 저장한 ETF PDF 이력
+
+    Args:
+        columns    (tuple, optional): 저장하고 비교할 열. 기본값은 ("계약수", "비중")
+        checkpoint (int  , optional): 스냅샷을 저장하는 관측일 간격. 기본값은 20
+    """
+
+    def __init__(self, columns=("계약수", "비중"), checkpoint: int = 20):
+        columns = tuple(columns)
+        if not columns or any(c not in PDF_COLUMNS for c in columns):
+            raise ValueError(f"columns must be a subset of {PDF_COLUMNS}: {columns}")
+        if checkpoint < 1:
+            raise ValueError("checkpoint must be >= 1")
+        self.columns = columns
+        self.checkpoint = checkpoint
+        self.errors = {}
+        self.full_rows = 0  # 매일 전체를 저장했을 때의 행 수
+
+        self._chunks = []  # add로 추가한 레코드
+        self._observed = {}  # ETF -> [(날짜, 스냅샷 여부), ...]
+        self._last = {}  # ETF -> 마지막 관측일의 구성 종목
+        self._records = None  # ETF, 날짜 순으로 정렬한 레코드 (조회할 때 만든다)
+        self._slices = {}
+
+    def __repr__(self):
+        return (
+            f"EtfPdfHistory(etfs={len(self._observed)}, rows={len(self.records)}, "
+            f"full_rows={self.full_rows})"
+        )
+
+    # ------------------------------------------------------------------------------------------
+    # 추가
+    # ------------------------------------------------------------------------------------------
+
+    def add(self, etf: str, date, basket: DataFrame):
+        """etf의 date 구성 종목을 추가. 날짜는 ETF마다 이전 관측일보다 뒤여야 한다.
+
+        Args:
+            etf    (str      ): ETF 티커
+            date   (str      ): 관측 일자 (YYYYMMDD)
+            basket (DataFrame): get_etf_portfolio_deposit_file 결과 (index: 구성 종목 티커)
+        """
+        day = pd.Timestamp(date).as_unit("ns")
+        observed = self._observed.setdefault(etf, [])
+        if observed and day <= observed[-1][0]:
+            raise ValueError(f"{etf}: {date} is not after {observed[-1][0]:%Y%m%d}")
+
+        basket = basket[list(self.columns)].astype(np.float64)
+        if basket.index.has_duplicates:
+            # 현금 등 단축코드가 같은 구성 종목은 합쳐서 하나로 저장한다.
+            basket = basket.groupby(level=0, sort=False).sum(min_count=1)
+        self.full_rows += len(basket)
+
+        previous = self._last.get(etf)
+        since = next((i for i, (_, snapshot) in enumerate(reversed(observed)) if snapshot), None)
+        snapshot = previous is None or since is None or since + 1 >= self.checkpoint
+        rows = basket.assign(편출=False) if snapshot else _diff(previous, basket)
+        observed.append((day, snapshot))
+        self._last[etf] = basket
+
+        if len(rows):
+            rows = rows.reset_index()
+            rows.insert(0, "날짜", day)
+            rows.insert(0, "ETF", etf)
+            self._chunks.append(rows)
+            self._records = None
+
+    @property
+    def records(self) -> DataFrame:
+        """저장한 레코드 (ETF, 날짜, 티커, columns..., 편출)"""
+        if self._records is None:
+            frames = self._chunks
+            if not frames:
+                frames = [DataFrame(columns=["ETF", "날짜", "티커", *self.columns, "편출"])]
+            records = pd.concat(frames, ignore_index=True)
+            records = records.sort_values(["ETF", "날짜"], kind="stable", ignore_index=True)
+            self._chunks = [records]
+            self._records = records
+            etfs = records["ETF"].to_numpy()
+            bounds = np.flatnonzero(np.r_[True, etfs[1:] != etfs[:-1], True])
+            self._slices = {
+                etfs[start]: (start, stop) for start, stop in zip(bounds[:-1], bounds[1:])
+            }
+        return self._records
+
+    @property
+    def compression(self) -> float:
+        """저장한 행 수 / 매일 전체를 저장했을 때의 행 수"""
+        return len(self.records) / self.full_rows if self.full_rows else 0.0
+
+    def etfs(self) -> list:
+        return list(self._observed)
+
+    def dates(self, etf: str) -> pd.DatetimeIndex:
+        """etf의 관측일"""
+        return pd.DatetimeIndex([day for day, _ in self._observed.get(etf, [])], name="날짜")
+
+    # ------------------------------------------------------------------------------------------
+    # 복원
+    # ------------------------------------------------------------------------------------------
+
+    def basket(self, etf: str, date) -> DataFrame:
+        """date 이전 가장 가까운 관측일의 etf 구성 종목
+
+        Args:
+            etf  (str): ETF 티커
+            date (str): 조회 일자 (YYYYMMDD)
+
+        Returns:
+            DataFrame: index는 구성 종목 티커, 열은 columns. 관측일이 없으면 빈 DataFrame
+        """
+        observed = self._observed.get(etf, [])
+        days = np.array([day.to_datetime64() for day, _ in observed], dtype="datetime64[ns]")
+        i = int(np.searchsorted(days, pd.Timestamp(date).to_datetime64(), side="right")) - 1
+        if i < 0:
+            return DataFrame(columns=list(self.columns), index=pd.Index([], name="티커"))
+        c = i
+        while not observed[c][1]:
+            c -= 1
+
+        records = self.records
+        start, stop = self._slices.get(etf, (0, 0))
+        dates = records["날짜"].to_numpy()[start:stop]
+        lo = start + int(np.searchsorted(dates, days[c], side="left"))
+        hi = start + int(np.searchsorted(dates, days[i], side="right"))
+        rows = records.iloc[lo:hi]
+        # 스냅샷 순서를 유지하면서 종목마다 마지막 레코드만 남긴다.
+        order = pd.unique(rows["티커"].to_numpy())
+        last = rows.drop_duplicates("티커", keep="last").set_index("티커").reindex(order)
+        last = last[~last["편출"].to_numpy(dtype=bool)]
+        return last[list(self.columns)]
+
+    # ------------------------------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------------------------------
+
+    def save(self, path):
+        """레코드와 관측일을 npz 파일로 저장. 임시 파일에 쓴 뒤 교체한다."""
+        records = self.records
+        observed = [(etf, day, snap) for etf, obs in self._observed.items() for day, snap in obs]
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    version=np.array([FORMAT_VERSION]),
+                    columns=np.array(self.columns),
+                    checkpoint=np.array([self.checkpoint]),
+                    full_rows=np.array([self.full_rows]),
+                    etf=records["ETF"].to_numpy(dtype=str),
+                    day=_to_days(records["날짜"]),
+                    ticker=records["티커"].to_numpy(dtype=str),
+                    values=records[list(self.columns)].to_numpy(dtype=np.float64),
+                    removed=records["편출"].to_numpy(dtype=bool),
+                    observed_etf=np.array([etf for etf, _, _ in observed], dtype=str),
+                    observed_day=_to_days(pd.DatetimeIndex([day for _, day, _ in observed])),
+                    observed_snapshot=np.array([snap for _, _, snap in observed], dtype=bool),
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path) -> "EtfPdfHistory":
+        """save로 저장한 파일을 읽음. 형식 버전이 다르면 ValueError"""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"][0]) != FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported format version")
+            history = cls([str(c) for c in data["columns"]], int(data["checkpoint"][0]))
+            history.full_rows = int(data["full_rows"][0])
+            records = DataFrame(
+                {
+                    "ETF": data["etf"].astype(object),
+                    "날짜": _from_days(data["day"]),
+                    "티커": data["ticker"].astype(object),
+                }
+            )
+            records[list(history.columns)] = data["values"]
+            records["편출"] = data["removed"]
+            days = _from_days(data["observed_day"])
+            for etf, day, snap in zip(data["observed_etf"], days, data["observed_snapshot"]):
+                history._observed.setdefault(str(etf), []).append((day, bool(snap)))
+        history._chunks = [records]
+        # 이어서 추가할 수 있도록 ETF마다 마지막 관측일의 구성 종목을 복원한다.
+        for etf, observed in history._observed.items():
+            history._last[etf] = history.basket(etf, observed[-1][0])
+        return history
+
+
+def _diff(previous: DataFrame, basket: DataFrame) -> DataFrame:
+    """previous에서 basket으로 바뀐 구성 종목. 편출된 종목은 값이 NaN이고 편출이 True"""
+    union = previous.index.append(basket.index.difference(previous.index, sort=False))
+    before = previous.reindex(union).to_numpy()
+    after = basket.reindex(union).to_numpy()
+    same = (before == after) | (np.isnan(before) & np.isnan(after))
+    removed = ~union.isin(basket.index)
+    changed = ~same.all(axis=1) | removed
+    rows = DataFrame(after[changed], index=union[changed], columns=basket.columns)
+    rows.index.name = "티커"
+    return rows.assign(편출=removed[changed])
+
+
+def _to_days(dates) -> np.ndarray:
+    return np.asarray(dates, dtype="datetime64[ns]").astype("datetime64[D]").astype(np.int32)
+
+
+def _from_days(days) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(np.asarray(days).astype("datetime64[D]").astype("datetime64[ns]"))
+
+
+def get_etf_portfolio_deposit_file_history(
+    tickers,
+    fromdate: str,
+    todate: str,
+    columns=("계약수", "비중"),
+    checkpoint: int = 20,
+    history: EtfPdfHistory | None = None,
+) -> EtfPdfHistory:
+    """여러 ETF의 기간 PDF를 수집해서 변경분으로 저장
+
+    Args:
+        tickers    (list                   ): ETF 티커 목록 (티커 하나도 가능)
+        fromdate   (str                    ): 조회 시작 일자 (YYYYMMDD)
+        todate     (str                    ): 조회 종료 일자 (YYYYMMDD)
+        columns    (tuple        , optional): 저장하고 비교할 열. 기본값은 ("계약수", "비중")
+        checkpoint (int          , optional): 스냅샷을 저장하는 관측일 간격. 기본값은 20
+        history    (EtfPdfHistory, optional): 이어서 저장할 이력. 지정하면 columns,
+                                              checkpoint는 history의 설정을 따른다.
+
+    Returns:
+        EtfPdfHistory: PDF 이력. 조회에 실패한 (ETF, 날짜)는 errors에 {(티커, 날짜): 예외}로 기록
+
+        >> history = get_etf_portfolio_deposit_file_history(["069500"], "20240102", "20240131")
+        >> history.basket("069500", "20240115").head(3)
+                    계약수    비중
+        티커
+        005930   3474.0  30.27
+        000660    420.0   9.51
+        373220     31.0   2.64
+    """
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    tickers = list(dict.fromkeys(tickers))
+    if history is None:
+        history = EtfPdfHistory(columns, checkpoint)
+    sessions = get_trading_calendar().sessions(fromdate.replace("-", ""), todate.replace("-", ""))
+    fetch = strict(_get_etf_portfolio_deposit_file)
+
+    def run(item):
+        date, ticker = item
+        try:
+            return fetch(date, ticker), None
+        except Exception as e:  # 한 건의 실패가 나머지 결과를 버리지 않도록 한다.
+            logging.warning(f"{ticker}({date}): {e!r}")
+            return None, e
+
+    # 동시 실행 한도를 채울 만큼의 영업일을 묶어서 조회하고 날짜 순서대로 추가한다.
+    block = max(1, math.ceil(get_concurrency_limit() / max(len(tickers), 1)))
+    dates = [day.strftime("%Y%m%d") for day in sessions]
+    for i in range(0, len(dates), block):
+        items = [(date, ticker) for date in dates[i : i + block] for ticker in tickers]
+        for (date, ticker), (df, error) in zip(items, run_concurrently(run, items)):
+            if error is not None:
+                history.errors[(ticker, date)] = error
+            elif df is not None and not df.empty:
+                history.add(ticker, date, df)
+    return history
@@ -0,0 +1,261 @@
+"""
+지수 구성 종목 이력
+
+get_index_portfolio_deposit_file은 하루치 구성 종목만 반환한다. 기간의 구성 종목
+이력을 매 영업일 조회하지 않고 변경일 주변만 조회해서 편입/편출 이벤트로 저장한다.
+
+- 조회: `max_interval` 영업일 간격으로 구성 종목을 조회하고, 양 끝의 구성 종목이
+  다른 구간만 이분 탐색해서 변경일을 찾는다. 구간 양 끝의 구성 종목이 같으면 그
+  사이에 바뀌지 않은 것으로 본다 (구간 안에서 편출 후 재편입된 경우는 찾지 못함).
+- 저장: 첫 영업일의 구성 종목을 편입으로 기록하고 이후에는 변경분만 기록한다.
+  특정 일자의 구성 종목은 이진 탐색으로 변경일을 찾은 뒤 가까운 기준점에서
+  최대 `_KEYFRAME`개 변경일만 적용해서 구한다.
+
+    >> history = stock.get_index_portfolio_history("1028", "20150101", "20231231")
+    >> history.events
+    >> history.as_of("20200615")
+    >> history.save("kospi200.npz")
+"""
+
+import bisect
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.krx.market.calendar import get_trading_calendar
+from pykrx.website.krx.market.wrap import (
+    get_index_portfolio_deposit_file as _get_index_portfolio_deposit_file,
+)
+
+from .stock_batch import run_concurrently, strict
+
+FORMAT_VERSION = 1
+# as_of가 기준점에서 적용하는 최대 변경일 수
+_KEYFRAME = 16
+
+
+class IndexPortfolioHistory:
+    """편입/편출 이벤트로 저장한 지수 구성 종목 이력
+
+    Args:
+        ticker   (str      ): 지수 티커
+        fromdate (str      ): 이력 시작 일자 (YYYYMMDD)
+        todate   (str      ): 이력 종료 일자 (YYYYMMDD)
+        events   (DataFrame): 날짜, 티커, 편입(bool) 열. 첫 날짜의 편입은 시작일의 구성 종목
+    """
+
+    def __init__(self, ticker: str, fromdate: str, todate: str, events: DataFrame):
+        self.ticker = ticker
+        self.fromdate = fromdate
+        self.todate = todate
+
+        events = events.sort_values("날짜", kind="stable").reset_index(drop=True)
+        self._days = events["날짜"].values.astype("datetime64[D]")
+        self._tickers = events["티커"].to_numpy(dtype=object)
+        self._added = events["편입"].to_numpy(dtype=bool)
+
+        # 변경일별 이벤트 범위와 _KEYFRAME개 변경일마다의 구성 종목
+        self._change_days, self._starts = np.unique(self._days, return_index=True)
+        self._ends = np.append(self._starts[1:], len(self._days))
+        self._keyframes = []
+        members = set()
+        for k in range(len(self._change_days)):
+            if k % _KEYFRAME == 0:
+                self._keyframes.append(frozenset(members))
+            self._apply(members, k)
+
+        # 종목별 이벤트 날짜. contains는 종목의 이벤트만 이진 탐색한다.
+        self._by_ticker = {}
+        for ticker_, day, added in zip(self._tickers, self._days, self._added):
+            days, flags = self._by_ticker.setdefault(ticker_, ([], []))
+            days.append(day)
+            flags.append(added)
+
+    def __repr__(self):
+        return (
+            f"IndexPortfolioHistory({self.ticker}, {self.fromdate}~{self.todate}, "
+            f"changes={max(len(self._change_days) - 1, 0)})"
+        )
+
+    def __len__(self):
+        return len(self._days)
+
+    def _apply(self, members: set, k: int):
+        for i in range(self._starts[k], self._ends[k]):
+            if self._added[i]:
+                members.add(self._tickers[i])
+            else:
+                members.discard(self._tickers[i])
+
+    def _day(self, date) -> np.datetime64:
+        day = pd.Timestamp(date).to_datetime64().astype("datetime64[D]")
+        lo = pd.Timestamp(self.fromdate).to_datetime64().astype("datetime64[D]")
+        hi = pd.Timestamp(self.todate).to_datetime64().astype("datetime64[D]")
+        if not lo <= day <= hi:
+            raise ValueError(f"{date} is outside the history ({self.fromdate}~{self.todate})")
+        return day
+
+    @property
+    def events(self) -> DataFrame:
+        """편입/편출 이벤트 (날짜, 티커, 편입)"""
+        return DataFrame(
+            {
+                "날짜": pd.DatetimeIndex(self._days.astype("datetime64[ns]")),
+                "티커": self._tickers,
+                "편입": self._added,
+            }
+        )
+
+    @property
+    def changes(self) -> pd.DatetimeIndex:
+        """구성 종목이 바뀐 날짜 (시작일 제외)"""
+        return pd.DatetimeIndex(self._change_days[1:].astype("datetime64[ns]"), name="날짜")
+
+    def as_of(self, date) -> list:
+        """date의 구성 종목
+
+        Args:
+            date (str): 조회 일자 (YYYYMMDD)
+
+        Returns:
+            list: 정렬된 티커 리스트
+        """
+        day = self._day(date)
+        k = int(np.searchsorted(self._change_days, day, side="right"))
+        if k == 0:
+            return []
+        base = (k - 1) // _KEYFRAME
+        members = set(self._keyframes[base])
+        for j in range(base * _KEYFRAME, k):
+            self._apply(members, j)
+        return sorted(members)
+
+    def contains(self, ticker: str, date) -> bool:
+        """date에 ticker가 지수 구성 종목이었는지 여부"""
+        day = self._day(date)
+        if ticker not in self._by_ticker:
+            return False
+        days, flags = self._by_ticker[ticker]
+        i = bisect.bisect_right(days, day)
+        return i > 0 and bool(flags[i - 1])
+
+    def save(self, path):
+        """이벤트를 npz 파일로 저장. 임시 파일에 쓴 뒤 교체한다."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    version=np.array([FORMAT_VERSION]),
+                    header=np.array([self.ticker, self.fromdate, self.todate]),
+                    days=self._days.astype(np.int32),
+                    tickers=self._tickers.astype(str),
+                    added=self._added,
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path) -> "IndexPortfolioHistory":
+        """save로 저장한 파일을 읽음. 형식 버전이 다르면 ValueError"""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"][0]) != FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported format version")
+            ticker, fromdate, todate = (str(x) for x in data["header"])
+            events = DataFrame(
+                {
+                    "날짜": data["days"].astype("datetime64[D]").astype("datetime64[ns]"),
+                    "티커": data["tickers"].astype(object),
+                    "편입": data["added"],
+                }
+            )
+        return cls(ticker, fromdate, todate, events)
+
+
+def get_index_portfolio_history(
+    ticker: str, fromdate: str, todate: str, max_interval: int = 63
+) -> IndexPortfolioHistory:
+    """기간의 지수 구성 종목 이력 조회
+
+    max_interval 영업일마다 구성 종목을 조회하고, 구성 종목이 달라진 구간만 이분
+    탐색해서 변경일을 찾는다. 요청 수는 대략 (영업일 수 / max_interval) +
+    변경일 수 × log2(max_interval)이다.
+
+    Args:
+        ticker       (str          ): 지수 티커
+        fromdate     (str          ): 조회 시작 일자 (YYYYMMDD)
+        todate       (str          ): 조회 종료 일자 (YYYYMMDD)
+        max_interval (int, optional): 구성 종목을 반드시 조회하는 최대 영업일 간격. 기본값은 63
+
+    Returns:
+        IndexPortfolioHistory: 편입/편출 이력
+
+    Raises:
+        ValueError: 구성 종목이 조회된 이후의 영업일에 빈 구성 종목이 조회된 경우
+
+        >> history = get_index_portfolio_history("1028", "20230601", "20230630")
+        >> history.changes
+        DatetimeIndex(['2023-06-09'], dtype='datetime64[ns]', name='날짜', freq=None)
+        >> history.events[history.events["날짜"] == "2023-06-09"]
+                  날짜      티커     편입
+        200 2023-06-09  000240   True
+        ...
+    """
+    if max_interval < 1:
+        raise ValueError("max_interval must be >= 1")
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+    sessions = get_trading_calendar().sessions(fromdate, todate)
+    if len(sessions) == 0:
+        raise ValueError(f"no trading days between {fromdate} and {todate}")
+
+    # 조회 실패를 빈 구성 종목으로 받으면 전 종목 편출로 기록되므로 예외로 받는다.
+    # KRX가 빈 응답을 돌려주는 경우도 있으므로, 구성 종목이 조회된 날 이후의 빈 결과는
+    # 조회 실패로 본다. 첫 구성 종목보다 앞선 빈 결과는 지수 산출 전이므로 그대로 둔다.
+    fetch = strict(_get_index_portfolio_deposit_file)
+    members = {}
+    n = len(sessions)
+
+    def probe(positions):
+        dates = [sessions[i].strftime("%Y%m%d") for i in positions]
+        results = run_concurrently(lambda date: fetch(date, ticker), dates)
+        for i, result in zip(positions, results):
+            members[i] = frozenset(result)
+        first = min((i for i, m in members.items() if m), default=n)
+        empty = [i for i, m in members.items() if not m and i > first]
+        if empty:
+            date = sessions[min(empty)].strftime("%Y%m%d")
+            raise ValueError(f"empty portfolio of {ticker} on {date}")
+
+    grid = sorted(set(range(0, n, max_interval)) | {n - 1})
+    probe(grid)
+    # 구간마다 가운데 날짜를 조회해서 변경일이 있는 구간을 반씩 좁힌다.
+    spans = list(zip(grid, grid[1:]))
+    while True:
+        spans = [(a, b) for a, b in spans if b - a > 1 and members[a] != members[b]]
+        if not spans:
+            break
+        mids = [(a + b) // 2 for a, b in spans]
+        probe(mids)
+        spans = [span for (a, b), m in zip(spans, mids) for span in ((a, m), (m, b))]
+
+    days, tickers, added = [], [], []
+    previous = frozenset()
+    for i in sorted(members):
+        current = members[i]
+        for diff, flag in ((current - previous, True), (previous - current, False)):
+            days += [sessions[i]] * len(diff)
+            tickers += sorted(diff)
+            added += [flag] * len(diff)
+        previous = current
+
+    events = DataFrame({"날짜": pd.DatetimeIndex(days), "티커": tickers, "편입": added})
+    return IndexPortfolioHistory(ticker, fromdate, todate, events)
@@ -15,6 +15,7 @@ from pykrx.website.krx.market.wrap import (
     get_market_cap_by_ticker as _get_market_cap_by_ticker,
 )
 
+from .stock_batch import fetch_by_tickers, is_ticker_list, strict
 from .stock_business_days import get_nearest_business_day_in_a_week
 from .stock_utils import market_valid_check, regex_yymmdd, resample_ohlcv
 
@@ -45,17 +46,19 @@ def get_market_cap(*args, **kwargs):
         return get_market_cap_by_ticker(*args, **kwargs)
 
 
-def get_market_cap_by_date(fromdate: str, todate: str, ticker: str, freq: str = "d") -> DataFrame:
+def get_market_cap_by_date(
+    fromdate: str, todate: str, ticker: str | list, freq: str = "d"
+) -> DataFrame:
     """일자별로 정렬된 시가총액
 
     Args:
         fromdate (str           ): 조회 시작 일자 (YYYYMMDD)
         todate   (str           ): 조회 종료 일자 (YYYYMMDD)
-        ticker   (str           ): 티커
+        ticker   (str or list   ): 티커. 목록이면 종목별로 동시에 조회
         freq     (str,  optional):  d - 일 / m - 월 / y - 년
 
     Returns:
-        DataFrame: 시가총액 데이터
+        DataFrame: 시가총액 데이터. ticker가 목록이면 (티커, 날짜) MultiIndex
     """
     if isinstance(fromdate, datetime.datetime):
         fromdate = datetime2string(fromdate)
@@ -66,9 +69,14 @@ def get_market_cap_by_date(fromdate: str, todate: str, ticker: str, freq: str =
     fromdate = fromdate.replace("-", "")
     todate = todate.replace("-", "")
 
-    df = _get_market_cap_by_date(fromdate, todate, ticker)
-
     how = {"시가총액": "last", "거래량": "sum", "거래대금": "sum", "상장주식수": "last"}
+    if is_ticker_list(ticker):
+        fetch = strict(_get_market_cap_by_date)
+        return fetch_by_tickers(
+            lambda t: resample_ohlcv(fetch(fromdate, todate, t), freq, how), ticker
+        )
+
+    df = _get_market_cap_by_date(fromdate, todate, ticker)
     return cast(DataFrame, resample_ohlcv(df, freq, how))
 
 
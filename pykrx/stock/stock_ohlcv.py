@@ -3,11 +3,18 @@
 """
 
 import datetime
+from dataclasses import dataclass
 from typing import cast
 
+import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
-from pykrx.website.krx import datetime2string
+from pykrx.website.comm.aio import get_concurrency_limit
+from pykrx.website.comm.ratelimit import get_rate_limiter
+from pykrx.website.krx import datetime2string, krxio
+from pykrx.website.krx.market.calendar import get_trading_calendar
+from pykrx.website.krx.market.core import IndividualStockPrice
 from pykrx.website.krx.market.wrap import (
     get_market_ohlcv_by_date as _get_market_ohlcv_by_date,
 )
@@ -16,7 +23,9 @@ from pykrx.website.krx.market.wrap import (
 )
 from pykrx.website.naver.wrap import get_market_ohlcv_by_date as _get_naver_market_ohlcv_by_date
 
+from .stock_batch import run_each, strict
 from .stock_business_days import get_nearest_business_day_in_a_week
+from .stock_ticker import get_market_ticker_list as _get_market_ticker_list
 from .stock_ticker import get_market_ticker_name
 from .stock_utils import market_valid_check, regex_yymmdd, resample_ohlcv
 
@@ -112,3 +121,229 @@ def get_market_ohlcv_by_ticker(date, market: str = "KOSPI", alternative: bool =
         target_date = get_nearest_business_day_in_a_week(date=date, prev=True)
         df = _get_market_ohlcv_by_ticker(target_date, market)
     return df
+
+
+# ----------------------------------------------------------------------------------------------------
+# Panel
+# ----------------------------------------------------------------------------------------------------
+
+PANEL_FIELDS = ["시가", "고가", "저가", "종가", "거래량", "거래대금"]
+
+# 요청 하나의 평균 응답 시간(초). 예상 소요 시간을 계산할 때만 사용한다.
+_REQUEST_LATENCY = 0.5
+
+
+@dataclass
+class PanelPlan:
+    """get_market_ohlcv_panel의 조회 계획
+
+    Attributes:
+        strategy        (str  ): ticker - 종목별 기간 조회 / date - 일자별 전종목 조회
+        ticker_requests (int  ): 종목별로 조회할 때의 요청 수. 티커 목록이 없으면 0
+        date_requests   (int  ): 일자별로 조회할 때의 요청 수
+        seconds         (float): 선택한 방식의 예상 소요 시간 (초)
+    """
+
+    strategy: str
+    ticker_requests: int
+    date_requests: int
+    seconds: float
+
+    @property
+    def requests(self) -> int:
+        return self.ticker_requests if self.strategy == "ticker" else self.date_requests
+
+
+def plan_market_ohlcv_panel(
+    fromdate: str, todate: str, tickers=None, adjusted: bool = False, strategy: str | None = None
+) -> PanelPlan:
+    """get_market_ohlcv_panel이 사용할 조회 방식을 결정
+
+    종목별 조회는 종목 수 x 구간 수만큼, 일자별 조회는 영업일 수만큼 요청한다.
+    구간 길이는 개별 종목 시세 조회의 현재 기간 분할 크기(configure_window_fetch)를
+    따른다. 요청 수가 적은 방식을 선택하며, 수정주가(adjusted)는 종목별 조회로만
+    받을 수 있다.
+
+    Args:
+        fromdate (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str           ): 조회 종료 일자 (YYYYMMDD)
+        tickers  (list, optional): 조회할 티커 목록. None이면 시장 전체
+        adjusted (bool, optional): 수정주가 여부
+        strategy (str , optional): ticker/date로 조회 방식을 지정
+
+    Returns:
+        PanelPlan: 조회 계획
+    """
+    if strategy not in (None, "ticker", "date"):
+        raise ValueError(f"strategy must be 'ticker' or 'date': {strategy}")
+    if adjusted and strategy == "date":
+        raise ValueError("adjusted prices are only available with strategy='ticker'")
+
+    days = get_trading_calendar().count(fromdate, todate)
+    window = krxio.window_days(IndividualStockPrice().bld)
+    windows = max(1, len(krxio.split_date_range(fromdate, todate, window)))
+    ticker_requests = len(tickers) * windows if tickers is not None else 0
+
+    if strategy is None:
+        if adjusted:
+            strategy = "ticker"
+        elif tickers is None or days <= ticker_requests:
+            strategy = "date"
+        else:
+            strategy = "ticker"
+
+    plan = PanelPlan(strategy, ticker_requests, days, 0.0)
+    limiter = get_rate_limiter("data.krx.co.kr")
+    throughput = get_concurrency_limit() / _REQUEST_LATENCY
+    if limiter is not None:
+        throughput = min(throughput, limiter.rate)
+    plan.seconds = plan.requests / throughput
+    return plan
+
+
+def get_market_ohlcv_panel(
+    fromdate: str,
+    todate: str,
+    tickers=None,
+    market: str = "ALL",
+    adjusted: bool = False,
+    layout: str = "long",
+    field: str = "종가",
+    strategy: str | None = None,
+) -> DataFrame:
+    """여러 종목의 기간 OHLCV를 한 번에 조회
+
+    종목 수와 영업일 수로 종목별 조회(get_market_ohlcv_by_date)와 일자별 전종목
+    조회(get_market_ohlcv_by_ticker) 중 요청이 적은 방식을 골라 동시에 조회한다.
+    동시 요청 수는 set_concurrency_limit, 요청 속도는 configure_rate_limit 한도를
+    따른다. 조회에 실패한 종목(종목별 조회) 또는 일자(일자별 조회)는 결과에서 빠지고
+    `df.attrs["errors"]`에 {티커 또는 날짜: 예외}로 남는다.
+
+    Args:
+        fromdate (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str           ): 조회 종료 일자 (YYYYMMDD)
+        tickers  (list, optional): 조회할 티커 목록. None이면 market 전체
+        market   (str , optional): tickers가 None일 때 조회할 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        adjusted (bool, optional): 수정주가 여부. True면 종목별로 조회
+        layout   (str , optional): long - (날짜, 티커) index / wide - 날짜 x 티커
+        field    (str , optional): layout이 wide일 때 값으로 사용할 열
+        strategy (str , optional): ticker/date로 조회 방식을 지정. 생략하면 자동 선택
+
+    Returns:
+        DataFrame:
+            >> get_market_ohlcv_panel("20240102", "20240103", ["005930", "000660"])
+
+                                  시가    고가    저가    종가    거래량        거래대금
+            날짜       티커
+            2024-01-02 000660   137500  140400  137100  138100   3218990   447163291700
+                       005930    78200   79800   78200   79600  17142847  1356958188621
+            2024-01-03 000660   137200  137500  133100  134300   4179810   561918016500
+                       005930    78500   78800   77000   77000  21753644  1690029162500
+
+            >> get_market_ohlcv_panel("20240102", "20240103", ["005930", "000660"], layout="wide")
+
+            티커         005930  000660
+            날짜
+            2024-01-02   79600  138100
+            2024-01-03   77000  134300
+    """
+    if isinstance(fromdate, datetime.datetime):
+        fromdate = datetime2string(fromdate)
+    if isinstance(todate, datetime.datetime):
+        todate = datetime2string(todate)
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+    if layout not in ("long", "wide"):
+        raise ValueError(f"layout must be 'long' or 'wide': {layout}")
+    if market not in ("KOSPI", "KOSDAQ", "KONEX", "ALL"):
+        raise ValueError(f"invalid market: {market}")
+    if field not in PANEL_FIELDS:
+        raise ValueError(f"field must be one of {PANEL_FIELDS}: {field}")
+
+    tickers = list(dict.fromkeys(tickers)) if tickers is not None else None
+    plan = plan_market_ohlcv_panel(fromdate, todate, tickers, adjusted, strategy)
+    if plan.strategy == "ticker":
+        if tickers is None:
+            last = get_trading_calendar().previous(todate)
+            tickers = _get_market_ticker_list(
+                todate if pd.isna(last) else last.strftime("%Y%m%d"), market
+            )
+        keys, frames, errors = _fetch_by_ticker(fromdate, todate, tickers, adjusted)
+        dates, codes, columns = _stack(frames, keys, by_ticker=True)
+    else:
+        sessions = get_trading_calendar().sessions(fromdate, todate)
+        keys, frames, errors = _fetch_by_date(
+            sessions, market if tickers is None else "ALL", tickers
+        )
+        dates, codes, columns = _stack(frames, keys, by_ticker=False)
+
+    if layout == "wide":
+        df = _wide_panel(dates, codes, columns[field], tickers)
+    else:
+        df = _long_panel(dates, codes, columns)
+    df.attrs["errors"] = errors
+    return df
+
+
+def _fetch_by_ticker(fromdate, todate, tickers, adjusted) -> tuple[list, list, dict]:
+    fetch = strict(_get_market_ohlcv_by_date)
+    frames, errors = run_each(lambda ticker: fetch(fromdate, todate, ticker, adjusted), tickers)
+    return list(tickers), frames, errors
+
+
+def _fetch_by_date(sessions, market, tickers) -> tuple[list, list, dict]:
+    fetch = strict(_get_market_ohlcv_by_ticker)
+    frames, errors = run_each(lambda day: fetch(day.strftime("%Y%m%d"), market), list(sessions))
+    if tickers is not None:
+        wanted = pd.Index(tickers)
+        frames = [df[df.index.isin(wanted)] if df is not None else None for df in frames]
+    return list(sessions), frames, errors
+
+
+def _stack(frames, keys, by_ticker: bool) -> tuple[np.ndarray, np.ndarray, dict]:
+    """조회 결과를 이어 붙인 (날짜, 티커, 열별 값) 배열. 결과마다 DataFrame을 만들지 않는다."""
+    dates, codes = [], []
+    columns = {name: [] for name in PANEL_FIELDS}
+    for key, df in zip(keys, frames):
+        if df is None or df.empty:
+            continue
+        n = len(df)
+        if by_ticker:
+            dates.append(df.index.values.astype("datetime64[ns]"))
+            codes.append(np.full(n, key, dtype=object))
+        else:
+            dates.append(np.full(n, np.datetime64(key, "ns")))
+            codes.append(np.asarray(df.index, dtype=object))
+        for name in PANEL_FIELDS:
+            columns[name].append(df[name].to_numpy(np.int64))
+
+    if not dates:
+        empty = np.array([], dtype=np.int64)
+        return (
+            np.array([], dtype="datetime64[ns]"),
+            np.array([], dtype=object),
+            dict.fromkeys(PANEL_FIELDS, empty),
+        )
+    return (
+        np.concatenate(dates),
+        np.concatenate(codes),
+        {name: np.concatenate(values) for name, values in columns.items()},
+    )
+
+
+def _long_panel(dates, codes, columns) -> DataFrame:
+    order = np.lexsort((codes.astype(str), dates))
+    index = pd.MultiIndex.from_arrays(
+        [dates[order], codes[order].astype(str)], names=["날짜", "티커"]
+    )
+    return DataFrame({name: values[order] for name, values in columns.items()}, index=index)
+
+
+def _wide_panel(dates, codes, values, tickers) -> DataFrame:
+    rows = pd.DatetimeIndex(np.unique(dates), name="날짜")
+    cols = pd.Index(tickers if tickers is not None else np.unique(codes.astype(str)), name="티커")
+    data = np.full((len(rows), len(cols)), np.nan)
+    r, c = rows.get_indexer(dates), cols.get_indexer(codes.astype(str))
+    mask = c >= 0
+    data[r[mask], c[mask]] = values[mask]
+    return DataFrame(data, index=rows, columns=cols)
@@ -0,0 +1,137 @@
+"""
+기간의 전종목 스냅샷을 일자별로 순회하는 함수들
+
+get_market_ohlcv_by_ticker처럼 하루치 전종목 결과를 반환하는 함수를 기간의
+영업일마다 호출한다.
+
+- 영업일은 로컬 거래일 달력으로 구하므로 휴일에는 요청하지 않는다.
+- 다음 영업일 결과를 `prefetch`개까지 미리 동시에 조회하고, 결과는 날짜 순서대로
+  반환한다. 메모리에는 미리 조회한 결과만 남는다.
+- `write_snapshots_parquet`은 결과를 받는 대로 Parquet 파일에 써서 여러 해의
+  스냅샷을 메모리에 모두 올리지 않고 저장한다.
+
+    >> for date, df in stock.iter_snapshots(stock.get_market_cap_by_ticker, "20200101", "20231231", market="ALL"):
+    >>     print(date, df["시가총액"].sum())
+"""
+
+import contextvars
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.comm.aio import get_concurrency_limit
+from pykrx.website.krx.market.calendar import get_trading_calendar
+
+
+def iter_snapshots(func, fromdate: str, todate: str, *args, prefetch: int | None = None, **kwargs):
+    """기간의 영업일마다 func(date, *args, **kwargs)를 호출한 결과를 날짜 순서대로 반환
+
+    Args:
+        func     (callable     ): 조회 일자(YYYYMMDD)를 첫 번째 인자로 받아 DataFrame을 반환하는 함수
+        fromdate (str          ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str          ): 조회 종료 일자 (YYYYMMDD)
+        prefetch (int, optional): 미리 조회할 영업일 수. 기본값은 동시 실행 한도
+
+    Yields:
+        tuple: (Timestamp, DataFrame)
+
+        >> for date, df in iter_snapshots(stock.get_market_ohlcv_by_ticker, "20240102", "20240105", market="KOSPI"):
+        >>     print(date, len(df))
+        2024-01-02 00:00:00 952
+        2024-01-03 00:00:00 952
+    """
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+    if prefetch is None:
+        prefetch = get_concurrency_limit()
+    if prefetch < 1:
+        raise ValueError("prefetch must be >= 1")
+
+    sessions = iter(get_trading_calendar().sessions(fromdate, todate))
+    with ThreadPoolExecutor(prefetch) as executor:
+        pending = deque()
+
+        def submit():
+            for date in sessions:
+                # 계측 중인 호출(contextvars)이 작업 스레드에서도 보이도록 context를 복사
+                run = contextvars.copy_context().run
+                pending.append(
+                    (date, executor.submit(run, func, date.strftime("%Y%m%d"), *args, **kwargs))
+                )
+                return True
+            return False
+
+        for _ in range(prefetch):
+            if not submit():
+                break
+        try:
+            while pending:
+                date, future = pending.popleft()
+                df = future.result()
+                submit()
+                yield date, df
+        finally:
+            # 순회를 중간에 멈추면 아직 시작하지 않은 조회를 취소한다.
+            for _, future in pending:
+                future.cancel()
+
+
+def write_snapshots_parquet(
+    func, fromdate: str, todate: str, path, *args, prefetch: int | None = None, **kwargs
+) -> int:
+    """iter_snapshots의 결과를 Parquet 파일 하나에 row group 단위로 기록
+
+    index(티커 등)는 열로 저장하고 맨 앞에 날짜 열을 추가한다. 정수 열은 int64,
+    category 열은 문자열로 저장해서 날짜마다 타입이 달라지지 않도록 한다. 결과가 빈
+    날짜는 건너뛴다. pyarrow가 필요하다 (pip install pykrx[arrow]).
+
+    Args:
+        func     (callable     ): iter_snapshots와 같음
+        fromdate (str          ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str          ): 조회 종료 일자 (YYYYMMDD)
+        path     (str or Path  ): 저장할 Parquet 파일 경로
+        prefetch (int, optional): 미리 조회할 영업일 수
+
+    Returns:
+        int: 기록한 행 수
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "write_snapshots_parquet requires pyarrow (pip install pykrx[arrow])"
+        ) from e
+
+    writer = None
+    rows = 0
+    try:
+        for date, df in iter_snapshots(func, fromdate, todate, *args, prefetch=prefetch, **kwargs):
+            if df is None or df.empty:
+                logging.info(f"{func.__name__}({date:%Y%m%d}): empty snapshot")
+                continue
+            table = pa.Table.from_pandas(_parquet_frame(date, df), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(str(path), table.schema)
+            writer.write_table(table.cast(writer.schema))
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def _parquet_frame(date, df: DataFrame) -> DataFrame:
+    df = df.reset_index()
+    for name in df.columns:
+        dtype = df[name].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            df[name] = df[name].astype(str)
+        elif pd.api.types.is_integer_dtype(dtype):
+            df[name] = df[name].astype(np.int64)
+    df.insert(0, "날짜", pd.Timestamp(date))
+    return df
@@ -1,3 +1,35 @@
+from pykrx.website.comm.aio import run_blocking, set_concurrency_limit
+from pykrx.website.comm.compact import compact_frame, disable_compact, enable_compact
+from pykrx.website.comm.diskcache import disable_disk_cache, disk_cache_info, enable_disk_cache
+from pykrx.website.comm.instrument import add_hook, remove_hook
+from pykrx.website.comm.memo import clear_memo, disable_memo, enable_memo, memo_info, memoize
+from pykrx.website.comm.numeric import NumberRangeError, convert_numeric, parse_numbers
+from pykrx.website.comm.ratelimit import configure_rate_limit
 from pykrx.website.comm.util import dataframe_empty_handler, singleton
+from pykrx.website.comm.webio import configure_session_pool, get_session
 
-__all__ = ["dataframe_empty_handler", "singleton"]
+__all__ = [
+    "NumberRangeError",
+    "add_hook",
+    "clear_memo",
+    "compact_frame",
+    "configure_rate_limit",
+    "configure_session_pool",
+    "convert_numeric",
+    "dataframe_empty_handler",
+    "disable_compact",
+    "disable_disk_cache",
+    "disable_memo",
+    "disk_cache_info",
+    "enable_compact",
+    "enable_disk_cache",
+    "enable_memo",
+    "get_session",
+    "memo_info",
+    "memoize",
+    "parse_numbers",
+    "remove_hook",
+    "run_blocking",
+    "set_concurrency_limit",
+    "singleton",
+]
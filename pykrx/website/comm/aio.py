@@ -0,0 +1,67 @@
+"""asyncio에서 블로킹 HTTP 요청을 실행하기 위한 유틸리티
+
+KRX/Naver 요청은 requests 기반의 블로킹 I/O이므로 이벤트 루프에서 직접
+호출하면 루프 전체가 멈춘다. 여기서는 요청을 워커 스레드로 넘기고, 모든
+코루틴이 공유하는 동시 실행 한도(semaphore)로 upstream에 보내는 요청 수를
+제한한다.
+"""
+
+import asyncio
+import functools
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_limit = 8
+_lock = threading.Lock()
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def set_concurrency_limit(limit: int):
+    """이벤트 루프당 동시에 실행할 수 있는 요청 수를 설정
+
+    Args:
+        limit (int): 최대 동시 요청 수 (1 이상)
+    """
+    global _limit
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    with _lock:
+        _limit = limit
+        _semaphores.clear()
+
+
+def get_concurrency_limit() -> int:
+    return _limit
+
+
+def _semaphore() -> asyncio.Semaphore:
+    # asyncio.Semaphore는 처음 사용된 루프에 묶이므로 루프별로 따로 만든다.
+    loop = asyncio.get_running_loop()
+    with _lock:
+        sem = _semaphores.get(loop)
+        if sem is None:
+            sem = asyncio.Semaphore(_limit)
+            _semaphores[loop] = sem
+        return sem
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """블로킹 함수를 동시 실행 한도 안에서 워커 스레드로 실행"""
+    async with _semaphore():
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def to_async(func: Callable[..., T]) -> Callable[..., Any]:
+    """블로킹 함수를 같은 시그니처의 코루틴 함수로 감싼다."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_blocking(func, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,144 @@
+"""메모리를 적게 쓰는 결과 모드
+
+`enable_compact()`로 켜면 스키마로 만드는 DataFrame이 다음 규칙으로 저장된다.
+
+- 티커(티커/종목코드 열, index)는 프로세스 전체가 공유하는 `TICKERS` 사전의
+  category로 저장한다. 호출마다 같은 categories 객체를 사용하므로 여러 번 조회한
+  결과를 합쳐도 category가 유지되고 문자열이 중복 저장되지 않는다.
+- 값이 반복되는 문자열 열(업종명, 시장구분 등)은 category로 저장한다.
+- 정수 열은 int64로 변환한 뒤(범위를 벗어나면 NumberRangeError) 값 범위를 담을 수
+  있는 가장 작은 부호 있는 정수 타입으로 줄인다.
+
+정수 타입은 조회 결과마다 달라질 수 있다. 큰 값을 만드는 연산(합계, 곱셈 등)
+전에는 `astype(np.int64)`로 변환해야 한다.
+
+    >> from pykrx.website.comm import enable_compact
+    >> enable_compact()
+    >> stock.get_market_ohlcv("20240102", market="ALL").memory_usage(deep=True).sum()
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+from pandas import CategoricalDtype, DataFrame
+
+TICKER_NAMES = frozenset(("티커", "종목코드"))
+
+_INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+class TickerDictionary:
+    """프로세스 전체가 공유하는 티커 category 사전
+
+    categories는 정렬된 상태를 유지하므로 category로 저장한 티커도 문자열과 같은
+    순서로 정렬된다. 처음 보는 티커가 들어오면 categories가 늘어나며, 이전에 만든
+    결과는 `align`으로 최신 dtype에 맞출 수 있다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._known: set = set()
+        self._dtype = CategoricalDtype([])
+
+    def __len__(self):
+        return len(self._known)
+
+    @property
+    def dtype(self) -> CategoricalDtype:
+        return self._dtype
+
+    def encode(self, values) -> pd.Categorical:
+        """티커 목록을 공유 사전의 category로 변환"""
+        values = list(values)
+        unseen = set(values).difference(self._known)
+        if unseen:
+            with self._lock:
+                unseen.difference_update(self._known)
+                if unseen:
+                    self._known.update(unseen)
+                    self._dtype = CategoricalDtype(sorted(self._known))
+        return pd.Categorical(values, dtype=self._dtype)
+
+    def align(self, obj):
+        """Series/Index/DataFrame의 티커 category를 최신 사전 dtype으로 변환"""
+        if isinstance(obj, DataFrame):
+            columns = [c for c in obj.columns if c in TICKER_NAMES]
+            obj = obj.astype(dict.fromkeys(columns, self._dtype)) if columns else obj
+            if obj.index.name in TICKER_NAMES:
+                obj.index = obj.index.astype(self._dtype)
+            return obj
+        return obj.astype(self._dtype)
+
+    def clear(self):
+        with self._lock:
+            self._known = set()
+            self._dtype = CategoricalDtype([])
+
+
+TICKERS = TickerDictionary()
+
+_enabled = False
+
+
+def enable_compact():
+    """스키마 결과를 메모리를 적게 쓰는 타입으로 생성"""
+    global _enabled
+    _enabled = True
+
+
+def disable_compact():
+    global _enabled
+    _enabled = False
+
+
+def compact_enabled() -> bool:
+    return _enabled
+
+
+def smallest_int(values: np.ndarray) -> np.ndarray:
+    """정수 배열을 값 범위를 담을 수 있는 가장 작은 부호 있는 정수 타입으로 변환"""
+    if len(values) == 0:
+        return values.astype(np.int8)
+    low, high = values.min(), values.max()
+    for dtype in _INT_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return values.astype(dtype, copy=False)
+    return values
+
+
+def compact_strings(name, values):
+    """문자열 열을 category로 변환. 티커는 공유 사전, 그 밖에는 값이 반복될 때만"""
+    if name in TICKER_NAMES:
+        return TICKERS.encode(values)
+    values = list(values)
+    if len(set(values)) * 2 <= len(values):
+        return pd.Categorical(values)
+    return values
+
+
+def compact_frame(df: DataFrame) -> DataFrame:
+    """이미 만들어진 DataFrame에 compact 규칙을 적용
+
+    Args:
+        df (DataFrame): 변환할 DataFrame
+
+    Returns:
+        DataFrame: 문자열은 category, 정수는 가장 작은 정수 타입으로 변환된 DataFrame
+    """
+    data = {}
+    for i, column in enumerate(df.columns):
+        series = df.iloc[:, i]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            data[i] = smallest_int(series.to_numpy())
+        elif pd.api.types.is_string_dtype(series.dtype) and series.notna().all():
+            data[i] = compact_strings(column, series.tolist())
+        else:
+            data[i] = series.array
+    index = df.index
+    if index.name in TICKER_NAMES and pd.api.types.is_string_dtype(index.dtype):
+        index = pd.CategoricalIndex(TICKERS.encode(index), name=index.name)
+    result = DataFrame(data, index=index)
+    result.columns = df.columns
+    return result
@@ -0,0 +1,268 @@
+"""KRX 응답을 저장하는 디스크 캐시
+
+과거 거래일의 데이터는 바뀌지 않으므로 같은 요청(bld + 파라미터)에 대한
+응답 JSON을 압축해서 디스크에 저장해 두고 재사용한다.
+
+- 키: url, bld와 정규화한 파라미터로 만든 sha256. 파일 이름이 곧 키이다.
+- 만료: 조회 구간이 오늘(KST) 이전에 끝나면 만료되지 않는다. 오늘을 포함하면
+  `ttl`, 날짜 파라미터가 없는 요청(티커 목록 등)은 `undated_ttl` 동안 유효하다.
+- 저장 대상: 레코드가 있는 응답만 저장한다. 빈 결과나 오류 응답은 저장하지 않고,
+  실제 사이트를 조회하는 transport(HttpTransport)를 사용할 때만 읽고 쓴다.
+- 용량: 전체 크기가 `max_bytes`를 넘으면 가장 오래 사용하지 않은 항목부터
+  지운다. 마지막 사용 시각은 파일 mtime으로 기록하므로 프로세스 간에 공유된다.
+
+    >> from pykrx.website.comm import enable_disk_cache, disk_cache_info
+    >> enable_disk_cache()
+    >> stock.get_market_ohlcv("20220104")   # upstream 조회 후 저장
+    >> stock.get_market_ohlcv("20220104")   # 디스크에서 읽음
+    >> disk_cache_info()
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from pykrx.website.comm.jsonio import loads
+
+_KST = timezone(timedelta(hours=9))
+_HEADER = struct.Struct("<d")  # 만료 시각 (epoch 초). 0이면 만료 없음
+_SUFFIX = ".json.z"
+
+# 조회 구간의 끝을 나타내는 파라미터 (우선순위 순)
+_DATE_PARAMS = ("endDd", "trdDd", "todate")
+
+
+def default_cache_dir() -> Path:
+    """pykrx가 디스크에 데이터를 저장하는 기본 경로
+
+    PYKRX_CACHE_DIR 환경 변수가 있으면 그 경로, 없으면 ~/.cache/pykrx
+    """
+    path = os.environ.get("PYKRX_CACHE_DIR")
+    if path:
+        return Path(path)
+    return Path.home() / ".cache" / "pykrx"
+
+
+def today_kst() -> str:
+    return datetime.now(_KST).strftime("%Y%m%d")
+
+
+def make_key(url: str, params: dict) -> str:
+    """url과 파라미터로 캐시 키를 생성. 파라미터 순서와 값의 타입에 무관하다."""
+    canonical = json.dumps(
+        [url, sorted((str(k), str(v)) for k, v in params.items())],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(data) -> bool:
+    """레코드 리스트가 하나라도 있는 응답인지 여부
+
+    KRX는 오류나 휴장일에도 빈 output 또는 오류 메시지만 담은 응답을 돌려준다. 과거
+    날짜의 응답은 만료되지 않으므로 이런 응답을 저장하면 다시 조회하지 않게 된다.
+    """
+    return isinstance(data, dict) and any(isinstance(v, list) and v for v in data.values())
+
+
+@dataclass
+class CacheInfo:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+    max_bytes: int = 0
+    directory: str = ""
+
+
+class DiskCache:
+    """압축 JSON 응답을 저장하는 LRU 디스크 캐시
+
+    Args:
+        directory   (str  ): 저장 경로
+        max_bytes   (int  ): 최대 저장 용량 (bytes)
+        ttl         (float): 오늘을 포함하는 요청의 유효 시간 (초)
+        undated_ttl (float): 날짜 파라미터가 없는 요청의 유효 시간 (초)
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike | None = None,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: float = 300.0,
+        undated_ttl: float = 6 * 3600.0,
+    ):
+        self.directory = Path(directory) if directory is not None else default_cache_dir() / "http"
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.undated_ttl = undated_ttl
+        self._lock = threading.Lock()
+        self._info = CacheInfo(max_bytes=max_bytes, directory=str(self.directory))
+        # path -> size. 다른 프로세스가 추가한 파일은 eviction 시 다시 스캔해서 반영한다.
+        self._sizes: dict[Path, int] | None = None
+        self._total = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / (key + _SUFFIX)
+
+    def _scan(self) -> dict[Path, int]:
+        sizes = {}
+        if self.directory.exists():
+            for path in self.directory.glob("*/*" + _SUFFIX):
+                with contextlib.suppress(FileNotFoundError):
+                    sizes[path] = path.stat().st_size
+        return sizes
+
+    def _index(self) -> dict[Path, int]:
+        if self._sizes is None:
+            self._sizes = self._scan()
+            self._total = sum(self._sizes.values())
+        return self._sizes
+
+    def expires_at(self, params: dict, now: float | None = None) -> float:
+        """요청 파라미터로 만료 시각을 계산. 0이면 만료되지 않는다."""
+        now = time.time() if now is None else now
+        for name in _DATE_PARAMS:
+            value = params.get(name)
+            if value:
+                if str(value) < today_kst():
+                    return 0.0
+                return now + self.ttl
+        return now + self.undated_ttl
+
+    def get(self, url: str, params: dict):
+        """저장된 응답을 반환. 없거나 만료됐으면 None"""
+        path = self._path(make_key(url, params))
+        try:
+            blob = path.read_bytes()
+            (expires,) = _HEADER.unpack_from(blob)
+            if expires and expires < time.time():
+                raise FileNotFoundError
+            data = loads(zlib.decompress(blob[_HEADER.size :]))
+        except (FileNotFoundError, struct.error, zlib.error, ValueError):
+            with self._lock:
+                self._info.misses += 1
+            return None
+
+        # LRU 순서를 위해 마지막 사용 시각 갱신
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        with self._lock:
+            self._info.hits += 1
+        return data
+
+    def set(self, url: str, params: dict, data):
+        """응답을 저장. 레코드가 없는 응답(빈 결과, 오류 응답)은 저장하지 않는다."""
+        if not is_cacheable(data):
+            return
+        path = self._path(make_key(url, params))
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        blob = _HEADER.pack(self.expires_at(params)) + zlib.compress(payload, 6)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 다른 스레드/프로세스가 읽는 도중 잘린 파일을 보지 않도록 rename으로 교체
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            return
+
+        with self._lock:
+            index = self._index()
+            self._total += len(blob) - index.get(path, 0)
+            index[path] = len(blob)
+            self._info.writes += 1
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """가장 오래 사용하지 않은 항목부터 max_bytes 이하가 될 때까지 삭제"""
+        self._sizes = self._scan()
+        entries = []
+        for path, size in self._sizes.items():
+            with contextlib.suppress(FileNotFoundError):
+                entries.append((path.stat().st_mtime, path, size))
+        entries.sort()
+
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+            self._sizes.pop(path, None)
+            total -= size
+            self._info.evictions += 1
+        self._total = total
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            index = self._index()
+            self._info.entries = len(index)
+            self._info.size = self._total
+            return CacheInfo(**vars(self._info))
+
+    def clear(self):
+        with self._lock:
+            for path in self._scan():
+                with contextlib.suppress(FileNotFoundError):
+                    path.unlink()
+            self._sizes = {}
+            self._total = 0
+            self._info = CacheInfo(max_bytes=self.max_bytes, directory=str(self.directory))
+
+
+_disk_cache: DiskCache | None = None
+
+
+def enable_disk_cache(
+    directory: str | os.PathLike | None = None,
+    max_bytes: int = 512 * 1024 * 1024,
+    ttl: float = 300.0,
+    undated_ttl: float = 6 * 3600.0,
+) -> DiskCache:
+    """KRX 응답 디스크 캐시를 활성화
+
+    Args:
+        directory   (str  , optional): 저장 경로. 기본값은 default_cache_dir()/http
+        max_bytes   (int  , optional): 최대 저장 용량 (bytes)
+        ttl         (float, optional): 오늘을 포함하는 요청의 유효 시간 (초)
+        undated_ttl (float, optional): 날짜 파라미터가 없는 요청의 유효 시간 (초)
+
+    Returns:
+        DiskCache: 활성화된 캐시 객체
+    """
+    global _disk_cache
+    _disk_cache = DiskCache(directory, max_bytes, ttl, undated_ttl)
+    return _disk_cache
+
+
+def disable_disk_cache():
+    global _disk_cache
+    _disk_cache = None
+
+
+def get_disk_cache() -> DiskCache | None:
+    return _disk_cache
+
+
+def disk_cache_info() -> CacheInfo | None:
+    """디스크 캐시의 hit/miss 통계와 사용량. 비활성화 상태면 None"""
+    cache = _disk_cache
+    return cache.info() if cache is not None else None
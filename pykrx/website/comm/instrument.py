@@ -0,0 +1,258 @@
+"""요청/디코딩/변환 단계별 계측 hook
+
+hook을 등록하면 다음 이벤트가 발생한다.
+
+- http     : Get/Post 요청 한 번. name은 bld(없으면 url 경로), bytes는 응답 크기.
+             seconds는 upstream 왕복 시간이고 속도 제한 대기는 throttle_seconds에 따로 기록
+- decode   : KRX 응답 JSON 디코딩 한 번. rows는 응답 레코드 수
+- call     : wrap 함수 호출 한 번. 호출 동안 발생한 http/throttle/decode 시간과 나머지
+             (pandas 정제 등) transform 시간, 결과 행 수를 함께 기록
+
+hook이 하나도 없으면 각 계측 지점은 리스트가 비었는지만 확인하고 넘어간다.
+
+    >> from pykrx.website.comm import instrument
+    >> agg = instrument.Aggregator()
+    >> instrument.add_hook(agg)
+    >> stock.get_market_ohlcv("20220104")
+    >> agg.summary()
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+_hooks: list = []
+
+
+@dataclass
+class Event:
+    kind: str
+    name: str
+    params: dict = field(default_factory=dict)
+    seconds: float = 0.0
+    bytes: int = 0
+    rows: int = 0
+    start: float = 0.0  # time.time() 기준 시작 시각
+    http_seconds: float = 0.0
+    throttle_seconds: float = 0.0  # 속도 제한 대기 시간
+    decode_seconds: float = 0.0
+    transform_seconds: float = 0.0
+
+
+def add_hook(hook):
+    """이벤트를 받을 callable(Event)을 등록"""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def enabled() -> bool:
+    return bool(_hooks)
+
+
+def emit(event: Event):
+    span = _current_call.get()
+    if span is not None:
+        span.add(event)
+    for hook in list(_hooks):
+        try:
+            hook(event)
+        except Exception:  # hook의 오류가 조회를 실패시키지 않도록 한다.
+            logging.getLogger(__name__).exception("instrumentation hook failed")
+
+
+class _CallSpan:
+    """wrap 함수 호출 동안 하위 이벤트 시간을 누적. 기간 분할 조회처럼 다른
+    스레드에서 발생한 이벤트도 더해지므로 lock으로 보호한다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.http = 0.0
+        self.throttle = 0.0
+        self.decode = 0.0
+        self.bytes = 0
+
+    def add(self, event: Event):
+        with self.lock:
+            if event.kind == "http":
+                self.http += event.seconds
+                self.throttle += event.throttle_seconds
+                self.bytes += event.bytes
+            elif event.kind == "decode":
+                self.decode += event.seconds
+
+
+_current_call: contextvars.ContextVar = contextvars.ContextVar("pykrx_call", default=None)
+
+
+def call(func, name: str, args: tuple, kwargs: dict):
+    """func를 실행하고 call 이벤트를 발생. 중첩된 wrap 호출은 가장 바깥 호출만 기록"""
+    if _current_call.get() is not None:
+        return func(*args, **kwargs)
+
+    span = _CallSpan()
+    token = _current_call.set(span)
+    start = time.time()
+    begin = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        _current_call.reset(token)
+    seconds = time.perf_counter() - begin
+
+    # 기간 분할 조회는 여러 구간을 동시에 받으므로 하위 시간의 합이 전체보다 클 수 있다.
+    transform = max(0.0, seconds - span.http - span.throttle - span.decode)
+    params = dict(enumerate(args)) if args else {}
+    params.update(kwargs)
+    emit(
+        Event(
+            "call",
+            name,
+            params,
+            seconds,
+            bytes=span.bytes,
+            rows=len(result) if hasattr(result, "__len__") else 0,
+            start=start,
+            http_seconds=span.http,
+            throttle_seconds=span.throttle,
+            decode_seconds=span.decode,
+            transform_seconds=transform,
+        )
+    )
+    return result
+
+
+class Aggregator:
+    """이벤트를 (kind, name)별로 모아 백분위수를 계산하는 hook
+
+    Args:
+        maxlen (int): (kind, name)별로 보관할 최근 이벤트 수
+    """
+
+    def __init__(self, maxlen: int = 10000):
+        self._lock = threading.Lock()
+        self._events: dict[tuple[str, str], deque] = defaultdict(lambda: deque(maxlen=maxlen))
+
+    def __call__(self, event: Event):
+        with self._lock:
+            self._events[(event.kind, event.name)].append(event)
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+
+    def summary(self, percentiles=(50, 90, 99)) -> pd.DataFrame:
+        """(kind, name)별 호출 수, 지연 시간 백분위수(ms), 평균 bytes/rows
+
+        Returns:
+            DataFrame:
+                                                      count   p50_ms   p90_ms   p99_ms  ...
+                kind   name
+                call   get_market_ohlcv_by_ticker         3    412.1    530.2    540.8  ...
+                decode dbms/MDC/STAT/standard/MDCSTAT01501 3     12.3     14.0     14.2  ...
+                http   dbms/MDC/STAT/standard/MDCSTAT01501 3    380.5    490.1    499.0  ...
+        """
+        with self._lock:
+            groups = {key: list(events) for key, events in self._events.items()}
+
+        rows = []
+        for (kind, name), events in sorted(groups.items()):
+            seconds = np.array([e.seconds for e in events]) * 1e3
+            row = {"kind": kind, "name": name, "count": len(events)}
+            for p, value in zip(percentiles, np.percentile(seconds, percentiles)):
+                row[f"p{p}_ms"] = value
+            row["mean_bytes"] = np.mean([e.bytes for e in events])
+            row["mean_rows"] = np.mean([e.rows for e in events])
+            if kind in ("call", "http"):
+                row["throttle_ms"] = np.mean([e.throttle_seconds for e in events]) * 1e3
+            if kind == "call":
+                row["http_ms"] = np.mean([e.http_seconds for e in events]) * 1e3
+                row["decode_ms"] = np.mean([e.decode_seconds for e in events]) * 1e3
+                row["transform_ms"] = np.mean([e.transform_seconds for e in events]) * 1e3
+            rows.append(row)
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows).set_index(["kind", "name"])
+
+
+class LoggingHook:
+    """이벤트를 logging으로 출력하는 hook"""
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger("pykrx.instrument")
+        self.level = level
+
+    def __call__(self, event: Event):
+        if not self.logger.isEnabledFor(self.level):
+            return
+        if event.kind == "call":
+            self.logger.log(
+                self.level,
+                "%s %s %.1fms (http %.1fms, throttle %.1fms, decode %.1fms, transform %.1fms) "
+                "rows=%d bytes=%d",
+                event.kind,
+                event.name,
+                event.seconds * 1e3,
+                event.http_seconds * 1e3,
+                event.throttle_seconds * 1e3,
+                event.decode_seconds * 1e3,
+                event.transform_seconds * 1e3,
+                event.rows,
+                event.bytes,
+            )
+        else:
+            self.logger.log(
+                self.level,
+                "%s %s %.1fms rows=%d bytes=%d params=%s",
+                event.kind,
+                event.name,
+                event.seconds * 1e3,
+                event.rows,
+                event.bytes,
+                event.params,
+            )
+
+
+class OpenTelemetryHook:
+    """이벤트를 OpenTelemetry span으로 내보내는 hook
+
+    opentelemetry-api가 설치되어 있어야 한다. 이벤트가 끝난 뒤 기록되므로 span의
+    시작/종료 시각을 이벤트 값으로 지정한다.
+
+    Args:
+        tracer (optional): 사용할 tracer. 기본값은 trace.get_tracer("pykrx")
+    """
+
+    def __init__(self, tracer=None):
+        if tracer is None:
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("pykrx")
+        self.tracer = tracer
+
+    def __call__(self, event: Event):
+        start_ns = int(event.start * 1e9)
+        span = self.tracer.start_span(f"pykrx.{event.kind} {event.name}", start_time=start_ns)
+        span.set_attribute("pykrx.kind", event.kind)
+        span.set_attribute("pykrx.name", event.name)
+        span.set_attribute("pykrx.bytes", event.bytes)
+        span.set_attribute("pykrx.rows", event.rows)
+        for key, value in event.params.items():
+            span.set_attribute(f"pykrx.param.{key}", str(value))
+        if event.kind in ("call", "http"):
+            span.set_attribute("pykrx.throttle_ms", event.throttle_seconds * 1e3)
+        if event.kind == "call":
+            span.set_attribute("pykrx.http_ms", event.http_seconds * 1e3)
+            span.set_attribute("pykrx.decode_ms", event.decode_seconds * 1e3)
+            span.set_attribute("pykrx.transform_ms", event.transform_seconds * 1e3)
+        span.end(end_time=start_ns + int(event.seconds * 1e9))
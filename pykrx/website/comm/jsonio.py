@@ -0,0 +1,86 @@
+"""KRX 응답 JSON 디코딩과 DataFrame 변환
+
+KRX 응답은 문자열 값만 가진 dict의 큰 리스트이다. orjson(또는 pysimdjson)이
+설치되어 있으면 표준 json 대신 사용하고, `DataFrame(list_of_dicts)`처럼
+행마다 key를 맞춰 보는 대신 key별 열(column) 리스트로 바로 DataFrame을
+생성한다. 선택적 의존성이 없으면 표준 라이브러리로 동작한다.
+"""
+
+import json
+
+from pandas import DataFrame
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - 선택적 의존성
+    _orjson = None
+
+try:
+    import simdjson as _simdjson
+except ImportError:  # pragma: no cover - 선택적 의존성
+    _simdjson = None
+
+BACKEND = "orjson" if _orjson is not None else "simdjson" if _simdjson is not None else "json"
+
+
+def loads(data: bytes | str):
+    """설치된 가장 빠른 디코더로 JSON을 파싱"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if _simdjson is not None:
+        return _simdjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(resp):
+    """requests.Response(또는 호환 객체)의 본문을 디코딩"""
+    content = getattr(resp, "content", None)
+    if not isinstance(content, (bytes, str)):
+        return resp.json()
+    try:
+        return loads(content)
+    except ValueError:
+        # UTF-8이 아닌 본문 등은 requests의 인코딩 추정에 맡긴다.
+        return resp.json()
+
+
+def copy_payload(data):
+    """KRX 응답을 레코드 단위까지 복사
+
+    응답은 {블록 이름: [레코드 dict, ...], ...} 형태이고 레코드 값은 문자열/숫자이므로
+    deepcopy 대신 리스트와 레코드 dict만 새로 만든다.
+    """
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: [dict(r) if isinstance(r, dict) else r for r in value]
+        if isinstance(value, list)
+        else value
+        for key, value in data.items()
+    }
+
+
+def records_to_frame(records: list) -> DataFrame:
+    """KRX 응답의 레코드 리스트를 DataFrame으로 변환
+
+    모든 레코드가 같은 key 구성을 가지면 key별로 값을 모아 열(column) 리스트를
+    만든다. pandas가 행마다 key를 맞춰 보는 과정을 생략하므로 더 빠르다. key
+    구성이 다른 레코드가 섞여 있으면 pandas의 기본 변환으로 되돌아간다.
+
+    Args:
+        records (list): dict 리스트
+
+    Returns:
+        DataFrame: 레코드의 key를 열로 갖는 DataFrame
+    """
+    if not records or not isinstance(records[0], dict):
+        return DataFrame(records)
+
+    keys = list(records[0])
+    width = len(keys)
+    if any(len(r) != width for r in records):
+        return DataFrame(records)
+    try:
+        return DataFrame({key: [r[key] for r in records] for key in keys})
+    except KeyError:
+        return DataFrame(records)
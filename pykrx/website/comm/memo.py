@@ -0,0 +1,205 @@
+"""wrap 함수 결과(DataFrame/Series/list)의 프로세스 내부 LRU 메모이제이션
+
+같은 인자로 여러 번 호출되는 wrap 함수는 매번 KRX 조회와 정제 과정을 다시
+수행한다. `enable_memo()`로 켜면 최종 DataFrame/Series/list를 함수와 인자별로
+메모리에 보관하고, 전체 크기가 `max_bytes`를 넘으면 가장 오래 사용하지 않은
+결과부터 버린다.
+
+호출자는 저장된 객체가 아닌 얕은 복사본을 받는다. copy-on-write 모드에서는
+복사본을 수정하는 순간 데이터가 복제되므로 저장된 결과는 변하지 않는다. list는
+새 list로 복사해서 돌려준다.
+오늘 날짜를 인자로 받은 결과는 장중에 바뀔 수 있으므로 `today_ttl` 동안만
+유효하다.
+"""
+
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import pandas as pd
+
+from pykrx.website.comm.compact import compact_enabled
+from pykrx.website.comm.diskcache import today_kst
+
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+@dataclass
+class MemoInfo:
+    enabled: bool = False
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+    max_bytes: int = 0
+
+
+def _nbytes(obj) -> int:
+    if isinstance(obj, list):
+        return sys.getsizeof(obj) + sum(sys.getsizeof(x) for x in obj)
+    return (
+        int(obj.memory_usage(deep=True).sum())
+        if isinstance(obj, pd.DataFrame)
+        else int(obj.memory_usage(deep=True))
+    )
+
+
+def _view(obj):
+    if isinstance(obj, list):
+        return list(obj)
+    if _COPY_ON_WRITE or pd.options.mode.copy_on_write:
+        return obj.copy(deep=False)
+    return obj.copy()
+
+
+class MemoCache:
+    """크기 제한이 있는 thread-safe LRU
+
+    Args:
+        max_bytes (int  ): 보관할 결과의 최대 메모리 사용량 (bytes)
+        today_ttl (float): 오늘 날짜가 포함된 결과의 유효 시간 (초)
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, today_ttl: float = 60.0):
+        self.max_bytes = max_bytes
+        self.today_ttl = today_ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, nbytes, expires)
+        self._size = 0
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] and entry[2] < time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key, value, volatile: bool = False):
+        nbytes = _nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        expires = time.monotonic() + self.today_ttl if volatile else 0.0
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, nbytes, expires)
+            self._size += nbytes
+            while self._size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _drop(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._size -= nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def info(self) -> MemoInfo:
+        with self._lock:
+            return MemoInfo(
+                enabled=True,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+                max_bytes=self.max_bytes,
+            )
+
+
+_memo: MemoCache | None = None
+
+
+def enable_memo(max_bytes: int = 256 * 1024 * 1024, today_ttl: float = 60.0) -> MemoCache:
+    """wrap 함수 결과 메모이제이션을 활성화
+
+    Args:
+        max_bytes (int  , optional): 최대 메모리 사용량 (bytes)
+        today_ttl (float, optional): 오늘 날짜가 포함된 결과의 유효 시간 (초)
+
+    Returns:
+        MemoCache: 활성화된 캐시 객체
+    """
+    global _memo
+    _memo = MemoCache(max_bytes, today_ttl)
+    return _memo
+
+
+def disable_memo():
+    global _memo
+    _memo = None
+
+
+def clear_memo():
+    if _memo is not None:
+        _memo.clear()
+
+
+def memo_info() -> MemoInfo:
+    memo = _memo
+    return memo.info() if memo is not None else MemoInfo()
+
+
+def _touches_today(values) -> bool:
+    today = today_kst()
+    for value in values:
+        if isinstance(value, str):
+            value = value.replace("-", "")
+            if len(value) == 8 and value.isdigit() and value >= today:
+                return True
+    return False
+
+
+def memoize(func):
+    """wrap 함수의 DataFrame/Series/list 결과를 메모이제이션
+
+    인자는 함수 시그니처에 맞춰 정규화하므로 위치 인자, 키워드 인자, 기본값
+    생략이 모두 같은 키가 된다. compact 모드 결과는 별도의 키로 저장한다. 해시할
+    수 없는 인자가 있거나 결과가 비어 있으면 (조회 실패일 수 있음) 저장하지 않는다.
+    """
+    signature = inspect.signature(func)
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        memo = _memo
+        if memo is None:
+            return func(*args, **kwargs)
+
+        try:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, tuple(bound.arguments.items()), compact_enabled())
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        cached = memo.get(key)
+        if cached is not None:
+            return _view(cached)
+
+        result = func(*args, **kwargs)
+        if isinstance(result, list):
+            if not result:
+                return result
+        elif not isinstance(result, (pd.DataFrame, pd.Series)) or result.empty:
+            return result
+        memo.set(key, result, _touches_today(bound.arguments.values()))
+        return _view(result)
+
+    return wrapper
@@ -0,0 +1,163 @@
+"""호스트별 token-bucket 요청 속도 제한
+
+모든 KRX/Naver 요청은 webio 계층에서 호스트별 token bucket을 통과한다.
+고정된 sleep 대신 허용된 속도만큼만 기다리므로, 한도에 여유가 있으면
+요청이 바로 나가고 한도를 넘을 때만 대기한다.
+
+기본 한도는 프로세스 내부에서만 공유된다. 여러 프로세스(예: 크롤러의
+multiprocessing 워커)가 같은 한도를 나눠 써야 하면 `shared_path`를 지정해
+파일 잠금 기반의 bucket을 사용한다.
+"""
+
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class TokenBucket:
+    """프로세스 내부에서 공유하는 thread-safe token bucket
+
+    Args:
+        rate     (float): 초당 채워지는 토큰 수 (허용 요청 속도)
+        capacity (float, optional): 한 번에 쌓일 수 있는 최대 토큰 수 (burst).
+                                    지정하지 않으면 max(1, rate)
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 차감하고 기다려야 할 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 얻을 때까지 대기
+
+        Returns:
+            float: 실제로 대기한 시간 (초)
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class SharedTokenBucket:
+    """여러 프로세스가 파일 잠금으로 공유하는 token bucket
+
+    bucket 상태(남은 토큰, 마지막 갱신 시각)를 `path`에 저장하고 fcntl.flock으로
+    보호한다. 프로세스 간 시계를 맞추기 위해 time.time()을 사용한다.
+
+    Args:
+        rate     (float): 초당 채워지는 토큰 수
+        capacity (float, optional): 최대 토큰 수 (burst)
+        path     (str  ): 상태를 저장할 파일 경로
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None, path: str = ""):
+        if fcntl is None:
+            raise RuntimeError("SharedTokenBucket requires fcntl (POSIX only)")
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def _reserve(self, tokens: float) -> float:
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                now = time.time()
+                try:
+                    stored, stamp = (float(x) for x in f.read().split())
+                except ValueError:
+                    stored, stamp = self.capacity, now
+                available = min(self.capacity, stored + max(0.0, now - stamp) * self.rate)
+                available -= tokens
+                f.seek(0)
+                f.truncate()
+                f.write(f"{available} {now}")
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        if available >= 0:
+            return 0.0
+        return -available / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# 호스트별 기본 한도 (초당 요청 수, burst)
+DEFAULT_RATES = {
+    "data.krx.co.kr": (2.0, 2.0),
+    "fchart.stock.naver.com": (5.0, 5.0),
+}
+
+_lock = threading.Lock()
+_limiters: dict[str, TokenBucket | SharedTokenBucket | None] = {}
+
+
+def configure_rate_limit(
+    host: str,
+    rate: float | None,
+    capacity: float | None = None,
+    shared_path: str | None = None,
+):
+    """호스트의 요청 속도 한도를 설정
+
+    Args:
+        host        (str  ): 호스트 이름 (예: data.krx.co.kr)
+        rate        (float): 초당 허용 요청 수. None이면 제한하지 않음
+        capacity    (float, optional): burst 허용량
+        shared_path (str  , optional): 지정하면 이 파일을 통해 여러 프로세스가
+                                       같은 한도를 공유
+    """
+    with _lock:
+        if rate is None:
+            _limiters[host] = None
+        elif shared_path is not None:
+            _limiters[host] = SharedTokenBucket(rate, capacity, shared_path)
+        else:
+            _limiters[host] = TokenBucket(rate, capacity)
+
+
+def get_rate_limiter(host: str) -> TokenBucket | SharedTokenBucket | None:
+    with _lock:
+        if host not in _limiters:
+            rate = DEFAULT_RATES.get(host)
+            _limiters[host] = TokenBucket(*rate) if rate is not None else None
+        return _limiters[host]
+
+
+def throttle(url: str) -> float:
+    """url의 호스트 한도에 맞춰 대기. 대기한 시간(초)을 반환"""
+    host = urlsplit(url).hostname or ""
+    limiter = get_rate_limiter(host)
+    if limiter is None:
+        return 0.0
+    return limiter.acquire()
@@ -0,0 +1,148 @@
+"""지연 로딩하는 thread-safe 참조 데이터 저장소
+
+티커 목록처럼 한 번 내려받아 계속 사용하는 데이터를 파트(시장) 단위로 보관한다.
+
+- 지연 로딩: 파트는 처음 조회될 때 내려받는다. KOSPI 지수 티커만 필요하면 KOSPI
+  파트만 조회한다.
+- 동시성: 파트마다 잠금을 두어 여러 스레드가 동시에 조회해도 파트당 한 번만
+  내려받는다. 이미 로딩된 파트를 읽을 때는 잠금을 사용하지 않는다.
+- 갱신: `invalidate`는 다음 조회 때 다시 내려받게 하고, `reload`는 새로 내려받은
+  뒤 교체한다. background=True면 갱신하는 동안 기존 데이터를 계속 제공한다.
+- 빈 결과(조회 실패)는 저장하지 않으므로 다음 조회 때 다시 시도한다.
+
+    >> registry = Registry(lambda market: fetch_index_tickers(market), ["KOSPI", "KOSDAQ"])
+    >> registry.get("KOSPI")           # KOSPI만 조회
+    >> registry.frame()                # 전체 파트를 합친 DataFrame
+    >> registry.reload(background=True)
+"""
+
+import threading
+
+import pandas as pd
+from pandas import DataFrame
+
+_MISSING = object()
+
+
+def _is_empty(value) -> bool:
+    return value is None or bool(getattr(value, "empty", False))
+
+
+class Registry:
+    """파트 단위로 지연 로딩하는 참조 데이터
+
+    Args:
+        loader  (callable          ): loader(part) -> 파트 데이터 (보통 DataFrame)
+        parts   (list              ): 파트 이름 목록. `frame`, `find`는 이 순서를 따른다
+        combine (callable, optional): 파트 DataFrame 목록을 합치는 함수. 기본값은 pd.concat
+    """
+
+    def __init__(self, loader, parts, combine=None):
+        self._loader = loader
+        self.parts = tuple(parts)
+        self._combine = combine or pd.concat
+        self._lock = threading.Lock()
+        self._part_locks = {part: threading.Lock() for part in self.parts}
+        self._values: dict = {}
+        self._combined = None  # (세대, DataFrame)
+        self._generation = 0
+
+    def __repr__(self):
+        return f"Registry(parts={self.parts}, loaded={self.loaded()})"
+
+    def loaded(self) -> list:
+        """로딩된 파트 목록"""
+        values = self._values
+        return [part for part in self.parts if part in values]
+
+    def get(self, part):
+        """파트 데이터. 로딩되지 않았으면 내려받는다.
+
+        Raises:
+            KeyError: 등록되지 않은 파트인 경우
+        """
+        value = self._values.get(part, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._part_locks[part]:
+            value = self._values.get(part, _MISSING)
+            if value is _MISSING:
+                value = self._loader(part)
+                if not _is_empty(value):
+                    self.set(part, value)
+        return value
+
+    def set(self, part, value):
+        """파트 데이터를 교체"""
+        with self._lock:
+            values = dict(self._values)
+            values[part] = value
+            self._values = values
+            self._generation += 1
+
+    def frame(self, parts=None) -> DataFrame:
+        """여러 파트를 합친 DataFrame. 전체 파트의 결과는 데이터가 바뀔 때까지 재사용한다."""
+        parts = self.parts if parts is None else tuple(parts)
+        if parts == self.parts:
+            combined = self._combined
+            if combined is not None and combined[0] == self._generation:
+                return combined[1]
+
+        generation = self._generation
+        frames = [value for value in map(self.get, parts) if not _is_empty(value)]
+        df = self._combine(frames) if frames else DataFrame()
+        if parts == self.parts and len(frames) == len(parts):
+            self._combined = (generation, df)
+        return df
+
+    def find(self, label):
+        """index에 label이 있는 첫 번째 파트의 DataFrame
+
+        로딩된 파트를 먼저 확인하고, 없으면 나머지 파트를 순서대로 로딩하면서 찾는다.
+
+        Raises:
+            KeyError: 어느 파트에도 없는 경우
+        """
+        loaded = self.loaded()
+        for part in loaded + [p for p in self.parts if p not in loaded]:
+            df = self.get(part)
+            if not _is_empty(df) and label in df.index:
+                return df
+        raise KeyError(label)
+
+    def invalidate(self, part=None):
+        """파트(생략하면 전체)를 버려 다음 조회 때 다시 내려받게 함"""
+        with self._lock:
+            if part is None:
+                self._values = {}
+            else:
+                self._values = {k: v for k, v in self._values.items() if k != part}
+            self._generation += 1
+
+    def reload(self, part=None, background: bool = False, loader=None):
+        """파트(생략하면 로딩된 전체)를 새로 내려받아 교체
+
+        Args:
+            part       (str     , optional): 갱신할 파트
+            background (bool    , optional): True면 스레드에서 갱신하고 바로 반환
+            loader     (callable, optional): 이번 갱신에만 사용할 loader
+
+        Returns:
+            threading.Thread: background=True인 경우 갱신 스레드, 아니면 None
+        """
+        parts = [part] if part is not None else self.loaded() or list(self.parts)
+        loader = loader or self._loader
+
+        def work():
+            for name in parts:
+                value = loader(name)
+                if not _is_empty(value):
+                    self.set(name, value)
+
+        if not background:
+            work()
+            return None
+        thread = threading.Thread(target=work, name="pykrx-registry-reload", daemon=True)
+        thread.start()
+        return thread
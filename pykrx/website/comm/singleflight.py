@@ -0,0 +1,112 @@
+"""동일한 요청의 동시 실행을 하나로 합치는 single-flight
+
+같은 키로 동시에 들어온 호출 중 첫 번째(leader)만 실제로 실행하고, 나머지는
+leader의 결과(또는 예외)를 받는다. 실행이 끝나면 키는 바로 제거되므로 결과를
+보관하는 캐시가 아니라 진행 중인 요청만 공유한다.
+
+결과가 변경 가능한 객체(응답 dict 등)이면 `copy`를 지정한다. 결과를 함께 받은
+호출이 있으면 호출마다 copy(결과)를 돌려주므로 한 호출이 결과를 수정해도 다른
+호출의 결과에는 영향이 없다. 함께 받은 호출이 없으면 복사하지 않는다.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """스레드 간 single-flight
+
+    Args:
+        copy (callable, optional): 결과를 함께 받은 호출마다 적용할 복사 함수
+    """
+
+    def __init__(self, copy: Callable | None = None):
+        self._lock = threading.Lock()
+        self._calls: dict[Any, _Call] = {}
+        self._copy = copy
+        self.shared = 0  # leader의 결과를 받아간 호출 수
+
+    def do(self, key, func: Callable, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                call.followers += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if self._copy is None else self._copy(call.result)
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        # 키를 지운 뒤에는 followers가 늘지 않는다. call.result는 아무도 수정하지 않는
+        # 원본으로 남겨 두고 모든 호출이 복사본을 받는다.
+        if self._copy is None or call.followers == 0:
+            return call.result
+        return self._copy(call.result)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """이벤트 루프 안의 task 간 single-flight
+
+    leader의 task는 asyncio.shield로 보호하므로 기다리던 task 하나가 취소되어도
+    다른 task가 공유하는 요청은 계속 진행된다.
+
+    Args:
+        copy (callable, optional): 결과를 함께 받은 호출마다 적용할 복사 함수
+    """
+
+    def __init__(self, copy: Callable | None = None):
+        self._tasks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Any, list]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._copy = copy
+        self.shared = 0
+
+    async def do(self, key, factory: Callable[[], Awaitable]):
+        loop = asyncio.get_running_loop()
+        tasks = self._tasks.setdefault(loop, {})
+        entry = tasks.get(key)
+        if entry is None:
+            task = loop.create_task(factory())
+            entry = tasks[key] = [task, 1]  # [task, 결과를 기다린 호출 수]
+            task.add_done_callback(lambda _: tasks.pop(key, None))
+        else:
+            self.shared += 1
+            entry[1] += 1
+        result = await asyncio.shield(entry[0])
+        # 먼저 깨어난 호출이 결과를 수정하기 전에 다른 호출이 복사하도록 보장할 수 없으므로
+        # 결과를 함께 받은 호출은 모두 복사본을 받는다.
+        if self._copy is None or entry[1] == 1:
+            return result
+        return self._copy(result)
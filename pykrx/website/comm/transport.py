@@ -0,0 +1,367 @@
+"""오프라인 테스트/벤치마크를 위한 record/replay/synthetic transport
+
+`webio.Get`/`Post`는 실제 요청을 `set_transport`로 지정한 transport에 위임한다.
+
+- RecordTransport   : 실제 사이트의 응답(JSON/XML)을 디렉터리에 저장
+- ReplayTransport   : 저장한 응답을 그대로 돌려준다. 선택적으로 지연 시간을 흉내 낸다.
+- SyntheticTransport: 원하는 규모(예: 3,000종목 x 20년)의 응답을 생성한다.
+
+    >> from pykrx.website.comm.transport import RecordTransport, ReplayTransport
+    >> from pykrx.website.comm.webio import set_transport
+    >> set_transport(RecordTransport("fixtures"))      # 온라인에서 한 번 기록
+    >> stock.get_market_ohlcv("20220104")
+    >> set_transport(ReplayTransport("fixtures", latency=0.05))   # 이후 오프라인 재생
+    >> stock.get_market_ohlcv("20220104")
+"""
+
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+from pykrx.website.comm.diskcache import make_key
+from pykrx.website.comm.webio import HttpTransport
+
+
+class ReplayMissError(LookupError):
+    """재생할 응답이 저장되어 있지 않음"""
+
+
+class TransportResponse:
+    """requests.Response 중 pykrx가 사용하는 부분만 구현한 응답 객체"""
+
+    def __init__(self, text: str, status_code: int = 200, content_type: str = "application/json"):
+        self.text = text
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type}
+        self.encoding = "utf-8"
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode(self.encoding)
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def _fixture_path(directory: Path, method: str, url: str, params: dict) -> Path:
+    # 사람이 찾아볼 수 있도록 호스트/bld(또는 url 경로) 아래에 저장
+    parts = urlsplit(url)
+    name = str(params.get("bld") or parts.path.strip("/") or "root").replace("/", "_")
+    key = make_key(f"{method} {url}", params)
+    return directory / (parts.hostname or "local") / name / f"{key[:16]}.json"
+
+
+class RecordTransport:
+    """실제 응답을 저장하면서 그대로 돌려주는 transport
+
+    Args:
+        directory (str): 저장 경로
+        inner     (optional): 실제 요청을 보낼 transport. 기본값은 HttpTransport
+    """
+
+    def __init__(self, directory: str | os.PathLike, inner=None):
+        self.directory = Path(directory)
+        self.inner = inner if inner is not None else HttpTransport()
+
+    def request(self, method: str, url: str, headers: dict, params: dict):
+        resp = self.inner.request(method, url, headers, params)
+        path = _fixture_path(self.directory, method, url, params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "method": method,
+            "url": url,
+            "params": {k: str(v) for k, v in params.items()},
+            "status_code": resp.status_code,
+            "content_type": resp.headers.get("Content-Type", ""),
+            "text": resp.text,
+        }
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+        return resp
+
+
+class ReplayTransport:
+    """RecordTransport로 저장한 응답을 재생하는 transport
+
+    저장되지 않은 요청은 ReplayMissError를 발생시키고 `misses`에 기록한다. 호출하는
+    쪽에서 예외를 처리해서 삼키더라도 `misses`로 재생하지 못한 요청을 확인할 수 있다.
+
+    Args:
+        directory (str  ): 저장 경로
+        latency   (float): 응답마다 추가할 지연 시간 (초). 실제 서버 왕복 시간을 흉내 낸다
+    """
+
+    def __init__(self, directory: str | os.PathLike, latency: float = 0.0):
+        self.directory = Path(directory)
+        self.latency = latency
+        self.misses = []
+
+    def request(self, method: str, url: str, headers: dict, params: dict):
+        path = _fixture_path(self.directory, method, url, params)
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            miss = f"{method} {url} {params}"
+            self.misses.append(miss)
+            raise ReplayMissError(miss) from None
+        if self.latency:
+            time.sleep(self.latency)
+        return TransportResponse(record["text"], record["status_code"], record["content_type"])
+
+
+# ----------------------------------------------------------------------------------------------------
+# Synthetic
+# ----------------------------------------------------------------------------------------------------
+
+
+def _fmt(values) -> list[str]:
+    return [f"{v:,}" for v in values]
+
+
+def _fmt_rate(values) -> list[str]:
+    return [f"{v:.2f}" for v in values]
+
+
+class SyntheticMarket:
+    """결정적인(seed 고정) 가상 종목과 시세
+
+    종목별 가격은 날짜의 연속 함수이므로 일자별 전종목 조회와 기간 조회가
+    서로 같은 값을 돌려준다.
+
+    Args:
+        tickers (int): 생성할 종목 수
+        seed    (int): 난수 seed
+    """
+
+    _MARKETS = [
+        ("STK", "유가증권", "KOSPI"),
+        ("KSQ", "코스닥", "KOSDAQ"),
+        ("KNX", "코넥스", "KONEX"),
+    ]
+
+    def __init__(self, tickers: int = 3000, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.tickers = [f"{(i + 1) * 10:06d}" for i in range(tickers)]
+        self.isins = [f"KR7{t}00{i % 10}" for i, t in enumerate(self.tickers)]
+        self.names = [f"종목{i + 1}" for i in range(tickers)]
+        self.markets = [
+            self._MARKETS[2] if i % 10 == 9 else self._MARKETS[i % 2] for i in range(tickers)
+        ]
+        self.base = rng.integers(1_000, 500_000, tickers)
+        self.phase = rng.uniform(0, 2 * np.pi, tickers)
+        self.shares = rng.integers(1_000_000, 6_000_000_000, tickers)
+        self._index = {isin: i for i, isin in enumerate(self.isins)}
+
+    def position(self, isin: str) -> int:
+        return self._index.get(isin, 0)
+
+    def select(self, market_id: str) -> np.ndarray:
+        if market_id in ("ALL", "", None):
+            return np.arange(len(self.tickers))
+        return np.array(
+            [i for i, m in enumerate(self.markets) if m[0] == market_id], dtype=np.int64
+        )
+
+    def prices(self, rows: np.ndarray, days: np.ndarray) -> dict[str, np.ndarray]:
+        """rows(종목)와 days(epoch 기준 일수)의 조합별 OHLCV. 두 배열은 broadcast 된다."""
+        base, phase = self.base[rows], self.phase[rows]
+
+        def level(d):
+            return np.maximum(10, (base * (np.sin(d / 60.0 + phase) * 0.3 + 1.0)).astype(np.int64))
+
+        close = level(days)
+        prev = level(days - 1)
+        spread = np.maximum(1, close // 50)
+        volume = (self.shares[rows] // 1000 * (1.5 + np.cos(days / 7.0 + rows))).astype(np.int64)
+        return {
+            "open": prev,
+            "high": np.maximum(prev, close) + spread,
+            "low": np.minimum(prev, close) - spread,
+            "close": close,
+            "change": close - prev,
+            "rate": (close - prev) / prev * 100,
+            "volume": volume,
+            "value": volume * close,
+            "mktcap": close * self.shares[rows],
+            "shares": np.broadcast_to(self.shares[rows], close.shape),
+        }
+
+
+def _days(dates) -> np.ndarray:
+    return (
+        (pd.DatetimeIndex(dates) - pd.Timestamp("1970-01-01")) // pd.Timedelta(days=1)
+    ).to_numpy()
+
+
+def _stock_finder(market: SyntheticMarket, params: dict):
+    rows = market.select(params.get("mktsel", "ALL"))
+    return {
+        "block1": [
+            {
+                "full_code": market.isins[i],
+                "short_code": market.tickers[i],
+                "codeName": market.names[i],
+                "marketCode": market.markets[i][0],
+                "marketName": market.markets[i][1],
+                "marketEngName": market.markets[i][2],
+                "ord1": "",
+                "ord2": "16",
+            }
+            for i in rows
+        ]
+    }
+
+
+def _all_stock_price(market: SyntheticMarket, params: dict):
+    date = pd.Timestamp(params["trdDd"])
+    if date.dayofweek >= 5:
+        return {"OutBlock_1": []}
+    rows = market.select(params.get("mktId", "ALL"))
+    p = market.prices(rows, _days([date])[0])
+    columns = {
+        "ISU_SRT_CD": [market.tickers[i] for i in rows],
+        "ISU_ABBRV": [market.names[i] for i in rows],
+        "MKT_NM": [market.markets[i][2] for i in rows],
+        "SECT_TP_NM": [""] * len(rows),
+        "TDD_CLSPRC": _fmt(p["close"]),
+        "FLUC_TP_CD": ["1" if c > 0 else "2" if c < 0 else "3" for c in p["change"]],
+        "CMPPREVDD_PRC": _fmt(p["change"]),
+        "FLUC_RT": _fmt_rate(p["rate"]),
+        "TDD_OPNPRC": _fmt(p["open"]),
+        "TDD_HGPRC": _fmt(p["high"]),
+        "TDD_LWPRC": _fmt(p["low"]),
+        "ACC_TRDVOL": _fmt(p["volume"]),
+        "ACC_TRDVAL": _fmt(p["value"]),
+        "MKTCAP": _fmt(p["mktcap"]),
+        "LIST_SHRS": _fmt(p["shares"]),
+        "MKT_ID": [market.markets[i][0] for i in rows],
+    }
+    return {"OutBlock_1": [dict(zip(columns, values)) for values in zip(*columns.values())]}
+
+
+def _individual_stock_price(market: SyntheticMarket, params: dict):
+    dates = pd.bdate_range(params["strtDd"], params["endDd"])[::-1]
+    row = market.position(params.get("isuCd", ""))
+    p = market.prices(np.full(len(dates), row), _days(dates))
+    columns = {
+        "TRD_DD": list(dates.strftime("%Y/%m/%d")),
+        "TDD_CLSPRC": _fmt(p["close"]),
+        "FLUC_TP_CD": ["1" if c > 0 else "2" if c < 0 else "3" for c in p["change"]],
+        "CMPPREVDD_PRC": _fmt(p["change"]),
+        "FLUC_RT": _fmt_rate(p["rate"]),
+        "TDD_OPNPRC": _fmt(p["open"]),
+        "TDD_HGPRC": _fmt(p["high"]),
+        "TDD_LWPRC": _fmt(p["low"]),
+        "ACC_TRDVOL": _fmt(p["volume"]),
+        "ACC_TRDVAL": _fmt(p["value"]),
+        "MKTCAP": _fmt(p["mktcap"]),
+        "LIST_SHRS": _fmt(p["shares"]),
+    }
+    return {"output": [dict(zip(columns, values)) for values in zip(*columns.values())]}
+
+
+def _per_pbr_all_stock(market: SyntheticMarket, params: dict):
+    date = pd.Timestamp(params["trdDd"])
+    if date.dayofweek >= 5:
+        return {"output": []}
+    rows = market.select(params.get("mktId", "ALL"))
+    p = market.prices(rows, _days([date])[0])
+    eps = market.base[rows] // 10
+    bps = market.base[rows] // 2
+    dps = market.base[rows] // 100
+    return {
+        "output": [
+            {
+                "ISU_SRT_CD": market.tickers[i],
+                "ISU_ABBRV": market.names[i],
+                "TDD_CLSPRC": f"{close:,}",
+                "FLUC_TP_CD": "1",
+                "CMPPREVDD_PRC": f"{change:,}",
+                "FLUC_RT": f"{rate:.2f}",
+                "EPS": f"{e:,}",
+                "PER": f"{close / e:.2f}",
+                "BPS": f"{b:,}",
+                "PBR": f"{close / b:.2f}",
+                "DPS": f"{d:,}",
+                "DVD_YLD": f"{d / close * 100:.2f}",
+            }
+            for i, close, change, rate, e, b, d in zip(
+                rows, p["close"], p["change"], p["rate"], eps, bps, dps
+            )
+        ]
+    }
+
+
+def _naver_sise(market: SyntheticMarket, params: dict):
+    count = int(params.get("count", 1))
+    dates = pd.bdate_range(end=datetime.now().date(), periods=count)
+    row = market.tickers.index(params["symbol"]) if params.get("symbol") in market.tickers else 0
+    p = market.prices(np.full(len(dates), row), _days(dates))
+    items = "\n".join(
+        f'<item data="{d}|{o}|{h}|{lo}|{c}|{v}" />'
+        for d, o, h, lo, c, v in zip(
+            dates.strftime("%Y%m%d"), p["open"], p["high"], p["low"], p["close"], p["volume"]
+        )
+    )
+    return f'<?xml version="1.0" encoding="EUC-KR" ?>\n<protocol>\n<chartdata symbol="{params.get("symbol")}">\n{items}\n</chartdata>\n</protocol>'
+
+
+class SyntheticTransport:
+    """가상 시세로 응답을 생성하는 transport
+
+    bld(KRX) 또는 url 경로(Naver)별 생성 함수를 사용한다. 생성 함수는
+    (SyntheticMarket, params)를 받아 JSON으로 직렬화할 객체나 문자열을 반환한다.
+
+    Args:
+        tickers    (int  ): 가상 종목 수
+        seed       (int  ): 난수 seed
+        latency    (float): 응답마다 추가할 지연 시간 (초)
+        generators (dict , optional): 기본 생성 함수에 추가/대체할 {bld: 함수}
+    """
+
+    GENERATORS: dict[str, Callable] = {
+        "dbms/comm/finder/finder_stkisu": _stock_finder,
+        "dbms/comm/finder/finder_listdelisu": lambda market, params: {"block1": []},
+        "dbms/MDC/STAT/standard/MDCSTAT01501": _all_stock_price,
+        "dbms/MDC/STAT/standard/MDCSTAT01701": _individual_stock_price,
+        "dbms/MDC/STAT/standard/MDCSTAT03501": _per_pbr_all_stock,
+        "/sise.nhn": _naver_sise,
+    }
+
+    def __init__(self, tickers: int = 3000, seed: int = 0, latency: float = 0.0, generators=None):
+        self.market = SyntheticMarket(tickers, seed)
+        self.latency = latency
+        self.generators = {**self.GENERATORS, **(generators or {})}
+        self.bytes_served = 0
+
+    def register(self, key: str, generator: Callable):
+        self.generators[key] = generator
+
+    def request(self, method: str, url: str, headers: dict, params: dict):
+        key = params.get("bld") or urlsplit(url).path
+        generator = self.generators.get(key)
+        if generator is None:
+            raise ReplayMissError(f"no synthetic generator for {key}")
+        payload = generator(self.market, params)
+        if isinstance(payload, str):
+            resp = TransportResponse(payload, content_type="text/xml")
+        else:
+            resp = TransportResponse(json.dumps(payload, ensure_ascii=False))
+        if self.latency:
+            time.sleep(self.latency)
+        self.bytes_served += len(resp.content)
+        return resp
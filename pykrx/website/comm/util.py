@@ -1,10 +1,14 @@
+import functools
 import logging
+import threading
 
 from pandas import DataFrame
 
+from pykrx.website.comm import instrument
+
 
 def dataframe_empty_handler(func):
-    def wrapper(*args, **kwargs):
+    def handled(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except (AttributeError, KeyError, TypeError, ValueError) as e:
@@ -12,24 +16,40 @@ def dataframe_empty_handler(func):
             logging.info(e)
             return DataFrame()
 
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if instrument._hooks:
+            return instrument.call(handled, func.__name__, args, kwargs)
+        return handled(*args, **kwargs)
+
     return wrapper
 
 
 def singleton(class_):
+    """인스턴스를 하나만 만드는 클래스 decorator
+
+    여러 스레드가 동시에 처음 생성해도 생성자는 한 번만 실행되며, 생성자가 끝나기
+    전의 인스턴스가 다른 스레드에 반환되지 않는다.
+    """
+
     class SingletonWrapper(class_):
         _instance = None
+        _lock = threading.RLock()
 
         def __new__(cls, *args, **kwargs):
-            if SingletonWrapper._instance is None:
-                SingletonWrapper._instance = super().__new__(cls, *args, **kwargs)
-                SingletonWrapper._instance._sealed = False
+            instance = SingletonWrapper._instance
+            if instance is not None:
+                return instance
+            with SingletonWrapper._lock:
+                if SingletonWrapper._instance is None:
+                    instance = super().__new__(cls)
+                    class_.__init__(instance, *args, **kwargs)
+                    SingletonWrapper._instance = instance
             return SingletonWrapper._instance
 
         def __init__(self, *args, **kwargs):
-            if self._sealed:
-                return
-            super().__init__(*args, **kwargs)
-            self._sealed = True
+            # 생성자는 __new__에서 잠금을 잡은 채 실행한다.
+            pass
 
     SingletonWrapper.__name__ = class_.__name__
     return SingletonWrapper
@@ -1,6 +1,165 @@
+import threading
+import time
 from abc import abstractmethod
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from pykrx.website.comm import instrument
+from pykrx.website.comm.aio import run_blocking
+from pykrx.website.comm.ratelimit import throttle
+
+
+class SessionPool:
+    """프로세스 전역에서 공유하는 keep-alive HTTP 세션 풀
+
+    매 요청마다 TCP 연결을 새로 맺지 않도록 하나의 requests.Session을 여러
+    스레드가 공유한다. urllib3의 커넥션 풀은 thread-safe 하므로 세션 객체의
+    생성/교체만 lock으로 보호한다.
+
+    Args:
+        pool_size    (int  ): 호스트별로 유지할 최대 커넥션 수
+        idle_timeout (float): 마지막 요청 이후 이 시간(초)이 지나면 유휴 커넥션을
+                              버리고 세션을 새로 만든다. 서버가 먼저 끊은
+                              keep-alive 커넥션을 재사용하는 것을 막기 위함
+    """
+
+    def __init__(self, pool_size: int = 10, idle_timeout: float = 30.0):
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._last_used = 0.0
+
+    def _create(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get(self) -> requests.Session:
+        """재사용 가능한 세션을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            if self._session is not None and now - self._last_used > self.idle_timeout:
+                # 진행 중인 요청의 커넥션은 반환 시점에 닫히므로 안전하다.
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._create()
+            self._last_used = now
+            return self._session
+
+    def configure(self, pool_size: int | None = None, idle_timeout: float | None = None):
+        """풀 설정을 변경. 기존 세션은 닫히고 다음 요청에서 새로 생성된다."""
+        with self._lock:
+            if pool_size is not None:
+                self.pool_size = pool_size
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_session_pool = SessionPool()
+
+
+def get_session() -> requests.Session:
+    return _session_pool.get()
+
+
+def configure_session_pool(pool_size: int | None = None, idle_timeout: float | None = None):
+    """KRX/Naver 요청에 사용하는 공유 커넥션 풀 설정
+
+    Args:
+        pool_size    (int  , optional): 호스트별 최대 커넥션 수
+        idle_timeout (float, optional): 유휴 커넥션 유지 시간 (초)
+    """
+    _session_pool.configure(pool_size, idle_timeout)
+
+
+class HttpTransport:
+    """실제 사이트로 요청을 보내는 기본 transport
+
+    호스트별 속도 제한과 공유 세션 풀은 여기서만 적용되므로 replay/synthetic
+    transport는 대기 없이 응답을 돌려준다.
+    """
+
+    def request(self, method: str, url: str, headers: dict, params: dict):
+        _timing.throttle = throttle(url)
+        if method == "GET":
+            return get_session().get(url, headers=headers, params=params)
+        return get_session().post(url, headers=headers, data=params)
+
+
+_transport = HttpTransport()
+# 스레드별 요청 시간. 속도 제한 대기(throttle)와 upstream 왕복 시간을 나눠서 기록한다.
+_timing = threading.local()
+
+
+def get_transport():
+    return _transport
+
+
+def set_transport(transport=None):
+    """Get/Post가 사용할 transport를 교체
+
+    Args:
+        transport (optional): request(method, url, headers, params) 메서드를 가진 객체.
+                              None이면 HttpTransport로 되돌린다.
+
+    Returns:
+        이전에 사용하던 transport
+    """
+    global _transport
+    previous = _transport
+    _transport = transport if transport is not None else HttpTransport()
+    return previous
+
+
+def pop_upstream_seconds() -> float | None:
+    """이 스레드에서 마지막으로 pop한 뒤 보낸 요청들의 upstream 왕복 시간 합계
+
+    속도 제한 대기 시간은 포함하지 않는다. 요청을 보내지 않았으면 (캐시 적중 등) None
+    """
+    seconds = getattr(_timing, "upstream", None)
+    _timing.upstream = None
+    return seconds
+
+
+def _request(method: str, url: str, headers: dict, params: dict):
+    _timing.throttle = 0.0
+    start = time.time()
+    begin = time.perf_counter()
+    resp = _transport.request(method, url, headers, params)
+    seconds = time.perf_counter() - begin - _timing.throttle
+    _timing.upstream = (getattr(_timing, "upstream", None) or 0.0) + seconds
+    if not instrument._hooks:
+        return resp
+
+    # 속도 제한 대기는 http 시간에 섞지 않고 throttle_seconds로 따로 기록한다.
+    content = getattr(resp, "content", b"")
+    instrument.emit(
+        instrument.Event(
+            "http",
+            str(params.get("bld") or urlsplit(url).path),
+            dict(params),
+            seconds,
+            bytes=len(content) if isinstance(content, (bytes, str)) else 0,
+            start=start + _timing.throttle,
+            throttle_seconds=_timing.throttle,
+        )
+    )
+    return resp
 
 
 class Get:
@@ -8,8 +167,7 @@ class Get:
         self.headers = {"User-Agent": "Mozilla/5.0", "Referer": "http://data.krx.co.kr/"}
 
     def read(self, **params):
-        resp = requests.get(self.url, headers=self.headers, params=params)
-        return resp
+        return _request("GET", self.url, self.headers, params)
 
     @property
     @abstractmethod
@@ -24,10 +182,23 @@ class Post:
             self.headers.update(headers)
 
     def read(self, **params):
-        resp = requests.post(self.url, headers=self.headers, data=params)
-        return resp
+        return _request("POST", self.url, self.headers, params)
 
     @property
     @abstractmethod
     def url(self) -> str:
         raise NotImplementedError
+
+
+class AsyncGet(Get):
+    """Get의 asyncio 버전. 요청은 공유 동시 실행 한도 안에서 워커 스레드로 실행된다."""
+
+    async def read(self, **params):  # type: ignore[override]
+        return await run_blocking(super().read, **params)
+
+
+class AsyncPost(Post):
+    """Post의 asyncio 버전. 요청은 공유 동시 실행 한도 안에서 워커 스레드로 실행된다."""
+
+    async def read(self, **params):  # type: ignore[override]
+        return await run_blocking(super().read, **params)
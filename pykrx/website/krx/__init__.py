@@ -1,9 +1,9 @@
 import datetime
-from typing import cast
 
-from pandas import DatetimeIndex
+import pandas as pd
 
-from .market.wrap import get_index_ohlcv_by_date
+from .market.calendar import get_trading_calendar
+from .market.wrap import get_index_ohlcv_by_date  # noqa: F401
 
 
 def datetime2string(dt, freq="d"):
@@ -18,6 +18,9 @@ def datetime2string(dt, freq="d"):
 def get_nearest_business_day_in_a_week(date: str | None = None, prev: bool = True) -> str:
     """인접한 영업일을 조회한다.
 
+    로컬 거래일 달력(TradingCalendar)으로 계산하므로 이미 알고 있는 기간이면
+    시세를 조회하지 않는다.
+
     Args:
         date (str , optional): 조회할 날짜로 입력하지 않으면 현재 시간으로 대체
         prev (bool, optional): 이전 영업일을 조회할지 이후 영업일을 조회할지
@@ -27,18 +30,10 @@ def get_nearest_business_day_in_a_week(date: str | None = None, prev: bool = Tru
         str: 날짜 (YYMMDD)
     """
     curr = datetime.datetime.now() if date is None else datetime.datetime.strptime(date, "%Y%m%d")
+    curr_str = curr.strftime("%Y%m%d")
 
-    if prev:
-        prev_dt = curr - datetime.timedelta(days=7)
-        curr_str = curr.strftime("%Y%m%d")
-        prev_str = prev_dt.strftime("%Y%m%d")
-        df = get_index_ohlcv_by_date(prev_str, curr_str, "1001")
-        index = cast(DatetimeIndex, df.index)
-        return index[-1].strftime("%Y%m%d")  # type: ignore[attr-defined]
-    else:
-        next_dt = curr + datetime.timedelta(days=7)
-        next_str = next_dt.strftime("%Y%m%d")
-        curr_str = curr.strftime("%Y%m%d")
-        df = get_index_ohlcv_by_date(curr_str, next_str, "1001")
-        index = cast(DatetimeIndex, df.index)
-        return index[0].strftime("%Y%m%d")  # type: ignore[attr-defined]
+    calendar = get_trading_calendar()
+    nearest = calendar.previous(curr_str) if prev else calendar.next(curr_str)
+    if pd.isna(nearest) or abs((nearest - pd.Timestamp(curr_str)).days) > 7:
+        raise IndexError(f"no business day within a week of {curr_str}")
+    return nearest.strftime("%Y%m%d")
@@ -1,5 +1,4 @@
 import pandas as pd
-from pandas import DataFrame
 
 from pykrx.website.krx.krxio import KrxWebIo
 
@@ -17,7 +16,7 @@ class MKD40038(KrxWebIo):
             if len(result["block1"]) == 0:  # type: ignore[index]
                 return None
 
-            df = DataFrame(result["block1"])  # type: ignore[index]
+            df = self.frame(result["block1"])  # type: ignore[index]
             df = df[["trd_dd", "prc_yd1", "prc_yd2", "prc_yd3", "prc_yd4", "prc_yd5"]]
             df.columns = ["일자", "3년물", "5년물", "10년물", "20년물", "30년물"]
             df.set_index("일자", inplace=True)
@@ -60,7 +59,7 @@ class OtcBondYieldAllStock(KrxWebIo):
 
         """
         result = self.read(inqTpCd="T", trdDd=trade_date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class OtcBondYieldIndividualTrend(KrxWebIo):
@@ -106,7 +105,7 @@ class OtcBondYieldIndividualTrend(KrxWebIo):
         result = self.read(
             inqTpCd="E", strtDd=start_date, endDd=end_date, bndKindTpCd=bond_kind_type_code
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 if __name__ == "__main__":
@@ -2,13 +2,14 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
-from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm import convert_numeric, dataframe_empty_handler, memoize
 from pykrx.website.krx.bond.core import (
     OtcBondYieldAllStock,
     OtcBondYieldIndividualTrend,
 )
 
 
+@memoize
 @dataframe_empty_handler
 def get_otc_treasury_yields_by_ticker(date: str) -> DataFrame:
     """[14017] 장외 채권수익률 - 전종목
@@ -38,11 +39,12 @@ def get_otc_treasury_yields_by_ticker(date: str) -> DataFrame:
     df = OtcBondYieldAllStock().fetch(date)
     if not df.empty:
         df.columns = ["채권종류", "수익률", "대비"]
-        df = df.astype({"수익률": np.float32, "대비": np.float32})
+        df = convert_numeric(df, {"수익률": np.float32, "대비": np.float32})
         df = df.set_index("채권종류")
     return df
 
 
+@memoize
 @dataframe_empty_handler
 def get_otc_treasury_yields_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """[14017] 장외 채권수익률 - 개별추이
@@ -92,7 +94,7 @@ def get_otc_treasury_yields_by_date(fromdate: str, todate: str, ticker: str) ->
 
     df = OtcBondYieldIndividualTrend().fetch(fromdate, todate, ticker2code[ticker])
     df.columns = ["일자", "수익률", "대비"]
-    df = df.astype({"수익률": np.float32, "대비": np.float32})
+    df = convert_numeric(df, {"수익률": np.float32, "대비": np.float32})
     df = df.set_index("일자")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
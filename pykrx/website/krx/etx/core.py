@@ -30,7 +30,7 @@ class ListedStockSearch(KrxWebIo):
                 4  KR7278420005     278420      ARIRANG ESG우수기업
         """
         result = self.read(mktsel=market, searchText=name)
-        return DataFrame(result["block1"])  # type: ignore[index]
+        return self.frame(result["block1"])  # type: ignore[index]
 
 
 class EtfAllStockBasicInfo(KrxWebIo):
@@ -54,7 +54,7 @@ class EtfAllStockBasicInfo(KrxWebIo):
                 4        KR7287300008     287300                         KB KBSTAR 200건설증권상장지수투자신탁(주식)                   KBSTAR 200건설                    KB KBSTAR 200 Constructions ETF  2017/12/22                     코스피 200 건설                KRX                일반 (1)                    실물            국내             주식       560,000   케이비자산운용   20,000       0.190                    비과세
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read()
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class EtnAllStockBasicInfo(KrxWebIo):
@@ -78,7 +78,7 @@ class EtnAllStockBasicInfo(KrxWebIo):
                 4    KRG581100069     580006               KB증권 KB KTOP30 파생결합증권(상장지수증권) 제6호           KB KTOP30 ETN                             KB KB KTOP30 ETN 6  2016/10/27  2026/10/23                 KTOP 30              KRX                 일반            ETN            국내             주식   5,000,000    KB증권       0.39      비과세
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read()
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class ElwAllStockBasicInfo(KrxWebIo):
@@ -102,7 +102,7 @@ class ElwAllStockBasicInfo(KrxWebIo):
                 4     KRA5811A0A44     58F407    KB증권(주) 주식워런트증권 제F407호      KBF407LG화학콜    KB SECURITIES ELW F407  2020/04/28  2021/02/10  2021/02/16          주식       LG화학  16,000,000    KB증권        0.002         콜      유럽형  322,500  KB증권          15           현금결제
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read()
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class IndividualStockPriceEtf(KrxWebIo):
@@ -129,7 +129,7 @@ class IndividualStockPriceEtf(KrxWebIo):
                 3  2021/01/14     43,835          2            30   -0.07  43,942.97     43,725    43,995    43,585    196,552   8,602,863,505  861,357,750,000          845,902,227,451  19,650,000    코스피 200         429.85           2          0.53       -0.12
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(isuCd=isin, strtDd=start_date, endDd=end_date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class AllStockPriceEtf(KrxWebIo):
@@ -156,7 +156,7 @@ class AllStockPriceEtf(KrxWebIo):
                 4       278420      ARIRANG ESG우수기업      8,950           145          1    1.65    8,952.56      8,815     8,975     8,810     39,513    352,947,304    4,027,500,000                        0     450,000    WISE ESG우수기업 지수       1,210.07         19.83           1     1.67
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(trdDd=date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class AllStockPriceChangeEtf(KrxWebIo):
@@ -186,7 +186,7 @@ class AllStockPriceChangeEtf(KrxWebIo):
                     4       278420       ARIRANG ESG우수기업    9,095    9,385          1     290    3.19      9,114      84,463,155
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(strtDd=start_date, endDd=end_date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class PDF(KrxWebIo):
@@ -213,7 +213,7 @@ class PDF(KrxWebIo):
                 NOTE: 웹 서버가 COMPST_ISU_CD에 ISIN과 축향형을 혼합해서 반환한다. Why?>
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(trdDd=date, isuCd=isin)  # API 파라미터 이름 유지
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class TrackingErrorTrend(KrxWebIo):
@@ -242,7 +242,7 @@ class TrackingErrorTrend(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=start_date, endDd=end_date, isuCd=isin)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class DivergenceRateTrend(KrxWebIo):
@@ -271,7 +271,7 @@ class DivergenceRateTrend(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=start_date, endDd=end_date, isuCd=isin_code)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class EtfInvestorTradingVolumePeriodTotal(KrxWebIo):
@@ -307,7 +307,7 @@ class EtfInvestorTradingVolumePeriodTotal(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=start_date, endDd=end_date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class EtfInvestorTradingVolumeDailyTrend(KrxWebIo):
@@ -350,7 +350,7 @@ class EtfInvestorTradingVolumeDailyTrend(KrxWebIo):
             inqCondTpCd1=query_condition_type_code1,
             inqCondTpCd2=query_condition_type_code2,
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class EtfInvestorTradingVolumeIndividualStockPeriodTotal(KrxWebIo):
@@ -390,7 +390,7 @@ class EtfInvestorTradingVolumeIndividualStockPeriodTotal(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=start_date, endDd=end_date, isuCd=isin_code)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class EtfInvestorTradingVolumeIndividualStockDailyTrend(KrxWebIo):
@@ -439,7 +439,7 @@ class EtfInvestorTradingVolumeIndividualStockDailyTrend(KrxWebIo):
             strtDd=start_date,
             endDd=end_date,
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class EtnInvestorTradingVolumeIndividualStockPeriodTotal(KrxWebIo):
@@ -479,7 +479,7 @@ class EtnInvestorTradingVolumeIndividualStockPeriodTotal(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=start_date, endDd=end_date, isuCd=isin_code)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class EtnInvestorTradingVolumeIndividualStockDailyTrend(KrxWebIo):
@@ -525,7 +525,7 @@ class EtnInvestorTradingVolumeIndividualStockDailyTrend(KrxWebIo):
             strtDd=start_date,
             endDd=end_date,
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 if __name__ == "__main__":
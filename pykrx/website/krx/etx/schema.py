@@ -0,0 +1,82 @@
+"""ETF/ETN/ELW core 클래스의 스키마"""
+
+import numpy as np
+
+from pykrx.website.krx.etx.core import (
+    PDF,
+    AllStockPriceChangeEtf,
+    AllStockPriceEtf,
+    DivergenceRateTrend,
+    IndividualStockPriceEtf,
+    TrackingErrorTrend,
+)
+from pykrx.website.krx.schema import DATE, Schema
+
+_OHLCV_FIELDS = [
+    ("TDD_OPNPRC", "시가", np.uint32),
+    ("TDD_HGPRC", "고가", np.uint32),
+    ("TDD_LWPRC", "저가", np.uint32),
+    ("TDD_CLSPRC", "종가", np.uint32),
+    ("ACC_TRDVOL", "거래량", np.uint64),
+    ("ACC_TRDVAL", "거래대금", np.uint64),
+    ("OBJ_STKPRC_IDX", "기초지수", np.float64),
+]
+
+ETF_OHLCV_BY_DATE = Schema(
+    IndividualStockPriceEtf,
+    [("TRD_DD", "날짜", DATE), ("LST_NAV", "NAV", np.float64), *_OHLCV_FIELDS],
+    index="날짜",
+)
+
+ETF_OHLCV_BY_TICKER = Schema(
+    AllStockPriceEtf,
+    [("ISU_SRT_CD", "티커"), ("NAV", "NAV", np.float64), *_OHLCV_FIELDS],
+    index="티커",
+)
+
+ETF_PRICE_CHANGE_BY_TICKER = Schema(
+    AllStockPriceChangeEtf,
+    [
+        ("ISU_SRT_CD", "티커"),
+        ("BAS_PRC", "시가", np.uint32),
+        ("CLSPRC", "종가", np.uint32),
+        ("CMP_PRC", "변동폭", np.int32),
+        ("FLUC_RT", "등락률", np.float32),
+        ("ACC_TRDVOL", "거래량", np.uint64),
+        ("ACC_TRDVAL", "거래대금", np.uint64),
+    ],
+    index="티커",
+)
+
+# 금액은 음수 값이 있을 수 있으므로 int64 사용
+ETF_PORTFOLIO_DEPOSIT_FILE = Schema(
+    PDF,
+    [
+        ("COMPST_ISU_CD", "티커"),
+        ("COMPST_ISU_CU1_SHRS", "계약수", np.float64),
+        ("VALU_AMT", "금액", np.int64),
+        ("COMPST_RTO", "비중", np.float32),
+    ],
+)
+
+ETF_PRICE_DEVIATION = Schema(
+    DivergenceRateTrend,
+    [
+        ("TRD_DD", "날짜", DATE),
+        ("CLSPRC", "종가", np.uint32),
+        ("LST_NAV", "NAV", np.float64),
+        ("DIVRG_RT", "괴리율", np.float32),
+    ],
+    index="날짜",
+)
+
+ETF_TRACKING_ERROR = Schema(
+    TrackingErrorTrend,
+    [
+        ("TRD_DD", "날짜", DATE),
+        ("LST_NAV", "NAV", np.float64),
+        ("OBJ_STKPRC_IDX", "지수", np.float64),
+        ("TRACE_ERR_RT", "추적오차율", np.float32),
+    ],
+    index="날짜",
+)
@@ -1,49 +1,68 @@
 import pandas as pd
 
 from pykrx.website.comm import dataframe_empty_handler, singleton
+from pykrx.website.comm.registry import Registry
 from pykrx.website.krx.etx.core import (
     ElwAllStockBasicInfo,
     EtfAllStockBasicInfo,
     EtnAllStockBasicInfo,
 )
 
+_CORES = {
+    "ETF": EtfAllStockBasicInfo,
+    "ETN": EtnAllStockBasicInfo,
+    "ELW": ElwAllStockBasicInfo,
+}
+
 
 @singleton
 class EtxTicker:
     def __init__(self):
-        self.df = self._get_tickers()
-
-    @dataframe_empty_handler
-    def _get_tickers(self):
-        df_etf = EtfAllStockBasicInfo().fetch()
-        df_etf = df_etf[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_etf["CATEGORY"] = "ETF"
+        # ETF/ETN/ELW 목록은 처음 조회할 때 시장별로 내려받는다.
+        self.registry = Registry(self._get_tickers, _CORES)
 
-        df_etn = EtnAllStockBasicInfo().fetch()
-        df_etn = df_etn[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_etn["CATEGORY"] = "ETN"
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.registry.frame()
 
-        df_elw = ElwAllStockBasicInfo().fetch()
-        df_elw = df_elw[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_elw["CATEGORY"] = "ELW"
-
-        df = pd.concat([df_etf, df_etn, df_elw])
+    @dataframe_empty_handler
+    def _get_tickers(self, market):
+        df = _CORES[market]().fetch()
+        df = df[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
+        df["CATEGORY"] = market
         df.columns = ["isin", "ticker", "종목명", "상장일", "시장"]
         df = df.replace("/", "", regex=True)
         return df.set_index("ticker")
 
+    def invalidate(self, market=None):
+        """market(생략하면 전체)의 목록을 버려 다음 조회 때 다시 내려받게 함"""
+        self.registry.invalidate(market)
+
+    def reload(self, market=None, background: bool = False):
+        """market(생략하면 로딩된 전체)의 목록을 새로 내려받아 교체"""
+        return self.registry.reload(market, background=background)
+
     def get_ticker(self, market, date) -> list:
         if market == "ALL":
             return self.df.index.to_list()
-        cond1 = self.df["시장"] == market
-        cond2 = self.df["상장일"] <= date
-        return self.df[cond1 & cond2].index.to_list()
+        if market not in _CORES:
+            return []
+        df = self.registry.get(market)
+        return df[df["상장일"] <= date].index.to_list()
+
+    def get(self, ticker, column):
+        """티커가 속한 시장의 목록만 읽어 column 값을 반환
+
+        Raises:
+            KeyError: ETF/ETN/ELW 어디에도 없는 티커인 경우
+        """
+        return self.registry.find(ticker).loc[ticker, column]
 
     def get_name(self, ticker) -> str:
-        return self.df.loc[ticker, "종목명"]
+        return self.get(ticker, "종목명")
 
     def get_market(self, ticker) -> str:
-        return self.df.loc[ticker].index["시장"]
+        return self.get(ticker, "시장")
 
 
 def get_etx_name(ticker):
@@ -64,19 +83,19 @@ def get_etx_ticker_list(date: str, market: str) -> list:
 
 
 def is_etf(ticker):
-    return EtxTicker().df.loc[ticker, "시장"] == "ETF"
+    return EtxTicker().get_market(ticker) == "ETF"
 
 
 def is_etn(ticker):
-    return EtxTicker().df.loc[ticker, "시장"] == "ETN"
+    return EtxTicker().get_market(ticker) == "ETN"
 
 
 def is_elw(ticker):
-    return EtxTicker().df.loc[ticker, "시장"] == "ELW"
+    return EtxTicker().get_market(ticker) == "ELW"
 
 
 def get_etx_isin(ticker):
-    return EtxTicker().df.loc[ticker, "isin"]
+    return EtxTicker().get(ticker, "isin")
 
 
 if __name__ == "__main__":
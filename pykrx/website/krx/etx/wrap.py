@@ -4,24 +4,20 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
-from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm import convert_numeric, dataframe_empty_handler, memoize
+from pykrx.website.krx.etx import schema
 from pykrx.website.krx.etx.core import (
-    PDF,
-    AllStockPriceChangeEtf,
-    AllStockPriceEtf,
-    DivergenceRateTrend,
     EtfInvestorTradingVolumeDailyTrend,
     EtfInvestorTradingVolumeIndividualStockDailyTrend,
     EtfInvestorTradingVolumeIndividualStockPeriodTotal,
     EtfInvestorTradingVolumePeriodTotal,
     EtnInvestorTradingVolumeIndividualStockDailyTrend,
     EtnInvestorTradingVolumeIndividualStockPeriodTotal,
-    IndividualStockPriceEtf,
-    TrackingErrorTrend,
 )
 from pykrx.website.krx.etx.ticker import get_etx_isin, is_etf
 
 
+@memoize
 @dataframe_empty_handler
 def get_etf_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """주어진 기간동안 특정 ETF의 OHLCV
@@ -42,41 +38,11 @@ def get_etf_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """  # pylint: disable=line-too-long # noqa: E501
 
     isin = get_etx_isin(ticker)
-    df = IndividualStockPriceEtf().fetch(fromdate, todate, isin)
-
-    df = df[
-        [
-            "TRD_DD",
-            "LST_NAV",
-            "TDD_OPNPRC",
-            "TDD_HGPRC",
-            "TDD_LWPRC",
-            "TDD_CLSPRC",
-            "ACC_TRDVOL",
-            "ACC_TRDVAL",
-            "OBJ_STKPRC_IDX",
-        ]
-    ]
-    df.columns = ["날짜", "NAV", "시가", "고가", "저가", "종가", "거래량", "거래대금", "기초지수"]
-    df = df.replace(r"^-$", "0", regex=True)
-    df = df.replace(r",", "", regex=True)
-    df = df.set_index("날짜")
-    df = df.astype(
-        {
-            "NAV": np.float64,
-            "시가": np.uint32,
-            "고가": np.uint32,
-            "저가": np.uint32,
-            "종가": np.uint32,
-            "거래량": np.uint64,
-            "거래대금": np.uint64,
-            "기초지수": np.float64,
-        }
-    )
-    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
+    df = schema.ETF_OHLCV_BY_DATE.fetch(fromdate, todate, isin)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
     """특정 일자의 전종목의 OHLCV 조회
@@ -98,39 +64,10 @@ def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
             278420    9145.45   9055   9150   9055    9105   1164    10598375   1234.03
     """  # pylint: disable=line-too-long # noqa: E501
 
-    df = AllStockPriceEtf().fetch(date)
-    df = df[
-        [
-            "ISU_SRT_CD",
-            "NAV",
-            "TDD_OPNPRC",
-            "TDD_HGPRC",
-            "TDD_LWPRC",
-            "TDD_CLSPRC",
-            "ACC_TRDVOL",
-            "ACC_TRDVAL",
-            "OBJ_STKPRC_IDX",
-        ]
-    ]
-    df.columns = ["티커", "NAV", "시가", "고가", "저가", "종가", "거래량", "거래대금", "기초지수"]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.set_index("티커")
-    df = df.astype(
-        {
-            "NAV": np.float64,
-            "시가": np.uint32,
-            "고가": np.uint32,
-            "저가": np.uint32,
-            "종가": np.uint32,
-            "거래량": np.uint64,
-            "거래대금": np.uint64,
-            "기초지수": np.float64,
-        }
-    )
-    return df
+    return schema.ETF_OHLCV_BY_TICKER.fetch(date)
 
 
+@memoize
 @dataframe_empty_handler
 def get_etf_price_change_by_ticker(fromdate: str, todate: str) -> DataFrame:
     """특정 기간동안 전종의 등락률 조회
@@ -153,25 +90,10 @@ def get_etf_price_change_by_ticker(fromdate: str, todate: str) -> DataFrame:
             278420    9095    9385     290    3.19     9114     84463155
     """
 
-    df = AllStockPriceChangeEtf().fetch(fromdate, todate)
-    df = df[["ISU_SRT_CD", "BAS_PRC", "CLSPRC", "CMP_PRC", "FLUC_RT", "ACC_TRDVOL", "ACC_TRDVAL"]]
-    df.columns = ["티커", "시가", "종가", "변동폭", "등락률", "거래량", "거래대금"]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.set_index("티커")
-    df = df.astype(
-        {
-            "시가": np.uint32,
-            "종가": np.uint32,
-            "변동폭": np.int32,
-            "등락률": np.float32,
-            "거래량": np.uint64,
-            "거래대금": np.uint64,
-        }
-    )
-    return df
+    return schema.ETF_PRICE_CHANGE_BY_TICKER.fetch(fromdate, todate)
 
 
+@memoize
 @dataframe_empty_handler
 def get_etf_portfolio_deposit_file(date: str, ticker: str) -> DataFrame:
     """Portfolio Deposit File 조회
@@ -191,24 +113,35 @@ def get_etf_portfolio_deposit_file(date: str, ticker: str) -> DataFrame:
     """
 
     isin = get_etx_isin(ticker)
-    df = PDF().fetch(date, isin)
-    df = df[["COMPST_ISU_CD", "COMPST_ISU_CU1_SHRS", "VALU_AMT", "COMPST_RTO"]]
-    df.columns = ["티커", "계약수", "금액", "비중"]
+    df = schema.ETF_PORTFOLIO_DEPOSIT_FILE.fetch(date, isin)
+    return normalize_portfolio_deposit_file(df)
 
-    # NOTE: 웹 서버가 COMPST_ISU_CD에 ISIN과 축향형을 혼합해서 반환한다. Why?
-    df["티커"] = df["티커"].apply(lambda x: x[3:9] if len(x) > 6 else x)  # type: ignore[attr-defined]
-    df = df.set_index("티커")
 
-    df = df.replace(",", "", regex=True)
-    # - empty string은 int, float로 형변환 불가
-    #  -> 이 문제를 해결하기 위해 '-' 문자는 0으로 치환
-    df = df.replace(r"\-$", "0", regex=True)
-    # 금액은 음수 값이 있을 수 있으므로 int64 사용
-    df = df.astype({"계약수": np.float64, "금액": np.int64, "비중": np.float32})
-    df = df[(df.T != 0).any()]
-    return cast(DataFrame, df)
+def normalize_portfolio_deposit_file(df: DataFrame) -> DataFrame:
+    """PDF 조회 결과의 티커를 단축코드로 바꾸고 값이 모두 0인 구성 종목을 제거
+
+    NOTE: 웹 서버가 COMPST_ISU_CD에 ISIN과 축향형을 혼합해서 반환한다. Why?
+    ISIN(KR7005930003)은 단축코드(005930) 부분인 4~9번째 글자만 남긴다. 행마다 파이썬
+    함수를 호출하지 않도록 고정폭 문자열 배열을 글자 단위로 잘라서 변환한다.
+    """
+    codes = np.asarray(df["티커"], dtype=str)
+    width = codes.dtype.itemsize // 4
+    if width > 6:
+        # 가장 긴 코드가 9글자보다 짧아도 [3:9]가 6글자 폭이 되도록 9글자 폭으로 맞춘다.
+        width = max(width, 9)
+        chars = codes.astype(f"U{width}").view("U1").reshape(len(codes), width)
+        short = np.ascontiguousarray(chars[:, 3:9]).view("U6").ravel()
+        codes = np.where(np.char.str_len(codes) > 6, short, codes)
+
+    df = df.set_index("티커")
+    df.index = pd.Index(codes, name="티커")
+    nonzero = np.zeros(len(df), dtype=bool)
+    for name in df.columns:
+        nonzero |= df[name].to_numpy() != 0
+    return cast(DataFrame, df[nonzero])
 
 
+@memoize
 @dataframe_empty_handler
 def get_etf_price_deviation(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """주어진 기간동안 특정 종목의 괴리율 추이를 반환
@@ -231,17 +164,11 @@ def get_etf_price_deviation(fromdate: str, todate: str, ticker: str) -> DataFram
     """
 
     isin = get_etx_isin(ticker)
-    df = DivergenceRateTrend().fetch(fromdate, todate, isin)
-    df = df[["TRD_DD", "CLSPRC", "LST_NAV", "DIVRG_RT"]]
-    df.columns = ["날짜", "종가", "NAV", "괴리율"]
-    df = df.set_index("날짜")
-    df = df.replace(",", "", regex=True)
-
-    df = df.astype({"종가": np.uint32, "NAV": np.float64, "괴리율": np.float32})
-    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
+    df = schema.ETF_PRICE_DEVIATION.fetch(fromdate, todate, isin)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_etf_tracking_error(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """주어진 기간동안 특정 종목의 추적 오차율을 반환
@@ -263,16 +190,11 @@ def get_etf_tracking_error(fromdate: str, todate: str, ticker: str) -> DataFrame
     """
 
     isin = get_etx_isin(ticker)
-    df = TrackingErrorTrend().fetch(fromdate, todate, isin)
-    df = df[["TRD_DD", "LST_NAV", "OBJ_STKPRC_IDX", "TRACE_ERR_RT"]]
-    df.columns = ["날짜", "NAV", "지수", "추적오차율"]
-    df = df.set_index("날짜")
-    df = df.replace(",", "", regex=True)
-    df = df.astype({"NAV": np.float64, "지수": np.float64, "추적오차율": np.float32})
-    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
+    df = schema.ETF_TRACKING_ERROR.fetch(fromdate, todate, isin)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_trading_volume_and_value_by_investor(fromdate: str, todate: str) -> DataFrame:
     """주어진 기간의 투자자별 거래실적 합계
@@ -303,8 +225,8 @@ def get_trading_volume_and_value_by_investor(fromdate: str, todate: str) -> Data
     df.index.name = None
     df.columns = pd.MultiIndex.from_product([["거래량", "거래대금"], ["매도", "매수", "순매수"]])
 
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = convert_numeric(
+        df,
         {
             ("거래량", "매도"): np.uint64,
             ("거래량", "매수"): np.uint64,
@@ -312,11 +234,12 @@ def get_trading_volume_and_value_by_investor(fromdate: str, todate: str) -> Data
             ("거래대금", "매도"): np.uint64,
             ("거래대금", "매수"): np.uint64,
             ("거래대금", "순매수"): np.int64,
-        }
+        },
     )
     return df
 
 
+@memoize
 @dataframe_empty_handler
 def get_trading_volume_and_value_by_date(
     fromdate: str, todate: str, query_type1: str, query_type2: str
@@ -354,19 +277,20 @@ def get_trading_volume_and_value_by_date(
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
 
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = convert_numeric(
+        df,
         {
             "기관": np.int64,
             "기타법인": np.int64,
             "개인": np.int64,
             "외국인": np.int64,
             "전체": np.uint64,
-        }
+        },
     )
     return df.sort_index()
 
 
+@memoize
 def get_indivisual_trading_volume_and_value_by_investor(
     fromdate: str, todate: str, ticker: str
 ) -> DataFrame:
@@ -410,8 +334,8 @@ def get_indivisual_trading_volume_and_value_by_investor(
     df = df.set_index("INVST_NM")
     df.columns = pd.MultiIndex.from_product([["거래량", "거래대금"], ["매도", "매수", "순매수"]])
 
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = convert_numeric(
+        df,
         {
             ("거래량", "매도"): np.uint64,
             ("거래량", "매수"): np.uint64,
@@ -419,11 +343,12 @@ def get_indivisual_trading_volume_and_value_by_investor(
             ("거래대금", "매도"): np.uint64,
             ("거래대금", "매수"): np.uint64,
             ("거래대금", "순매수"): np.int64,
-        }
+        },
     )
     return df
 
 
+@memoize
 @dataframe_empty_handler
 def get_indivisual_trading_volume_and_value_by_date(
     fromdate: str, todate: str, ticker: str, query_type1: str, query_type2: str
@@ -469,15 +394,15 @@ def get_indivisual_trading_volume_and_value_by_date(
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
 
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = convert_numeric(
+        df,
         {
             "기관": np.int64,
             "기타법인": np.int64,
             "개인": np.int64,
             "외국인": np.int64,
             "전체": np.uint64,
-        }
+        },
     )
     return df.sort_index()
 
@@ -43,7 +43,7 @@ class DerivativeProductSearch(KrxWebIo):
         KRDRVFUEST     EURO STOXX50 Futures
         """
         data = self.read(secugrpId="ALL")
-        df = DataFrame(data["output"])  # type: ignore[index]
+        df = self.frame(data["output"])  # type: ignore[index]
         return df.set_index("value")
 
 
@@ -90,7 +90,7 @@ class AllProductBasicInfo(KrxWebIo):
             result = self.read(prodId=product_id, subProdId=sub_prod_id, csvslx_isNo=False)
         else:
             result = self.read(prodId=product_id, csvslx_isNo=False)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class AllProductPrice(KrxWebIo):
@@ -127,7 +127,7 @@ class AllProductPrice(KrxWebIo):
                     12  KR4401S9VCS2   401S9VCS  코스피200 SP 2209-2412 (주간)          -          0             -          -         -         -   312.92     0.00          0                   0              -         FU
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(trdDd=trade_date, prodId=product_id, mktTpCd="T", rghtTpCd="T")
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+"""선물 core 클래스의 스키마"""
+
+import numpy as np
+
+from pykrx.website.krx.future.core import AllProductPrice
+from pykrx.website.krx.schema import Schema
+
+FUTURE_OHLCV_BY_TICKER = Schema(
+    AllProductPrice,
+    [
+        ("ISU_SRT_CD", "종목코드"),
+        ("ISU_NM", "종목명"),
+        ("TDD_CLSPRC", "종가", np.float64),
+        ("CMPPREVDD_PRC", "대비", np.float64),
+        ("TDD_OPNPRC", "시가", np.float64),
+        ("TDD_HGPRC", "고가", np.float64),
+        ("TDD_LWPRC", "저가", np.float64),
+        ("SETL_PRC", "현물가", np.float64),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+    ],
+    index="종목코드",
+)
@@ -1,8 +1,17 @@
+import contextvars
+import threading
 import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 import pandas as pd
 
+from pykrx.website.comm import instrument, webio
+from pykrx.website.comm.aio import run_blocking
+from pykrx.website.comm.diskcache import get_disk_cache, make_key
+from pykrx.website.comm.jsonio import copy_payload, read_json, records_to_frame
+from pykrx.website.comm.singleflight import AsyncSingleFlight, SingleFlight
 from pykrx.website.comm.webio import Get, Post
 
 
@@ -21,42 +30,211 @@ class KrxFutureIo(Get):
         return NotImplementedError
 
 
+# 같은 bld/파라미터로 동시에 들어온 조회는 하나의 upstream 요청을 공유한다. 응답 dict를
+# 수정하는 호출이 있어도 서로 영향을 주지 않도록 함께 받은 호출마다 복사본을 돌려준다.
+_flight = SingleFlight(copy=copy_payload)
+_async_flight = AsyncSingleFlight(copy=copy_payload)
+
+
+class WindowPlanner:
+    """bld별 기간 분할 크기 결정
+
+    KRX는 한 번에 최대 2년(730일)까지 조회할 수 있다. bld별로 관측한 일당 행 수와
+    일당 응답 시간의 이동 평균으로, 한 구간이 `target_rows`행 또는
+    `target_seconds`초를 넘지 않도록 구간 길이를 정한다. 구간을 짧게 나눌수록
+    더 많은 구간을 동시에 받을 수 있다.
+
+    Args:
+        max_days       (int  ): 최대 구간 길이 (일)
+        min_days       (int  ): 최소 구간 길이 (일)
+        target_rows    (int  ): 구간당 목표 행 수
+        target_seconds (float): 구간당 목표 응답 시간 (초)
+        alpha          (float): 이동 평균 가중치
+    """
+
+    def __init__(
+        self,
+        max_days: int = 730,
+        min_days: int = 30,
+        target_rows: int = 20000,
+        target_seconds: float = 3.0,
+        alpha: float = 0.3,
+    ):
+        self.max_days = max_days
+        self.min_days = min_days
+        self.target_rows = target_rows
+        self.target_seconds = target_seconds
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._stats: dict[str, list[float]] = {}  # bld -> [일당 행 수, 일당 응답 시간]
+
+    def window_days(self, bld: str) -> int:
+        with self._lock:
+            stats = self._stats.get(bld)
+        if stats is None:
+            return self.max_days
+        rows_per_day, seconds_per_day = stats
+        days = float(self.max_days)
+        if rows_per_day > 0:
+            days = min(days, self.target_rows / rows_per_day)
+        if seconds_per_day > 0:
+            days = min(days, self.target_seconds / seconds_per_day)
+        return int(max(self.min_days, min(self.max_days, days)))
+
+    def observe(self, bld: str, days: int, rows: int, seconds: float | None):
+        """구간 하나의 결과를 반영. seconds가 None이면 (캐시 적중 등) 행 수만 반영한다."""
+        days = max(days, 1)
+        with self._lock:
+            stats = self._stats.get(bld)
+            if stats is None:
+                self._stats[bld] = [rows / days, 0.0 if seconds is None else seconds / days]
+                return
+            stats[0] += self.alpha * (rows / days - stats[0])
+            if seconds is not None:
+                stats[1] += self.alpha * (seconds / days - stats[1])
+
+
+_planner = WindowPlanner()
+_window_workers = 4
+
+
+def configure_window_fetch(
+    max_workers: int | None = None,
+    max_days: int | None = None,
+    target_rows: int | None = None,
+    target_seconds: float | None = None,
+):
+    """기간 분할 조회 설정
+
+    Args:
+        max_workers    (int  , optional): 동시에 조회할 최대 구간 수. 실제 요청 속도는
+                                          호스트별 rate limit을 따른다
+        max_days       (int  , optional): 최대 구간 길이 (일)
+        target_rows    (int  , optional): 구간당 목표 행 수
+        target_seconds (float, optional): 구간당 목표 응답 시간 (초)
+    """
+    global _window_workers
+    if max_workers is not None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        _window_workers = max_workers
+    if max_days is not None:
+        _planner.max_days = max_days
+    if target_rows is not None:
+        _planner.target_rows = target_rows
+    if target_seconds is not None:
+        _planner.target_seconds = target_seconds
+
+
+def window_days(bld: str) -> int:
+    """bld의 기간 조회를 나눌 현재 구간 길이 (일)"""
+    return _planner.window_days(bld)
+
+
+def split_date_range(fromdate: str, todate: str, days: int) -> list[tuple[str, str]]:
+    """[fromdate, todate]를 최대 days일 길이(양 끝 포함 days+1일)의 구간으로 분할"""
+    dt_s = pd.to_datetime(fromdate)
+    dt_e = pd.to_datetime(todate)
+    delta = pd.Timedelta(days=days)
+    windows = []
+    while dt_s + delta < dt_e:
+        windows.append((dt_s.strftime("%Y%m%d"), (dt_s + delta).strftime("%Y%m%d")))
+        dt_s += delta + pd.Timedelta(days=1)
+    if dt_s <= dt_e:
+        windows.append((dt_s.strftime("%Y%m%d"), dt_e.strftime("%Y%m%d")))
+    return windows
+
+
+def merge_windows(results: list[dict]) -> dict | None:
+    """구간별 응답을 합친다. 리스트 값(output/OutBlock_1/block1 등)은 한 번에 이어 붙인다."""
+    if not results:
+        return None
+    merged = dict(results[0])
+    for key, value in results[0].items():
+        if isinstance(value, list):
+            merged[key] = list(chain.from_iterable(r.get(key, ()) for r in results))
+    return merged
+
+
 class KrxWebIo(Post):
+    def __init__(self, schema=None, output: str = "pandas"):
+        """
+        Args:
+            schema (Schema, optional): 응답을 최종 DataFrame으로 변환할 스키마
+            output (str,    optional): 스키마 변환 결과 (pandas/arrow)
+        """
+        super().__init__()
+        self.schema = schema
+        self.output = output
+
     def read(self, **params):
         params.update(bld=self.bld)
-        if "strtDd" in params and "endDd" in params:
-            dt_s = pd.to_datetime(params["strtDd"])
-            dt_e = pd.to_datetime(params["endDd"])
-            delta = pd.to_timedelta("730 days")
-
-            result = None
-            while dt_s + delta < dt_e:
-                dt_tmp = dt_s + delta
-                params["strtDd"] = dt_s.strftime("%Y%m%d")
-                params["endDd"] = dt_tmp.strftime("%Y%m%d")
-                dt_s += delta + pd.to_timedelta("1 days")
-                resp = super().read(**params)
-                if result is None:
-                    result = resp.json()
-                else:
-                    result["output"] += resp.json()["output"]
-
-                # 초당 2년 데이터 조회
-                time.sleep(1)
-
-            if dt_s <= dt_e:
-                params["strtDd"] = dt_s.strftime("%Y%m%d")
-                params["endDd"] = dt_e.strftime("%Y%m%d")
-                resp = super().read(**params)
-
-                if result is not None:
-                    result["output"] += resp.json()["output"]
-                else:
-                    result = resp.json()
-            return result
-        else:
-            resp = super().read(**params)
-            return resp.json()
+        return _flight.do(make_key(self.url, params), self._read, **params)
+
+    def _read(self, **params):
+        if "strtDd" not in params or "endDd" not in params:
+            return self._read_json(**params)
+
+        windows = split_date_range(
+            params["strtDd"], params["endDd"], _planner.window_days(self.bld)
+        )
+        if len(windows) <= 1:
+            return merge_windows([self._read_window(params, w) for w in windows])
+        with ThreadPoolExecutor(min(_window_workers, len(windows))) as executor:
+            # 계측 중인 wrap 호출(contextvars)이 작업 스레드에서도 보이도록 context를 복사
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._read_window, params, w)
+                for w in windows
+            ]
+            results = [f.result() for f in futures]
+        return merge_windows(results)
+
+    def _read_window(self, params: dict, window: tuple[str, str]) -> dict:
+        # 응답 시간은 upstream 왕복 시간만 사용한다. 속도 제한 대기까지 느린 서버로 보면
+        # 구간이 줄어들고, 요청이 늘어난 만큼 대기가 길어져서 구간이 계속 줄어든다.
+        webio.pop_upstream_seconds()
+        data = self._read_json(**{**params, "strtDd": window[0], "endDd": window[1]})
+        seconds = webio.pop_upstream_seconds()
+
+        rows = max((len(v) for v in data.values() if isinstance(v, list)), default=0)
+        days = (pd.to_datetime(window[1]) - pd.to_datetime(window[0])).days + 1
+        _planner.observe(self.bld, days, rows, seconds)
+        return data
+
+    def _read_json(self, **params):
+        """단일 요청을 JSON으로 반환. 디스크 캐시가 켜져 있으면 먼저 조회한다."""
+        cache = get_disk_cache()
+        if not isinstance(webio.get_transport(), webio.HttpTransport):
+            # replay/synthetic 응답이 공유 캐시에 섞이거나 캐시가 재생 결과를 가리지 않도록 한다.
+            cache = None
+        if cache is not None:
+            data = cache.get(self.url, params)
+            if data is not None:
+                return data
+        resp = super().read(**params)
+        data = self._decode_instrumented(resp, params) if instrument._hooks else read_json(resp)
+        if cache is not None:
+            cache.set(self.url, params, data)
+        return data
+
+    def _decode_instrumented(self, resp, params: dict):
+        start = time.time()
+        begin = time.perf_counter()
+        data = read_json(resp)
+        seconds = time.perf_counter() - begin
+        rows = max((len(v) for v in data.values() if isinstance(v, list)), default=0)
+        instrument.emit(
+            instrument.Event("decode", self.bld, dict(params), seconds, rows=rows, start=start)
+        )
+        return data
+
+    def frame(self, records) -> pd.DataFrame:
+        """응답 레코드 리스트를 DataFrame으로 변환. 스키마가 있으면 스키마대로 변환한다."""
+        if self.schema is not None:
+            if self.output == "arrow":
+                return self.schema.build_arrow(records)
+            return self.schema.build(records)
+        return records_to_frame(records)
 
     @property
     def url(self):
@@ -75,3 +253,16 @@ class KrxWebIo(Post):
     @abstractmethod
     def fetch(self, **params):
         return NotImplementedError
+
+
+class AsyncKrxWebIo(KrxWebIo):
+    """KrxWebIo의 asyncio 버전
+
+    기간 분할 조회를 포함한 KrxWebIo.read 전체를 워커 스레드에서 실행하므로
+    하나의 이벤트 루프에서 여러 bld를 동시에 조회할 수 있다.
+    """
+
+    async def read(self, **params):  # type: ignore[override]
+        params.update(bld=self.bld)
+        key = make_key(self.url, params)
+        return await _async_flight.do(key, lambda: run_blocking(KrxWebIo.read, self, **params))
@@ -0,0 +1,382 @@
+"""로컬 KRX 거래일 달력
+
+영업일 계산(가까운 영업일, n 영업일 뒤, 기간 중 영업일 수 등)을 호출마다 시세를
+조회하지 않고 로컬에 저장한 거래일 배열로 계산한다.
+
+- 거래일: 코스피 지수(1001) 일별 시세가 있는 날. 1980-01-04부터 제공된다.
+- 확정 구간: 달력은 거래일을 알고 있는 연속 구간 하나를 유지한다. 조회 범위가
+  구간을 벗어나면 벗어난 부분만 내려받아 구간을 넓힌다.
+- 오늘: 장 시작 전에는 오늘 시세가 없으므로 오늘의 거래일 여부는 `today_ttl`초가
+  지나면 다시 확인하고, 파일에는 어제까지만 저장한다. 오늘 이후의 거래일은 알 수
+  없으므로 계산에서 제외한다 (다음 영업일이 없으면 NaT).
+- 저장: 실제 사이트를 조회하는 transport(HttpTransport)를 사용할 때만 캐시 경로의
+  trading_calendar.npz에 저장하고 다음 프로세스에서 읽는다.
+
+    >> from pykrx.website.krx.market.calendar import get_trading_calendar
+    >> calendar = get_trading_calendar()
+    >> calendar.previous("20240101")                      # Timestamp('2023-12-28')
+    >> calendar.offset(["20240102", "20240105"], 5)       # DatetimeIndex
+    >> calendar.count("20240101", "20240131")             # 21
+    >> calendar.month_ends("20230101", "20231231")
+"""
+
+import inspect
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DatetimeIndex
+
+from pykrx.website.comm import webio
+from pykrx.website.comm.diskcache import default_cache_dir, today_kst
+
+FORMAT_VERSION = 1
+FIRST_SESSION = np.datetime64("1980-01-04", "D")
+
+_DAY = np.timedelta64(1, "D")
+# 조회 날짜 앞뒤로 함께 확인하는 기간. KRX 최장 휴장(2017년 추석 연휴 10일)보다 길게 잡는다.
+_PAD = np.timedelta64(14, "D")
+# 이보다 많은 평일이 포함된 구간에서 거래일이 하나도 없으면 조회 실패로 본다.
+_MAX_CLOSED_WEEKDAYS = 10
+
+
+def _fetch_index_sessions(fromdate: str, todate: str) -> DatetimeIndex:
+    from pykrx.website.krx.market.wrap import get_index_ohlcv_by_date
+
+    # dataframe_empty_handler는 조회 실패를 빈 결과로 바꾸므로, 실패한 구간이 휴장일로
+    # 저장되지 않도록 걷어내고 호출해서 실패를 예외로 받는다.
+    return inspect.unwrap(get_index_ohlcv_by_date)(fromdate, todate, "1001").index
+
+
+def _to_days(dates) -> tuple[np.ndarray, bool]:
+    """날짜(YYYYMMDD 문자열, datetime, Timestamp 또는 목록)를 datetime64[D] 배열로 변환"""
+    if isinstance(dates, str) and len(dates) == 8 and dates.isdigit():
+        return np.array([f"{dates[:4]}-{dates[4:6]}-{dates[6:]}"], dtype="datetime64[D]"), True
+    scalar = np.ndim(dates) == 0
+    if isinstance(dates, DatetimeIndex):
+        return dates.values.astype("datetime64[D]"), False
+    values = pd.to_datetime(pd.Index(np.atleast_1d(np.asarray(dates, dtype=object))))
+    return values.values.astype("datetime64[D]"), scalar
+
+
+def _from_days(days: np.ndarray, scalar: bool):
+    if scalar:
+        return pd.Timestamp(days[0])
+    return DatetimeIndex(days.astype("datetime64[ns]"))
+
+
+def _yyyymmdd(day: np.datetime64) -> str:
+    return str(day).replace("-", "")
+
+
+def _today() -> np.datetime64:
+    today = today_kst()
+    return np.datetime64(f"{today[:4]}-{today[4:6]}-{today[6:]}", "D")
+
+
+class TradingCalendar:
+    """디스크에 저장하고 필요한 구간만 넓혀 가는 KRX 거래일 달력
+
+    Args:
+        path      (str or Path, optional): 파일 경로. 기본값은 캐시 경로의 trading_calendar.npz
+        fetch     (callable   , optional): fetch(fromdate, todate) -> 거래일 DatetimeIndex.
+                                           조회에 실패하면 빈 결과 대신 예외를 발생시켜야 한다
+        enabled   (bool       , optional): False면 디스크를 사용하지 않음
+        today_ttl (float      , optional): 오늘의 거래일 여부를 다시 확인하는 간격(초)
+    """
+
+    def __init__(self, path=None, fetch=None, enabled: bool = True, today_ttl: float = 600.0):
+        self.path = Path(path) if path is not None else default_cache_dir() / "trading_calendar.npz"
+        self.enabled = enabled
+        self.today_ttl = today_ttl
+        self._fetch = fetch or _fetch_index_sessions
+        self._lock = threading.RLock()
+        self._sessions = np.array([], dtype="datetime64[D]")
+        self._lo = self._hi = None  # 확정 구간 (datetime64[D])
+        self._today = None  # 오늘로 보고 확인한 날짜
+        self._today_checked = 0.0
+        self._loaded = False
+
+    def __repr__(self):
+        return f"TradingCalendar(covered={self.covered()}, sessions={len(self._sessions)})"
+
+    def persistent(self) -> bool:
+        return self.enabled and isinstance(webio.get_transport(), webio.HttpTransport)
+
+    def covered(self) -> tuple | None:
+        """거래일을 알고 있는 구간 (시작일, 종료일). 비어 있으면 None"""
+        if self._lo is None:
+            return None
+        return _yyyymmdd(self._lo), _yyyymmdd(self._hi)
+
+    # ------------------------------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------------------------------
+
+    def ensure(self, fromdate, todate):
+        """[fromdate, todate] 구간의 거래일을 확정. 모르는 부분만 내려받는다."""
+        (lo,), _ = _to_days(fromdate)
+        (hi,), _ = _to_days(todate)
+        self._ensure(lo, hi)
+
+    def _ensure(self, lo, hi):
+        today = _today()
+        lo, hi = max(lo, FIRST_SESSION), min(hi, today)
+        if lo > hi:
+            return
+
+        with self._lock:
+            self._load_once()
+            if self._today is not None and self._today < today and self._hi >= self._today:
+                # 전날 장 시작 전에 확인한 날은 다시 확인한다.
+                self._hi = self._today - _DAY
+                self._sessions = self._sessions[self._sessions <= self._hi]
+                if self._hi < self._lo:
+                    self._lo = self._hi = None
+                self._today = None
+
+            spans = []
+            if self._lo is None:
+                spans.append((lo, hi))
+            else:
+                if lo < self._lo:
+                    spans.append((lo, self._lo - _DAY))
+                if hi > self._hi:
+                    spans.append((self._hi + _DAY, hi))
+                elif hi == today and time.time() - self._today_checked > self.today_ttl:
+                    spans.append((today, today))
+            if not spans:
+                return
+
+            fetched = False
+            for start, end in spans:
+                fetched |= self._extend(start, end, today)
+            if fetched and self.persistent():
+                self._save(today)
+
+    def _extend(self, start, end, today) -> bool:
+        # fetch가 예외를 발생시키면 구간을 넓히지 않고 그대로 전달한다.
+        days, _ = _to_days(self._fetch(_yyyymmdd(start), _yyyymmdd(end)))
+        days = days[(days >= start) & (days <= end)]
+        if len(days) == 0 and np.busday_count(start, end + _DAY) > _MAX_CLOSED_WEEKDAYS:
+            logging.info(f"trading calendar: no sessions in {start} ~ {end}")
+            return False
+
+        keep = (self._sessions < start) | (self._sessions > end)
+        self._sessions = np.union1d(self._sessions[keep], days)
+        self._lo = start if self._lo is None else min(self._lo, start)
+        self._hi = end if self._hi is None else max(self._hi, end)
+        if end >= today:
+            self._today, self._today_checked = today, time.time()
+        return True
+
+    def invalidate(self):
+        """메모리의 달력을 비움. 다음 조회 때 파일을 다시 읽는다."""
+        with self._lock:
+            self._sessions = np.array([], dtype="datetime64[D]")
+            self._lo = self._hi = None
+            self._today, self._today_checked = None, 0.0
+            self._loaded = False
+
+    # ------------------------------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------------------------------
+
+    def _load_once(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.persistent():
+            return
+        stored = load_calendar(self.path)
+        if stored is not None:
+            self._sessions, self._lo, self._hi = stored
+
+    def _save(self, today):
+        # 오늘은 장 중에 바뀔 수 있으므로 어제까지만 저장한다.
+        hi = min(self._hi, today - _DAY)
+        if hi < self._lo:
+            return
+        lo, sessions = self._lo, self._sessions[self._sessions <= hi]
+        stored = load_calendar(self.path)
+        if stored is not None:
+            # 다른 프로세스가 저장한 구간과 이어지면 합쳐서 저장한다.
+            other, other_lo, other_hi = stored
+            if other_lo <= hi + _DAY and lo <= other_hi + _DAY:
+                sessions = np.union1d(sessions, other[(other < lo) | (other > hi)])
+                lo, hi = min(lo, other_lo), max(hi, other_hi)
+        try:
+            save_calendar(self.path, sessions, lo, hi)
+        except OSError as e:
+            logging.info(f"trading calendar {self.path}: {e}")
+
+    # ------------------------------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------------------------------
+
+    def _view(self, lo, hi) -> np.ndarray:
+        self._ensure(lo, hi)
+        return self._sessions
+
+    def sessions(self, fromdate, todate) -> DatetimeIndex:
+        """기간 중 거래일
+
+        Args:
+            fromdate (str): 조회 시작 일자 (YYYYMMDD)
+            todate   (str): 조회 종료 일자 (YYYYMMDD)
+
+        Returns:
+            DatetimeIndex: 거래일 (오늘까지)
+        """
+        (lo,), _ = _to_days(fromdate)
+        (hi,), _ = _to_days(todate)
+        arr = self._view(lo, hi)
+        return _from_days(arr[(arr >= lo) & (arr <= hi)], False)
+
+    def is_session(self, dates):
+        """거래일 여부. 날짜 목록을 입력하면 bool 배열"""
+        days, scalar = _to_days(dates)
+        arr = self._view(days.min(), days.max())
+        if len(arr):
+            result = arr[np.minimum(np.searchsorted(arr, days), len(arr) - 1)] == days
+        else:
+            result = np.zeros(len(days), dtype=bool)
+        return bool(result[0]) if scalar else result
+
+    def previous(self, dates, inclusive: bool = True):
+        """날짜 이전의 가장 가까운 거래일. inclusive면 그 날이 거래일일 때 그대로 반환"""
+        return self._roll(dates, 0, inclusive, forward=False)
+
+    def next(self, dates, inclusive: bool = True):
+        """날짜 이후의 가장 가까운 거래일. 오늘 이후라서 알 수 없으면 NaT"""
+        return self._roll(dates, 0, inclusive, forward=True)
+
+    def offset(self, dates, n: int, roll: str = "backward"):
+        """날짜에서 n 거래일 이동한 거래일
+
+        Args:
+            dates (str or list): 기준 일자
+            n     (int        ): 이동할 거래일 수. 음수면 과거로 이동
+            roll  (str        ): 기준 일자가 휴일일 때 이전(backward)/이후(forward) 거래일에서 출발
+
+        Returns:
+            Timestamp or DatetimeIndex: 범위를 벗어나면 NaT
+        """
+        if roll not in ("backward", "forward"):
+            raise ValueError(f"roll must be 'backward' or 'forward': {roll}")
+        return self._roll(dates, n, True, forward=roll == "forward")
+
+    def _roll(self, dates, n: int, inclusive: bool, forward: bool):
+        days, scalar = _to_days(dates)
+        today = _today()
+        # 거래일은 달력 일수의 절반 이상이므로 |n| * 2일 + 여유 기간이면 충분하다.
+        pad = _PAD + np.timedelta64(abs(n) * 2, "D")
+        while True:
+            lo, hi = days.min() - pad, days.max() + pad
+            arr = self._view(lo, hi)
+            if forward:
+                i = np.searchsorted(arr, days, side="left" if inclusive else "right")
+            else:
+                i = np.searchsorted(arr, days, side="right" if inclusive else "left") - 1
+            i = i + n
+            ok = (i >= 0) & (i < len(arr))
+            if self._lo is None or self._lo > max(lo, FIRST_SESSION) or self._hi < min(hi, today):
+                break  # 조회에 실패했거나 오늘 이후라서 구간을 넓힐 수 없음
+            # 배열 끝에 걸린 결과는 구간을 넓혀서 다시 계산한다.
+            need_lo = np.any(i < 0) and lo > FIRST_SESSION
+            need_hi = np.any(i >= len(arr)) and hi < today
+            if not (need_lo or need_hi):
+                break
+            pad = pad * 2
+
+        result = np.full(len(days), np.datetime64("NaT"), dtype="datetime64[D]")
+        result[ok] = arr[i[ok]]
+        return _from_days(result, scalar)
+
+    def count(self, fromdate, todate):
+        """[fromdate, todate] 기간의 거래일 수. 목록을 입력하면 원소별로 계산한 배열"""
+        lo_days, scalar = _to_days(fromdate)
+        hi_days, _ = _to_days(todate)
+        arr = self._view(lo_days.min(), hi_days.max())
+        counts = np.searchsorted(arr, hi_days, "right") - np.searchsorted(arr, lo_days, "left")
+        counts = np.maximum(counts, 0)
+        return int(counts[0]) if scalar else counts
+
+    def month_ends(self, fromdate, todate) -> DatetimeIndex:
+        """기간 중 매월 마지막 거래일. 마지막 달은 월말 거래일이 todate 이전인 경우만 포함"""
+        (lo,), _ = _to_days(fromdate)
+        (hi,), _ = _to_days(todate)
+        month_end = (hi.astype("datetime64[M]") + 1).astype("datetime64[D]") - _DAY
+        arr = self._view(lo, month_end)
+        arr = arr[(arr >= lo) & (arr <= month_end)]
+        months = arr.astype("datetime64[M]")
+        last = np.append(months[1:] != months[:-1], True) if len(arr) else np.array([], bool)
+        today = _today()
+        if len(arr) and month_end > today and months[-1] == today.astype("datetime64[M]"):
+            # 이번 달은 아직 끝나지 않았으므로 월말 거래일을 알 수 없다.
+            last[-1] = False
+        ends = arr[last]
+        return _from_days(ends[ends <= hi], False)
+
+
+def save_calendar(path, sessions: np.ndarray, lo, hi):
+    """거래일 배열과 확정 구간을 npz 파일로 저장. 임시 파일에 쓴 뒤 교체한다."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                version=np.array([FORMAT_VERSION]),
+                sessions=np.asarray(sessions, dtype="datetime64[D]").astype(np.int32),
+                covered=np.array([lo, hi], dtype="datetime64[D]").astype(np.int32),
+            )
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_calendar(path) -> tuple | None:
+    """저장된 (거래일 배열, 시작일, 종료일). 파일이 없거나 형식 버전이 다르면 None"""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"][0]) != FORMAT_VERSION:
+                return None
+            sessions = data["sessions"].astype("datetime64[D]")
+            lo, hi = data["covered"].astype("datetime64[D]")
+    except (OSError, ValueError, KeyError) as e:
+        logging.info(f"trading calendar {path}: {e}")
+        return None
+    return sessions, lo, hi
+
+
+_calendar = TradingCalendar()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    return _calendar
+
+
+def configure_trading_calendar(
+    path=None, enabled: bool = True, today_ttl: float = 600.0
+) -> TradingCalendar:
+    """영업일 계산에 사용할 거래일 달력 설정
+
+    Args:
+        path      (str or Path, optional): 파일 경로. 기본값은 캐시 경로의 trading_calendar.npz
+        enabled   (bool       , optional): False면 디스크를 사용하지 않음
+        today_ttl (float      , optional): 오늘의 거래일 여부를 다시 확인하는 간격(초)
+
+    Returns:
+        TradingCalendar: 설정된 객체
+    """
+    global _calendar
+    _calendar = TradingCalendar(path, enabled=enabled, today_ttl=today_ttl)
+    return _calendar
@@ -37,7 +37,7 @@ class ListedStockSearch(KrxWebIo):
                 KOSDAQ        16
         """
         result = self.read(locale="ko_KR", mktsel=mktsel, searchText=search_text, typeNo=0)
-        return DataFrame(result["block1"])  # type: ignore[index]
+        return self.frame(result["block1"])  # type: ignore[index]
 
 
 class DelistedStockSearch(KrxWebIo):
@@ -74,7 +74,7 @@ class DelistedStockSearch(KrxWebIo):
                   코스닥        16
         """
         result = self.read(mktsel=mktsel, searchText=search_text, typeNo=0)
-        return DataFrame(result["block1"])  # type: ignore[index]  # type: ignore[index]
+        return self.frame(result["block1"])  # type: ignore[index]  # type: ignore[index]
 
 
 class IndividualStockPrice(KrxWebIo):
@@ -121,7 +121,7 @@ class IndividualStockPrice(KrxWebIo):
         result = self.read(
             isuCd=isin_code, strtDd=start_date, endDd=end_date, adjStkPrc=adjusted_price
         )
-        return DataFrame(result["output"])  # type: ignore[index]  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]  # type: ignore[index]
 
 
 class AllStockPrice(KrxWebIo):
@@ -163,7 +163,7 @@ class AllStockPrice(KrxWebIo):
                 31,950    142,780,675   91,264,138,975   20,394,221    KSQ
         """
         result = self.read(mktId=market_id, trdDd=trade_date)
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]  # type: ignore[index]
 
 
 class PerPbrDividendYieldAllStock(KrxWebIo):
@@ -204,7 +204,7 @@ class PerPbrDividendYieldAllStock(KrxWebIo):
                   7,468  3.43   50    0.20
         """
         result = self.read(mktId=market_id, trdDd=trade_date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class PerPbrDividendYieldIndividual(KrxWebIo):
@@ -240,7 +240,7 @@ class PerPbrDividendYieldIndividual(KrxWebIo):
                 5,997  7.59  28,126  1.62  850    1.87
         """
         result = self.read(mktId=market_id, strtDd=start_date, endDd=end_date, isuCd=isin_code)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class AllStockPriceChange(KrxWebIo):
@@ -280,7 +280,7 @@ class AllStockPriceChange(KrxWebIo):
         result = self.read(
             mktId=market_id, adjStkPrc=adjusted_price, strtDd=start_date, endDd=end_date
         )
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class ForeignOwnershipAllStock(KrxWebIo):
@@ -326,7 +326,7 @@ class ForeignOwnershipAllStock(KrxWebIo):
         result = self.read(
             searchType=1, mktId=market_id, trdDd=trade_date, isuLmtRto=isin_limit_ratio
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class ForeignOwnershipIndividualTrend(KrxWebIo):
@@ -368,7 +368,7 @@ class ForeignOwnershipIndividualTrend(KrxWebIo):
                              55.68
         """
         result = self.read(searchType=2, strtDd=start_date, endDd=end_date, isuCd=isin_code)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class InvestorTradingVolumeMarketTotal(KrxWebIo):
@@ -410,7 +410,7 @@ class InvestorTradingVolumeMarketTotal(KrxWebIo):
         result = self.read(
             strtDd=start_date, endDd=end_date, mktId=market_id, etf=etf, etn=etn, elw=elw
         )
-        return DataFrame(result["output"]).drop("CONV_OBJ_TP_CD", axis=1)  # type: ignore[index]
+        return self.frame(result["output"]).drop("CONV_OBJ_TP_CD", axis=1)  # type: ignore[index]
 
 
 class InvestorTradingVolumeMarketDailyGeneral(KrxWebIo):
@@ -474,7 +474,7 @@ class InvestorTradingVolumeMarketDailyGeneral(KrxWebIo):
             trdVolVal=trade_volume_value,
             askBid=ask_bid,
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class InvestorTradingVolumeMarketDailyDetail(KrxWebIo):
@@ -545,7 +545,7 @@ class InvestorTradingVolumeMarketDailyDetail(KrxWebIo):
             askBid=ask_bid,
             detailView=1,
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class InvestorTradingVolumeIndividualTotal(KrxWebIo):
@@ -582,7 +582,7 @@ class InvestorTradingVolumeIndividualTotal(KrxWebIo):
         result = self.read(
             strtDd=start_date, endDd=end_date, isuCd=isin_code, inqTpCd=1, trdVolVal=1, askBid=1
         )
-        return DataFrame(result["output"]).drop("CONV_OBJ_TP_CD", axis=1)  # type: ignore[index]
+        return self.frame(result["output"]).drop("CONV_OBJ_TP_CD", axis=1)  # type: ignore[index]
 
 
 class InvestorTradingVolumeIndividualDailyGeneral(KrxWebIo):
@@ -628,7 +628,7 @@ class InvestorTradingVolumeIndividualDailyGeneral(KrxWebIo):
             trdVolVal=trade_volume_value,
             askBid=ask_bid,
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class InvestorTradingVolumeIndividualDailyDetail(KrxWebIo):
@@ -685,7 +685,7 @@ class InvestorTradingVolumeIndividualDailyDetail(KrxWebIo):
             askBid=ask_bid,
             detailView=1,
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class InvestorNetPurchaseTopStock(KrxWebIo):
@@ -742,7 +742,7 @@ class InvestorNetPurchaseTopStock(KrxWebIo):
         result = self.read(
             strtDd=start_date, endDd=end_date, mktId=market_id, invstTpCd=investor_type_code
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class AllIndexBasicInfo(KrxWebIo):
@@ -780,7 +780,7 @@ class AllIndexBasicInfo(KrxWebIo):
                            100         5        042
         """
         result = self.read(idxIndMidclssCd=index_industry_midclass_code)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class StockIndexSearch(KrxWebIo):
@@ -814,7 +814,7 @@ class StockIndexSearch(KrxWebIo):
                 marketName : ['KRX' 'KOSPI' 'KOSDAQ' '테마']
         """
         result = self.read(mktsel=market)
-        return DataFrame(result["block1"])  # type: ignore[index]
+        return self.frame(result["block1"])  # type: ignore[index]
 
 
 class IndividualIndexPrice(KrxWebIo):
@@ -857,7 +857,7 @@ class IndividualIndexPrice(KrxWebIo):
                     6,602,833,901,895  146,811,113,380,140
         """
         result = self.read(indIdx2=ticker, indIdx=group_id, strtDd=from_date, endDd=to_date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class AllIndexPrice(KrxWebIo):
@@ -928,7 +928,7 @@ class AllIndexPrice(KrxWebIo):
                     5,768,837,287,881  1,453,136,066,992,400
         """
         result = self.read(idxIndMidclssCd=index_industry_midclass_code, trdDd=trade_date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class AllIndexPriceChange(KrxWebIo):
@@ -969,7 +969,7 @@ class AllIndexPriceChange(KrxWebIo):
         result = self.read(
             idxIndMidclssCd=index_industry_midclass_code, strtDd=start_date, endDd=end_date
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class PerPbrDividendYieldAllIndex(KrxWebIo):
@@ -1007,7 +1007,7 @@ class PerPbrDividendYieldAllIndex(KrxWebIo):
                       -                  2.59   0.61
         """
         result = self.read(idxIndMidclssCd=index_industry_midclass_code, trdDd=trade_date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class PerPbrDividendYieldIndividualIndex(KrxWebIo):
@@ -1050,7 +1050,7 @@ class PerPbrDividendYieldIndividualIndex(KrxWebIo):
         result = self.read(
             indTpCd=index_type_code, indTpCd2=index_type_code2, strtDd=start_date, endDd=end_date
         )
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class IndexConstituentStock(KrxWebIo):
@@ -1087,7 +1087,7 @@ class IndexConstituentStock(KrxWebIo):
                         1.60   57,327,924,855,000
         """
         result = self.read(indIdx2=ticker, indIdx=group_id, trdDd=date)
-        return DataFrame(result["output"])  # type: ignore[index]
+        return self.frame(result["output"])  # type: ignore[index]
 
 
 class IndustryClassification(KrxWebIo):
@@ -1112,7 +1112,7 @@ class IndustryClassification(KrxWebIo):
         937     000545      흥국화재우     KOSPI         보험       7,000           -30   -0.43      5,376,000,000          2
         938     003280        흥아해운     KOSPI      운수창고업    1,660            -5   -0.30    399,105,332,340          2
         """
-        return DataFrame(self.read(trdDd=trade_date, mktId=market_id)["block1"])  # type: ignore[index]
+        return self.frame(self.read(trdDd=trade_date, mktId=market_id)["block1"])  # type: ignore[index]
 
 
 # -----------------------------------------------------------------------------
@@ -1153,7 +1153,7 @@ class IndividualStockShortSellingSummary(KrxWebIo):
                     286,846,560,000
         """
         result = self.read(isuCd=isin_code, strtDd=start_date, endDd=end_date)
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class IndividualStockShortSellingTradeAllStock(KrxWebIo):
@@ -1198,7 +1198,7 @@ class IndividualStockShortSellingTradeAllStock(KrxWebIo):
                          0.16       10,635,610   6,658,032,800      0.16
         """
         result = self.read(trdDd=trade_date, mktId=market_id, inqCond="".join(security_group_id))
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class IndividualStockShortSellingTradeIndividualTrend(KrxWebIo):
@@ -1238,7 +1238,7 @@ class IndividualStockShortSellingTradeIndividualTrend(KrxWebIo):
         """
 
         result = self.read(strtDd=start_date, endDd=end_date, isuCd=isin_code)
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class InvestorShortSellingTrade(KrxWebIo):
@@ -1305,7 +1305,7 @@ class InvestorShortSellingTrade(KrxWebIo):
             inqCondTpCd=inquiry_condition_type_code,
             mktTpCd=market_type_code,
         )
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class ShortSellingTradeTop50Stock(KrxWebIo):
@@ -1350,7 +1350,7 @@ class ShortSellingTradeTop50Stock(KrxWebIo):
                                       0.51                        4.91  -2.37
         """
         result = self.read(trdDd=trade_date, mktTpCd=market_type_code)
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class ShortSellingBalanceTop50Stock(KrxWebIo):
@@ -1395,7 +1395,7 @@ class ShortSellingBalanceTop50Stock(KrxWebIo):
                             2.74
         """
         result = self.read(trdDd=trade_date, mktTpCd=market_type_code)
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class AllStockShortSellingBalance(KrxWebIo):
@@ -1433,7 +1433,7 @@ class AllStockShortSellingBalance(KrxWebIo):
                     3,340,271,200  1,825,237,377,600    0.18
         """
         result = self.read(trdDd=trade_date, mktTpCd=market_type_code)
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class IndividualStockShortSellingBalance(KrxWebIo):
@@ -1473,7 +1473,7 @@ class IndividualStockShortSellingBalance(KrxWebIo):
                         331,322,931,525,000    0.09
         """
         result = self.read(strtDd=start_date, endDd=end_date, isuCd=isin_code)
-        return DataFrame(result["OutBlock_1"])  # type: ignore[index]
+        return self.frame(result["OutBlock_1"])  # type: ignore[index]
 
 
 class CompanyMajorChange(KrxWebIo):
@@ -1503,7 +1503,7 @@ class CompanyMajorChange(KrxWebIo):
                 4  2000/01/20
         """
         result = self.read(isuCd=isin_code)
-        return DataFrame(result["block1"])  # type: ignore[index]
+        return self.frame(result["block1"])  # type: ignore[index]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,256 @@
+"""디스크에 저장하는 종목 마스터
+
+StockTicker는 처음 ISIN을 조회할 때 상장 종목(ListedStockSearch)과 상장폐지
+종목(DelistedStockSearch) 전체 목록을 내려받는다. 크롤러처럼 프로세스를 여러 개
+띄우면 프로세스마다 두 번씩 조회하게 되므로, 내려받은 목록을 디스크에 저장해
+두고 다음 프로세스부터는 파일을 memory-map 해서 읽는다.
+
+- 형식: 헤더(매직, 형식 버전, 저장 시각) 뒤에 표(listed, delisted)마다 행 수와
+  열(티커, 종목, ISIN, 시장)별 고정 폭 UTF-8 바이트 배열을 이어 붙인 파일
+- 갱신: 저장 시각이 `max_age`보다 오래되면 저장된 목록을 바로 사용하고 백그라운드
+  스레드에서 새로 내려받아 파일과 StockTicker를 교체한다. 파일이 없거나 형식
+  버전이 다르면 기존처럼 바로 내려받는다.
+- 실제 사이트를 조회하는 transport(HttpTransport)를 사용할 때만 파일을 읽고 쓴다.
+  record/replay/synthetic transport의 목록이 디스크에 남지 않도록 하기 위해서다.
+
+    >> from pykrx.website.krx.market.master import configure_ticker_master
+    >> configure_ticker_master(max_age=6 * 3600)   # 6시간이 지나면 갱신
+    >> configure_ticker_master(enabled=False)      # 매번 내려받기
+"""
+
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.comm import webio
+from pykrx.website.comm.diskcache import default_cache_dir
+
+FORMAT_VERSION = 1
+TABLES = ("listed", "delisted")
+COLUMNS = ("종목", "ISIN", "시장")
+
+_MAGIC = b"PYKRXTM\0"
+_HEADER = struct.Struct("<8sId")  # 매직, 형식 버전, 저장 시각 (epoch 초)
+_COUNT = struct.Struct("<I")  # 표의 행 수 또는 열의 바이트 폭
+_LOCK_TIMEOUT = 60.0
+
+
+@dataclass
+class MasterFile:
+    version: int
+    saved_at: float
+    tables: dict
+
+    def age(self) -> float:
+        return time.time() - self.saved_at
+
+
+def save_master(path, tables: dict, saved_at: float | None = None):
+    """종목 목록을 파일에 저장. 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 본다.
+
+    Args:
+        path     (str or Path): 저장할 파일 경로
+        tables   (dict       ): {"listed": DataFrame, "delisted": DataFrame}. index는 티커
+        saved_at (float      ): 저장 시각. 생략하면 현재 시각
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    saved_at = time.time() if saved_at is None else saved_at
+
+    chunks = [_HEADER.pack(_MAGIC, FORMAT_VERSION, saved_at)]
+    for name in TABLES:
+        df = tables[name]
+        chunks.append(_COUNT.pack(len(df)))
+        for values in (df.index, *(df[c] for c in COLUMNS)):
+            encoded = np.array([str(v).encode("utf-8") for v in values], dtype=bytes)
+            width = max(encoded.dtype.itemsize, 1)
+            chunks.append(_COUNT.pack(width))
+            chunks.append(encoded.astype(f"S{width}").tobytes())
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(chunks)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_master(path) -> MasterFile | None:
+    """저장된 종목 목록을 memory-map 해서 읽음
+
+    Returns:
+        MasterFile: 파일이 없거나 손상되었거나 형식 버전이 다르면 None
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse(mm)
+    except (OSError, ValueError, struct.error) as e:
+        logging.info(f"ticker master {path}: {e}")
+        return None
+
+
+def _parse(mm) -> MasterFile | None:
+    magic, version, saved_at = _HEADER.unpack_from(mm, 0)
+    if magic != _MAGIC or version != FORMAT_VERSION:
+        return None
+
+    offset = _HEADER.size
+    tables = {}
+    for name in TABLES:
+        (rows,) = _COUNT.unpack_from(mm, offset)
+        offset += _COUNT.size
+        columns = []
+        for _ in range(1 + len(COLUMNS)):
+            (width,) = _COUNT.unpack_from(mm, offset)
+            offset += _COUNT.size
+            columns.append(_decode(mm, offset, rows, width))
+            offset += rows * width
+        index = pd.Index(columns[0], name="티커")
+        tables[name] = DataFrame(dict(zip(COLUMNS, columns[1:])), index=index)
+    if offset != len(mm):
+        raise ValueError("unexpected trailing bytes")
+    return MasterFile(version, saved_at, tables)
+
+
+def _decode(mm, offset: int, rows: int, width: int) -> list:
+    raw = np.frombuffer(mm, dtype=f"S{width}", count=rows, offset=offset)
+    return [value.decode("utf-8") for value in raw.tolist()]
+
+
+class TickerMaster:
+    """StockTicker가 사용하는 종목 목록을 디스크와 동기화
+
+    Args:
+        path    (str or Path, optional): 파일 경로. 기본값은 캐시 경로의 ticker_master.bin
+        max_age (float      , optional): 이 시간(초)이 지나면 백그라운드에서 갱신
+        enabled (bool       , optional): False면 디스크를 사용하지 않음
+    """
+
+    def __init__(self, path=None, max_age: float = 24 * 3600, enabled: bool = True):
+        self.path = Path(path) if path is not None else default_cache_dir() / "ticker_master.bin"
+        self.max_age = max_age
+        self.enabled = enabled
+        self._refreshing = threading.Lock()
+
+    def persistent(self) -> bool:
+        return self.enabled and isinstance(webio.get_transport(), webio.HttpTransport)
+
+    def load(self, fetch, on_refresh=None) -> tuple:
+        """종목 목록을 반환
+
+        Args:
+            fetch      (callable): (listed, delisted) DataFrame을 내려받는 함수
+            on_refresh (callable): 백그라운드 갱신이 끝나면 새 (listed, delisted)로 호출
+
+        Returns:
+            tuple: (listed, delisted, from_disk)
+        """
+        if not self.persistent():
+            return (*fetch(), False)
+
+        stored = load_master(self.path)
+        if stored is None:
+            listed, delisted = self.refresh(fetch)
+            return listed, delisted, False
+
+        if stored.age() > self.max_age:
+            thread = threading.Thread(
+                target=self._refresh_in_background,
+                args=(fetch, on_refresh),
+                name="pykrx-ticker-master",
+                daemon=True,
+            )
+            thread.start()
+        return stored.tables["listed"], stored.tables["delisted"], True
+
+    def refresh(self, fetch) -> tuple:
+        """종목 목록을 내려받아 저장하고 반환. 조회에 실패한 목록(빈 DataFrame)은 저장하지 않음"""
+        listed, delisted = fetch()
+        if self.persistent() and not listed.empty and not delisted.empty:
+            try:
+                save_master(self.path, {"listed": listed, "delisted": delisted})
+            except OSError as e:
+                logging.info(f"ticker master {self.path}: {e}")
+        return listed, delisted
+
+    def _refresh_in_background(self, fetch, on_refresh):
+        if not self._refreshing.acquire(blocking=False):
+            return
+        try:
+            with _ProcessLock(self.path.with_name(self.path.name + ".lock")) as owner:
+                if not owner:
+                    return
+                # 다른 프로세스가 먼저 갱신했으면 그 파일을 사용한다.
+                stored = load_master(self.path)
+                if stored is not None and stored.age() <= self.max_age:
+                    tables = stored.tables["listed"], stored.tables["delisted"]
+                else:
+                    tables = self.refresh(fetch)
+            if on_refresh is not None and not tables[0].empty:
+                on_refresh(tables)
+        except Exception as e:  # 백그라운드 갱신 실패는 저장된 목록을 계속 사용한다.
+            logging.info(f"ticker master refresh failed: {e}")
+        finally:
+            self._refreshing.release()
+
+
+class _ProcessLock:
+    """O_EXCL 잠금 파일. 다른 프로세스가 갱신 중이면 owner=False"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.owner = False
+
+    def __enter__(self) -> bool:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if time.time() - self.path.stat().st_mtime > _LOCK_TIMEOUT:
+                self.path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+        try:
+            os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            self.owner = True
+        except FileExistsError:
+            self.owner = False
+        return self.owner
+
+    def __exit__(self, *exc):
+        if self.owner:
+            self.path.unlink(missing_ok=True)
+        return False
+
+
+_master = TickerMaster()
+
+
+def get_ticker_master() -> TickerMaster:
+    return _master
+
+
+def configure_ticker_master(path=None, max_age: float = 24 * 3600, enabled: bool = True):
+    """StockTicker가 사용할 디스크 종목 마스터 설정
+
+    Args:
+        path    (str or Path, optional): 파일 경로. 기본값은 캐시 경로의 ticker_master.bin
+        max_age (float      , optional): 이 시간(초)이 지나면 백그라운드에서 갱신
+        enabled (bool       , optional): False면 디스크를 사용하지 않고 매번 내려받음
+
+    Returns:
+        TickerMaster: 설정된 객체
+    """
+    global _master
+    _master = TickerMaster(path, max_age, enabled)
+    return _master
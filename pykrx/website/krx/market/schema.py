@@ -0,0 +1,339 @@
+"""주식/지수/공매도 core 클래스의 스키마"""
+
+import numpy as np
+
+from pykrx.website.krx.market.core import (
+    AllIndexBasicInfo,
+    AllIndexPrice,
+    AllIndexPriceChange,
+    AllStockPrice,
+    AllStockPriceChange,
+    AllStockShortSellingBalance,
+    ForeignOwnershipAllStock,
+    ForeignOwnershipIndividualTrend,
+    IndividualIndexPrice,
+    IndividualStockPrice,
+    IndividualStockShortSellingBalance,
+    IndividualStockShortSellingTradeAllStock,
+    IndividualStockShortSellingTradeIndividualTrend,
+    IndustryClassification,
+    PerPbrDividendYieldAllIndex,
+    PerPbrDividendYieldAllStock,
+    PerPbrDividendYieldIndividual,
+    PerPbrDividendYieldIndividualIndex,
+    ShortSellingBalanceTop50Stock,
+    ShortSellingTradeTop50Stock,
+)
+from pykrx.website.krx.schema import DATE, Schema
+
+MARKET_TO_MKTID = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
+INDEX_GROUP_TO_IDX = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
+SHORTING_MARKET_TO_IDX = {"KOSPI": 1, "KOSDAQ": 2, "KONEX": 3}
+
+# -----------------------------------------------------------------------------
+# stock
+STOCK_OHLCV_BY_DATE = Schema(
+    IndividualStockPrice,
+    [
+        ("TRD_DD", "날짜", DATE),
+        ("TDD_OPNPRC", "시가", np.int32),
+        ("TDD_HGPRC", "고가", np.int32),
+        ("TDD_LWPRC", "저가", np.int32),
+        ("TDD_CLSPRC", "종가", np.int32),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+        ("FLUC_RT", "등락률", np.float32),
+    ],
+    index="날짜",
+)
+
+STOCK_OHLCV_BY_TICKER = Schema(
+    AllStockPrice,
+    [
+        ("ISU_SRT_CD", "티커"),
+        ("TDD_OPNPRC", "시가", np.int32),
+        ("TDD_HGPRC", "고가", np.int32),
+        ("TDD_LWPRC", "저가", np.int32),
+        ("TDD_CLSPRC", "종가", np.int32),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+        ("FLUC_RT", "등락률", np.float32),
+        ("MKTCAP", "시가총액", np.int64),
+    ],
+    index="티커",
+)
+
+STOCK_CAP_BY_DATE = Schema(
+    IndividualStockPrice,
+    [
+        ("TRD_DD", "날짜", DATE),
+        ("MKTCAP", "시가총액", np.int64),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+        ("LIST_SHRS", "상장주식수", np.int64),
+    ],
+    index="날짜",
+)
+
+STOCK_CAP_BY_TICKER = Schema(
+    AllStockPrice,
+    [
+        ("ISU_SRT_CD", "티커"),
+        ("TDD_CLSPRC", "종가", np.int64),
+        ("MKTCAP", "시가총액", np.int64),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+        ("LIST_SHRS", "상장주식수", np.int64),
+    ],
+    index="티커",
+)
+
+STOCK_TICKER_AND_NAME = Schema(
+    AllStockPrice,
+    [("ISU_SRT_CD", "티커"), ("ISU_ABBRV", "종목명")],
+    index="티커",
+)
+
+STOCK_FUNDAMENTAL_BY_TICKER = Schema(
+    PerPbrDividendYieldAllStock,
+    [
+        ("ISU_SRT_CD", "티커"),
+        ("BPS", "BPS", np.int32),
+        ("PER", "PER", np.float64),
+        ("PBR", "PBR", np.float64),
+        ("EPS", "EPS", np.int32),
+        ("DVD_YLD", "DIV", np.float64),
+        ("DPS", "DPS", np.int32),
+    ],
+    index="티커",
+)
+
+STOCK_FUNDAMENTAL_BY_DATE = Schema(
+    PerPbrDividendYieldIndividual,
+    [
+        ("TRD_DD", "날짜", DATE),
+        ("BPS", "BPS", np.int32),
+        ("PER", "PER", np.float64),
+        ("PBR", "PBR", np.float32),
+        ("EPS", "EPS", np.int32),
+        ("DVD_YLD", "DIV", np.float32),
+        ("DPS", "DPS", np.int32),
+    ],
+    index="날짜",
+)
+
+STOCK_PRICE_CHANGE_BY_TICKER = Schema(
+    AllStockPriceChange,
+    [
+        ("ISU_ABBRV", "종목명"),
+        ("ISU_SRT_CD", "티커"),
+        ("BAS_PRC", "시가", np.int32),
+        ("TDD_CLSPRC", "종가", np.int32),
+        ("CMPPREVDD_PRC", "변동폭", np.int32),
+        ("FLUC_RT", "등락률", np.float64),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+    ],
+    index="티커",
+)
+
+FOREIGN_OWNERSHIP_BY_DATE = Schema(
+    ForeignOwnershipIndividualTrend,
+    [
+        ("TRD_DD", "날짜", DATE),
+        ("LIST_SHRS", "상장주식수", np.int64),
+        ("FORN_HD_QTY", "보유수량", np.int64),
+        ("FORN_SHR_RT", "지분율", np.float16),
+        ("FORN_ORD_LMT_QTY", "한도수량", np.int64),
+        ("FORN_LMT_EXHST_RT", "한도소진률", np.float16),
+    ],
+    index="날짜",
+)
+
+FOREIGN_OWNERSHIP_BY_TICKER = Schema(
+    ForeignOwnershipAllStock,
+    [
+        ("ISU_SRT_CD", "티커"),
+        ("LIST_SHRS", "상장주식수", np.int64),
+        ("FORN_HD_QTY", "보유수량", np.int64),
+        ("FORN_SHR_RT", "지분율", np.float16),
+        ("FORN_ORD_LMT_QTY", "한도수량", np.int64),
+        ("FORN_LMT_EXHST_RT", "한도소진률", np.float16),
+    ],
+    index="티커",
+)
+
+SECTOR_CLASSIFICATIONS = Schema(
+    IndustryClassification,
+    [
+        ("ISU_SRT_CD", "종목코드"),
+        ("ISU_ABBRV", "종목명"),
+        ("IDX_IND_NM", "업종명"),
+        ("TDD_CLSPRC", "종가", np.int32),
+        ("CMPPREVDD_PRC", "대비", np.float64),
+        ("FLUC_RT", "등락률", np.float64),
+        ("MKTCAP", "시가총액", np.int64),
+    ],
+    index="종목코드",
+)
+
+# -----------------------------------------------------------------------------
+# index
+INDEX_OHLCV_BY_DATE = Schema(
+    IndividualIndexPrice,
+    [
+        ("TRD_DD", "날짜", DATE),
+        ("OPNPRC_IDX", "시가", np.float64),
+        ("HGPRC_IDX", "고가", np.float64),
+        ("LWPRC_IDX", "저가", np.float64),
+        ("CLSPRC_IDX", "종가", np.float64),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+        ("MKTCAP", "상장시가총액", np.int64),
+    ],
+    index="날짜",
+)
+
+INDEX_OHLCV_BY_TICKER = Schema(
+    AllIndexPrice,
+    [
+        ("IDX_NM", "지수명"),
+        ("OPNPRC_IDX", "시가", np.float64),
+        ("HGPRC_IDX", "고가", np.float64),
+        ("LWPRC_IDX", "저가", np.float64),
+        ("CLSPRC_IDX", "종가", np.float64),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+        ("MKTCAP", "상장시가총액", np.int64),
+    ],
+    index="지수명",
+)
+
+INDEX_LISTING_DATE = Schema(
+    AllIndexBasicInfo,
+    [
+        ("IDX_NM", "지수명"),
+        ("BAS_TM_CONTN", "기준시점"),
+        ("ANNC_TM_CONTN", "발표시점"),
+        ("BAS_IDX_CONTN", "기준지수", np.float64),
+        ("COMPST_ISU_CNT", "종목수", np.int16),
+    ],
+    index="지수명",
+)
+
+INDEX_PRICE_CHANGE_BY_TICKER = Schema(
+    AllIndexPriceChange,
+    [
+        ("IDX_IND_NM", "지수명"),
+        ("OPN_DD_INDX", "시가", np.float64),
+        ("END_DD_INDX", "종가", np.float64),
+        ("FLUC_RT", "등락률", np.float16),
+        ("ACC_TRDVOL", "거래량", np.int64),
+        ("ACC_TRDVAL", "거래대금", np.int64),
+    ],
+    index="지수명",
+)
+
+INDEX_FUNDAMENTAL_BY_TICKER = Schema(
+    PerPbrDividendYieldAllIndex,
+    [
+        ("IDX_NM", "지수명"),
+        ("CLSPRC_IDX", "종가", np.float64),
+        ("FLUC_RT", "등락률", np.float64),
+        ("WT_PER", "PER", np.float32),
+        ("FWD_PER", "선행PER", np.float32),
+        ("WT_STKPRC_NETASST_RTO", "PBR", np.float32),
+        ("DIV_YD", "배당수익률", np.float32),
+    ],
+    index="지수명",
+)
+
+INDEX_FUNDAMENTAL_BY_DATE = Schema(
+    PerPbrDividendYieldIndividualIndex,
+    [
+        ("TRD_DD", "날짜", DATE),
+        ("CLSPRC_IDX", "종가", np.float64),
+        ("FLUC_RT", "등락률", np.float64),
+        ("WT_PER", "PER", np.float32),
+        ("WT_STKPRC_NETASST_RTO", "PBR", np.float32),
+        ("DIV_YD", "배당수익률", np.float32),
+    ],
+    index="날짜",
+)
+
+# -----------------------------------------------------------------------------
+# shorting
+_SHORTING_TRADE_FIELDS = [
+    ("CVSRTSELL_TRDVOL", ("거래량", "공매도"), np.int64),
+    ("ACC_TRDVOL", ("거래량", "매수"), np.int64),
+    ("TRDVOL_WT", ("거래량", "비중"), np.float32),
+    ("CVSRTSELL_TRDVAL", ("거래대금", "공매도"), np.int64),
+    ("ACC_TRDVAL", ("거래대금", "매수"), np.int64),
+    ("TRDVAL_WT", ("거래대금", "비중"), np.float32),
+]
+
+SHORTING_TRADE_BY_DATE = Schema(
+    IndividualStockShortSellingTradeIndividualTrend,
+    [("TRD_DD", "날짜", DATE), *_SHORTING_TRADE_FIELDS],
+    index="날짜",
+)
+
+SHORTING_TRADE_BY_TICKER = Schema(
+    IndividualStockShortSellingTradeAllStock,
+    [("ISU_CD", "티커"), *_SHORTING_TRADE_FIELDS],
+    index="티커",
+)
+
+SHORTING_VOLUME_TOP50 = Schema(
+    ShortSellingTradeTop50Stock,
+    [
+        ("RANK", "순위", np.int32),
+        ("ISU_CD", "티커"),
+        ("CVSRTSELL_TRDVAL", "공매도거래대금", np.int64),
+        ("ACC_TRDVAL", "총거래대금", np.int64),
+        ("TDD_SRTSELL_WT", "공매도비중", np.float64),
+        ("STR_CONST_VAL1", "직전40일거래대금평균", np.int64),
+        ("STR_CONST_VAL2", "공매도거래대금증가율", np.float64),
+        ("VALU_PD_AVG_SRTSELL_WT", "직전40일공매도평균비중", np.float64),
+        ("VALU_PD_CMP_TDD_SRTSELL_RTO", "공매도비중증가율", np.float64),
+        ("PRC_YD", "주가수익률", np.float64),
+    ],
+    index="티커",
+)
+
+SHORTING_BALANCE_TOP50 = Schema(
+    ShortSellingBalanceTop50Stock,
+    [
+        ("RANK", "순위", np.int32),
+        ("ISU_CD", "티커"),
+        ("BAL_QTY", "공매도잔고", np.int64),
+        ("LIST_SHRS", "상장주식수", np.int64),
+        ("BAL_AMT", "공매도금액", np.int64),
+        ("MKTCAP", "시가총액", np.float64),
+        ("BAL_RTO", "비중", np.float16),
+    ],
+    index="티커",
+)
+
+_SHORTING_BALANCE_FIELDS = [
+    ("BAL_QTY", "공매도잔고", np.int64),
+    ("LIST_SHRS", "상장주식수", np.int64),
+    ("BAL_AMT", "공매도금액", np.int64),
+    ("MKTCAP", "시가총액", np.float64),
+]
+
+SHORTING_BALANCE_BY_TICKER = Schema(
+    AllStockShortSellingBalance,
+    [("ISU_CD", "티커"), *_SHORTING_BALANCE_FIELDS, ("BAL_RTO", "비중", np.float16)],
+    index="티커",
+)
+
+SHORTING_BALANCE_BY_DATE = Schema(
+    IndividualStockShortSellingBalance,
+    [
+        ("RPT_DUTY_OCCR_DD", "날짜", DATE),
+        *_SHORTING_BALANCE_FIELDS,
+        ("BAL_RTO", "비중", np.float32),
+    ],
+    index="날짜",
+)
@@ -1,19 +1,94 @@
+import threading
+from typing import NamedTuple
+
 import pandas as pd
 from pandas import DataFrame
 
 from pykrx.website.comm import dataframe_empty_handler, singleton
+from pykrx.website.comm.registry import Registry
 from pykrx.website.krx.market.core import (
     AllIndexBasicInfo,
     DelistedStockSearch,
     ListedStockSearch,
 )
+from pykrx.website.krx.market.master import get_ticker_master
+
+_FIELDS = ["종목", "ISIN", "시장"]
+
+
+class _StockTables(NamedTuple):
+    listed: DataFrame
+    delisted: DataFrame
+    resolved: DataFrame
+    index: dict
+    from_disk: bool
+
+    @property
+    def empty(self) -> bool:
+        return self.resolved.empty
+
+
+def _stock_tables(listed, delisted, from_disk=False) -> _StockTables:
+    resolved = _resolve(listed, delisted)
+    index = dict(zip(resolved.index, zip(*(resolved[c] for c in _FIELDS))))
+    return _StockTables(listed, delisted, resolved, index, from_disk)
 
 
 @singleton
 class StockTicker:
     def __init__(self):
-        self.listed = self.__fetch(ListedStockSearch)
-        self.delisted = self.__fetch(DelistedStockSearch)
+        # 목록은 처음 조회할 때 내려받는다. 상장/상장폐지 목록은 디스크 마스터에
+        # 함께 저장되므로 하나의 파트로 관리한다.
+        self.registry = Registry(self.__load, ["ALL"])
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def listed(self) -> DataFrame:
+        return self.registry.get("ALL").listed
+
+    @property
+    def delisted(self) -> DataFrame:
+        return self.registry.get("ALL").delisted
+
+    def __load(self, part):
+        # 디스크에 저장된 목록이 있으면 조회 없이 사용하고, 오래되었으면 백그라운드에서 갱신
+        listed, delisted, from_disk = get_ticker_master().load(self.__fetch_all, self.__replace)
+        return _stock_tables(listed, delisted, from_disk)
+
+    def __fetch_all(self):
+        return self.__fetch(ListedStockSearch), self.__fetch(DelistedStockSearch)
+
+    def __replace(self, tables):
+        new = _stock_tables(*tables)
+        if new.empty:
+            # 조회에 실패하면 기존 목록을 유지하고 다시 내려받지 않는다.
+            new = self.registry.get("ALL")._replace(from_disk=False)
+        self.registry.set("ALL", new)
+
+    def __refresh(self, tables):
+        with self._refresh_lock:
+            if self.registry.get("ALL") is tables:
+                self.__replace(get_ticker_master().refresh(self.__fetch_all))
+        return self.registry.get("ALL")
+
+    def invalidate(self):
+        """목록을 버려 다음 조회 때 다시 읽게 함"""
+        self.registry.invalidate()
+
+    def reload(self, background: bool = False):
+        """상장/상장폐지 목록을 새로 내려받아 교체
+
+        Args:
+            background (bool, optional): True면 스레드에서 갱신하고, 갱신하는 동안 기존 목록을 사용
+
+        Returns:
+            threading.Thread: background=True인 경우 갱신 스레드
+        """
+
+        def load(part):
+            return _stock_tables(*get_ticker_master().refresh(self.__fetch_all))
+
+        return self.registry.reload("ALL", background=background, loader=load)
 
     @dataframe_empty_handler
     def __fetch(self, what, market="전체"):
@@ -27,6 +102,15 @@ class StockTicker:
         df = df.set_index("티커")
         return df
 
+    def lookup(self, ticker) -> tuple | None:
+        """입력된 종목(ticker)의 (종목, ISIN, 시장). 없으면 None"""
+        tables = self.registry.get("ALL")
+        entry = tables.index.get(ticker)
+        if entry is None and tables.from_disk:
+            # 저장 이후 새로 상장된 종목일 수 있으므로 한 번은 새로 내려받는다.
+            entry = self.__refresh(tables).index.get(ticker)
+        return entry
+
     def get(self, ticker):
         """입력된 종목(ticker)의 정보를 Series로 반환
 
@@ -40,36 +124,66 @@ class StockTicker:
                 ISIN    KR7005930003
                 시장          코스피
         """
+        entry = self.lookup(ticker)
+        if entry is None:
+            return None
+        return pd.Series(entry, index=_FIELDS, name=ticker)
+
+    def lookup_many(self, tickers) -> DataFrame:
+        """여러 종목의 정보를 한 번에 조회
 
-        df = self.listed
-        if ticker not in df.index:
-            df = self.delisted
-            if ticker not in df.index:
-                return None
-            # 030270 에스마크	KR7030270003
-            # 030270 가희 11R	KRA030270151
-            elif isinstance(df.loc[ticker], DataFrame):
-                # ISIN을 기준으로 sorting 후 첫 번째 데이터를 선택
-                df = df.loc[ticker].sort_values("ISIN").iloc[:1]
-        return df.loc[ticker]
+        Args:
+            tickers (list): 6자리 종목 구분 정보 목록
+
+        Returns:
+            DataFrame: tickers 순서의 종목, ISIN, 시장. 없는 종목의 값은 NaN
+
+                             종목          ISIN  시장
+                티커
+                005930   삼성전자  KR7005930003   STK
+                000660  SK하이닉스  KR7000660001   STK
+        """
+        tickers = list(tickers)
+        tables = self.registry.get("ALL")
+        if tables.from_disk and not all(t in tables.index for t in tickers):
+            tables = self.__refresh(tables)
+        return tables.resolved.reindex(pd.Index(tickers, name="티커"))
+
+
+def _resolve(listed: DataFrame, delisted: DataFrame) -> DataFrame:
+    """티커마다 한 행만 남긴 조회용 목록
+
+    상장 종목을 우선하고, 상장폐지 목록에서 같은 티커가 여러 번 나오면 ISIN 순으로
+    첫 번째 종목을 사용한다.
+
+        030270 에스마크	KR7030270003
+        030270 가희 11R	KRA030270151
+    """
+    frames = []
+    for df in (listed, delisted):
+        if df.empty:
+            continue
+        df = df[_FIELDS].sort_values("ISIN", kind="stable")
+        frames.append(df[~df.index.duplicated()])
+    if not frames:
+        return DataFrame(columns=_FIELDS, index=pd.Index([], name="티커"))
+    resolved = pd.concat(frames)
+    return resolved[~resolved.index.duplicated()]
 
 
 @dataframe_empty_handler
 def get_stock_name(ticker):
-    s = StockTicker().get(ticker)
-    return s["종목"]
+    return StockTicker().lookup(ticker)[0]
 
 
 @dataframe_empty_handler
 def get_stock_ticker_isin(ticker):
-    s = StockTicker().get(ticker)
-    return s["ISIN"]
+    return StockTicker().lookup(ticker)[1]
 
 
 @dataframe_empty_handler
 def get_stock_ticekr_market(ticker):
-    s = StockTicker().get(ticker)
-    return s["시장"]
+    return StockTicker().lookup(ticker)[2]
 
 
 # ----------------------------------------------------------------------------------------------------
@@ -77,44 +191,60 @@ def get_stock_ticekr_market(ticker):
 # ----------------------------------------------------------------------------------------------------
 
 
+# - 01 : KRX
+# - 02 : KOSPI
+# - 03 : KOSDAQ
+# - 04 : 테마
+_INDEX_MARKETS = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
+
+
 @singleton
 class IndexTicker:
     def __init__(self):
-        self.df = self.__fetch()
+        # 시장별로 처음 조회할 때 내려받는다.
+        self.registry = Registry(
+            self.__fetch,
+            _INDEX_MARKETS,
+            combine=lambda frames: pd.concat(frames).sort_index(ascending=True),
+        )
+
+    @property
+    def df(self) -> DataFrame:
+        return self.registry.frame()
 
     @dataframe_empty_handler
-    def __fetch(self):
-        # - 01 : KRX
-        # - 02 : KOSPI
-        # - 03 : KOSDAQ
-        # - 04 : 테마
-        data = []
-        for market in ["01", "02", "03", "04"]:
-            df = AllIndexBasicInfo().fetch(market)
-            df = df[["IDX_IND_CD", "IDX_NM", "BAS_TM_CONTN", "IND_TP_CD"]]
-            df.columns = ["티커", "지수명", "기준일", "그룹"]
-
-            code2market = {"01": "KRX", "02": "KOSPI", "03": "KOSDAQ", "04": "테마"}
-            df["시장"] = code2market[market]
-            # 다른 지수에 같은 티커가 존재함. 중복 문제를 피하기 위해 코스피
-            # 1xxx 코스닥 2xxx로 내부에서 사용함
-            #    full_code short_code    codeName marketCode marketName
-            # 29         1        001      코스피        STK      KOSPI
-            # 75         2        001      코스닥        KSQ     KOSDAQ
-            df["티커"] = df["그룹"] + df["티커"]
-            data.append(df.set_index("티커"))
-
-        return pd.concat(data).sort_index(ascending=True)
+    def __fetch(self, market):
+        df = AllIndexBasicInfo().fetch(_INDEX_MARKETS[market])
+        df = df[["IDX_IND_CD", "IDX_NM", "BAS_TM_CONTN", "IND_TP_CD"]]
+        df.columns = ["티커", "지수명", "기준일", "그룹"]
+        df["시장"] = market
+        # 다른 지수에 같은 티커가 존재함. 중복 문제를 피하기 위해 코스피
+        # 1xxx 코스닥 2xxx로 내부에서 사용함
+        #    full_code short_code    codeName marketCode marketName
+        # 29         1        001      코스피        STK      KOSPI
+        # 75         2        001      코스닥        KSQ     KOSDAQ
+        df["티커"] = df["그룹"] + df["티커"]
+        return df.set_index("티커").sort_index(ascending=True)
+
+    def invalidate(self, market=None):
+        """market(생략하면 전체)의 목록을 버려 다음 조회 때 다시 내려받게 함"""
+        self.registry.invalidate(market)
+
+    def reload(self, market=None, background: bool = False):
+        """market(생략하면 로딩된 전체)의 목록을 새로 내려받아 교체"""
+        return self.registry.reload(market, background=background)
 
     def get_ticker(self, market, date):
-        cond = (self.df["시장"] == market) & (self.df["기준일"] <= date)
-        return self.df[cond].index.tolist()
+        if market not in _INDEX_MARKETS:
+            return []
+        df = self.registry.get(market)
+        return df[df["기준일"] <= date].index.tolist()
 
     def get_name(self, ticker):
-        return self.df.loc[ticker, "지수명"]
+        return self.registry.find(ticker).loc[ticker, "지수명"]
 
     def get_market(self, ticker):
-        return self.df.loc[ticker].index["시장"]
+        return self.registry.find(ticker).loc[ticker, "시장"]
 
 
 if __name__ == "__main__":
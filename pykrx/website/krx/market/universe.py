@@ -0,0 +1,318 @@
+"""시점별 종목 유니버스 색인
+
+날짜별 티커 목록(get_market_ticker_list)을 날짜마다 조회하지 않고 로컬에서 답하기
+위한 색인이다. 영업일마다 시장별 티커 목록을 한 번 반영하면서 전날과 달라진
+티커만 구간으로 기록한다.
+
+- 구간: (티커, 시장, 시작 영업일, 종료 영업일). 상장/상장폐지는 구간의 시작과 끝,
+  시장 이전(코스닥 -> 코스피 등)은 이전 시장 구간의 끝과 새 시장 구간의 시작이다.
+- 갱신: `sync`는 마지막으로 반영한 날 이후의 영업일만 조회해서 반영한다.
+- 조회: 특정 일자의 티커 목록, 기간 중 상장된 티커, (일자 x 티커) bitmap을 구간
+  배열에서 numpy 연산으로 계산한다.
+
+    >> universe = UniverseIndex.load("universe.npz")        # 없으면 빈 색인
+    >> universe.sync(business_days, ["KOSPI", "KOSDAQ"], fetch)
+    >> universe.save("universe.npz")
+    >> universe.tickers_on("20210104", "KOSPI")
+"""
+
+import bisect
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+FORMAT_VERSION = 1
+
+
+class UniverseIndex:
+    """영업일별 시장 구성 종목을 구간으로 저장하는 색인"""
+
+    def __init__(self):
+        self.dates: list[str] = []  # 반영한 영업일 (YYYYMMDD, 오름차순)
+        self.markets: list[str] = []
+        self.tickers: list[str] = []
+        self._ticker_ids: dict[str, int] = {}
+        self._market_ids: dict[str, int] = {}
+        # 닫힌 구간: ticker id, market id, 시작/종료 영업일 번호
+        self._closed: list[tuple[int, int, int, int]] = []
+        # 열린 구간: market id -> {ticker id: 시작 영업일 번호}
+        self._open: dict[int, dict[int, int]] = {}
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def __repr__(self):
+        span = f"{self.dates[0]}~{self.dates[-1]}" if self.dates else "empty"
+        return f"UniverseIndex({span}, tickers={len(self.tickers)}, intervals={self.num_intervals})"
+
+    @property
+    def num_intervals(self) -> int:
+        return len(self._closed) + sum(map(len, self._open.values()))
+
+    @property
+    def last_date(self) -> str | None:
+        return self.dates[-1] if self.dates else None
+
+    # -------------------------------------------------------------------------
+    # 갱신
+    def update(self, date: str, snapshot: dict):
+        """한 영업일의 시장별 티커 목록을 반영
+
+        Args:
+            date     (str ): 영업일 (YYYYMMDD). 마지막으로 반영한 날보다 뒤여야 한다.
+            snapshot (dict): {시장: 티커 목록}. 목록이 비어 있는 시장은 조회 실패로
+                             보고 전날 상태를 유지한다.
+
+        Raises:
+            ValueError: 이미 반영한 날 이전의 날짜인 경우
+        """
+        date = date.replace("-", "")
+        if self.dates and date <= self.dates[-1]:
+            raise ValueError(f"{date} is not after the last indexed day {self.dates[-1]}")
+
+        day = len(self.dates)
+        self.dates.append(date)
+        for market, tickers in snapshot.items():
+            if not tickers:
+                continue
+            mid = self._id(self._market_ids, self.markets, market)
+            today = {self._id(self._ticker_ids, self.tickers, t) for t in tickers}
+            opened = self._open.setdefault(mid, {})
+            for tid in opened.keys() - today:
+                self._closed.append((tid, mid, opened.pop(tid), day - 1))
+            for tid in today.difference(opened):
+                opened[tid] = day
+        self._arrays = None
+
+    def sync(self, dates, markets, fetch) -> int:
+        """마지막으로 반영한 날 이후의 영업일만 조회해서 반영
+
+        Args:
+            dates   (list    ): 영업일 목록 (YYYYMMDD 또는 Timestamp)
+            markets (list    ): 조회할 시장
+            fetch   (callable): fetch(date, market) -> 티커 목록
+
+        Returns:
+            int: 새로 반영한 영업일 수
+        """
+        days = sorted({_yyyymmdd(d) for d in dates})
+        if self.dates:
+            days = days[bisect.bisect_right(days, self.dates[-1]) :]
+        for date in days:
+            self.update(date, {m: fetch(date, m) for m in markets})
+        return len(days)
+
+    @staticmethod
+    def _id(ids: dict, names: list, name: str) -> int:
+        i = ids.get(name)
+        if i is None:
+            i = ids[name] = len(names)
+            names.append(name)
+        return i
+
+    # -------------------------------------------------------------------------
+    # 조회
+    def _interval_arrays(self):
+        """(티커 정렬 순서, market id, 시작, 종료) numpy 배열. 열린 구간의 종료는 마지막 영업일
+
+        티커는 id 대신 정렬 순서로 저장해 조회 결과를 따로 정렬하지 않는다.
+        """
+        if self._arrays is None:
+            last = len(self.dates) - 1
+            rows = self._closed + [
+                (tid, mid, start, last)
+                for mid, opened in self._open.items()
+                for tid, start in opened.items()
+            ]
+            table = np.array(rows, dtype=np.int32).reshape(-1, 4)
+            order = np.argsort(np.array(self.tickers, dtype=object), kind="stable")
+            rank = np.empty(len(order), dtype=np.int32)
+            rank[order] = np.arange(len(order), dtype=np.int32)
+            self._sorted_tickers = np.array(self.tickers, dtype=object)[order]
+            self._arrays = (rank[table[:, 0]], *(table[:, i].copy() for i in range(1, 4)))
+        return self._arrays
+
+    def _ticker_names(self, ranks) -> np.ndarray:
+        return self._sorted_tickers[ranks]
+
+    def _unique(self, ranks) -> np.ndarray:
+        """정렬된 고유 티커 순서. np.unique보다 빠르도록 티커 수 크기의 bool 배열 사용"""
+        hit = np.zeros(len(self.tickers), dtype=bool)
+        hit[ranks] = True
+        return np.flatnonzero(hit)
+
+    def _day(self, date, side: str = "right") -> int:
+        """date 이전(또는 같은) 마지막 영업일 번호. side="left"면 date 이후 첫 영업일 번호"""
+        date = _yyyymmdd(date)
+        if side == "left":
+            return bisect.bisect_left(self.dates, date)
+        return bisect.bisect_right(self.dates, date) - 1
+
+    def _market_mask(self, markets, market) -> np.ndarray:
+        if market is None or market == "ALL":
+            return np.ones(len(markets), dtype=bool)
+        mid = self._market_ids.get(market, -1)
+        return markets == mid
+
+    def tickers_on(self, date, market: str | None = None) -> list[str]:
+        """date에 상장되어 있던 티커 목록
+
+        영업일이 아니면 그 이전 마지막 영업일 기준이다.
+
+        Args:
+            date   (str): 조회 일자 (YYYYMMDD)
+            market (str): 시장 (KOSPI/KOSDAQ/KONEX). None 또는 ALL이면 전체
+
+        Returns:
+            list: 정렬된 티커 목록
+        """
+        day = self._day(date)
+        if day < 0:
+            return []
+        ranks, markets, starts, ends = self._interval_arrays()
+        mask = (starts <= day) & (ends >= day) & self._market_mask(markets, market)
+        return self._ticker_names(self._unique(ranks[mask])).tolist()
+
+    def listed_between(self, fromdate, todate, market: str | None = None) -> list[str]:
+        """기간 중 하루라도 상장되어 있던 티커 목록"""
+        first, last = self._day(fromdate, "left"), self._day(todate)
+        if first > last:
+            return []
+        ranks, markets, starts, ends = self._interval_arrays()
+        mask = (starts <= last) & (ends >= first) & self._market_mask(markets, market)
+        return self._ticker_names(self._unique(ranks[mask])).tolist()
+
+    def intervals(self, market: str | None = None) -> DataFrame:
+        """구간 형태의 색인
+
+        Returns:
+            DataFrame:
+                       티커    시장    시작일    종료일
+                0    005930  KOSPI  20200102  20211230
+                1    091990  KOSDAQ 20200102  20210303
+                2    091990  KOSPI  20210304  20211230
+        """
+        ranks, markets, starts, ends = self._interval_arrays()
+        mask = self._market_mask(markets, market)
+        dates = np.array(self.dates, dtype=object)
+        df = DataFrame(
+            {
+                "티커": self._ticker_names(ranks[mask]),
+                "시장": np.array(self.markets, dtype=object)[markets[mask]],
+                "시작일": dates[starts[mask]],
+                "종료일": dates[ends[mask]],
+            }
+        )
+        return df.sort_values(["티커", "시작일"], ignore_index=True)
+
+    def bitmap(self, fromdate=None, todate=None, market: str | None = None) -> DataFrame:
+        """(영업일 x 티커) 상장 여부 bitmap
+
+        구간의 시작에 +1, 종료 다음 날에 -1을 기록한 뒤 누적합으로 계산한다.
+
+        Returns:
+            DataFrame: index는 영업일(Timestamp), 열은 티커, 값은 bool
+        """
+        first = 0 if fromdate is None else self._day(fromdate, "left")
+        last = len(self.dates) - 1 if todate is None else self._day(todate)
+        dates = pd.to_datetime(self.dates[first : last + 1], format="%Y%m%d")
+        if first > last:
+            return DataFrame(index=dates, columns=pd.Index([], name="티커"), dtype=bool)
+
+        ranks, markets, starts, ends = self._interval_arrays()
+        mask = (starts <= last) & (ends >= first) & self._market_mask(markets, market)
+        used = self._unique(ranks[mask])
+        column = np.searchsorted(used, ranks[mask])
+
+        delta = np.zeros((last - first + 2, len(used)), dtype=np.int16)
+        np.add.at(delta, (np.maximum(starts[mask], first) - first, column), 1)
+        np.add.at(delta, (np.minimum(ends[mask], last) - first + 1, column), -1)
+        bits = np.cumsum(delta[:-1], axis=0) > 0
+
+        columns = pd.Index(self._ticker_names(used), name="티커")
+        return DataFrame(bits, index=dates, columns=columns)
+
+    def summary(self, fromdate=None, todate=None, markets=None) -> DataFrame:
+        """기간 안에서 티커별 처음/마지막으로 확인된 영업일과 처음 확인된 시장
+
+        Returns:
+            DataFrame: index는 티커, 열은 market, first_seen_date, last_seen_date
+        """
+        first = 0 if fromdate is None else self._day(fromdate, "left")
+        last = len(self.dates) - 1 if todate is None else self._day(todate)
+        ranks, mids, starts, ends = self._interval_arrays()
+        mask = (starts <= last) & (ends >= first)
+        if markets is not None:
+            mask &= np.isin(mids, [self._market_ids.get(m, -1) for m in markets])
+
+        dates = np.array(self.dates, dtype=object)
+        df = DataFrame(
+            {
+                "ticker": self._ticker_names(ranks[mask]),
+                "market": np.array(self.markets, dtype=object)[mids[mask]],
+                "first_seen_date": dates[np.maximum(starts[mask], first)],
+                "last_seen_date": dates[np.minimum(ends[mask], last)],
+            }
+        )
+        df = df.sort_values(["ticker", "first_seen_date"])
+        return df.groupby("ticker", sort=True).agg(
+            market=("market", "first"),
+            first_seen_date=("first_seen_date", "first"),
+            last_seen_date=("last_seen_date", "max"),
+        )
+
+    # -------------------------------------------------------------------------
+    # 저장
+    def save(self, path):
+        """npz 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        closed = np.array(self._closed, dtype=np.int32).reshape(-1, 4)
+        opened = np.array(
+            [
+                (tid, mid, start)
+                for mid, tickers in self._open.items()
+                for tid, start in tickers.items()
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 3)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                version=np.array([FORMAT_VERSION]),
+                dates=np.array(self.dates, dtype=str),
+                markets=np.array(self.markets, dtype=str),
+                tickers=np.array(self.tickers, dtype=str),
+                closed=closed,
+                opened=opened,
+            )
+
+    @classmethod
+    def load(cls, path) -> "UniverseIndex":
+        """저장된 색인을 읽음. 파일이 없거나 형식 버전이 다르면 빈 색인"""
+        index = cls()
+        try:
+            data = np.load(path, allow_pickle=False)
+        except (OSError, ValueError):
+            return index
+        with data:
+            if int(data["version"][0]) != FORMAT_VERSION:
+                return index
+            index.dates = data["dates"].tolist()
+            index.markets = data["markets"].tolist()
+            index.tickers = data["tickers"].tolist()
+            index._closed = [tuple(row) for row in data["closed"].tolist()]
+            for tid, mid, start in data["opened"].tolist():
+                index._open.setdefault(mid, {})[tid] = start
+        index._market_ids = {m: i for i, m in enumerate(index.markets)}
+        index._ticker_ids = {t: i for i, t in enumerate(index.tickers)}
+        return index
+
+
+def _yyyymmdd(date) -> str:
+    if isinstance(date, str):
+        return date.replace("-", "")
+    return pd.Timestamp(date).strftime("%Y%m%d")
@@ -4,25 +4,12 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 
-from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm import convert_numeric, dataframe_empty_handler, memoize
+from pykrx.website.krx.market import schema
 from pykrx.website.krx.market.core import (
-    AllIndexBasicInfo,
-    AllIndexPrice,
-    AllIndexPriceChange,
-    AllStockPrice,
-    AllStockPriceChange,
-    AllStockShortSellingBalance,
     CompanyMajorChange,
-    ForeignOwnershipAllStock,
-    ForeignOwnershipIndividualTrend,
     IndexConstituentStock,
-    IndividualIndexPrice,
-    IndividualStockPrice,
-    IndividualStockShortSellingBalance,
     IndividualStockShortSellingSummary,
-    IndividualStockShortSellingTradeAllStock,
-    IndividualStockShortSellingTradeIndividualTrend,
-    IndustryClassification,
     InvestorNetPurchaseTopStock,
     InvestorShortSellingTrade,
     InvestorTradingVolumeIndividualDailyDetail,
@@ -31,18 +18,18 @@ from pykrx.website.krx.market.core import (
     InvestorTradingVolumeMarketDailyDetail,
     InvestorTradingVolumeMarketDailyGeneral,
     InvestorTradingVolumeMarketTotal,
-    PerPbrDividendYieldAllIndex,
-    PerPbrDividendYieldAllStock,
-    PerPbrDividendYieldIndividual,
-    PerPbrDividendYieldIndividualIndex,
-    ShortSellingBalanceTop50Stock,
-    ShortSellingTradeTop50Stock,
+)
+from pykrx.website.krx.market.schema import (
+    INDEX_GROUP_TO_IDX,
+    MARKET_TO_MKTID,
+    SHORTING_MARKET_TO_IDX,
 )
 from pykrx.website.krx.market.ticker import get_stock_ticker_isin
 
 
 # -----------------------------------------------------------------------------
 # stock
+@memoize
 @dataframe_empty_handler
 def get_market_ohlcv_by_date(
     fromdate: str, todate: str, ticker: str, adjusted: bool = True
@@ -70,40 +57,11 @@ def get_market_ohlcv_by_date(
 
     isin = get_stock_ticker_isin(ticker)
     adjusted_value = 2 if adjusted else 1
-    df = IndividualStockPrice().fetch(fromdate, todate, isin, adjusted_value)
-
-    df = df[
-        [
-            "TRD_DD",
-            "TDD_OPNPRC",
-            "TDD_HGPRC",
-            "TDD_LWPRC",
-            "TDD_CLSPRC",
-            "ACC_TRDVOL",
-            "ACC_TRDVAL",
-            "FLUC_RT",
-        ]
-    ]
-    df.columns = ["날짜", "시가", "고가", "저가", "종가", "거래량", "거래대금", "등락률"]
-    df = df.set_index("날짜")
-    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(
-        {
-            "시가": np.int32,
-            "고가": np.int32,
-            "저가": np.int32,
-            "종가": np.int32,
-            "거래량": np.int32,
-            "거래대금": np.int64,
-            "등락률": np.float32,
-        }
-    )
+    df = schema.STOCK_OHLCV_BY_DATE.fetch(fromdate, todate, isin, adjusted_value)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
     """티커별로 정리된 전종목 OHLCV
@@ -123,52 +81,10 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
             265520  22150  23100  22050  22400  255846  5798313650
     """
 
-    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-
-    df = AllStockPrice().fetch(date, market2mktid[market])
-    df = df[
-        [
-            "ISU_SRT_CD",
-            "TDD_OPNPRC",
-            "TDD_HGPRC",
-            "TDD_LWPRC",
-            "TDD_CLSPRC",
-            "ACC_TRDVOL",
-            "ACC_TRDVAL",
-            "FLUC_RT",
-            "MKTCAP",
-        ]
-    ]
-    df.columns = [
-        "티커",
-        "시가",
-        "고가",
-        "저가",
-        "종가",
-        "거래량",
-        "거래대금",
-        "등락률",
-        "시가총액",
-    ]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
-    df = df.set_index("티커")
-    df = df.astype(
-        {
-            "시가": np.int32,
-            "고가": np.int32,
-            "저가": np.int32,
-            "종가": np.int32,
-            "거래량": np.int32,
-            "거래대금": np.int64,
-            "등락률": np.float32,
-            "시가총액": np.int64,
-        }
-    )
-    return df
+    return schema.STOCK_OHLCV_BY_TICKER.fetch(date, MARKET_TO_MKTID[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_cap_by_date(
     fromdate: str, todate: str, ticker: str, adjusted: bool = True
@@ -193,18 +109,11 @@ def get_market_cap_by_date(
 
     isin = get_stock_ticker_isin(ticker)
     adjusted_value = 2 if adjusted else 1
-    df = IndividualStockPrice().fetch(fromdate, todate, isin, adjusted_value)
-    df = df[["TRD_DD", "MKTCAP", "ACC_TRDVOL", "ACC_TRDVAL", "LIST_SHRS"]]
-    df.columns = ["날짜", "시가총액", "거래량", "거래대금", "상장주식수"]
-
-    df = df.replace("/", "", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.set_index("날짜")
-    df = df.astype(np.int64)
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df = schema.STOCK_CAP_BY_DATE.fetch(fromdate, todate, isin, adjusted_value)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_cap_by_ticker(
     date: str, market: str = "KOSPI", ascending: bool = False
@@ -228,22 +137,11 @@ def get_market_cap_by_ticker(
             068270  316000   42640845660000    918369   42640845660000   134939385
     """  # pylint: disable=line-too-long # noqa: E501
 
-    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-
-    df = AllStockPrice().fetch(date, market2mktid[market])
-    df = df[["ISU_SRT_CD", "TDD_CLSPRC", "MKTCAP", "ACC_TRDVOL", "ACC_TRDVAL", "LIST_SHRS"]]
-    df.columns = ["티커", "종가", "시가총액", "거래량", "거래대금", "상장주식수"]
-
-    df = df.set_index("티커")
-    df = df.replace(r"\W", "", regex=True)
-    # pandas FutureWarning 해결: replace 대신 mask 사용
-    for col in df.columns:
-        df[col] = df[col].mask(df[col] == "", 0)
-    df = df.infer_objects(copy=False)
-    df = df.astype(np.int64)
+    df = schema.STOCK_CAP_BY_TICKER.fetch(date, MARKET_TO_MKTID[market])
     return df.sort_values("시가총액", ascending=ascending)
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
     """티커별로 정리된 특정 일자의 BPS/PER/PBR/배당수익률
@@ -263,29 +161,10 @@ def get_market_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFr
             054620   APS홀딩스   13639   0.10  0.32  46508  0.00    0
     """
 
-    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-    df = PerPbrDividendYieldAllStock().fetch(date, market2mktid[market])
-
-    df = df[["ISU_SRT_CD", "BPS", "PER", "PBR", "EPS", "DVD_YLD", "DPS"]]
-    df.columns = ["티커", "BPS", "PER", "PBR", "EPS", "DIV", "DPS"]
-    df.set_index("티커", inplace=True)
-
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
-        {
-            "BPS": np.int32,
-            "PER": np.float64,
-            "PBR": np.float64,
-            "EPS": np.int32,
-            "DIV": np.float64,
-            "DPS": np.int32,
-        }
-    )
-    return cast("DataFrame", df)
+    return schema.STOCK_FUNDAMENTAL_BY_TICKER.fetch(date, MARKET_TO_MKTID[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_fundamental_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """날짜로 정렬된 종목별 BPS/PER/PBR/배당수익률
@@ -309,30 +188,11 @@ def get_market_fundamental_by_date(fromdate: str, todate: str, ticker: str) -> D
     isin = get_stock_ticker_isin(ticker)
     # market = get_stock_ticekr_market(ticker)
 
-    df = PerPbrDividendYieldIndividual().fetch(fromdate, todate, "ALL", isin)
-
-    df = df[["TRD_DD", "BPS", "PER", "PBR", "EPS", "DVD_YLD", "DPS"]]
-    df.columns = ["날짜", "BPS", "PER", "PBR", "EPS", "DIV", "DPS"]
-
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("/", "", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
-        {
-            "BPS": np.int32,
-            "PER": np.float64,
-            "PBR": np.float32,
-            "EPS": np.int32,
-            "DIV": np.float32,
-            "DPS": np.int32,
-        },
-    )
-    df = df.set_index("날짜")
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df = schema.STOCK_FUNDAMENTAL_BY_DATE.fetch(fromdate, todate, "ALL", isin)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_ticker_and_name(date: str, market: str = "KOSPI") -> Series:
     """티커이름 (index), 종목명 (value)으로 구성된 시리즈 반환
@@ -353,15 +213,11 @@ def get_market_ticker_and_name(date: str, market: str = "KOSPI") -> Series:
             282330    BGF리테일
     """
 
-    market2code = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-
-    df = AllStockPrice().fetch(date, market2code[market])
-    df = df[["ISU_SRT_CD", "ISU_ABBRV"]]
-    df.columns = ["티커", "종목명"]
-    df = df.set_index("티커")
+    df = schema.STOCK_TICKER_AND_NAME.fetch(date, MARKET_TO_MKTID[market])
     return cast(Series, df["종목명"])
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_price_change_by_ticker(
     fromdate: str, todate: str, market: str = "KOSPI", adjusted: bool = True
@@ -377,42 +233,14 @@ def get_market_price_change_by_ticker(
     Returns:
         DataFrame:
     """
-    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
 
     adjusted_value = 2 if adjusted else 1
-
-    df = AllStockPriceChange().fetch(fromdate, todate, market2mktid[market], adjusted_value)
-    df = df[
-        [
-            "ISU_ABBRV",
-            "ISU_SRT_CD",
-            "BAS_PRC",
-            "TDD_CLSPRC",
-            "CMPPREVDD_PRC",
-            "FLUC_RT",
-            "ACC_TRDVOL",
-            "ACC_TRDVAL",
-        ]
-    ]
-    df.columns = ["종목명", "티커", "시가", "종가", "변동폭", "등락률", "거래량", "거래대금"]
-    df = df.set_index("티커")
-
-    df = df.replace(r"[^-.\w]", "", regex=True)
-    df = df.replace(r"\-$", "", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(
-        {
-            "시가": np.int32,
-            "종가": np.int32,
-            "변동폭": np.int32,
-            "등락률": np.float64,
-            "거래량": np.int64,
-            "거래대금": np.int64,
-        }
+    return schema.STOCK_PRICE_CHANGE_BY_TICKER.fetch(
+        fromdate, todate, MARKET_TO_MKTID[market], adjusted_value
     )
-    return df
 
 
+@memoize
 def get_exhaustion_rates_of_foreign_investment_by_date(
     fromdate: str, todate: str, ticker: str
 ) -> DataFrame:
@@ -435,38 +263,11 @@ def get_exhaustion_rates_of_foreign_investment_by_date(
     """
 
     isin = get_stock_ticker_isin(ticker)
-
-    df = ForeignOwnershipIndividualTrend().fetch(fromdate, todate, isin)
-
-    df = df[
-        [
-            "TRD_DD",
-            "LIST_SHRS",
-            "FORN_HD_QTY",
-            "FORN_SHR_RT",
-            "FORN_ORD_LMT_QTY",
-            "FORN_LMT_EXHST_RT",
-        ]
-    ]
-    df.columns = ["날짜", "상장주식수", "보유수량", "지분율", "한도수량", "한도소진률"]
-
-    df = df.replace("/", "", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
-        {
-            "상장주식수": np.int64,
-            "보유수량": np.int64,
-            "지분율": np.float16,
-            "한도수량": np.int64,
-            "한도소진률": np.float16,
-        }
-    )
-    df = df.set_index("날짜")
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df = schema.FOREIGN_OWNERSHIP_BY_DATE.fetch(fromdate, todate, isin)
     return df.sort_index()
 
 
+@memoize
 def get_exhaustion_rates_of_foreign_investment_by_ticker(
     date: str, market: str, balance_limit: bool
 ) -> DataFrame:
@@ -490,37 +291,12 @@ def get_exhaustion_rates_of_foreign_investment_by_ticker(
             020560  223235294   13871465   6.210938  111595323  12.429688
     """
 
-    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-
     isin_limit_ratio = 1 if balance_limit else 0
-    df = ForeignOwnershipAllStock().fetch(date, market2mktid[market], isin_limit_ratio)
-
-    df = df[
-        [
-            "ISU_SRT_CD",
-            "LIST_SHRS",
-            "FORN_HD_QTY",
-            "FORN_SHR_RT",
-            "FORN_ORD_LMT_QTY",
-            "FORN_LMT_EXHST_RT",
-        ]
-    ]
-    df.columns = ["티커", "상장주식수", "보유수량", "지분율", "한도수량", "한도소진률"]
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
-        {
-            "상장주식수": np.int64,
-            "보유수량": np.int64,
-            "지분율": np.float16,
-            "한도수량": np.int64,
-            "한도소진률": np.float16,
-        }
-    )
-    df = df.set_index("티커")
+    df = schema.FOREIGN_OWNERSHIP_BY_TICKER.fetch(date, MARKET_TO_MKTID[market], isin_limit_ratio)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_trading_value_and_volume_on_ticker_by_investor(
     fromdate: str, todate: str, ticker: str
@@ -561,11 +337,10 @@ def get_market_trading_value_and_volume_on_ticker_by_investor(
     df = df.set_index("INVST_TP_NM")
     df.index.name = "투자자구분"
     df.columns = pd.MultiIndex.from_product([["거래량", "거래대금"], ["매도", "매수", "순매수"]])
-    df = df.replace(r"[^-\w]", "", regex=True)
-    df = df.replace("", "0")
-    return df.astype(np.int64)
+    return convert_numeric(df, np.int64)
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_trading_value_and_volume_on_market_by_investor(
     fromdate: str, todate: str, market: str, etf: bool = True, etn: bool = True, elw: bool = True
@@ -620,20 +395,17 @@ def get_market_trading_value_and_volume_on_market_by_investor(
     etn_value = "EN" if etn else ""
     elw_value = "EW" if elw else ""
 
-    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-
     df = InvestorTradingVolumeMarketTotal().fetch(
-        fromdate, todate, market2mktid[market], etf_value, etn_value, elw_value
+        fromdate, todate, MARKET_TO_MKTID[market], etf_value, etn_value, elw_value
     )
 
     df = df.set_index("INVST_TP_NM")
     df.index.name = "투자자구분"
     df.columns = pd.MultiIndex.from_product([["거래량", "거래대금"], ["매도", "매수", "순매수"]])
-    df = df.replace(r"[^-\w]", "", regex=True)
-    df = df.replace("", "0")
-    return df.astype(np.int64)
+    return convert_numeric(df, np.int64)
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_trading_value_and_volume_on_market_by_date(
     fromdate: str,
@@ -673,13 +445,11 @@ def get_market_trading_value_and_volume_on_market_by_date(
     trade_volume_value = {"거래량": 1, "거래대금": 2}.get(option_a, 1)
     ask_bid = {"매도": 1, "매수": 2, "순매수": 3}.get(option_b, 3)
 
-    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-
     if detail_view:
         df = InvestorTradingVolumeMarketDailyDetail().fetch(
             fromdate,
             todate,
-            market2mktid[market],
+            MARKET_TO_MKTID[market],
             etf_value,
             etn_value,
             elw_value,
@@ -705,7 +475,7 @@ def get_market_trading_value_and_volume_on_market_by_date(
         df = InvestorTradingVolumeMarketDailyGeneral().fetch(
             fromdate,
             todate,
-            market2mktid[market],
+            MARKET_TO_MKTID[market],
             etf_value,
             etn_value,
             elw_value,
@@ -716,12 +486,11 @@ def get_market_trading_value_and_volume_on_market_by_date(
 
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.replace(r"[^-\w]", "", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(np.int64)
+    df = convert_numeric(df, np.int64)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_trading_value_and_volume_on_ticker_by_date(
     fromdate: str, todate: str, ticker: str, option_a: str, option_b: str, detail_view: bool
@@ -776,12 +545,11 @@ def get_market_trading_value_and_volume_on_ticker_by_date(
 
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.replace(r"[^-\w]", "", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(np.int64)
+    df = convert_numeric(df, np.int64)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_net_purchases_of_equities_by_ticker(
     fromdate: str, todate: str, market: str, investor: str
@@ -818,8 +586,6 @@ def get_market_net_purchases_of_equities_by_ticker(
             352820     빅히트      247298      442325        195027   39722470000   73131351500     33408881500
     """  # pylint: disable=line-too-long # noqa: E501
 
-    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-
     investor_to_invst_tp_cd = {
         "금융투자": 1000,
         "보험": 2000,
@@ -838,7 +604,7 @@ def get_market_net_purchases_of_equities_by_ticker(
 
     investor_type_code = str(investor_to_invst_tp_cd[investor])
     df = InvestorNetPurchaseTopStock().fetch(
-        fromdate, todate, market2mktid[market], investor_type_code
+        fromdate, todate, MARKET_TO_MKTID[market], investor_type_code
     )
 
     df.columns = [
@@ -851,24 +617,22 @@ def get_market_net_purchases_of_equities_by_ticker(
         "매수거래대금",
         "순매수거래대금",
     ]
-    df = df.replace("/", "", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = convert_numeric(
+        df,
         {
-            "티커": str,
-            "종목명": str,
             "매수거래량": np.int64,
             "매도거래량": np.int64,
             "순매수거래량": np.int64,
             "매수거래대금": np.int64,
             "매도거래대금": np.int64,
             "순매수거래대금": np.int64,
-        }
+        },
     )
     df["티커"] = df["티커"].apply(lambda x: x.zfill(6))
     return df.set_index("티커")
 
 
+@memoize
 @dataframe_empty_handler
 def get_market_sector_classifications(date: str, market: str) -> DataFrame:
     """[12025] 업종별 분류 현황
@@ -890,35 +654,13 @@ def get_market_sector_classifications(date: str, market: str) -> DataFrame:
             282330    BGF리테일     유통업  156000 -1500.0   -0.95  2696289336000
             138930  BNK금융지주   기타금융    6560   -40.0   -0.61  2138135213760
     """  # pylint: disable=line-too-long # noqa: E501
-    market2mktid = {
-        "KOSPI": "STK",
-        "KOSDAQ": "KSQ",
-    }
-    df = IndustryClassification().fetch(date, market2mktid[market])
-
-    df = df[
-        [
-            "ISU_SRT_CD",
-            "ISU_ABBRV",
-            "IDX_IND_NM",
-            "TDD_CLSPRC",
-            "CMPPREVDD_PRC",
-            "FLUC_RT",
-            "MKTCAP",
-        ]
-    ]
-    df.columns = ["종목코드", "종목명", "업종명", "종가", "대비", "등락률", "시가총액"]
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
-        {"종가": np.int32, "대비": np.float64, "등락률": np.float64, "시가총액": np.int64}
-    )
-    return df.set_index("종목코드")
+
+    return schema.SECTOR_CLASSIFICATIONS.fetch(date, MARKET_TO_MKTID[market])
 
 
 # -----------------------------------------------------------------------------
 # index
+@memoize
 @dataframe_empty_handler
 def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """일자별 특정 지수의 OHLCV
@@ -939,40 +681,11 @@ def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFram
             2019-04-08  755.320007  756.159973  750.020020  751.919983  762374091  4321665707119
     """  # pylint: disable=line-too-long # noqa: E501
 
-    df = IndividualIndexPrice().fetch(ticker[1:], ticker[0], fromdate, todate)
-    df = df[
-        [
-            "TRD_DD",
-            "OPNPRC_IDX",
-            "HGPRC_IDX",
-            "LWPRC_IDX",
-            "CLSPRC_IDX",
-            "ACC_TRDVOL",
-            "ACC_TRDVAL",
-            "MKTCAP",
-        ]
-    ]
-    df.columns = ["날짜", "시가", "고가", "저가", "종가", "거래량", "거래대금", "상장시가총액"]
-
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
-    df = df.set_index("날짜")
-    df = df.astype(
-        {
-            "시가": np.float64,
-            "고가": np.float64,
-            "저가": np.float64,
-            "종가": np.float64,
-            "거래량": np.int64,
-            "거래대금": np.int64,
-            "상장시가총액": np.int64,
-        }
-    )
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df = schema.INDEX_OHLCV_BY_DATE.fetch(ticker[1:], ticker[0], fromdate, todate)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_index_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
     """전종목 지수 OHLCV
@@ -995,39 +708,10 @@ def get_index_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
             코스피50              2736.77   2752.70   2693.90   2700.81   52627040    5768837287881
     """  # pylint: disable=line-too-long # noqa: E501
 
-    market2idx = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
-    df = AllIndexPrice().fetch(date, market2idx[market])
-    df = df[
-        [
-            "IDX_NM",
-            "OPNPRC_IDX",
-            "HGPRC_IDX",
-            "LWPRC_IDX",
-            "CLSPRC_IDX",
-            "ACC_TRDVOL",
-            "ACC_TRDVAL",
-            "MKTCAP",
-        ]
-    ]
-    df.columns = ["지수명", "시가", "고가", "저가", "종가", "거래량", "거래대금", "상장시가총액"]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
-    df = df.set_index("지수명")
-    df = df.astype(
-        {
-            "시가": np.float64,
-            "고가": np.float64,
-            "저가": np.float64,
-            "종가": np.float64,
-            "거래량": np.int64,
-            "거래대금": np.int64,
-            "상장시가총액": np.int64,
-        }
-    )
-    return df
+    return schema.INDEX_OHLCV_BY_TICKER.fetch(date, INDEX_GROUP_TO_IDX[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_index_listing_date(market: str = "KOSPI") -> DataFrame:
     """[11004] 전체지수 기본정보
@@ -1046,17 +730,10 @@ def get_index_listing_date(market: str = "KOSPI") -> DataFrame:
             코스피 200 중소형주  2010.01.04  2015.07.13     1000.0     101
     """
 
-    market2idx = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
-    df = AllIndexBasicInfo().fetch(market2idx[market])
-    df = df[["IDX_NM", "BAS_TM_CONTN", "ANNC_TM_CONTN", "BAS_IDX_CONTN", "COMPST_ISU_CNT"]]
-    df.columns = ["지수명", "기준시점", "발표시점", "기준지수", "종목수"]
-    df = df.set_index("지수명")
-    df = df.replace(",", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype({"기준지수": np.float64, "종목수": np.int16})
-    return df
+    return schema.INDEX_LISTING_DATE.fetch(INDEX_GROUP_TO_IDX[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_index_price_change_by_ticker(fromdate: str, todate: str, market: str) -> DataFrame:
     """지정된 기간 동안의 전종목 OHLCV
@@ -1080,30 +757,10 @@ def get_index_price_change_by_ticker(fromdate: str, todate: str, market: str) ->
             코스닥 150 커뮤니케이션서비스   2037.000000   2090.000000  2.599609     25001250    816778277690
     """  # pylint: disable=line-too-long # noqa: E501
 
-    market2idx = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
-    df = AllIndexPriceChange().fetch(fromdate, todate, market2idx[market])
-    df = df[["IDX_IND_NM", "OPN_DD_INDX", "END_DD_INDX", "FLUC_RT", "ACC_TRDVOL", "ACC_TRDVAL"]]
-    df.columns = ["지수명", "시가", "종가", "등락률", "거래량", "거래대금"]
-    df = df.set_index("지수명")
-    df = df.replace(r"[^\w\.-]", "", regex=True)
-    df = df.replace("", 0)
-    # pandas FutureWarning 해결: replace 대신 mask 사용
-    for col in df.columns:
-        df[col] = df[col].mask(df[col] == "-", 0)
-    df = df.infer_objects(copy=False)
-    # 큰 정수 값 처리: pd.to_numeric을 사용하여 overflow 경고 방지
-    for col in ["거래량", "거래대금"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(np.int64)
-    df = df.astype(
-        {
-            "시가": np.float64,
-            "종가": np.float64,
-            "등락률": np.float16,
-        }
-    )
-    return df
+    return schema.INDEX_PRICE_CHANGE_BY_TICKER.fetch(fromdate, todate, INDEX_GROUP_TO_IDX[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_index_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
     """[11004] 전체지수 기본정보
@@ -1127,29 +784,10 @@ def get_index_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFra
 
     """
 
-    market2idx = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
-    df = PerPbrDividendYieldAllIndex().fetch(date, market2idx[market])
-    df = df[
-        ["IDX_NM", "CLSPRC_IDX", "FLUC_RT", "WT_PER", "FWD_PER", "WT_STKPRC_NETASST_RTO", "DIV_YD"]
-    ]
-    df.columns = ["지수명", "종가", "등락률", "PER", "선행PER", "PBR", "배당수익률"]
-    df = df.set_index("지수명")
-    df = df.replace("^-$", 0, regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
-        {
-            "종가": np.float64,
-            "등락률": np.float64,
-            "PER": np.float32,
-            "선행PER": np.float32,
-            "PBR": np.float32,
-            "배당수익률": np.float32,
-        }
-    )
-    return df
+    return schema.INDEX_FUNDAMENTAL_BY_TICKER.fetch(date, INDEX_GROUP_TO_IDX[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_index_fundamental_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """일자별 특정 지수의 OHLCV
@@ -1173,26 +811,11 @@ def get_index_fundamental_by_date(fromdate: str, todate: str, ticker: str) -> Da
             2021-11-26  1770.31   -1.61    13.73      0.0  1.26        1.99
     """
 
-    df = PerPbrDividendYieldIndividualIndex().fetch(fromdate, todate, ticker[0], ticker[1:])
-    df = df[["TRD_DD", "CLSPRC_IDX", "FLUC_RT", "WT_PER", "WT_STKPRC_NETASST_RTO", "DIV_YD"]]
-    df.columns = ["날짜", "종가", "등락률", "PER", "PBR", "배당수익률"]
-    df = df.set_index("날짜")
-    df.index = pd.to_datetime(df.index)
-    df = df.replace("^-$", 0, regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
-        {
-            "종가": np.float64,
-            "등락률": np.float64,
-            "PER": np.float32,
-            "PBR": np.float32,
-            "배당수익률": np.float32,
-        }
-    )
+    df = schema.INDEX_FUNDAMENTAL_BY_DATE.fetch(fromdate, todate, ticker[0], ticker[1:])
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_index_portfolio_deposit_file(date: str, ticker: str) -> list:
     """지수구성종목을 리스트로 반환
@@ -1213,6 +836,7 @@ def get_index_portfolio_deposit_file(date: str, ticker: str) -> list:
 
 # -----------------------------------------------------------------------------
 # shorting
+@memoize
 @dataframe_empty_handler
 def get_shorting_status_by_date(fromdate, todate, ticker):
     """일자별 공매도 종합 현황
@@ -1239,14 +863,13 @@ def get_shorting_status_by_date(fromdate, todate, ticker):
     idx = (df.iloc[:2] == "-").any(axis=1).sum()
     df = df.iloc[idx:]
 
-    df = df.replace(r"\D", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
-        {"거래량": np.int32, "잔고수량": np.int32, "거래대금": np.int64, "잔고금액": np.int64}
+    df = convert_numeric(
+        df, {"거래량": np.int64, "잔고수량": np.int64, "거래대금": np.int64, "잔고금액": np.int64}
     )
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_shorting_trading_value_and_volume_by_date(
     fromdate: str, todate: str, ticker: str
@@ -1273,37 +896,13 @@ def get_shorting_trading_value_and_volume_by_date(
             2021-01-04   9279  38655276  0.02   771889500  3185356823460  0.02
             2021-01-05    169  35335669  0.00    14011100  2915618322800  0.00
     """
+
     isin = get_stock_ticker_isin(ticker)
-    df = IndividualStockShortSellingTradeIndividualTrend().fetch(fromdate, todate, isin)
-
-    df = df.set_index("TRD_DD")
-    df.index.name = "날짜"
-    df = df[
-        [
-            "CVSRTSELL_TRDVOL",
-            "ACC_TRDVOL",
-            "TRDVOL_WT",
-            "CVSRTSELL_TRDVAL",
-            "ACC_TRDVAL",
-            "TRDVAL_WT",
-        ]
-    ]
-    df.columns = pd.MultiIndex.from_product([["거래량", "거래대금"], ["공매도", "매수", "비중"]])
-    df = df.replace(r"[^-\w\.]", "", regex=True).replace("", "0")
-    df = df.astype(
-        {
-            ("거래량", "공매도"): np.int64,
-            ("거래량", "매수"): np.int64,
-            ("거래량", "비중"): np.float32,
-            ("거래대금", "공매도"): np.int64,
-            ("거래대금", "매수"): np.int64,
-            ("거래대금", "비중"): np.float32,
-        }
-    )
-    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
+    df = schema.SHORTING_TRADE_BY_DATE.fetch(fromdate, todate, isin)
     return cast(DataFrame, df.sort_index())
 
 
+@memoize
 @dataframe_empty_handler
 def get_shorting_trading_value_and_volume_by_ticker(
     date: str, market: str, include: list
@@ -1339,37 +938,11 @@ def get_shorting_trading_value_and_volume_by_ticker(
         "수익증권": "BC",
     }
     include = [inc2code[x] for x in include]
-    market = {"KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}[market]
-
-    df = IndividualStockShortSellingTradeAllStock().fetch(date, market, include)
-
-    df = df.set_index("ISU_CD")
-    df.index.name = "티커"
-    df = df[
-        [
-            "CVSRTSELL_TRDVOL",
-            "ACC_TRDVOL",
-            "TRDVOL_WT",
-            "CVSRTSELL_TRDVAL",
-            "ACC_TRDVAL",
-            "TRDVAL_WT",
-        ]
-    ]
-    df.columns = pd.MultiIndex.from_product([["거래량", "거래대금"], ["공매도", "매수", "비중"]])
-    df = df.replace(r"[^-\w\.]", "", regex=True).replace("", "0")
-    df = df.astype(
-        {
-            ("거래량", "공매도"): np.int64,
-            ("거래량", "매수"): np.int64,
-            ("거래량", "비중"): np.float32,
-            ("거래대금", "공매도"): np.int64,
-            ("거래대금", "매수"): np.int64,
-            ("거래대금", "비중"): np.float32,
-        }
-    )
+    df = schema.SHORTING_TRADE_BY_TICKER.fetch(date, MARKET_TO_MKTID[market], include)
     return cast(DataFrame, df)
 
 
+@memoize
 @dataframe_empty_handler
 def get_shorting_investor_by_date(
     fromdate: str, todate: str, market: str = "KOSPI", inquery: str = "거래량"
@@ -1415,13 +988,12 @@ def get_shorting_investor_by_date(
     )
 
     df.columns = ["날짜", "기관", "개인", "외국인", "기타", "합계"]
-    df = df.replace(r"[^\w\.]", "", regex=True)
-    df = df.replace("", 0)
     df = df.set_index("날짜")
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
-    return df.astype(np.int64).sort_index()
+    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
+    return convert_numeric(df, np.int64).sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_shorting_volume_top50(date: str, market: str) -> DataFrame:
     """공매도 비중 상위 50개 종목 정보
@@ -1444,54 +1016,11 @@ def get_shorting_volume_top50(date: str, market: str) -> DataFrame:
             005945   4         25401240    908915950        2.79               4610634                  5.51                     0.44              6.40       -0.35
             227840   5         13784400    546597900        2.52               3084294                  4.47                     0.51              4.91       -2.37
     """  # pylint: disable=line-too-long # noqa: E501
-    market2idx = {"KOSPI": 1, "KOSDAQ": 2, "KONEX": 3}
-    df = ShortSellingTradeTop50Stock().fetch(date, market2idx[market])
-
-    df = df[
-        [
-            "RANK",
-            "ISU_CD",
-            "CVSRTSELL_TRDVAL",
-            "ACC_TRDVAL",
-            "TDD_SRTSELL_WT",
-            "STR_CONST_VAL1",
-            "STR_CONST_VAL2",
-            "VALU_PD_AVG_SRTSELL_WT",
-            "VALU_PD_CMP_TDD_SRTSELL_RTO",
-            "PRC_YD",
-        ]
-    ]
-    df.columns = [
-        "순위",
-        "티커",
-        "공매도거래대금",
-        "총거래대금",
-        "공매도비중",
-        "직전40일거래대금평균",
-        "공매도거래대금증가율",
-        "직전40일공매도평균비중",
-        "공매도비중증가율",
-        "주가수익률",
-    ]
-    df = df.set_index("티커")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
-        {
-            "순위": np.int32,
-            "공매도거래대금": np.int64,
-            "총거래대금": np.int64,
-            "직전40일거래대금평균": np.int64,
-            "공매도비중": np.float64,
-            "공매도거래대금증가율": np.float64,
-            "직전40일공매도평균비중": np.float64,
-            "공매도비중증가율": np.float64,
-            "주가수익률": np.float64,
-        }
-    )
-    return df
+
+    return schema.SHORTING_VOLUME_TOP50.fetch(date, SHORTING_MARKET_TO_IDX[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_shorting_balance_top50(date: str, market: str) -> DataFrame:
     """공매도 잔고 상위 50개 종목 정보
@@ -1515,27 +1044,10 @@ def get_shorting_balance_top50(date: str, market: str) -> DataFrame:
             011690    5      1604890     58494201     1957965800  7.136293e+10   2.740234
     """  # pylint: disable=line-too-long # noqa: E501
 
-    market2idx = {"KOSPI": 1, "KOSDAQ": 2, "KONEX": 3}
-    df = ShortSellingBalanceTop50Stock().fetch(date, market2idx[market])
-
-    df = df[["RANK", "ISU_CD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP", "BAL_RTO"]]
-    df.columns = ["순위", "티커", "공매도잔고", "상장주식수", "공매도금액", "시가총액", "비중"]
-    df = df.set_index("티커")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
-        {
-            "순위": np.int32,
-            "공매도잔고": np.int64,
-            "상장주식수": np.int64,
-            "공매도금액": np.int64,
-            "시가총액": np.float64,
-            "비중": np.float16,
-        }
-    )
-    return df
+    return schema.SHORTING_BALANCE_TOP50.fetch(date, SHORTING_MARKET_TO_IDX[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_shorting_balance_by_ticker(date: str, market: str) -> DataFrame:
     """티커로 정렬된 공매도 잔고 현황
@@ -1559,26 +1071,10 @@ def get_shorting_balance_by_ticker(date: str, market: str) -> DataFrame:
             138930      596477    325935246  3340271200  1.825237e+12  0.180054
     """
 
-    market2idx = {"KOSPI": 1, "KOSDAQ": 2, "KONEX": 3}
-    df = AllStockShortSellingBalance().fetch(date, market2idx[market])
-
-    df = df[["ISU_CD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP", "BAL_RTO"]]
-    df.columns = ["티커", "공매도잔고", "상장주식수", "공매도금액", "시가총액", "비중"]
-    df = df.set_index("티커")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
-        {
-            "공매도잔고": np.int64,
-            "상장주식수": np.int64,
-            "공매도금액": np.int64,
-            "시가총액": np.float64,
-            "비중": np.float16,
-        }
-    )
-    return df
+    return schema.SHORTING_BALANCE_BY_TICKER.fetch(date, SHORTING_MARKET_TO_IDX[market])
 
 
+@memoize
 @dataframe_empty_handler
 def get_shorting_balance_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
     """일자별로 정렬된 투자자별 공매도 잔고 현황
@@ -1604,26 +1100,11 @@ def get_shorting_balance_by_date(fromdate: str, todate: str, ticker: str) -> Dat
     """  # pylint: disable=line-too-long # noqa: E501
 
     isin = get_stock_ticker_isin(ticker)
-    df = IndividualStockShortSellingBalance().fetch(fromdate, todate, isin)
-
-    df = df[["RPT_DUTY_OCCR_DD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP", "BAL_RTO"]]
-    df.columns = ["날짜", "공매도잔고", "상장주식수", "공매도금액", "시가총액", "비중"]
-    df = df.set_index("날짜")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace("", 0)
-    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.astype(
-        {
-            "공매도잔고": np.int64,
-            "상장주식수": np.int64,
-            "공매도금액": np.int64,
-            "시가총액": np.float64,
-            "비중": np.float32,
-        }
-    )
+    df = schema.SHORTING_BALANCE_BY_DATE.fetch(fromdate, todate, isin)
     return df.sort_index()
 
 
+@memoize
 @dataframe_empty_handler
 def get_stock_major_changes(ticker: str) -> DataFrame:
     """기업 주요 변동사항
@@ -1654,10 +1135,10 @@ def get_stock_major_changes(ticker: str) -> DataFrame:
     ]
     df = df.set_index("날짜")
     df = df.replace(r"[^-\w\.]", "", regex=True)
-    df[["액면변경전", "액면변경후"]] = df[["액면변경전", "액면변경후"]].replace("", 0)
+    df["액면변경후"] = df["액면변경후"].replace("", 0)
     df = df.replace("", "-")
+    df = convert_numeric(df, {"액면변경전": np.int16})
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.astype({"액면변경전": np.int16})
     return df.sort_index()
 
 
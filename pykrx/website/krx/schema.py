@@ -0,0 +1,171 @@
+"""core 클래스 응답의 스키마
+
+wrap 함수마다 반복되던 열 선택, 한글 이름 변경, 숫자 변환, index 지정을
+`Schema` 하나로 선언한다. core 클래스를 `schema`와 함께 생성하면 KrxWebIo.frame이
+응답 레코드에서 바로 최종 DataFrame을 만든다.
+
+    >> OHLCV = Schema(AllStockPrice, [("ISU_SRT_CD", "티커"), ("TDD_CLSPRC", "종가", np.int32)],
+                      index="티커")
+    >> OHLCV.fetch("20240115", "STK")
+
+pyarrow가 설치되어 있으면 `output="arrow"`로 같은 스키마의 pyarrow.Table을 만들 수
+있다. 숫자 변환은 Arrow compute로 수행하고 pandas를 거치지 않는다.
+
+    >> OHLCV.fetch("20240115", "STK", output="arrow")
+"""
+
+from collections import defaultdict
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.comm import compact
+from pykrx.website.comm.numeric import parse_numbers
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - 선택적 의존성
+    pa = None
+    pc = None
+
+DATE = "date"
+
+_registry: dict[type, list] = defaultdict(list)
+
+
+class Schema:
+    """core 클래스 응답 레코드를 DataFrame으로 변환하는 규칙
+
+    Args:
+        core        (type): KrxWebIo를 상속한 core 클래스
+        fields      (list): (원본 필드, 출력 이름[, dtype]) 목록. dtype을 생략하면
+                            문자열 그대로, DATE면 날짜로 변환한다. 출력 이름이
+                            tuple이면 MultiIndex 열이 된다.
+        index       (str ): index로 사용할 출력 이름
+        date_format (str ): DATE 필드의 형식
+    """
+
+    def __init__(self, core, fields, index=None, date_format: str = "%Y/%m/%d"):
+        self.core = core
+        self.sources = [f[0] for f in fields]
+        self.names = [f[1] for f in fields]
+        self.dtypes = [f[2] if len(f) > 2 else None for f in fields]
+        self.index = index
+        self.date_format = date_format
+        self._getter = itemgetter(*self.sources)
+        _registry[core].append(self)
+
+    def __repr__(self):
+        return f"Schema({self.core.__name__}, {self.names}, index={self.index!r})"
+
+    def fetch(self, *args, output: str = "pandas", **kwargs):
+        """core 클래스의 fetch를 호출하고 이 스키마로 변환한 결과를 반환
+
+        Args:
+            output (str, optional): pandas - DataFrame / arrow - pyarrow.Table
+        """
+        return self.core(schema=self, output=output).fetch(*args, **kwargs)
+
+    def _columns(self, records: list) -> list:
+        if len(self.sources) == 1:
+            return [[self._getter(r) for r in records]]
+        return list(zip(*map(self._getter, records)))
+
+    def build(self, records: list) -> DataFrame:
+        """응답 레코드를 한 번 순회해 열 단위로 모은 뒤 열마다 dtype으로 변환
+
+        compact 모드(`enable_compact`)에서는 문자열을 category로, 정수를 값 범위에
+        맞는 가장 작은 타입으로 변환한다.
+
+        Raises:
+            KeyError: 레코드에 스키마의 필드가 없는 경우
+            ValueError: 숫자로 변환할 수 없는 값이 있는 경우
+        """
+        if not records:
+            return DataFrame()
+
+        small = compact.compact_enabled()
+        data = {}
+        index = None
+        for name, dtype, values in zip(self.names, self.dtypes, self._columns(records)):
+            if dtype is None:
+                values = compact.compact_strings(name, values) if small else list(values)
+            elif dtype == DATE:
+                values = pd.to_datetime(values, format=self.date_format)
+            elif small and np.dtype(dtype).kind in "iu":
+                values = compact.smallest_int(parse_numbers(values, np.int64))
+            else:
+                values = parse_numbers(values, dtype)
+
+            if name == self.index:
+                index = pd.Index(values, name=name)
+            else:
+                data[name] = values
+        return DataFrame(data, index=index)
+
+    def build_arrow(self, records: list):
+        """응답 레코드를 pyarrow.Table로 변환
+
+        index 필드는 일반 열로 포함되고, DATE 필드는 date32, tuple 이름은 "_"로
+        이어 붙인 열 이름이 된다. Arrow에서 형변환을 지원하지 않는 float16은 float32로
+        저장한다.
+
+        Returns:
+            pyarrow.Table: 레코드가 없으면 열 구성만 있는 빈 Table
+
+        Raises:
+            ImportError: pyarrow가 설치되지 않은 경우
+            KeyError: 레코드에 스키마의 필드가 없는 경우
+            ValueError: 숫자로 변환할 수 없는 값이 있는 경우
+        """
+        if pa is None:
+            raise ImportError("output='arrow' requires pyarrow (pip install pykrx[arrow])")
+
+        names = ["_".join(n) if isinstance(n, tuple) else n for n in self.names]
+        types = [_arrow_type(t) for t in self.dtypes]
+        if not records:
+            return pa.table([pa.array([], type=t) for t in types], names=names)
+
+        arrays = []
+        for dtype, values in zip(self.dtypes, self._columns(records)):
+            text = pa.array(values, type=pa.string())
+            if dtype is None:
+                arrays.append(text)
+            elif dtype == DATE:
+                stamps = pc.strptime(text, format=self.date_format, unit="s")
+                arrays.append(pc.cast(stamps, pa.date32()))
+            else:
+                arrays.append(_arrow_numbers(text, _arrow_type(dtype)))
+        return pa.table(arrays, names=names)
+
+
+def _arrow_type(dtype):
+    if dtype is None:
+        return pa.string()
+    if dtype == DATE:
+        return pa.date32()
+    dtype = np.dtype(dtype)
+    if dtype == np.float16:
+        return pa.float32()
+    return pa.from_numpy_dtype(dtype)
+
+
+def _arrow_numbers(text, target):
+    """parse_numbers의 Arrow compute 버전. 변환 오류는 pa.ArrowInvalid(ValueError)"""
+    blanks = pa.array(["", "-"])
+    cleaned = pc.replace_substring(text, ",", "")
+    cleaned = pc.if_else(pc.is_in(cleaned, value_set=blanks), "0", cleaned)
+    try:
+        return pc.cast(cleaned, target)
+    except pa.ArrowInvalid:
+        cleaned = pc.replace_substring_regex(text, r"[^-\w\.]", "")
+        cleaned = pc.if_else(pc.is_in(cleaned, value_set=blanks), "0", cleaned)
+        return pc.cast(cleaned, target)
+
+
+def schemas_for(core) -> list:
+    """core 클래스에 등록된 스키마 목록"""
+    return list(_registry.get(core, ()))
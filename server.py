@@ -9,7 +9,9 @@ from datetime import datetime, timedelta
 import uvicorn
 from fastapi import FastAPI, HTTPException, Path, Query
 
-from pykrx import bond, stock
+from pykrx import bond
+from pykrx.stock import aio as stock
+from pykrx.website.comm import run_blocking
 
 # 기본 날짜 설정 (최근 영업일 기준)
 _DEFAULT_TO_DATE = datetime.now().strftime("%Y%m%d")
@@ -49,7 +51,7 @@ async def get_ticker_list(
         # 타입 체커를 만족시키기 위해 기본값 명시
         market_value = market if market is not None else "KOSPI"
         # date는 None을 허용 (함수 내부에서 처리)
-        tickers = stock.get_market_ticker_list(date, market=market_value)  # type: ignore
+        tickers = await stock.get_market_ticker_list(date, market=market_value)  # type: ignore
         return {"date": date, "market": market_value, "count": len(tickers), "tickers": tickers}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -61,7 +63,7 @@ async def get_ticker_name(
 ):
     """티커 이름 조회"""
     try:
-        name = stock.get_market_ticker_name(ticker)
+        name = await stock.get_market_ticker_name(ticker)
         return {"ticker": ticker, "name": name}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -79,7 +81,7 @@ async def get_ohlcv_by_date(
     """일자별 OHLCV 데이터 조회"""
     try:
         freq_value = freq if freq is not None else "d"
-        df = stock.get_market_ohlcv_by_date(fromdate, todate, ticker, freq=freq_value)
+        df = await stock.get_market_ohlcv_by_date(fromdate, todate, ticker, freq=freq_value)
         # DataFrame을 JSON으로 변환
         df.reset_index(inplace=True)
         df["날짜"] = df["날짜"].astype(str)
@@ -101,7 +103,7 @@ async def get_ohlcv_by_ticker(
     """티커별 OHLCV 데이터 조회"""
     try:
         market_value = market if market is not None else "KOSPI"
-        df = stock.get_market_ohlcv_by_ticker(date, market_value)
+        df = await stock.get_market_ohlcv_by_ticker(date, market_value)
         df.reset_index(inplace=True)
         return {
             "date": date,
@@ -123,7 +125,7 @@ async def get_market_cap(
 ):
     """시가총액 조회"""
     try:
-        df = stock.get_market_cap_by_date(fromdate, todate, ticker)
+        df = await stock.get_market_cap_by_date(fromdate, todate, ticker)
         df.reset_index(inplace=True)
         df["날짜"] = df["날짜"].astype(str)
         return {
@@ -149,7 +151,7 @@ async def get_net_purchases(
     try:
         market_value = market if market is not None else "ALL"
         investor_value = investor if investor is not None else "전체"
-        df = stock.get_market_net_purchases_of_equities_by_ticker(
+        df = await stock.get_market_net_purchases_of_equities_by_ticker(
             fromdate, todate, market_value, investor_value
         )
         df.reset_index(inplace=True)
@@ -179,7 +181,7 @@ async def get_index_ticker_list(
     try:
         market_value = market if market is not None else "KOSPI"
         # date는 None을 허용 (함수 내부에서 처리)
-        tickers = stock.get_index_ticker_list(date, market_value)  # type: ignore
+        tickers = await stock.get_index_ticker_list(date, market_value)  # type: ignore
         return {"date": date, "market": market_value, "count": len(tickers), "tickers": tickers}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -195,7 +197,7 @@ async def get_index_ohlcv(
 ):
     """지수 OHLCV 조회"""
     try:
-        df = stock.get_index_ohlcv_by_date(fromdate, todate, ticker)
+        df = await stock.get_index_ohlcv_by_date(fromdate, todate, ticker)
         df.reset_index(inplace=True)
         df["날짜"] = df["날짜"].astype(str)
         return {
@@ -225,7 +227,7 @@ async def get_treasury_yields(
 ):
     """국채 수익률 조회"""
     try:
-        df = bond.get_otc_treasury_yields(fromdate, todate, ticker)
+        df = await run_blocking(bond.get_otc_treasury_yields, fromdate, todate, ticker)
 
         # 빈 DataFrame 체크
         if df.empty:
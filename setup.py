@@ -28,6 +28,10 @@ setup(
         "multipledispatch",
         "matplotlib",
     ],
+    extras_require={
+        "fast": ["orjson"],
+        "arrow": ["pyarrow"],
+    },
     license="MIT",
     packages=find_packages(include=["pykrx", "pykrx.*", "pykrx.stock.*"]),
     package_data={
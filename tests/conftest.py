@@ -0,0 +1,85 @@
+"""pytest 공통 설정
+
+--transport 옵션으로 통합 테스트가 사용할 transport를 선택한다.
+
+    $ pytest tests/pykrx/stock --transport=record      # 실제 사이트 조회 후 응답 저장
+    $ pytest tests/pykrx/stock --transport=replay      # 저장한 응답으로 오프라인 실행
+    $ pytest tests/pykrx/stock --transport=synthetic   # 가상 시세로 실행 (값 검증 테스트는 실패할 수 있음)
+
+PYKRX_TRANSPORT 환경 변수로도 지정할 수 있다. 기본값은 http (실제 사이트 조회).
+
+replay 모드에서 저장된 응답이 없는 요청을 보낸 테스트는 실패 대신 skip으로 보고한다.
+응답 저장소(tests/fixtures/transport)는 record 모드로 실행해서 만든다.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "transport"
+
+# replay 모드에서 사용하는 ReplayTransport
+_replay = None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--transport",
+        default=os.environ.get("PYKRX_TRANSPORT", "http"),
+        choices=["http", "record", "replay", "synthetic"],
+        help="Get/Post가 사용할 transport",
+    )
+    parser.addoption(
+        "--transport-dir",
+        default=str(FIXTURE_DIR),
+        help="record/replay 응답 저장 경로",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pykrx_transport(request):
+    from pykrx.website.comm import transport
+    from pykrx.website.comm.webio import set_transport
+
+    mode = request.config.getoption("--transport")
+    directory = request.config.getoption("--transport-dir")
+    if mode == "record":
+        selected = transport.RecordTransport(directory)
+    elif mode == "replay":
+        global _replay
+        selected = _replay = transport.ReplayTransport(directory)
+    elif mode == "synthetic":
+        selected = transport.SyntheticTransport()
+    else:
+        yield None
+        return
+
+    previous = set_transport(selected)
+    yield selected
+    set_transport(previous)
+
+
+def _skip_replay_miss():
+    """저장된 응답이 없어서 실패한 테스트를 skip으로 바꾸는 hook 본체
+
+    wrap 함수나 동시 조회에서 ReplayMissError를 처리해서 빈 결과로 바꾼 경우에도
+    ReplayTransport.misses로 재생하지 못한 요청을 확인한다.
+    """
+    before = len(_replay.misses) if _replay is not None else 0
+    try:
+        return (yield)
+    except Exception:
+        if _replay is not None and len(_replay.misses) > before:
+            pytest.skip(f"no recorded response: {_replay.misses[before]}")
+        raise
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_setup(item):
+    return (yield from _skip_replay_miss())
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    return (yield from _skip_replay_miss())
@@ -0,0 +1,149 @@
+"""여러 종목 OHLCV 패널 조회 테스트"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pykrx.stock import stock_ohlcv
+from pykrx.stock.stock_ohlcv import get_market_ohlcv_panel, plan_market_ohlcv_panel
+from pykrx.website.krx import krxio
+from pykrx.website.krx.market import calendar as calendar_module
+from pykrx.website.krx.market.calendar import TradingCalendar
+
+SESSIONS = pd.bdate_range("2024-01-02", "2024-03-29")
+UNIVERSE = ["000660", "005930", "035420", "051910"]
+
+
+def price(date, ticker):
+    return int(ticker) % 1000 + date.day
+
+
+def frame(dates, tickers, index):
+    close = np.array([price(d, t) for d, t in zip(dates, tickers)], dtype=np.int64)
+    return pd.DataFrame(
+        {
+            "시가": close - 1,
+            "고가": close + 1,
+            "저가": close - 2,
+            "종가": close,
+            "거래량": close * 10,
+            "거래대금": close * 1000,
+        },
+        index=index,
+    )
+
+
+class FakeKrx:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.by_date = []
+        self.by_ticker = []
+
+    def ohlcv_by_date(self, fromdate, todate, ticker, adjusted=True):
+        with self.lock:
+            self.by_date.append((ticker, adjusted))
+        if ticker == "999999":
+            raise KeyError(ticker)
+        days = SESSIONS[(fromdate <= SESSIONS) & (todate >= SESSIONS)]
+        return frame(days, [ticker] * len(days), pd.DatetimeIndex(days, name="날짜"))
+
+    def ohlcv_by_ticker(self, date, market="KOSPI"):
+        with self.lock:
+            self.by_ticker.append((date, market))
+        if date == "20240320":
+            raise ValueError(date)
+        day = pd.Timestamp(date)
+        return frame([day] * len(UNIVERSE), UNIVERSE, pd.Index(UNIVERSE, name="티커"))
+
+
+@pytest.fixture
+def krx(monkeypatch):
+    fake = FakeKrx()
+    monkeypatch.setattr(calendar_module, "today_kst", lambda: "20240329")
+    calendar = TradingCalendar(
+        fetch=lambda f, t: SESSIONS[(f <= SESSIONS) & (t >= SESSIONS)], enabled=False
+    )
+    monkeypatch.setattr(stock_ohlcv, "get_trading_calendar", lambda: calendar)
+    monkeypatch.setattr(stock_ohlcv, "_get_market_ohlcv_by_date", fake.ohlcv_by_date)
+    monkeypatch.setattr(stock_ohlcv, "_get_market_ohlcv_by_ticker", fake.ohlcv_by_ticker)
+    monkeypatch.setattr(stock_ohlcv, "_get_market_ticker_list", lambda date, market: UNIVERSE)
+    return fake
+
+
+class TestPanelPlan:
+    def test_few_tickers_by_ticker(self, krx):
+        """종목 수가 영업일 수보다 적으면 종목별 조회"""
+        plan = plan_market_ohlcv_panel("20240102", "20240329", ["005930", "000660"])
+        assert plan.strategy == "ticker"
+        assert (plan.ticker_requests, plan.date_requests) == (2, len(SESSIONS))
+
+    def test_many_tickers_by_date(self, krx):
+        """종목 수가 영업일 수보다 많으면 일자별 전종목 조회"""
+        tickers = [f"{i:06d}" for i in range(100)]
+        assert plan_market_ohlcv_panel("20240102", "20240131", tickers).strategy == "date"
+        assert plan_market_ohlcv_panel("20240102", "20240131").strategy == "date"
+
+    def test_window_days(self, krx, monkeypatch):
+        """종목별 요청 수는 개별 종목 시세 조회의 기간 분할 크기를 따름"""
+        monkeypatch.setattr(krxio._planner, "max_days", 30)
+        plan = plan_market_ohlcv_panel("20240102", "20240329", ["005930", "000660"])
+        assert plan.ticker_requests == 2 * 3
+
+    def test_adjusted_by_ticker(self, krx):
+        """수정주가는 종목별 조회로만 받을 수 있음"""
+        assert (
+            plan_market_ohlcv_panel("20240102", "20240105", UNIVERSE, adjusted=True).strategy
+            == "ticker"
+        )
+        with pytest.raises(ValueError):
+            plan_market_ohlcv_panel(
+                "20240102", "20240105", UNIVERSE, adjusted=True, strategy="date"
+            )
+
+
+class TestOhlcvPanel:
+    def test_strategies_match(self, krx):
+        """두 조회 방식의 결과가 같음"""
+        tickers = ["005930", "000660"]
+        by_ticker = get_market_ohlcv_panel("20240102", "20240110", tickers, strategy="ticker")
+        by_date = get_market_ohlcv_panel("20240102", "20240110", tickers, strategy="date")
+        pd.testing.assert_frame_equal(by_ticker, by_date)
+        assert len(krx.by_date) == 2
+        assert len(krx.by_ticker) == 7
+        assert by_date.index.names == ["날짜", "티커"]
+        assert by_date.loc[(pd.Timestamp("2024-01-03"), "005930"), "종가"] == price(
+            pd.Timestamp("2024-01-03"), "005930"
+        )
+
+    def test_wide(self, krx):
+        df = get_market_ohlcv_panel("20240102", "20240105", ["035420", "005930"], layout="wide")
+        assert df.columns.tolist() == ["035420", "005930"]
+        assert len(df) == 4
+        assert df.loc["2024-01-04", "005930"] == price(pd.Timestamp("2024-01-04"), "005930")
+        assert df.attrs["errors"] == {}
+
+    def test_ticker_errors(self, krx):
+        """조회에 실패한 종목은 빠지고 attrs["errors"]에 남음"""
+        df = get_market_ohlcv_panel("20240102", "20240105", ["005930", "999999"], strategy="ticker")
+        assert df.index.get_level_values("티커").unique().tolist() == ["005930"]
+        assert isinstance(df.attrs["errors"]["999999"], KeyError)
+
+    def test_date_errors(self, krx):
+        """조회에 실패한 일자는 빠지고 attrs["errors"]에 남음"""
+        df = get_market_ohlcv_panel("20240319", "20240321", market="KOSPI", layout="wide")
+        assert df.index.strftime("%Y%m%d").tolist() == ["20240319", "20240321"]
+        assert list(df.attrs["errors"]) == [pd.Timestamp("2024-03-20")]
+
+    def test_market_by_date(self, krx):
+        """tickers가 없으면 시장 전체를 일자별로 조회"""
+        df = get_market_ohlcv_panel("20240102", "20240103", market="KOSPI")
+        assert set(krx.by_ticker) == {("20240102", "KOSPI"), ("20240103", "KOSPI")}
+        assert len(df) == 2 * len(UNIVERSE)
+
+    def test_invalid_args(self, krx):
+        with pytest.raises(ValueError):
+            get_market_ohlcv_panel("20240102", "20240103", layout="tall")
+        with pytest.raises(ValueError):
+            get_market_ohlcv_panel("20240102", "20240103", field="시가총액")
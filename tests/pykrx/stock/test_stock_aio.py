@@ -0,0 +1,59 @@
+"""pykrx.stock.aio 비동기 API 테스트"""
+
+import asyncio
+import inspect
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+import pykrx.stock as stock
+from pykrx.stock import aio
+from pykrx.website.comm.aio import run_blocking, set_concurrency_limit
+
+
+class TestStockAio:
+    """비동기 API 테스트 클래스"""
+
+    def test_mirrors_stock_api(self):
+        """stock의 조회 함수가 모두 코루틴 함수로 제공되는지 테스트"""
+        for name in stock.__all__:
+            if name in aio._SYNC_ONLY:
+                continue
+            assert inspect.iscoroutinefunction(getattr(aio, name)), name
+
+    def test_delegates_to_sync_api(self):
+        """비동기 함수가 동기 함수와 같은 결과를 반환하는지 테스트"""
+        mock_df = pd.DataFrame(
+            {"시가": [100], "고가": [110], "저가": [90], "종가": [105]},
+            index=pd.Index(["005930"], name="티커"),
+        )
+        with patch("pykrx.stock.stock_ohlcv._get_market_ohlcv_by_ticker") as mock_krx:
+            mock_krx.return_value = mock_df
+            result = asyncio.run(aio.get_market_ohlcv_by_ticker("20240115"))
+        mock_krx.assert_called_once_with("20240115", "KOSPI")
+        assert result.equals(mock_df)
+
+    def test_concurrency_limit(self):
+        """동시 실행 수가 설정한 한도를 넘지 않는지 테스트"""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def slow_call():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.05)
+            with lock:
+                state["running"] -= 1
+
+        async def main():
+            await asyncio.gather(*[run_blocking(slow_call) for _ in range(8)])
+
+        set_concurrency_limit(2)
+        try:
+            asyncio.run(main())
+        finally:
+            set_concurrency_limit(8)
+        assert state["peak"] == 2
@@ -0,0 +1,92 @@
+"""여러 종목 일자별 조회 테스트"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from pykrx.stock import stock_api, stock_market_cap
+from pykrx.stock.stock_batch import fetch_by_tickers, strict
+from pykrx.website.comm import dataframe_empty_handler, memoize
+
+DATES = pd.DatetimeIndex(["2024-01-02", "2024-01-03", "2024-01-31", "2024-02-01"], name="날짜")
+
+
+def fake_by_date(fromdate, todate, ticker):
+    if ticker == "999999":
+        raise KeyError(ticker)
+    value = int(ticker)
+    return pd.DataFrame(
+        {
+            "시가총액": [value * 10] * len(DATES),
+            "거래량": [value] * len(DATES),
+            "거래대금": [value * 100] * len(DATES),
+            "상장주식수": [value * 2] * len(DATES),
+        },
+        index=DATES,
+    )
+
+
+class TestFetchByTickers:
+    def test_multiindex(self):
+        df = fetch_by_tickers(lambda t: fake_by_date("", "", t), ["005930", "000660"])
+        assert df.index.names == ["티커", "날짜"]
+        assert df.index.get_level_values(0).unique().tolist() == ["005930", "000660"]
+        assert df.loc["000660", "거래량"].tolist() == [660] * len(DATES)
+        assert df.attrs["errors"] == {}
+
+    def test_error_isolation(self):
+        """실패한 종목은 빠지고 나머지 종목의 결과는 반환"""
+        df = fetch_by_tickers(lambda t: fake_by_date("", "", t), ["005930", "999999"])
+        assert df.index.get_level_values(0).unique().tolist() == ["005930"]
+        assert isinstance(df.attrs["errors"]["999999"], KeyError)
+
+    def test_concurrent(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow(ticker):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return fake_by_date("", "", ticker)
+
+        fetch_by_tickers(slow, [f"{i:06d}" for i in range(1, 9)])
+        assert peak[0] > 1
+
+    def test_strict(self):
+        """dataframe_empty_handler를 걷어낸 함수는 예외를 전달"""
+
+        @memoize
+        @dataframe_empty_handler
+        def broken(ticker):
+            raise KeyError(ticker)
+
+        assert broken("005930").empty
+        with pytest.raises(KeyError):
+            strict(broken)("005930")
+
+
+class TestBatchedApi:
+    def test_market_cap_by_date(self, monkeypatch):
+        monkeypatch.setattr(stock_market_cap, "_get_market_cap_by_date", fake_by_date)
+        df = stock_market_cap.get_market_cap_by_date(
+            "20240102", "20240201", ["005930", "999999", "000660"], freq="m"
+        )
+        assert df.index.get_level_values(0).unique().tolist() == ["005930", "000660"]
+        assert len(df.loc["005930"]) == 2
+        assert list(df.attrs["errors"]) == ["999999"]
+
+    def test_single_ticker_unchanged(self, monkeypatch):
+        monkeypatch.setattr(stock_api, "_get_shorting_status_by_date", fake_by_date)
+        df = stock_api.get_shorting_status_by_date("20240102", "20240201", "005930")
+        assert df.index.equals(DATES)
+
+    def test_shorting_status_by_date(self, monkeypatch):
+        monkeypatch.setattr(stock_api, "_get_shorting_status_by_date", fake_by_date)
+        df = stock_api.get_shorting_status_by_date("20240102", "20240201", ("005930", "000660"))
+        assert len(df) == 2 * len(DATES)
@@ -0,0 +1,128 @@
+"""ETF PDF 이력 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pykrx.stock import stock_etf_pdf
+from pykrx.stock.stock_etf_pdf import (
+    PDF_COLUMNS,
+    EtfPdfHistory,
+    get_etf_portfolio_deposit_file_history,
+)
+from pykrx.website.krx.etx.wrap import normalize_portfolio_deposit_file
+from pykrx.website.krx.market import calendar as calendar_module
+from pykrx.website.krx.market.calendar import TradingCalendar
+
+SESSIONS = pd.bdate_range("2024-01-02", "2024-03-29")
+
+
+def pdf(date, ticker):
+    """3월 4일에 000660 계약수 변경, 2월 1일부터 035420 편출 / 051910 편입"""
+    if ticker == "999999":
+        raise KeyError(ticker)
+    shares = {"005930": 100.0, "000660": 20.0 if date < "20240304" else 25.0}
+    shares["035420" if date < "20240201" else "051910"] = 5.0
+    if ticker == "102110":
+        shares = {code: value * 2 for code, value in shares.items()}
+    index = pd.Index(list(shares), name="티커")
+    values = np.array(list(shares.values()))
+    return pd.DataFrame(
+        {
+            "계약수": values,
+            "금액": (values * int(date[-2:]) * 1000).astype(np.int64),
+            "비중": (values / values.sum() * 100).astype(np.float32),
+        },
+        index=index,
+    )
+
+
+@pytest.fixture(autouse=True)
+def deposit_file(monkeypatch):
+    monkeypatch.setattr(calendar_module, "today_kst", lambda: "20240329")
+    calendar = TradingCalendar(
+        fetch=lambda f, t: SESSIONS[(f <= SESSIONS) & (t >= SESSIONS)], enabled=False
+    )
+    monkeypatch.setattr(stock_etf_pdf, "get_trading_calendar", lambda: calendar)
+    monkeypatch.setattr(stock_etf_pdf, "_get_etf_portfolio_deposit_file", pdf)
+
+
+def expected(date, ticker, columns=("계약수", "비중")):
+    return pdf(date, ticker)[list(columns)].astype(np.float64)
+
+
+class TestNormalizePortfolioDepositFile:
+    def test_normalize(self):
+        """ISIN은 단축코드로 바꾸고 값이 모두 0인 종목은 제거"""
+        df = pd.DataFrame(
+            {
+                "티커": ["KR7005930003", "000660", "KRD010010001"],
+                "계약수": [10.0, 3.0, 0.0],
+                "금액": np.array([100, 0, 0], dtype=np.int64),
+                "비중": np.array([1.5, 0.0, 0.0], dtype=np.float32),
+            }
+        )
+        result = normalize_portfolio_deposit_file(df)
+        assert result.index.tolist() == ["005930", "000660"]
+        assert result.index.name == "티커"
+        assert result["금액"].tolist() == [100, 0]
+
+    @pytest.mark.parametrize("code", ["CASH0001", "ABCDEFG"])
+    def test_normalize_short_codes(self, code):
+        """가장 긴 코드가 9글자보다 짧아도 x[3:9]와 같게 변환"""
+        df = pd.DataFrame({"티커": ["005930", code], "계약수": [10.0, 1.0]})
+        result = normalize_portfolio_deposit_file(df)
+        assert result.index.tolist() == ["005930", code[3:9]]
+
+
+class TestEtfPdfHistory:
+    def test_basket(self):
+        """저장한 변경분으로 모든 (ETF, 날짜)의 구성 종목을 복원"""
+        history = get_etf_portfolio_deposit_file_history(
+            ["069500", "102110", "999999"], "20240102", "20240329", checkpoint=10
+        )
+        assert history.etfs() == ["069500", "102110"]
+        assert len(history.errors) == len(SESSIONS)
+        for etf in ["069500", "102110"]:
+            for day in SESSIONS:
+                date = day.strftime("%Y%m%d")
+                pd.testing.assert_frame_equal(
+                    history.basket(etf, date), expected(date, etf), check_names=False
+                )
+        # 휴일에는 이전 관측일의 구성 종목
+        pd.testing.assert_frame_equal(
+            history.basket("069500", "20240303"), expected("20240301", "069500")
+        )
+        assert history.basket("069500", "20231229").empty
+
+    def test_compression(self):
+        """스냅샷 사이에는 바뀐 종목만 저장"""
+        history = get_etf_portfolio_deposit_file_history("069500", "20240102", "20240329")
+        snapshots = -(-len(SESSIONS) // 20)
+        # 스냅샷 + 2월 1일 (편입 1, 편출 1) + 3월 4일 (계약수 변경 1, 비중 변경 2)
+        assert len(history.records) == snapshots * 3 + 2 + 3
+        assert history.compression < 0.15
+
+    def test_lossless_amount(self):
+        history = get_etf_portfolio_deposit_file_history(
+            "069500", "20240102", "20240131", columns=PDF_COLUMNS
+        )
+        pd.testing.assert_frame_equal(
+            history.basket("069500", "20240117"),
+            expected("20240117", "069500", PDF_COLUMNS),
+            check_names=False,
+        )
+
+    def test_save_load_append(self, tmp_path):
+        """저장한 이력을 읽어서 이어서 수집"""
+        history = get_etf_portfolio_deposit_file_history("069500", "20240102", "20240215")
+        path = tmp_path / "pdf.npz"
+        history.save(path)
+        loaded = EtfPdfHistory.load(path)
+        pd.testing.assert_frame_equal(loaded.records, history.records)
+
+        get_etf_portfolio_deposit_file_history("069500", "20240216", "20240329", history=loaded)
+        full = get_etf_portfolio_deposit_file_history("069500", "20240102", "20240329")
+        pd.testing.assert_frame_equal(loaded.records, full.records)
+        with pytest.raises(ValueError):
+            loaded.add("069500", "20240329", pdf("20240329", "069500"))
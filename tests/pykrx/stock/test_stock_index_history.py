@@ -0,0 +1,114 @@
+"""지수 구성 종목 이력 테스트"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from pykrx.stock import stock_index_history
+from pykrx.stock.stock_index_history import IndexPortfolioHistory, get_index_portfolio_history
+from pykrx.website.krx.market import calendar as calendar_module
+from pykrx.website.krx.market.calendar import TradingCalendar
+
+SESSIONS = pd.bdate_range("2023-01-02", "2023-12-29")
+# (변경일, 편입, 편출)
+REBALANCES = [
+    ("20230609", {"900001", "900002"}, {"000003"}),
+    ("20230612", {"000003"}, set()),
+    ("20231208", {"900003"}, {"000001", "900001"}),
+]
+BASE = {"000001", "000002", "000003", "000004"}
+
+
+def members(date):
+    result = set(BASE)
+    for day, added, removed in REBALANCES:
+        if date >= day:
+            result = (result | added) - removed
+    return result
+
+
+@pytest.fixture
+def deposit_file(monkeypatch):
+    dates = []
+    lock = threading.Lock()
+
+    def fake(date, ticker):
+        with lock:
+            dates.append(date)
+        return sorted(members(date))
+
+    monkeypatch.setattr(calendar_module, "today_kst", lambda: "20231229")
+    calendar = TradingCalendar(
+        fetch=lambda f, t: SESSIONS[(f <= SESSIONS) & (t >= SESSIONS)], enabled=False
+    )
+    monkeypatch.setattr(stock_index_history, "get_trading_calendar", lambda: calendar)
+    monkeypatch.setattr(stock_index_history, "_get_index_portfolio_deposit_file", fake)
+    return dates
+
+
+class TestIndexPortfolioHistory:
+    def test_changes(self, deposit_file):
+        """변경일 주변만 조회하고 모든 변경일을 찾음"""
+        history = get_index_portfolio_history("1028", "20230101", "20231231")
+        assert history.changes.strftime("%Y%m%d").tolist() == ["20230609", "20230612", "20231208"]
+        assert len(deposit_file) < len(SESSIONS) // 4
+
+    def test_as_of(self, deposit_file):
+        history = get_index_portfolio_history("1028", "20230101", "20231231", max_interval=20)
+        for date in ["20230102", "20230608", "20230609", "20230611", "20230612", "20231229"]:
+            assert history.as_of(date) == sorted(members(date)), date
+        assert history.contains("000003", "20230608")
+        assert not history.contains("000003", "20230609")
+        assert history.contains("000003", "20230612")
+        assert not history.contains("999999", "20230612")
+        with pytest.raises(ValueError):
+            history.as_of("20240102")
+
+    def test_events(self, deposit_file):
+        """시작일의 구성 종목과 변경분만 저장"""
+        events = get_index_portfolio_history("1028", "20230101", "20231231").events
+        assert len(events) == len(BASE) + 3 + 1 + 3
+        removed = events[~events["편입"]]
+        assert removed["티커"].tolist() == ["000003", "000001", "900001"]
+
+    def test_empty_result_after_members(self, deposit_file, monkeypatch):
+        """구성 종목이 조회된 이후의 빈 결과는 전 종목 편출이 아닌 조회 실패"""
+
+        def fake(date, ticker):
+            return [] if date == "20230904" else sorted(members(date))
+
+        monkeypatch.setattr(stock_index_history, "_get_index_portfolio_deposit_file", fake)
+        with pytest.raises(ValueError, match="20230904"):
+            get_index_portfolio_history("1028", "20230801", "20231031", max_interval=2)
+
+    def test_empty_before_first_members(self, deposit_file, monkeypatch):
+        """지수 산출 전의 빈 결과는 그대로 기록"""
+
+        def fake(date, ticker):
+            return [] if date < "20230609" else sorted(members(date))
+
+        monkeypatch.setattr(stock_index_history, "_get_index_portfolio_deposit_file", fake)
+        history = get_index_portfolio_history("1028", "20230101", "20231231")
+        assert history.as_of("20230608") == []
+        assert history.as_of("20230609") == sorted(members("20230609"))
+
+    def test_keyframes(self, monkeypatch):
+        """기준점을 여러 개 거치는 이력도 같은 결과"""
+        monkeypatch.setattr(stock_index_history, "_KEYFRAME", 2)
+        days = pd.bdate_range("2023-01-02", periods=10)
+        events = pd.DataFrame(
+            {"날짜": days, "티커": [f"{i:06d}" for i in range(10)], "편입": [True] * 10}
+        )
+        history = IndexPortfolioHistory("1028", "20230102", "20230113", events)
+        assert history.as_of("20230106") == [f"{i:06d}" for i in range(5)]
+        assert len(history.as_of("20230113")) == 10
+
+    def test_save_load(self, deposit_file, tmp_path):
+        history = get_index_portfolio_history("1028", "20230101", "20231231")
+        path = tmp_path / "history.npz"
+        history.save(path)
+        loaded = IndexPortfolioHistory.load(path)
+        assert (loaded.ticker, loaded.fromdate, loaded.todate) == ("1028", "20230101", "20231231")
+        pd.testing.assert_frame_equal(loaded.events, history.events)
+        assert loaded.as_of("20230901") == history.as_of("20230901")
@@ -0,0 +1,93 @@
+"""기간 스냅샷 순회 테스트"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pykrx.stock import stock_snapshots
+from pykrx.stock.stock_snapshots import iter_snapshots, write_snapshots_parquet
+from pykrx.website.krx.market import calendar as calendar_module
+from pykrx.website.krx.market.calendar import TradingCalendar
+
+SESSIONS = pd.bdate_range("2024-01-02", "2024-01-31").drop(pd.Timestamp("2024-01-15"))
+
+
+class FakeSnapshot:
+    __name__ = "get_market_cap_by_ticker"
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, date, market="KOSPI"):
+        with self.lock:
+            self.calls.append((date, market))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        # 앞선 날짜가 늦게 끝나도 순서대로 반환되는지 확인하기 위해 역순으로 지연
+        time.sleep(self.delay * (31 - int(date[-2:])) / 31)
+        with self.lock:
+            self.active -= 1
+        tickers = ["005930", "000660"] if date != "20240105" else ["005930"]
+        return pd.DataFrame(
+            {"종가": np.array([int(date[-2:])] * len(tickers), dtype=np.int32)},
+            index=pd.Index(tickers, name="티커"),
+        )
+
+
+@pytest.fixture(autouse=True)
+def calendar(monkeypatch):
+    monkeypatch.setattr(calendar_module, "today_kst", lambda: "20240131")
+    calendar = TradingCalendar(
+        fetch=lambda f, t: SESSIONS[(f <= SESSIONS) & (t >= SESSIONS)], enabled=False
+    )
+    monkeypatch.setattr(stock_snapshots, "get_trading_calendar", lambda: calendar)
+    return calendar
+
+
+class TestIterSnapshots:
+    def test_trading_days_in_order(self):
+        """휴일에는 조회하지 않고 날짜 순서대로 반환"""
+        fetch = FakeSnapshot(delay=0.02)
+        result = list(iter_snapshots(fetch, "20240112", "20240117", "KOSDAQ", prefetch=3))
+        assert [d.strftime("%Y%m%d") for d, _ in result] == ["20240112", "20240116", "20240117"]
+        assert sorted(fetch.calls) == [
+            ("20240112", "KOSDAQ"),
+            ("20240116", "KOSDAQ"),
+            ("20240117", "KOSDAQ"),
+        ]
+        assert result[1][1]["종가"].tolist() == [16, 16]
+        assert fetch.peak > 1
+
+    def test_bounded_prefetch(self):
+        """미리 조회하는 영업일 수는 prefetch를 넘지 않음"""
+        fetch = FakeSnapshot()
+        snapshots = iter_snapshots(fetch, "20240102", "20240131", prefetch=2)
+        next(snapshots)
+        time.sleep(0.05)
+        assert len(fetch.calls) <= 3
+        snapshots.close()
+
+    def test_invalid_prefetch(self):
+        with pytest.raises(ValueError):
+            next(iter_snapshots(FakeSnapshot(), "20240102", "20240131", prefetch=0))
+
+
+class TestWriteSnapshotsParquet:
+    def test_write(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "snapshots.parquet"
+        rows = write_snapshots_parquet(FakeSnapshot(), "20240102", "20240105", path, market="ALL")
+        assert rows == 7
+
+        table = pq.read_table(path)
+        assert table.column_names == ["날짜", "티커", "종가"]
+        df = table.to_pandas()
+        assert df["종가"].dtype == np.int64
+        assert df.groupby("날짜").size().tolist() == [2, 2, 2, 1]
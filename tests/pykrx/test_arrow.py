@@ -0,0 +1,59 @@
+"""pykrx.arrow API 테스트"""
+
+import datetime
+
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from pykrx import arrow  # noqa: E402
+from pykrx.website.comm import webio  # noqa: E402
+from pykrx.website.comm.transport import SyntheticTransport  # noqa: E402
+from pykrx.website.krx.market import wrap  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def synthetic():
+    previous = webio.set_transport(SyntheticTransport(tickers=30))
+    yield
+    webio.set_transport(previous)
+
+
+class TestArrowApi:
+    """Arrow API 테스트 클래스"""
+
+    def test_same_values_as_dataframe(self):
+        """pykrx.stock과 같은 열 이름, 타입, 값을 반환하는지 테스트"""
+        table = arrow.get_market_ohlcv_by_ticker("20240102", "ALL")
+        df = wrap.get_market_ohlcv_by_ticker("20240102", "ALL")
+        assert table.schema.field("종가").type == pa.int32()
+        assert table.schema.field("거래대금").type == pa.int64()
+        pd.testing.assert_frame_equal(table.to_pandas().set_index("티커"), df)
+
+    def test_date_column(self):
+        """날짜 index가 정렬된 date32 열로 포함되는지 테스트"""
+        ticker = wrap.get_market_ohlcv_by_ticker("20240102", "ALL").index[0]
+        table = arrow.get_market_ohlcv_by_date(datetime.date(2023, 12, 1), "2024-01-02", ticker)
+        df = wrap.get_market_ohlcv_by_date("20231201", "20240102", ticker)
+        assert table.column_names[0] == "날짜"
+        assert table.schema.field("날짜").type == pa.date32()
+        result = table.to_pandas().set_index("날짜")
+        result.index = pd.to_datetime(result.index)
+        assert result.index.is_monotonic_increasing
+        assert (result["종가"].to_numpy() == df["종가"].to_numpy()).all()
+
+    def test_invalid_market(self):
+        """조회 오류는 빈 Table을 반환하는지 테스트"""
+        assert arrow.get_market_ohlcv_by_ticker("20240102", "INVALID").num_rows == 0
+
+    def test_market_cap_sorted(self):
+        """pykrx.stock과 같이 시가총액 내림차순으로 정렬되는지 테스트"""
+        table = arrow.get_market_cap_by_ticker("20240102")
+        df = wrap.get_market_cap_by_ticker("20240102", "ALL")
+        result = table.to_pandas().set_index("티커")
+        assert result["시가총액"].is_monotonic_decreasing
+        assert result["시가총액"].tolist() == df["시가총액"].tolist()
+        pd.testing.assert_frame_equal(result.sort_index(), df.sort_index())
+        ascending = arrow.get_market_cap_by_ticker("20240102", ascending=True)
+        assert ascending.column("시가총액").to_pandas().is_monotonic_increasing
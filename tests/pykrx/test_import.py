@@ -0,0 +1,60 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+def loaded_modules(statement: str) -> set:
+    probe = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    return set(json.loads(out.strip().splitlines()[-1]))
+
+
+class TestLazyImport:
+    def test_import_pykrx_is_light(self):
+        """import pykrx는 pandas, matplotlib, 하위 패키지를 불러오지 않음"""
+        modules = loaded_modules("import pykrx")
+        for heavy in ("pandas", "matplotlib", "pykrx.stock", "pykrx.bond", "pykrx.website"):
+            assert heavy not in modules
+
+    def test_submodule_on_access(self):
+        """하위 패키지는 처음 접근할 때 불러옴"""
+        modules = loaded_modules("import pykrx; pykrx.bond.get_otc_treasury_yields")
+        assert "pykrx.bond" in modules
+        assert "pykrx.stock" not in modules
+        assert "matplotlib" not in modules
+
+    def test_unknown_attribute(self):
+        import pykrx
+
+        with pytest.raises(AttributeError):
+            pykrx.no_such_module  # noqa: B018
+
+
+class TestSetupFont:
+    def test_setup_font(self):
+        """setup_font는 matplotlib 기본 글꼴을 한글 글꼴로 설정"""
+        import matplotlib.pyplot as plt
+
+        import pykrx
+
+        family = pykrx.setup_font(force=True)
+        assert plt.rcParams["font.family"][0] == family
+        assert plt.rcParams["axes.unicode_minus"] is False
+
+    def test_font_on_pyplot_import(self):
+        """import pykrx 뒤에 matplotlib.pyplot을 불러와도 한글 글꼴을 설정"""
+        probe = (
+            "import sys, pykrx\n"
+            "assert 'matplotlib' not in sys.modules\n"
+            "import matplotlib.pyplot as plt\n"
+            "print(plt.rcParams['font.family'][0], plt.__loader__.__class__.__name__)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+        ).stdout.split()
+        assert out[0] in ("NanumBarunGothic", "AppleGothic")
+        assert out[1] != "_SetupFontLoader"
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pykrx.website.comm import compact
+from pykrx.website.comm.compact import TickerDictionary, compact_frame, smallest_int
+from pykrx.website.krx.market.core import AllStockPrice
+from pykrx.website.krx.schema import Schema
+
+RECORDS = [
+    {"ISU_SRT_CD": "005930", "MKT_NM": "KOSPI", "ACC_TRDVOL": "3,000,000,000"},
+    {"ISU_SRT_CD": "000660", "MKT_NM": "KOSPI", "ACC_TRDVOL": "120"},
+    {"ISU_SRT_CD": "035720", "MKT_NM": "KOSPI", "ACC_TRDVOL": "-"},
+    {"ISU_SRT_CD": "091990", "MKT_NM": "KOSDAQ", "ACC_TRDVOL": "7"},
+]
+
+
+@pytest.fixture
+def compact_mode():
+    compact.enable_compact()
+    yield
+    compact.disable_compact()
+
+
+class TestTickerDictionary:
+    def test_shared_dtype(self):
+        """같은 티커 집합이면 호출마다 같은 dtype 객체를 공유"""
+        tickers = TickerDictionary()
+        first = tickers.encode(["005930", "000660"])
+        second = tickers.encode(["000660"])
+        assert first.dtype is second.dtype
+        assert list(tickers.dtype.categories) == ["000660", "005930"]
+
+    def test_align_after_growth(self):
+        """새 티커로 사전이 늘어나도 이전 결과를 최신 dtype으로 맞춰 합칠 수 있음"""
+        tickers = TickerDictionary()
+        old = pd.Series(tickers.encode(["005930"]))
+        new = pd.Series(tickers.encode(["000660"]))
+        merged = pd.concat([tickers.align(old), new])
+        assert merged.dtype == tickers.dtype
+        assert merged.tolist() == ["005930", "000660"]
+
+
+class TestSmallestInt:
+    @pytest.mark.parametrize(
+        "values, dtype",
+        [
+            ([0, 127], np.int8),
+            ([-1, 30000], np.int16),
+            ([0, 2**31 - 1], np.int32),
+            ([0, 2**31], np.int64),
+        ],
+    )
+    def test_range(self, values, dtype):
+        assert smallest_int(np.array(values, dtype=np.int64)).dtype == dtype
+
+
+class TestCompactSchema:
+    SCHEMA = Schema(
+        AllStockPrice,
+        [("ISU_SRT_CD", "티커"), ("MKT_NM", "시장구분"), ("ACC_TRDVOL", "거래량", np.int32)],
+        index="티커",
+    )
+
+    def test_default_overflow(self):
+        """선언한 dtype의 범위를 벗어나면 잘리지 않고 오류를 발생"""
+        with pytest.raises(OverflowError):
+            self.SCHEMA.build(RECORDS)
+
+    def test_compact_build(self, compact_mode):
+        df = self.SCHEMA.build(RECORDS)
+        assert isinstance(df.index, pd.CategoricalIndex)
+        assert df.index.dtype is compact.TICKERS.dtype
+        assert df["시장구분"].dtype == "category"
+        assert df["거래량"].dtype == np.int64
+        assert df.loc["005930", "거래량"] == 3_000_000_000
+        assert df.sort_index().index.tolist() == sorted(r["ISU_SRT_CD"] for r in RECORDS)
+
+    def test_compact_frame(self):
+        df = pd.DataFrame(
+            {
+                "시장구분": ["KOSPI", "KOSPI", "KOSDAQ", "KOSPI"],
+                "종가": np.arange(4, dtype=np.int64),
+            },
+            index=pd.Index(["A", "B", "C", "D"], name="티커"),
+        )
+        result = compact_frame(df)
+        assert result["시장구분"].dtype == "category"
+        assert result["종가"].dtype == np.int8
+        assert isinstance(result.index, pd.CategoricalIndex)
+        assert (
+            result.astype({"시장구분": str, "종가": np.int64}).values.tolist() == df.values.tolist()
+        )
@@ -0,0 +1,144 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pykrx.website.comm import diskcache, webio
+from pykrx.website.comm.diskcache import DiskCache, make_key
+from pykrx.website.krx.krxio import KrxWebIo
+
+URL = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+
+
+class SampleIo(KrxWebIo):
+    @property
+    def bld(self):
+        return "dbms/MDC/STAT/standard/MDCSTAT01501"
+
+    def fetch(self, **params):
+        return self.read(**params)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiskCache(tmp_path, max_bytes=10_000, ttl=60)
+
+
+@pytest.fixture
+def enabled(tmp_path):
+    # 디스크 캐시는 HttpTransport 응답만 저장하므로 --transport 옵션과 무관하게 지정
+    previous = webio.set_transport(webio.HttpTransport())
+    cache = diskcache.enable_disk_cache(tmp_path)
+    yield cache
+    diskcache.disable_disk_cache()
+    webio.set_transport(previous)
+
+
+class TestMakeKey:
+    def test_param_order_and_type_independent(self):
+        """파라미터 순서와 값의 타입은 키에 영향을 주지 않음"""
+        a = make_key(URL, {"bld": "x", "trdDd": "20220104", "share": 1})
+        b = make_key(URL, {"share": "1", "trdDd": "20220104", "bld": "x"})
+        assert a == b
+        assert a != make_key(URL, {"bld": "x", "trdDd": "20220105", "share": 1})
+
+
+class TestDiskCache:
+    def test_roundtrip_and_stats(self, cache):
+        params = {"bld": "x", "trdDd": "20220104"}
+        assert cache.get(URL, params) is None
+        cache.set(URL, params, {"output": [{"종목명": "삼성전자"}]})
+        assert cache.get(URL, params) == {"output": [{"종목명": "삼성전자"}]}
+
+        info = cache.info()
+        assert (info.hits, info.misses, info.writes, info.entries) == (1, 1, 1, 1)
+        assert info.size > 0
+
+    def test_settled_dates_never_expire(self, cache):
+        """오늘 이전에 끝나는 요청은 만료되지 않음"""
+        assert cache.expires_at({"strtDd": "20200101", "endDd": "20211231"}) == 0.0
+
+    def test_today_uses_ttl(self, cache):
+        """오늘을 포함하는 요청은 ttl 이후 만료"""
+        params = {"bld": "x", "trdDd": diskcache.today_kst()}
+        with patch.object(diskcache.time, "time", return_value=1000.0):
+            assert cache.expires_at(params) == 1060.0
+            cache.set(URL, params, {"output": [{"v": 1}]})
+            assert cache.get(URL, params) == {"output": [{"v": 1}]}
+        with patch.object(diskcache.time, "time", return_value=1061.0):
+            assert cache.get(URL, params) is None
+
+    def test_undated_requests_use_undated_ttl(self, cache):
+        assert cache.expires_at({"bld": "x"}, now=0.0) == cache.undated_ttl
+
+    def test_lru_eviction(self, tmp_path):
+        """용량을 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        cache = DiskCache(tmp_path, max_bytes=10**9)
+        for i in range(3):
+            cache.set(URL, {"trdDd": f"2020010{i}"}, {"output": ["x" * 100]})
+            path = cache._path(make_key(URL, {"trdDd": f"2020010{i}"}))
+            os.utime(path, (i, i))
+        size = cache.info().size
+
+        # 0번을 최근에 사용 → 1번이 가장 오래됨
+        cache.get(URL, {"trdDd": "20200100"})
+        cache.max_bytes = size
+        cache.set(URL, {"trdDd": "20200103"}, {"output": ["x" * 100]})
+
+        assert cache.get(URL, {"trdDd": "20200101"}) is None
+        assert cache.get(URL, {"trdDd": "20200100"}) is not None
+        assert cache.get(URL, {"trdDd": "20200103"}) is not None
+        assert cache.info().evictions == 1
+
+    def test_corrupted_entry_is_a_miss(self, cache):
+        params = {"trdDd": "20200101"}
+        cache.set(URL, params, {"output": [{"v": 1}]})
+        cache._path(make_key(URL, params)).write_bytes(b"broken")
+        assert cache.get(URL, params) is None
+
+
+class TestKrxWebIoCache:
+    def test_second_read_served_from_disk(self, enabled):
+        """같은 요청은 한 번만 upstream으로 전송"""
+        resp = MagicMock()
+        resp.json.return_value = {"output": [{"ISU_SRT_CD": "005930"}]}
+        with patch("pykrx.website.comm.webio.Post.read", return_value=resp) as mock_read:
+            first = SampleIo().fetch(trdDd="20220104", mktId="STK")
+            second = SampleIo().fetch(trdDd="20220104", mktId="STK")
+        assert first == second == {"output": [{"ISU_SRT_CD": "005930"}]}
+        assert mock_read.call_count == 1
+        assert diskcache.disk_cache_info().hits == 1
+
+    def test_windows_cached_separately(self, enabled):
+        """730일 단위로 나눈 구간을 각각 저장"""
+        resp = MagicMock()
+        resp.json.side_effect = lambda: {"output": [{"v": 1}]}
+        with patch("pykrx.website.comm.webio.Post.read", return_value=resp) as mock_read:
+            SampleIo().fetch(strtDd="20150101", endDd="20191231", isuCd="KR7005930003")
+            assert mock_read.call_count == 3
+            result = SampleIo().fetch(strtDd="20150101", endDd="20191231", isuCd="KR7005930003")
+            assert mock_read.call_count == 3
+        assert len(result["output"]) == 3
+
+    def test_empty_and_error_payloads_not_cached(self, enabled):
+        """빈 결과나 오류 응답은 저장하지 않고 다시 조회"""
+        resp = MagicMock()
+        resp.json.side_effect = [{"output": []}, {"error": "ERR"}, {"output": [{"v": 1}]}]
+        with patch("pykrx.website.comm.webio.Post.read", return_value=resp) as mock_read:
+            for _ in range(3):
+                SampleIo().fetch(trdDd="20220104", mktId="STK")
+            assert SampleIo().fetch(trdDd="20220104", mktId="STK") == {"output": [{"v": 1}]}
+        assert mock_read.call_count == 3
+        assert diskcache.disk_cache_info().writes == 1
+
+    def test_non_http_transport_bypasses_cache(self, enabled):
+        """replay/synthetic transport의 응답은 공유 캐시에 저장하지 않음"""
+        from pykrx.website.comm import webio
+        from pykrx.website.comm.transport import SyntheticTransport
+
+        previous = webio.set_transport(SyntheticTransport(tickers=5))
+        try:
+            SampleIo().fetch(trdDd="20220104", mktId="STK")
+        finally:
+            webio.set_transport(previous)
+        assert diskcache.disk_cache_info().writes == 0
@@ -0,0 +1,135 @@
+import logging
+import time
+
+import pytest
+
+from pykrx.website.comm import instrument, webio
+from pykrx.website.comm.instrument import Aggregator, Event, LoggingHook
+from pykrx.website.comm.transport import SyntheticTransport
+from pykrx.website.krx.market import wrap
+
+BLD = "dbms/MDC/STAT/standard/MDCSTAT01501"
+
+
+@pytest.fixture
+def synthetic():
+    previous = webio.set_transport(SyntheticTransport(tickers=20))
+    yield
+    webio.set_transport(previous)
+
+
+@pytest.fixture
+def events():
+    collected = []
+    instrument.add_hook(collected.append)
+    yield collected
+    instrument.remove_hook(collected.append)
+
+
+class TestInstrument:
+    def test_no_hooks_no_events(self, synthetic):
+        """hook이 없으면 계측하지 않음"""
+        assert not instrument.enabled()
+        df = wrap.get_market_ohlcv_by_ticker("20240115", "KOSPI")
+        assert not df.empty
+
+    def test_http_decode_call_events(self, synthetic, events):
+        """http/decode/call 이벤트가 순서대로 발생"""
+        df = wrap.get_market_ohlcv_by_ticker("20240115", "ALL")
+
+        kinds = [e.kind for e in events]
+        assert kinds == ["http", "decode", "call"]
+        http, decode, call = events
+        assert http.name == BLD and http.bytes > 0
+        assert http.params["trdDd"] == "20240115"
+        assert decode.name == BLD and decode.rows == 20
+        assert call.name == "get_market_ohlcv_by_ticker"
+        assert call.rows == len(df)
+        assert call.bytes == http.bytes
+        assert call.http_seconds == pytest.approx(http.seconds)
+        assert call.transform_seconds >= 0
+
+    def test_nested_calls_recorded_once(self, synthetic, events):
+        """wrap 함수 안에서 호출한 wrap 함수는 별도로 기록하지 않음"""
+        wrap.get_market_ohlcv_by_ticker("20240115", "KOSPI")
+        assert [e.kind for e in events].count("call") == 1
+
+    def test_throttle_wait_separated(self, events, monkeypatch):
+        """속도 제한 대기 시간은 http 시간에 포함하지 않고 따로 기록"""
+
+        class FakeSession:
+            def post(self, url, headers=None, data=None):
+                return type("Response", (), {"content": b'{"output": []}'})()
+
+        def slow_throttle(url):
+            time.sleep(0.05)
+            return 0.05
+
+        monkeypatch.setattr(webio, "throttle", slow_throttle)
+        monkeypatch.setattr(webio, "get_session", FakeSession)
+        previous = webio.set_transport(None)
+        try:
+            webio._request("POST", "http://data.krx.co.kr/", {}, {"bld": BLD})
+        finally:
+            webio.set_transport(previous)
+
+        (http,) = events
+        assert http.throttle_seconds == pytest.approx(0.05)
+        assert http.seconds < 0.05
+
+    def test_hook_error_is_swallowed(self, synthetic):
+        def broken(event):
+            raise RuntimeError("boom")
+
+        instrument.add_hook(broken)
+        try:
+            df = wrap.get_market_ohlcv_by_ticker("20240115", "ALL")
+        finally:
+            instrument.remove_hook(broken)
+        assert not df.empty
+
+
+class TestAggregator:
+    def test_percentiles(self):
+        agg = Aggregator()
+        for ms in range(1, 101):
+            agg(Event("http", BLD, seconds=ms / 1e3, bytes=100, rows=10))
+
+        row = agg.summary(percentiles=(50, 99)).loc[("http", BLD)]
+        assert row["count"] == 100
+        assert row["p50_ms"] == pytest.approx(50.5)
+        assert row["p99_ms"] == pytest.approx(99.01)
+        assert row["mean_bytes"] == 100
+
+    def test_call_breakdown(self):
+        agg = Aggregator()
+        agg(
+            Event(
+                "call",
+                "f",
+                seconds=0.3,
+                http_seconds=0.2,
+                decode_seconds=0.05,
+                transform_seconds=0.05,
+            )
+        )
+        row = agg.summary().loc[("call", "f")]
+        assert row["http_ms"] == pytest.approx(200)
+        assert row["transform_ms"] == pytest.approx(50)
+
+    def test_maxlen(self):
+        agg = Aggregator(maxlen=3)
+        for _ in range(10):
+            agg(Event("http", BLD, seconds=0.1))
+        assert agg.summary().loc[("http", BLD), "count"] == 3
+
+    def test_empty(self):
+        assert Aggregator().summary().empty
+
+
+class TestLoggingHook:
+    def test_logs_call_breakdown(self, caplog):
+        hook = LoggingHook(level=logging.INFO)
+        with caplog.at_level(logging.INFO, logger="pykrx.instrument"):
+            hook(Event("call", "get_market_ohlcv", seconds=0.5, http_seconds=0.4, rows=3))
+        assert "get_market_ohlcv 500.0ms (http 400.0ms" in caplog.text
@@ -0,0 +1,44 @@
+import json
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from pykrx.website.comm import jsonio
+from pykrx.website.comm.jsonio import read_json, records_to_frame
+
+
+class TestRecordsToFrame:
+    def test_same_as_pandas(self):
+        """pandas의 기본 변환과 같은 결과"""
+        records = [
+            {"ISU_SRT_CD": "005930", "TDD_CLSPRC": "71,000"},
+            {"TDD_CLSPRC": "128,000", "ISU_SRT_CD": "000660"},
+        ]
+        pd.testing.assert_frame_equal(records_to_frame(records), pd.DataFrame(records))
+
+    def test_mixed_keys_fall_back(self):
+        records = [{"a": "1", "b": "2"}, {"a": "3", "c": "4"}, {"a": "5"}]
+        pd.testing.assert_frame_equal(records_to_frame(records), pd.DataFrame(records))
+
+    def test_empty(self):
+        assert records_to_frame([]).empty
+
+
+class TestReadJson:
+    def test_decodes_content(self):
+        resp = MagicMock()
+        resp.content = json.dumps({"output": [{"종목명": "삼성전자"}]}).encode("utf-8")
+        assert read_json(resp) == {"output": [{"종목명": "삼성전자"}]}
+        resp.json.assert_not_called()
+
+    def test_non_utf8_falls_back_to_response(self):
+        """UTF-8이 아닌 본문은 requests의 디코딩 사용"""
+        resp = MagicMock()
+        resp.content = '{"a": "가"}'.encode("euc-kr")
+        resp.json.return_value = {"a": "가"}
+        assert read_json(resp) == {"a": "가"}
+
+    def test_stdlib_backend(self, monkeypatch):
+        monkeypatch.setattr(jsonio, "_orjson", None)
+        monkeypatch.setattr(jsonio, "_simdjson", None)
+        assert jsonio.loads(b'{"a": ["1"]}') == {"a": ["1"]}
@@ -0,0 +1,148 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pykrx.website.comm import webio
+from pykrx.website.krx import krxio
+from pykrx.website.krx.krxio import (
+    KrxWebIo,
+    WindowPlanner,
+    configure_window_fetch,
+    merge_windows,
+    split_date_range,
+)
+
+
+class HistoryIo(KrxWebIo):
+    @property
+    def bld(self):
+        return "dbms/MDC/STAT/standard/MDCSTAT01701"
+
+    def fetch(self, **params):
+        return self.read(**params)
+
+
+@pytest.fixture
+def planner(monkeypatch):
+    planner = WindowPlanner()
+    monkeypatch.setattr(krxio, "_planner", planner)
+    return planner
+
+
+class TestSplitDateRange:
+    def test_matches_two_year_windows(self):
+        """기존과 같이 730일 단위로 분할"""
+        assert split_date_range("20150101", "20191231", 730) == [
+            ("20150101", "20161231"),
+            ("20170101", "20190101"),
+            ("20190102", "20191231"),
+        ]
+
+    def test_short_range_single_window(self):
+        assert split_date_range("20240101", "20240131", 730) == [("20240101", "20240131")]
+
+    def test_reversed_range(self):
+        assert split_date_range("20240131", "20240101", 730) == []
+
+
+class TestMergeWindows:
+    def test_merges_every_list_block(self):
+        """output 외의 블록(OutBlock_1 등)도 순서대로 합침"""
+        merged = merge_windows(
+            [
+                {"OutBlock_1": [1, 2], "CURRENT_DATETIME": "a"},
+                {"OutBlock_1": [3], "CURRENT_DATETIME": "b"},
+                {"OutBlock_1": [], "CURRENT_DATETIME": "c"},
+            ]
+        )
+        assert merged == {"OutBlock_1": [1, 2, 3], "CURRENT_DATETIME": "a"}
+
+    def test_empty(self):
+        assert merge_windows([]) is None
+
+
+class TestWindowPlanner:
+    def test_defaults_to_max_window(self):
+        assert WindowPlanner().window_days("unknown") == 730
+
+    def test_shrinks_for_heavy_responses(self):
+        """일당 행 수가 많은 bld는 구간을 줄임"""
+        planner = WindowPlanner(target_rows=10000)
+        planner.observe("heavy", days=730, rows=730 * 100, seconds=1.0)
+        assert planner.window_days("heavy") == 100
+
+    def test_shrinks_for_slow_responses(self):
+        planner = WindowPlanner(target_seconds=1.0)
+        planner.observe("slow", days=730, rows=500, seconds=7.3)
+        assert planner.window_days("slow") == 100
+
+    def test_respects_min_days(self):
+        planner = WindowPlanner(min_days=30)
+        planner.observe("huge", days=10, rows=10**7, seconds=100)
+        assert planner.window_days("huge") == 30
+
+
+class TestConcurrentWindows:
+    def test_windows_fetched_concurrently_in_order(self, planner):
+        """구간을 동시에 조회하고 원래 순서대로 합침"""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fake_read_json(self, **params):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return {"output": [params["strtDd"]]}
+
+        configure_window_fetch(max_workers=4)
+        with patch.object(KrxWebIo, "_read_json", fake_read_json):
+            result = HistoryIo().fetch(strtDd="19950101", endDd="20241231", isuCd="KR7005930003")
+
+        starts = result["output"]
+        assert len(starts) == len(split_date_range("19950101", "20241231", 730))
+        assert starts == sorted(starts)
+        assert state["peak"] > 1
+
+    def test_max_workers_validation(self):
+        with pytest.raises(ValueError):
+            configure_window_fetch(max_workers=0)
+
+
+class FakeSession:
+    def post(self, url, headers=None, data=None):
+        time.sleep(0.001)
+        return type("Response", (), {"content": b'{"output": [{"A": 1}]}'})()
+
+
+class TestUpstreamLatency:
+    def test_throttle_wait_not_counted(self, planner, monkeypatch):
+        """속도 제한 대기 시간은 응답 시간으로 보지 않아 구간이 줄지 않음"""
+
+        def slow_throttle(url):
+            time.sleep(0.05)
+            return 0.05
+
+        monkeypatch.setattr(krxio, "get_disk_cache", lambda: None)
+        monkeypatch.setattr(webio, "throttle", slow_throttle)
+        monkeypatch.setattr(webio, "get_session", FakeSession)
+        configure_window_fetch(max_workers=1)
+        previous = webio.set_transport(None)
+        try:
+            HistoryIo().fetch(strtDd="20200101", endDd="20200110", isuCd="KR7005930003")
+        finally:
+            webio.set_transport(previous)
+            configure_window_fetch(max_workers=4)
+        planner.target_seconds = 0.02
+        # 대기(50ms)를 포함했으면 일당 5ms 이상으로 보고 구간을 최소 길이로 줄인다.
+        assert planner.window_days("dbms/MDC/STAT/standard/MDCSTAT01701") > planner.min_days
+
+    def test_cache_hit_keeps_latency(self):
+        planner = WindowPlanner(target_seconds=1.0)
+        planner.observe("slow", days=730, rows=500, seconds=7.3)
+        planner.observe("slow", days=730, rows=500, seconds=None)
+        assert planner.window_days("slow") == 100
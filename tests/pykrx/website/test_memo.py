@@ -0,0 +1,151 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+import pykrx
+from pykrx.website.comm import memo
+from pykrx.website.comm.memo import disable_memo, enable_memo, memoize
+
+
+@pytest.fixture
+def enabled():
+    cache = enable_memo()
+    yield cache
+    disable_memo()
+
+
+def make_counter():
+    calls = []
+
+    @memoize
+    def get_snapshot(date: str, market: str = "KOSPI") -> pd.DataFrame:
+        calls.append((date, market))
+        return pd.DataFrame({"종가": [71000, 128000]}, index=["005930", "000660"])
+
+    return get_snapshot, calls
+
+
+class TestMemoize:
+    def test_disabled_by_default(self):
+        """활성화하지 않으면 매번 원본 함수를 호출"""
+        func, calls = make_counter()
+        func("20220104")
+        func("20220104")
+        assert len(calls) == 2
+
+    def test_equivalent_arguments_share_entry(self, enabled):
+        """위치 인자, 키워드 인자, 기본값 생략은 같은 키"""
+        func, calls = make_counter()
+        func("20220104")
+        func("20220104", "KOSPI")
+        func(date="20220104", market="KOSPI")
+        assert len(calls) == 1
+        func("20220104", "KOSDAQ")
+        assert len(calls) == 2
+        assert (enabled.info().hits, enabled.info().misses) == (2, 2)
+
+    def test_callers_cannot_corrupt_cache(self, enabled):
+        """반환된 DataFrame을 수정해도 저장된 결과는 변하지 않음"""
+        func, _ = make_counter()
+        df = func("20220104")
+        df.loc["005930", "종가"] = 0
+        df["신규"] = 1
+        again = func("20220104")
+        assert again.loc["005930", "종가"] == 71000
+        assert list(again.columns) == ["종가"]
+
+    def test_list_result(self, enabled):
+        """list 결과도 저장하고 호출마다 새 list로 반환"""
+        calls = []
+
+        @memoize
+        def get_members(date: str, ticker: str) -> list:
+            calls.append(date)
+            return ["005930", "000660"] if date != "20220105" else []
+
+        first = get_members("20220104", "1028")
+        first.append("999999")
+        assert get_members("20220104", "1028") == ["005930", "000660"]
+        assert len(calls) == 1
+        assert enabled.info().size > 0
+
+        get_members("20220105", "1028")
+        get_members("20220105", "1028")
+        assert len(calls) == 3
+
+    def test_empty_result_not_cached(self, enabled):
+        calls = []
+
+        @memoize
+        def get_empty(date):
+            calls.append(date)
+            return pd.DataFrame()
+
+        get_empty("20220104")
+        get_empty("20220104")
+        assert len(calls) == 2
+
+    def test_today_expires(self, enabled):
+        """오늘 날짜가 포함된 결과는 today_ttl 이후 다시 조회"""
+        func, calls = make_counter()
+        today = memo.today_kst()
+        with patch.object(memo.time, "monotonic", return_value=100.0):
+            func(today)
+            func(today)
+        assert len(calls) == 1
+        with patch.object(memo.time, "monotonic", return_value=100.0 + enabled.today_ttl + 1):
+            func(today)
+        assert len(calls) == 2
+
+    def test_lru_eviction_by_size(self):
+        func, calls = make_counter()
+        nbytes = memo._nbytes(func("20220104"))
+        cache = enable_memo(max_bytes=nbytes * 2)
+        try:
+            func("20220104")
+            func("20220105")
+            func("20220104")  # 20220105가 가장 오래 사용하지 않은 항목
+            func("20220106")
+            assert cache.info().evictions == 1
+            calls.clear()
+            func("20220104")
+            func("20220105")
+            assert calls == [("20220105", "KOSPI")]
+        finally:
+            disable_memo()
+
+
+class TestCacheInfo:
+    def test_reports_memo_and_disk(self, enabled):
+        func, _ = make_counter()
+        func("20220104")
+        func("20220104")
+        info = pykrx.cache_info()
+        assert info["memo"].enabled
+        assert (info["memo"].hits, info["memo"].entries) == (1, 1)
+        assert info["disk"] is None
+
+    def test_wrap_functions_are_memoized(self, enabled):
+        """wrap 함수는 같은 인자에 대해 KRX를 한 번만 조회"""
+        from pykrx.website.krx.market import wrap
+        from pykrx.website.krx.market.core import AllStockPrice
+
+        raw = {
+            "OutBlock_1": [
+                {
+                    "ISU_SRT_CD": "005930",
+                    "ISU_ABBRV": "삼성전자",
+                    "TDD_CLSPRC": "71,000",
+                    "MKTCAP": "423,845,000,000,000",
+                    "ACC_TRDVOL": "10,000",
+                    "ACC_TRDVAL": "710,000,000",
+                    "LIST_SHRS": "5,969,782,550",
+                }
+            ]
+        }
+        with patch.object(AllStockPrice, "read", return_value=raw) as fetch:
+            first = wrap.get_market_cap_by_ticker("20220104", "KOSPI")
+            second = wrap.get_market_cap_by_ticker("20220104", market="KOSPI")
+        assert fetch.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm.numeric import NumberRangeError, convert_numeric, parse_numbers
+from pykrx.website.krx.market.schema import INDEX_LISTING_DATE
+
+
+class TestParseNumbers:
+    def test_krx_formats(self):
+        """쉼표, 음수, 값 없음('-', '')을 한 번에 변환"""
+        values = pd.Series(["1,234", "-5", "-", "", "0"])
+        result = parse_numbers(values, np.int64)
+        assert result.dtype == np.int64
+        assert result.tolist() == [1234, -5, 0, 0, 0]
+
+    def test_float(self):
+        result = parse_numbers(["-1.23", "1,000.5", "-"], np.float32)
+        assert result.dtype == np.float32
+        assert result.tolist() == pytest.approx([-1.23, 1000.5, 0.0])
+
+    def test_irregular_values(self):
+        """날짜 구분자 등 그 밖의 기호는 정규식으로 제거"""
+        result = parse_numbers(["2021/01/04", "12 %"], np.int64)
+        assert result.tolist() == [20210104, 12]
+
+    def test_numeric_series(self):
+        result = parse_numbers(pd.Series([1, 2, 3]), np.int16)
+        assert result.dtype == np.int16
+
+    def test_invalid_value(self):
+        with pytest.raises(ValueError):
+            parse_numbers(["abc"], np.int64)
+
+    def test_overflow(self):
+        """범위를 벗어난 값은 잘리지 않고 ValueError를 발생"""
+        with pytest.raises(NumberRangeError):
+            parse_numbers(["3,000,000,000"], np.int32)
+        with pytest.raises(ValueError):
+            parse_numbers(["40,000", "1 %"], np.int16)
+
+    def test_overflow_handled(self):
+        """범위를 벗어난 값은 다른 변환 오류처럼 빈 DataFrame으로 처리"""
+        records = [
+            {
+                "IDX_NM": "코스피",
+                "BAS_TM_CONTN": "1980.01.04",
+                "ANNC_TM_CONTN": "1983.01.04",
+                "BAS_IDX_CONTN": "100.00",
+                "COMPST_ISU_CNT": "40,000",
+            }
+        ]
+        build = dataframe_empty_handler(INDEX_LISTING_DATE.build)
+        assert build(records).empty
+
+
+class TestConvertNumeric:
+    def test_only_listed_columns(self):
+        df = pd.DataFrame({"종목명": ["삼성 전자", "-"], "종가": ["71,000", "-"]})
+        result = convert_numeric(df, {"종가": np.int32})
+        assert result["종목명"].tolist() == ["삼성 전자", "-"]
+        assert result["종가"].tolist() == [71000, 0]
+        assert result["종가"].dtype == np.int32
+
+    def test_single_dtype_multiindex(self):
+        """MultiIndex 열에 하나의 dtype 적용"""
+        df = pd.DataFrame(
+            [["1,000", "-2,000"], ["", "3"]],
+            index=pd.Index(["개인", "외국인"], name="투자자구분"),
+            columns=pd.MultiIndex.from_product([["거래량"], ["매도", "순매수"]]),
+        )
+        result = convert_numeric(df, np.int64)
+        assert result.columns.equals(df.columns)
+        assert result.index.equals(df.index)
+        assert result.loc["개인", ("거래량", "순매수")] == -2000
+        assert (result.dtypes == np.int64).all()
+
+    def test_matches_regex_cleaning(self):
+        """기존 정규식 replace + astype 결과와 동일"""
+        df = pd.DataFrame(
+            {
+                "종가": ["1,234", "-", "", "56,700"],
+                "등락률": ["-1.23", "0.00", "-", "29.97"],
+                "거래대금": ["123,456,789,012", "", "-", "0"],
+            }
+        )
+        dtypes = {"종가": np.int32, "등락률": np.float32, "거래대금": np.int64}
+        legacy = df.replace(r"[^-\w\.]", "", regex=True)
+        legacy = legacy.replace(r"\-$", "0", regex=True).replace("", "0")
+        legacy = legacy.astype(dtypes)
+        pd.testing.assert_frame_equal(convert_numeric(df, dtypes), legacy)
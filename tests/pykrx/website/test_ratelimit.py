@@ -0,0 +1,124 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pykrx.website.comm import ratelimit
+from pykrx.website.comm.ratelimit import (
+    SharedTokenBucket,
+    TokenBucket,
+    configure_rate_limit,
+    get_rate_limiter,
+    throttle,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with (
+        patch.object(ratelimit.time, "monotonic", clock),
+        patch.object(ratelimit.time, "time", clock),
+        patch.object(ratelimit.time, "sleep", clock.sleep),
+    ):
+        yield clock
+
+
+@pytest.fixture
+def limiters():
+    saved = dict(ratelimit._limiters)
+    ratelimit._limiters.clear()
+    yield ratelimit._limiters
+    ratelimit._limiters.clear()
+    ratelimit._limiters.update(saved)
+
+
+class TestTokenBucket:
+    def test_burst_passes_without_wait(self, clock):
+        """capacity 만큼은 대기 없이 통과"""
+        bucket = TokenBucket(rate=2, capacity=3)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert clock.now == 1000.0
+
+    def test_waits_for_refill(self, clock):
+        """토큰이 없으면 rate에 맞춰 대기"""
+        bucket = TokenBucket(rate=2, capacity=1)
+        bucket.acquire()
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert clock.now == pytest.approx(1001.0)
+
+    def test_idle_refill_is_capped(self, clock):
+        """오래 쉬어도 capacity 이상 쌓이지 않음"""
+        bucket = TokenBucket(rate=1, capacity=2)
+        clock.now += 100
+        waits = [bucket.acquire() for _ in range(3)]
+        assert waits == [0.0, 0.0, pytest.approx(1.0)]
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_threads_share_budget(self, clock):
+        """여러 스레드가 하나의 한도를 나눠 사용"""
+        bucket = TokenBucket(rate=1000, capacity=1)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            wait = bucket._reserve(1)
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 각 요청은 앞선 요청 뒤로 1ms씩 밀린다.
+        assert sorted(waits) == pytest.approx([0.0, 0.001, 0.002, 0.003, 0.004], abs=1e-4)
+
+
+class TestSharedTokenBucket:
+    def test_buckets_share_state_file(self, clock, tmp_path):
+        """같은 상태 파일을 쓰는 bucket은 한도를 공유"""
+        path = str(tmp_path / "krx.state")
+        a = SharedTokenBucket(rate=2, capacity=1, path=path)
+        b = SharedTokenBucket(rate=2, capacity=1, path=path)
+        assert a.acquire() == 0.0
+        assert b.acquire() == pytest.approx(0.5)
+        clock.now += 10
+        assert b.acquire() == 0.0
+
+
+class TestRegistry:
+    def test_default_hosts(self, limiters):
+        assert isinstance(get_rate_limiter("data.krx.co.kr"), TokenBucket)
+        assert get_rate_limiter("example.com") is None
+
+    def test_configure_and_disable(self, limiters):
+        configure_rate_limit("data.krx.co.kr", 10, 5)
+        limiter = get_rate_limiter("data.krx.co.kr")
+        assert (limiter.rate, limiter.capacity) == (10, 5)
+
+        configure_rate_limit("data.krx.co.kr", None)
+        assert throttle("http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd") == 0.0
+
+    def test_throttle_uses_url_host(self, limiters, clock):
+        configure_rate_limit("fchart.stock.naver.com", 1, 1)
+        url = "https://fchart.stock.naver.com/sise.nhn"
+        assert throttle(url) == 0.0
+        assert throttle(url) == pytest.approx(1.0)
+        # 다른 호스트에는 영향 없음
+        assert throttle("http://example.com/") == 0.0
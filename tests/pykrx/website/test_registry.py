@@ -0,0 +1,206 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from pykrx.website.comm import singleton
+from pykrx.website.comm.registry import Registry
+from pykrx.website.krx.etx import ticker as etx_ticker_module
+from pykrx.website.krx.etx.ticker import EtxTicker, get_etx_isin, is_etf, is_etn
+from pykrx.website.krx.market import ticker as market_ticker_module
+from pykrx.website.krx.market.ticker import IndexTicker
+
+
+class CountingLoader:
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, part):
+        with self.lock:
+            self.calls.append(part)
+            version = len(self.calls)
+        time.sleep(self.delay)
+        return DataFrame({"value": [version]}, index=pd.Index([f"{part}-1"]))
+
+
+def run_threads(target, n=8):
+    barrier = threading.Barrier(n)
+    results = [None] * n
+
+    def work(i):
+        barrier.wait()
+        results[i] = target()
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestRegistry:
+    def test_lazy_partial_load(self):
+        """요청한 파트만 내려받음"""
+        loader = CountingLoader()
+        registry = Registry(loader, ["KOSPI", "KOSDAQ"])
+        assert loader.calls == []
+        registry.get("KOSPI")
+        registry.get("KOSPI")
+        assert loader.calls == ["KOSPI"]
+        assert registry.loaded() == ["KOSPI"]
+
+    def test_concurrent_get_loads_once(self):
+        """여러 스레드가 동시에 조회해도 파트당 한 번만 내려받음"""
+        loader = CountingLoader(delay=0.05)
+        registry = Registry(loader, ["KOSPI", "KOSDAQ"])
+        results = run_threads(lambda: registry.get("KOSPI"))
+        assert loader.calls == ["KOSPI"]
+        assert all(r is results[0] for r in results)
+
+    def test_empty_result_not_cached(self):
+        """조회에 실패한 빈 결과는 다음 조회 때 다시 시도"""
+        calls = []
+
+        def loader(part):
+            calls.append(part)
+            return DataFrame() if len(calls) == 1 else DataFrame({"v": [1]})
+
+        registry = Registry(loader, ["ALL"])
+        assert registry.get("ALL").empty
+        assert not registry.get("ALL").empty
+        assert len(calls) == 2
+
+    def test_frame_and_find(self):
+        loader = CountingLoader()
+        registry = Registry(loader, ["A", "B", "C"])
+        assert registry.find("B-1").index.tolist() == ["B-1"]
+        assert loader.calls == ["A", "B"]
+        with pytest.raises(KeyError):
+            registry.find("Z")
+        df = registry.frame()
+        assert df.index.tolist() == ["A-1", "B-1", "C-1"]
+        assert registry.frame() is df
+
+    def test_invalidate(self):
+        loader = CountingLoader()
+        registry = Registry(loader, ["A", "B"])
+        registry.frame()
+        registry.invalidate("A")
+        assert registry.loaded() == ["B"]
+        assert registry.get("A")["value"].iloc[0] == 3
+
+    def test_background_reload(self):
+        """백그라운드 갱신 중에도 기존 데이터를 반환하고, 끝나면 교체"""
+        loader = CountingLoader()
+        registry = Registry(loader, ["A"])
+        old = registry.get("A")
+        loader.delay = 0.1
+        thread = registry.reload(background=True)
+        assert registry.get("A") is old
+        thread.join()
+        assert registry.get("A")["value"].iloc[0] == 2
+
+
+class TestSingleton:
+    def test_concurrent_construction(self):
+        """동시에 생성해도 생성자는 한 번만 실행되고 완성된 인스턴스만 반환"""
+        calls = []
+
+        @singleton
+        class Slow:
+            def __init__(self):
+                calls.append(1)
+                time.sleep(0.05)
+                self.ready = True
+
+        results = run_threads(Slow)
+        assert len(calls) == 1
+        assert all(r is results[0] and r.ready for r in results)
+
+
+class FakeIndexInfo:
+    calls = []
+
+    def fetch(self, market):
+        FakeIndexInfo.calls.append(market)
+        group = {"01": "5", "02": "1", "03": "2", "04": "1"}[market]
+        return DataFrame(
+            {
+                "IDX_IND_CD": ["002", "001"],
+                "IDX_NM": [f"{market}-2", f"{market}-1"],
+                "BAS_TM_CONTN": ["19900103", "19800104"],
+                "IND_TP_CD": [group, group],
+            }
+        )
+
+
+class FakeEtxInfo:
+    calls = []
+
+    def __init__(self, market, tickers):
+        self.market, self.tickers = market, tickers
+
+    def __call__(self):
+        return self
+
+    def fetch(self):
+        FakeEtxInfo.calls.append(self.market)
+        return DataFrame(
+            {
+                "ISU_CD": [f"KR{t}" for t in self.tickers],
+                "ISU_SRT_CD": self.tickers,
+                "ISU_ABBRV": [f"{self.market} {t}" for t in self.tickers],
+                "LIST_DD": ["2020/01/02"] * len(self.tickers),
+            }
+        )
+
+
+class TestIndexTickerRegistry:
+    @pytest.fixture
+    def index_ticker(self, monkeypatch):
+        FakeIndexInfo.calls = []
+        monkeypatch.setattr(market_ticker_module, "AllIndexBasicInfo", FakeIndexInfo)
+        monkeypatch.setattr(IndexTicker, "_instance", None)
+        return IndexTicker()
+
+    def test_partial_market(self, index_ticker):
+        """KOSPI 지수 티커만 조회하면 KOSPI 목록만 내려받음"""
+        assert index_ticker.get_ticker("KOSPI", "19850101") == ["1001"]
+        assert index_ticker.get_name("1001") == "02-1"
+        assert FakeIndexInfo.calls == ["02"]
+
+    def test_concurrent_construction(self, index_ticker, monkeypatch):
+        monkeypatch.setattr(IndexTicker, "_instance", None)
+        run_threads(lambda: IndexTicker().get_ticker("KOSDAQ", "20200101"))
+        assert FakeIndexInfo.calls == ["03"]
+
+
+class TestEtxTickerRegistry:
+    @pytest.fixture
+    def etx_ticker(self, monkeypatch):
+        FakeEtxInfo.calls = []
+        cores = {
+            "ETF": FakeEtxInfo("ETF", ["069500"]),
+            "ETN": FakeEtxInfo("ETN", ["580011"]),
+            "ELW": FakeEtxInfo("ELW", ["57JA01"]),
+        }
+        monkeypatch.setattr(etx_ticker_module, "_CORES", cores)
+        monkeypatch.setattr(EtxTicker, "_instance", None)
+        return EtxTicker()
+
+    def test_find_stops_at_market(self, etx_ticker):
+        """티커가 속한 시장까지만 내려받음"""
+        assert is_etf("069500")
+        assert get_etx_isin("069500") == "KR069500"
+        assert FakeEtxInfo.calls == ["ETF"]
+        assert is_etn("580011")
+        assert FakeEtxInfo.calls == ["ETF", "ETN"]
+
+    def test_get_ticker(self, etx_ticker):
+        assert etx_ticker.get_ticker("ELW", "20200102") == ["57JA01"]
+        assert etx_ticker.get_ticker("ALL", "20200102") == ["069500", "580011", "57JA01"]
@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pykrx.website.krx.market import schema as market_schema
+from pykrx.website.krx.market.core import AllStockPrice
+from pykrx.website.krx.schema import DATE, Schema, schemas_for
+
+RECORDS = [
+    {"TRD_DD": "2024/01/02", "ISU_SRT_CD": "005930", "TDD_CLSPRC": "79,600", "FLUC_RT": "1.02"},
+    {"TRD_DD": "2024/01/03", "ISU_SRT_CD": "000660", "TDD_CLSPRC": "-", "FLUC_RT": "-0.50"},
+]
+
+
+class TestSchema:
+    def test_build_typed_frame(self):
+        """필드 선택, 이름 변경, 숫자 변환, index 지정을 한 번에 수행"""
+        schema = Schema(
+            AllStockPrice,
+            [
+                ("ISU_SRT_CD", "티커"),
+                ("TDD_CLSPRC", "종가", np.int32),
+                ("FLUC_RT", "등락률", np.float32),
+            ],
+            index="티커",
+        )
+        df = schema.build(RECORDS)
+        assert list(df.columns) == ["종가", "등락률"]
+        assert df.index.name == "티커"
+        assert df.loc["005930", "종가"] == 79600
+        assert df.loc["000660", "종가"] == 0
+        assert df["종가"].dtype == np.int32
+        assert df["등락률"].dtype == np.float32
+
+    def test_date_index(self):
+        schema = Schema(
+            AllStockPrice,
+            [("TRD_DD", "날짜", DATE), ("TDD_CLSPRC", "종가", np.int64)],
+            index="날짜",
+        )
+        df = schema.build(RECORDS)
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert df.index[0] == pd.Timestamp("2024-01-02")
+
+    def test_multiindex_columns(self):
+        schema = Schema(
+            AllStockPrice,
+            [("ISU_SRT_CD", "티커"), ("TDD_CLSPRC", ("가격", "종가"), np.int64)],
+            index="티커",
+        )
+        df = schema.build(RECORDS)
+        assert isinstance(df.columns, pd.MultiIndex)
+        assert df.loc["005930", ("가격", "종가")] == 79600
+
+    def test_empty_records(self):
+        assert Schema(AllStockPrice, [("ISU_SRT_CD", "티커")]).build([]).empty
+
+    def test_missing_field(self):
+        schema = Schema(AllStockPrice, [("ISU_SRT_CD", "티커"), ("MKTCAP", "시가총액", np.int64)])
+        with pytest.raises(KeyError):
+            schema.build(RECORDS)
+
+    def test_registry(self):
+        """core 클래스별로 등록된 스키마 조회"""
+        assert market_schema.STOCK_OHLCV_BY_TICKER in schemas_for(AllStockPrice)
+        assert market_schema.STOCK_CAP_BY_TICKER in schemas_for(AllStockPrice)
+
+    def test_fetch_uses_schema(self):
+        """core 클래스의 fetch 결과가 스키마로 변환됨"""
+        raw = {"OutBlock_1": [dict(r, ISU_ABBRV="종목") for r in RECORDS]}
+        with patch.object(AllStockPrice, "read", return_value=raw):
+            df = market_schema.STOCK_TICKER_AND_NAME.fetch("20240103", "STK")
+        assert df["종목명"].tolist() == ["종목", "종목"]
+        assert df.index.tolist() == ["005930", "000660"]
+
+    def test_core_without_schema(self):
+        """스키마 없이 생성하면 기존처럼 원본 문자열 DataFrame"""
+        raw = {"OutBlock_1": RECORDS}
+        with patch.object(AllStockPrice, "read", return_value=raw):
+            df = AllStockPrice().fetch("20240103", "STK")
+        assert df["TDD_CLSPRC"].tolist() == ["79,600", "-"]
+
+
+class TestSchemaArrow:
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_build_arrow(self, pyarrow):
+        """index 필드는 첫 열, 숫자는 Arrow compute로 변환"""
+        schema = Schema(
+            AllStockPrice,
+            [
+                ("TRD_DD", "날짜", DATE),
+                ("TDD_CLSPRC", "종가", np.int32),
+                ("FLUC_RT", "등락률", np.float16),
+            ],
+            index="날짜",
+        )
+        table = schema.build_arrow(RECORDS)
+        assert table.column_names == ["날짜", "종가", "등락률"]
+        assert table.schema.field("날짜").type == pyarrow.date32()
+        assert table.schema.field("등락률").type == pyarrow.float32()
+        assert table.column("종가").to_pylist() == [79600, 0]
+        assert table.column("등락률").to_pylist() == pytest.approx([1.02, -0.5])
+
+    def test_matches_build(self, pyarrow):
+        """build와 같은 값"""
+        schema = market_schema.STOCK_TICKER_AND_NAME
+        records = [dict(r, ISU_ABBRV="종목") for r in RECORDS]
+        expected = schema.build(records).reset_index()
+        assert schema.build_arrow(records).to_pandas().equals(expected)
+
+    def test_irregular_and_invalid_values(self, pyarrow):
+        schema = Schema(AllStockPrice, [("TDD_CLSPRC", "종가", np.int64)])
+        table = schema.build_arrow([{"TDD_CLSPRC": "12 %"}, {"TDD_CLSPRC": "1,000"}])
+        assert table.column("종가").to_pylist() == [12, 1000]
+        with pytest.raises(ValueError):
+            schema.build_arrow([{"TDD_CLSPRC": "abc"}])
+
+    def test_overflow(self, pyarrow):
+        """범위를 벗어난 값은 잘리지 않고 오류를 발생"""
+        schema = Schema(AllStockPrice, [("TDD_CLSPRC", "종가", np.int32)])
+        with pytest.raises(ValueError):
+            schema.build_arrow([{"TDD_CLSPRC": "3,000,000,000"}])
+
+    def test_empty_records(self, pyarrow):
+        """레코드가 없어도 열 이름과 타입은 유지"""
+        table = market_schema.SHORTING_BALANCE_BY_TICKER.build_arrow([])
+        assert table.num_rows == 0
+        assert table.num_columns == len(market_schema.SHORTING_BALANCE_BY_TICKER.names)
@@ -0,0 +1,239 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pykrx.website.comm.jsonio import copy_payload
+from pykrx.website.comm.singleflight import AsyncSingleFlight, SingleFlight
+from pykrx.website.krx.krxio import AsyncKrxWebIo, KrxWebIo
+
+
+class SampleIo(KrxWebIo):
+    @property
+    def bld(self):
+        return "dbms/MDC/STAT/standard/MDCSTAT01501"
+
+    def fetch(self, **params):
+        return self.read(**params)
+
+
+class AsyncSampleIo(AsyncKrxWebIo):
+    @property
+    def bld(self):
+        return "dbms/MDC/STAT/standard/MDCSTAT01501"
+
+    async def fetch(self, **params):
+        return await self.read(**params)
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        """동시에 들어온 같은 키의 호출은 한 번만 실행"""
+        flight = SingleFlight(copy=copy_payload)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"output": [1]}
+
+        def worker():
+            results.append(flight.do("key", slow))
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=worker) for _ in range(4)]
+        for t in followers:
+            t.start()
+        while flight.shared < 4:
+            time.sleep(0.001)
+        release.set()
+        for t in [leader, *followers]:
+            t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 5
+        assert all(r == {"output": [1]} for r in results)
+        # 호출마다 별도의 복사본을 받음
+        assert len({id(r) for r in results}) == 5
+        assert len({id(r["output"]) for r in results}) == 5
+        assert flight.in_flight() == 0
+
+    def test_error_propagates_to_followers(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fail():
+            release.wait(5)
+            raise ValueError("boom")
+
+        def worker():
+            try:
+                flight.do("key", fail)
+            except ValueError as e:
+                errors.append(e)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        while flight.in_flight() == 0:
+            time.sleep(0.001)
+        followers = [threading.Thread(target=worker) for _ in range(2)]
+        for f in followers:
+            f.start()
+        while flight.shared < 2:
+            time.sleep(0.001)
+        release.set()
+        for f in [t, *followers]:
+            f.join()
+        assert len(errors) == 3
+
+    def test_follower_mutation_is_isolated(self):
+        """한 호출이 결과를 수정해도 다른 호출의 결과는 그대로"""
+        flight = SingleFlight(copy=copy_payload)
+        release = threading.Event()
+        results = []
+
+        def slow():
+            release.wait(5)
+            return {"output": [{"v": 1}]}
+
+        def worker():
+            result = flight.do("key", slow)
+            result["output"][0]["v"] += 1
+            result.pop("output")
+            results.append(result)
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        while flight.in_flight() == 0:
+            time.sleep(0.001)
+        follower = threading.Thread(target=worker)
+        follower.start()
+        while flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        for t in (leader, follower):
+            t.join()
+        assert results == [{}, {}]
+
+    def test_unshared_result_not_copied(self):
+        flight = SingleFlight(copy=copy_payload)
+        data = {"output": []}
+        assert flight.do("key", lambda: data) is data
+
+    def test_sequential_calls_are_not_cached(self):
+        """진행 중인 요청만 공유하고 결과를 보관하지 않음"""
+        flight = SingleFlight()
+        func = MagicMock(return_value=1)
+        flight.do("key", func)
+        flight.do("key", func)
+        assert func.call_count == 2
+
+
+class TestAsyncSingleFlight:
+    def test_tasks_share_one_execution(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def main():
+            flight = AsyncSingleFlight()
+            return await asyncio.gather(*[flight.do("key", fetch) for _ in range(5)])
+
+        assert asyncio.run(main()) == ["result"] * 5
+        assert calls == [1]
+
+    def test_tasks_receive_copies(self):
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return {"output": [{"v": 1}]}
+
+        async def main():
+            flight = AsyncSingleFlight(copy=copy_payload)
+            return await asyncio.gather(*[flight.do("key", fetch) for _ in range(3)])
+
+        results = asyncio.run(main())
+        results[0]["output"][0]["v"] = 2
+        assert results[1] == results[2] == {"output": [{"v": 1}]}
+
+    def test_cancelled_waiter_does_not_cancel_shared_task(self):
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def main():
+            flight = AsyncSingleFlight()
+            first = asyncio.ensure_future(flight.do("key", fetch))
+            second = asyncio.ensure_future(flight.do("key", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(main()) == "result"
+
+
+class TestKrxWebIoCoalescing:
+    def test_threads_share_upstream_request(self):
+        """같은 bld/파라미터로 동시에 조회하면 upstream 요청은 한 번"""
+        gate = threading.Event()
+        resp = MagicMock()
+        resp.json.return_value = {"output": [{"ISU_SRT_CD": "005930"}]}
+
+        def slow_read(*args, **kwargs):
+            gate.wait(5)
+            return resp
+
+        results = []
+        with patch("pykrx.website.comm.webio.Post.read", side_effect=slow_read) as mock_read:
+            timer = threading.Timer(0.1, gate.set)
+            timer.start()
+            run_threads(lambda: results.append(SampleIo().fetch(trdDd="20220104", mktId="STK")), 5)
+        assert mock_read.call_count == 1
+        assert results == [{"output": [{"ISU_SRT_CD": "005930"}]}] * 5
+
+    def test_different_params_are_not_coalesced(self):
+        resp = MagicMock()
+        resp.json.return_value = {"output": []}
+        with patch("pykrx.website.comm.webio.Post.read", return_value=resp) as mock_read:
+            SampleIo().fetch(trdDd="20220104", mktId="STK")
+            SampleIo().fetch(trdDd="20220104", mktId="KSQ")
+        assert mock_read.call_count == 2
+
+    def test_async_tasks_share_upstream_request(self):
+        resp = MagicMock()
+        resp.json.return_value = {"output": []}
+
+        def slow_read(*args, **kwargs):
+            time.sleep(0.05)
+            return resp
+
+        async def main():
+            return await asyncio.gather(
+                *[AsyncSampleIo().fetch(trdDd="20220104", mktId="STK") for _ in range(5)]
+            )
+
+        with patch("pykrx.website.comm.webio.Post.read", side_effect=slow_read) as mock_read:
+            results = asyncio.run(main())
+        assert mock_read.call_count == 1
+        assert results == [{"output": []}] * 5
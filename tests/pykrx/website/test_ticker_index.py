@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+from pykrx.website.krx.market import ticker as ticker_module
+from pykrx.website.krx.market.ticker import StockTicker, get_stock_ticker_isin
+
+LISTED = pd.DataFrame(
+    {
+        "종목": ["삼성전자", "SK하이닉스"],
+        "ISIN": ["KR7005930003", "KR7000660001"],
+        "시장": ["STK", "STK"],
+    },
+    index=pd.Index(["005930", "000660"], name="티커"),
+)
+DELISTED = pd.DataFrame(
+    {
+        "종목": ["가희 11R", "에스마크", "옛삼성"],
+        "ISIN": ["KRA030270151", "KR7030270003", "KR7005930999"],
+        "시장": ["KSQ", "KSQ", "STK"],
+    },
+    index=pd.Index(["030270", "030270", "005930"], name="티커"),
+)
+
+
+class FakeMaster:
+    def load(self, fetch, on_refresh=None):
+        return LISTED, DELISTED, False
+
+
+@pytest.fixture
+def stock_ticker(monkeypatch):
+    monkeypatch.setattr(ticker_module, "get_ticker_master", FakeMaster)
+    monkeypatch.setattr(StockTicker, "_instance", None)
+    return StockTicker()
+
+
+class TestStockTickerIndex:
+    def test_duplicated_delisted(self, stock_ticker):
+        """상장폐지 목록의 중복 티커는 ISIN 순으로 첫 번째 종목"""
+        assert stock_ticker.lookup("030270") == ("에스마크", "KR7030270003", "KSQ")
+
+    def test_listed_first(self, stock_ticker):
+        """상장 목록과 상장폐지 목록에 모두 있으면 상장 종목"""
+        assert get_stock_ticker_isin("005930") == "KR7005930003"
+
+    def test_get_series(self, stock_ticker):
+        s = stock_ticker.get("000660")
+        assert s["ISIN"] == "KR7000660001"
+        assert s.name == "000660"
+        assert stock_ticker.get("999999") is None
+
+    def test_lookup_many(self, stock_ticker):
+        df = stock_ticker.lookup_many(["000660", "999999", "030270"])
+        assert df.index.tolist() == ["000660", "999999", "030270"]
+        assert df["ISIN"].tolist()[0] == "KR7000660001"
+        assert pd.isna(df.loc["999999", "ISIN"])
+        assert df.loc["030270", "종목"] == "에스마크"
@@ -0,0 +1,104 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from pykrx.website.krx.market import master
+from pykrx.website.krx.market.master import TickerMaster, load_master, save_master
+
+LISTED = pd.DataFrame(
+    {
+        "종목": ["삼성전자", "SK하이닉스"],
+        "ISIN": ["KR7005930003", "KR7000660001"],
+        "시장": ["STK", "STK"],
+    },
+    index=pd.Index(["005930", "000660"], name="티커"),
+)
+DELISTED = pd.DataFrame(
+    {"종목": ["에스마크"], "ISIN": ["KR7030270003"], "시장": ["KSQ"]},
+    index=pd.Index(["030270"], name="티커"),
+)
+
+
+@pytest.fixture
+def ticker_master(tmp_path, monkeypatch):
+    monkeypatch.setattr(TickerMaster, "persistent", lambda self: True)
+    return TickerMaster(tmp_path / "ticker_master.bin", max_age=60)
+
+
+class FakeFetch:
+    def __init__(self, listed=LISTED, delisted=DELISTED):
+        self.calls = 0
+        self.tables = listed, delisted
+
+    def __call__(self):
+        self.calls += 1
+        return self.tables
+
+
+class TestMasterFile:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "m.bin"
+        save_master(path, {"listed": LISTED, "delisted": DELISTED}, saved_at=1000.0)
+        stored = load_master(path)
+        assert stored.saved_at == 1000.0
+        pd.testing.assert_frame_equal(stored.tables["listed"], LISTED)
+        pd.testing.assert_frame_equal(stored.tables["delisted"], DELISTED)
+
+    def test_version_mismatch(self, tmp_path, monkeypatch):
+        """형식 버전이 다른 파일은 사용하지 않음"""
+        path = tmp_path / "m.bin"
+        save_master(path, {"listed": LISTED, "delisted": DELISTED})
+        monkeypatch.setattr(master, "FORMAT_VERSION", master.FORMAT_VERSION + 1)
+        assert load_master(path) is None
+
+    def test_truncated(self, tmp_path):
+        path = tmp_path / "m.bin"
+        save_master(path, {"listed": LISTED, "delisted": DELISTED})
+        path.write_bytes(path.read_bytes()[:-3])
+        assert load_master(path) is None
+
+
+class TestTickerMaster:
+    def test_cold_start_saves(self, ticker_master):
+        """파일이 없으면 내려받아 저장하고, 다음 프로세스는 조회 없이 파일을 사용"""
+        fetch = FakeFetch()
+        listed, _, from_disk = ticker_master.load(fetch)
+        assert fetch.calls == 1 and not from_disk
+        assert listed.equals(LISTED)
+
+        listed, _, from_disk = TickerMaster(ticker_master.path, max_age=60).load(fetch)
+        assert fetch.calls == 1 and from_disk
+        pd.testing.assert_frame_equal(listed, LISTED)
+
+    def test_stale_refreshes_in_background(self, ticker_master):
+        """오래된 파일은 바로 사용하고 백그라운드에서 갱신"""
+        save_master(ticker_master.path, {"listed": LISTED, "delisted": DELISTED}, saved_at=0.0)
+        refreshed = threading.Event()
+        newer = pd.concat([LISTED, DELISTED])
+        fetch = FakeFetch(listed=newer)
+
+        listed, _, from_disk = ticker_master.load(fetch, lambda tables: refreshed.set())
+        assert from_disk and len(listed) == len(LISTED)
+        assert refreshed.wait(5)
+        assert fetch.calls == 1
+        assert len(load_master(ticker_master.path).tables["listed"]) == len(newer)
+        assert load_master(ticker_master.path).age() < 60
+
+    def test_failed_fetch_not_saved(self, ticker_master):
+        fetch = FakeFetch(listed=pd.DataFrame())
+        ticker_master.load(fetch)
+        assert not ticker_master.path.exists()
+
+    def test_not_persistent_without_http(self, tmp_path):
+        """record/replay/synthetic transport에서는 디스크를 사용하지 않음"""
+        from pykrx.website.comm import webio
+        from pykrx.website.comm.transport import SyntheticTransport
+
+        previous = webio.set_transport(SyntheticTransport(tickers=1))
+        try:
+            ticker_master = TickerMaster(tmp_path / "m.bin")
+            ticker_master.load(FakeFetch())
+            assert not ticker_master.path.exists()
+        finally:
+            webio.set_transport(previous)
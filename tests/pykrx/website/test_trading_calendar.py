@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pykrx.website.krx.market import calendar as calendar_module
+from pykrx.website.krx.market.calendar import TradingCalendar, load_calendar
+
+HOLIDAYS = pd.to_datetime(["2023-12-29", "2024-01-01", "2024-02-09", "2024-02-12"])
+
+
+class FakeSessions:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, fromdate, todate):
+        self.calls.append((fromdate, todate))
+        days = pd.bdate_range(fromdate, todate)
+        return days[~days.isin(HOLIDAYS)]
+
+
+@pytest.fixture
+def fetch(monkeypatch):
+    monkeypatch.setattr(calendar_module, "today_kst", lambda: "20240315")
+    return FakeSessions()
+
+
+@pytest.fixture
+def calendar(fetch):
+    return TradingCalendar(fetch=fetch, enabled=False)
+
+
+class TestTradingCalendar:
+    def test_previous_next(self, calendar):
+        assert calendar.previous("20240101") == pd.Timestamp("2023-12-28")
+        assert calendar.next("20240210") == pd.Timestamp("2024-02-13")
+        assert calendar.previous("20240102", inclusive=False) == pd.Timestamp("2023-12-28")
+
+    def test_vectorized(self, calendar):
+        result = calendar.offset(["20240102", "20240208"], 2)
+        assert result.tolist() == [pd.Timestamp("2024-01-04"), pd.Timestamp("2024-02-14")]
+        assert calendar.is_session(["20240209", "20240213"]).tolist() == [False, True]
+        counts = calendar.count(["20240101", "20240201"], ["20240131", "20240229"])
+        assert counts.tolist() == [22, 19]
+
+    def test_month_ends(self, calendar):
+        ends = calendar.month_ends("20231101", "20240315")
+        assert ends.strftime("%Y%m%d").tolist() == ["20231130", "20231228", "20240131", "20240229"]
+
+    def test_incremental_fetch(self, calendar, fetch):
+        """이미 알고 있는 구간은 다시 조회하지 않고, 벗어난 부분만 조회"""
+        calendar.sessions("20240102", "20240131")
+        calendar.count("20240105", "20240125")
+        assert len(fetch.calls) == 1
+        calendar.sessions("20231201", "20240131")
+        assert fetch.calls[-1] == ("20231201", "20240101")
+
+    def test_future_unknown(self, calendar):
+        """오늘 이후의 거래일은 알 수 없으므로 NaT"""
+        assert pd.isna(calendar.next("20240316"))
+        assert calendar.sessions("20240314", "20240331").tolist() == [
+            pd.Timestamp("2024-03-14"),
+            pd.Timestamp("2024-03-15"),
+        ]
+
+    def test_failed_fetch_not_covered(self, fetch):
+        """조회에 실패하면 구간을 넓히지 않음"""
+        calendar = TradingCalendar(fetch=lambda f, t: pd.DatetimeIndex([]), enabled=False)
+        assert calendar.sessions("20240101", "20240131").empty
+        assert calendar.covered() is None
+
+    def test_fetch_error_not_covered(self, fetch, tmp_path, monkeypatch):
+        """조회 오류는 짧은 구간이라도 휴장일로 저장하지 않음"""
+        monkeypatch.setattr(TradingCalendar, "persistent", lambda self: True)
+
+        def broken(fromdate, todate):
+            raise ValueError("bad payload")
+
+        path = tmp_path / "calendar.npz"
+        calendar = TradingCalendar(path, fetch=broken)
+        with pytest.raises(ValueError):
+            calendar.sessions("20240304", "20240307")
+        assert calendar.covered() is None
+        assert not path.exists()
+
+    def test_default_fetch_raises(self, fetch, monkeypatch):
+        """기본 fetch는 dataframe_empty_handler를 거치지 않아 조회 실패가 예외로 전달됨"""
+        from pykrx.website.krx.market import schema
+
+        def broken(*args, **kwargs):
+            raise KeyError("output")
+
+        monkeypatch.setattr(schema.INDEX_OHLCV_BY_DATE, "fetch", broken)
+        with pytest.raises(KeyError):
+            TradingCalendar(enabled=False).sessions("20240304", "20240307")
+
+    def test_persistence(self, fetch, tmp_path, monkeypatch):
+        """어제까지의 거래일을 저장하고 다음 프로세스에서 조회 없이 사용"""
+        monkeypatch.setattr(TradingCalendar, "persistent", lambda self: True)
+        path = tmp_path / "calendar.npz"
+        TradingCalendar(path, fetch=fetch).sessions("20240101", "20240315")
+        sessions, lo, hi = load_calendar(path)
+        assert (lo, hi) == (np.datetime64("2024-01-01"), np.datetime64("2024-03-14"))
+
+        fetch.calls.clear()
+        restored = TradingCalendar(path, fetch=fetch)
+        assert restored.count("20240101", "20240314") == len(sessions)
+        assert fetch.calls == []
@@ -0,0 +1,136 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from pykrx.stock.stock_batch import run_each
+from pykrx.website.comm import webio
+from pykrx.website.comm.transport import (
+    RecordTransport,
+    ReplayMissError,
+    ReplayTransport,
+    SyntheticTransport,
+    TransportResponse,
+)
+from pykrx.website.krx.market import wrap
+from pykrx.website.krx.market.core import AllStockPrice, IndividualStockPrice
+from pykrx.website.naver.core import Sise
+
+URL = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+
+
+@pytest.fixture
+def use_transport():
+    previous = webio.get_transport()
+
+    def install(transport):
+        webio.set_transport(transport)
+        return transport
+
+    yield install
+    webio.set_transport(previous)
+
+
+class FakeInner:
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, method, url, headers, params):
+        self.calls += 1
+        return TransportResponse('{"OutBlock_1": [{"ISU_SRT_CD": "005930"}]}')
+
+
+class TestRecordReplay:
+    def test_replay_serves_recorded_payload(self, tmp_path, use_transport):
+        """기록한 응답을 같은 요청에 그대로 재생"""
+        inner = FakeInner()
+        use_transport(RecordTransport(tmp_path, inner=inner))
+        recorded = AllStockPrice().fetch("20220104", "STK")
+        assert inner.calls == 1
+        assert list((tmp_path / "data.krx.co.kr").iterdir())[0].name.endswith("MDCSTAT01501")
+
+        use_transport(ReplayTransport(tmp_path))
+        replayed = AllStockPrice().fetch("20220104", "STK")
+        pd.testing.assert_frame_equal(recorded, replayed)
+
+    def test_replay_miss(self, tmp_path, use_transport):
+        replay = use_transport(ReplayTransport(tmp_path))
+        with pytest.raises(ReplayMissError):
+            AllStockPrice().read(trdDd="20220104", mktId="STK")
+        assert len(replay.misses) == 1
+        assert "MDCSTAT01501" in replay.misses[0]
+
+    def test_replay_miss_recorded_when_handled(self, tmp_path, use_transport):
+        """호출하는 쪽에서 예외를 처리해도 재생하지 못한 요청은 misses에 남음"""
+        replay = use_transport(ReplayTransport(tmp_path))
+        _, errors = run_each(lambda date: wrap.get_market_ohlcv_by_ticker(date), ["20220104"])
+        assert isinstance(errors["20220104"], ReplayMissError)
+        assert len(replay.misses) == 1
+
+    def test_replay_latency(self, tmp_path, use_transport, monkeypatch):
+        use_transport(RecordTransport(tmp_path, inner=FakeInner()))
+        AllStockPrice().fetch("20220104", "STK")
+
+        sleep = MagicMock()
+        monkeypatch.setattr("pykrx.website.comm.transport.time.sleep", sleep)
+        use_transport(ReplayTransport(tmp_path, latency=0.05))
+        AllStockPrice().fetch("20220104", "STK")
+        sleep.assert_called_once_with(0.05)
+
+
+class TestSyntheticTransport:
+    def test_snapshot_size(self, use_transport):
+        """요청한 종목 수만큼 전종목 시세 생성"""
+        use_transport(SyntheticTransport(tickers=500))
+        df = AllStockPrice().fetch("20240115", "ALL")
+        assert len(df) == 500
+        assert AllStockPrice().fetch("20240113", "ALL").empty  # 토요일
+
+    def test_snapshot_and_range_agree(self, use_transport):
+        """같은 종목/일자는 전종목 조회와 기간 조회 값이 일치"""
+        synthetic = use_transport(SyntheticTransport(tickers=50))
+        isin = synthetic.market.isins[3]
+        ticker = synthetic.market.tickers[3]
+
+        snapshot = AllStockPrice().fetch("20240115", "ALL").set_index("ISU_SRT_CD")
+        history = IndividualStockPrice().fetch("20240101", "20240115", isin, 1)
+        assert history.iloc[0]["TRD_DD"] == "2024/01/15"
+        assert history.iloc[0]["TDD_CLSPRC"] == snapshot.loc[ticker, "TDD_CLSPRC"]
+
+    def test_wrap_function_parses_synthetic_payload(self, use_transport):
+        use_transport(SyntheticTransport(tickers=30))
+        df = wrap.get_market_ohlcv_by_ticker("20240115", "KOSPI")
+        assert len(df) > 0
+        assert list(df.columns) == [
+            "시가",
+            "고가",
+            "저가",
+            "종가",
+            "거래량",
+            "거래대금",
+            "등락률",
+            "시가총액",
+        ]
+
+    def test_twenty_year_history(self, use_transport):
+        synthetic = use_transport(SyntheticTransport(tickers=1))
+        df = IndividualStockPrice().fetch("20040101", "20231231", synthetic.market.isins[0], 1)
+        assert len(df) == len(pd.bdate_range("20040101", "20231231"))
+
+    def test_naver_xml(self, use_transport):
+        use_transport(SyntheticTransport(tickers=5))
+        xml = Sise().fetch("000010", 10)
+        assert xml.count("<item") == 10
+
+    def test_unknown_bld(self, use_transport):
+        use_transport(SyntheticTransport(tickers=5))
+        with pytest.raises(ReplayMissError):
+            webio.get_transport().request("POST", URL, {}, {"bld": "dbms/unknown"})
+
+    def test_custom_generator(self, use_transport):
+        synthetic = use_transport(SyntheticTransport(tickers=5))
+        synthetic.register(
+            "dbms/custom", lambda market, params: {"output": [{"n": len(market.tickers)}]}
+        )
+        resp = webio.get_transport().request("POST", URL, {}, {"bld": "dbms/custom"})
+        assert resp.json() == {"output": [{"n": 5}]}
@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from pykrx.website.krx.market.universe import UniverseIndex
+
+SNAPSHOTS = {
+    "20210104": {"KOSPI": ["005930", "000660"], "KOSDAQ": ["091990"]},
+    "20210105": {"KOSPI": ["005930", "000660"], "KOSDAQ": ["091990"]},
+    "20210106": {"KOSPI": ["005930", "091990"], "KOSDAQ": ["035720"]},
+    "20210107": {"KOSPI": ["005930", "091990"], "KOSDAQ": []},
+}
+
+
+def fetch(date, market):
+    return SNAPSHOTS[date][market]
+
+
+@pytest.fixture
+def universe():
+    index = UniverseIndex()
+    index.sync(SNAPSHOTS, ["KOSPI", "KOSDAQ"], fetch)
+    return index
+
+
+class TestUniverseIndex:
+    def test_intervals(self, universe):
+        """상장폐지와 시장 이전을 구간으로 기록"""
+        df = universe.intervals()
+        rows = df[df["티커"] == "091990"][["시장", "시작일", "종료일"]].values.tolist()
+        assert rows == [["KOSDAQ", "20210104", "20210105"], ["KOSPI", "20210106", "20210107"]]
+        assert df[df["티커"] == "000660"]["종료일"].tolist() == ["20210105"]
+
+    def test_tickers_on(self, universe):
+        assert universe.tickers_on("20210105", "KOSPI") == ["000660", "005930"]
+        assert universe.tickers_on("20210106") == ["005930", "035720", "091990"]
+        # 영업일이 아니면 이전 영업일 기준
+        assert universe.tickers_on("2021-01-09", "KOSPI") == ["005930", "091990"]
+        assert universe.tickers_on("20201231") == []
+
+    def test_failed_snapshot_keeps_state(self, universe):
+        """조회 실패(빈 목록)는 상장폐지로 처리하지 않음"""
+        assert universe.tickers_on("20210107", "KOSDAQ") == ["035720"]
+
+    def test_listed_between(self, universe):
+        assert universe.listed_between("20210105", "20210106", "KOSDAQ") == ["035720", "091990"]
+
+    def test_bitmap(self, universe):
+        bits = universe.bitmap("20210105", "20210106")
+        assert bits.index.tolist() == [pd.Timestamp("2021-01-05"), pd.Timestamp("2021-01-06")]
+        assert bits.columns.tolist() == ["000660", "005930", "035720", "091990"]
+        assert bits.values.tolist() == [[True, True, False, True], [False, True, True, True]]
+
+    def test_incremental_sync(self, universe):
+        """이미 반영한 영업일은 다시 조회하지 않음"""
+        calls = []
+        added = universe.sync(
+            [*SNAPSHOTS, "20210108"], ["KOSPI"], lambda d, m: calls.append(d) or ["005930"]
+        )
+        assert added == 1 and calls == ["20210108"]
+        assert universe.tickers_on("20210108", "KOSPI") == ["005930"]
+        with pytest.raises(ValueError):
+            universe.update("20210105", {"KOSPI": ["005930"]})
+
+    def test_summary(self, universe):
+        df = universe.summary("20210105", "20210107", ["KOSPI", "KOSDAQ"])
+        assert df.loc["091990"].tolist() == ["KOSDAQ", "20210105", "20210107"]
+        assert df.loc["000660", "last_seen_date"] == "20210105"
+
+    def test_save_load(self, universe, tmp_path):
+        path = tmp_path / "universe.npz"
+        universe.save(path)
+        loaded = UniverseIndex.load(path)
+        pd.testing.assert_frame_equal(loaded.intervals(), universe.intervals())
+        loaded.update("20210108", {"KOSPI": ["005930"]})
+        assert loaded.tickers_on("20210108", "KOSPI") == ["005930"]
+        assert UniverseIndex.load(tmp_path / "missing.npz").last_date is None
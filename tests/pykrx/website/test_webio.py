@@ -0,0 +1,66 @@
+"""공유 HTTP 세션 풀 테스트"""
+
+from unittest.mock import MagicMock, patch
+
+from pykrx.website.comm.webio import Get, Post, SessionPool
+
+
+class DummyGet(Get):
+    @property
+    def url(self):
+        return "http://127.0.0.1/get"
+
+
+class DummyPost(Post):
+    @property
+    def url(self):
+        return "http://127.0.0.1/post"
+
+
+class TestSessionPool:
+    """SessionPool 테스트 클래스"""
+
+    def test_session_is_reused(self):
+        """연속 호출 시 같은 세션을 재사용하는지 테스트"""
+        pool = SessionPool(pool_size=4, idle_timeout=60)
+        assert pool.get() is pool.get()
+        pool.close()
+
+    def test_idle_timeout_recreates_session(self):
+        """유휴 시간이 지나면 세션을 새로 만드는지 테스트"""
+        pool = SessionPool(pool_size=4, idle_timeout=10)
+        with patch("pykrx.website.comm.webio.time.monotonic") as mock_clock:
+            mock_clock.return_value = 100.0
+            first = pool.get()
+            mock_clock.return_value = 105.0
+            assert pool.get() is first
+            mock_clock.return_value = 200.0
+            assert pool.get() is not first
+        pool.close()
+
+    def test_configure_resets_session(self):
+        """설정 변경 시 기존 세션을 버리는지 테스트"""
+        pool = SessionPool()
+        first = pool.get()
+        pool.configure(pool_size=2)
+        assert pool.pool_size == 2
+        assert pool.get() is not first
+        pool.close()
+
+
+class TestWebIo:
+    """Get/Post가 공유 세션을 사용하는지 테스트"""
+
+    def test_get_uses_shared_session(self):
+        session = MagicMock()
+        with patch("pykrx.website.comm.webio.get_session", return_value=session):
+            DummyGet().read(a=1)
+        session.get.assert_called_once()
+        assert session.get.call_args.kwargs["params"] == {"a": 1}
+
+    def test_post_uses_shared_session(self):
+        session = MagicMock()
+        with patch("pykrx.website.comm.webio.get_session", return_value=session):
+            DummyPost().read(bld="x")
+        session.post.assert_called_once()
+        assert session.post.call_args.kwargs["data"] == {"bld": "x"}